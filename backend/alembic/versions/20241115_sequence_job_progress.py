@@ -0,0 +1,19 @@
+"""Track streaming progress on sequence analysis jobs."""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20241115_sequence_job_progress"
+down_revision = "20241110_marketplace_billing"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("sequence_jobs", sa.Column("progress", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("sequence_jobs", "progress")
@@ -0,0 +1,25 @@
+"""Store DNA asset version sequences in a packed 2-bit layout."""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20241118_dna_asset_packed_sequences"
+down_revision = "20241115_sequence_job_progress"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "dna_asset_versions",
+        sa.Column("sequence_packed", sa.LargeBinary(), nullable=True),
+    )
+    # existing rows keep their text payload; new versions write only the packed column
+    op.alter_column("dna_asset_versions", "sequence", existing_type=sa.Text(), nullable=True)
+
+
+def downgrade() -> None:
+    op.alter_column("dna_asset_versions", "sequence", existing_type=sa.Text(), nullable=False)
+    op.drop_column("dna_asset_versions", "sequence_packed")
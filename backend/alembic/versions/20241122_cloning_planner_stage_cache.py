@@ -0,0 +1,37 @@
+"""Add content-addressed cloning planner stage cache."""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20241122_cloning_planner_stage_cache"
+down_revision = "20241118_dna_asset_packed_sequences"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "cloning_planner_stage_cache",
+        sa.Column("cache_key", sa.String(length=64), primary_key=True),
+        sa.Column("stage", sa.String(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("size_bytes", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("hit_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("last_accessed_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index(
+        "ix_cloning_planner_stage_cache_last_accessed_at",
+        "cloning_planner_stage_cache",
+        ["last_accessed_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_cloning_planner_stage_cache_last_accessed_at",
+        table_name="cloning_planner_stage_cache",
+    )
+    op.drop_table("cloning_planner_stage_cache")
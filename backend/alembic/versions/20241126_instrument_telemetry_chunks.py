@@ -0,0 +1,124 @@
+"""Store instrument telemetry as time-bucketed compressed chunks per channel."""
+
+from collections import defaultdict
+from datetime import datetime, timezone
+import json
+import uuid
+import zlib
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "20241126_instrument_telemetry_chunks"
+down_revision = "20241122_cloning_planner_stage_cache"
+branch_labels = None
+depends_on = None
+
+_BACKFILL_BUCKET_SECONDS = 60
+
+
+def upgrade() -> None:
+    op.create_table(
+        "instrument_telemetry_chunks",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "run_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("instrument_runs.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("channel", sa.String(), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(), nullable=False),
+        sa.Column("bucket_seconds", sa.Integer(), nullable=False),
+        sa.Column("sample_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("first_recorded_at", sa.DateTime(), nullable=False),
+        sa.Column("last_recorded_at", sa.DateTime(), nullable=False),
+        sa.Column("encoding", sa.String(), nullable=False, server_default="zlib+json"),
+        sa.Column("samples", sa.LargeBinary(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.UniqueConstraint(
+            "run_id", "channel", "bucket_start", name="uq_instrument_telemetry_chunk_bucket"
+        ),
+    )
+    op.create_index(
+        "ix_instrument_telemetry_chunks_run_bucket",
+        "instrument_telemetry_chunks",
+        ["run_id", "bucket_start"],
+    )
+    _backfill_chunks()
+
+
+def _backfill_chunks() -> None:
+    # legacy per-sample rows are regrouped into chunks; the old table is left for rollback
+    bind = op.get_bind()
+    legacy = sa.table(
+        "instrument_telemetry_samples",
+        sa.column("run_id", postgresql.UUID(as_uuid=True)),
+        sa.column("channel", sa.String()),
+        sa.column("payload", sa.JSON()),
+        sa.column("recorded_at", sa.DateTime()),
+    )
+    chunks = sa.table(
+        "instrument_telemetry_chunks",
+        sa.column("id", postgresql.UUID(as_uuid=True)),
+        sa.column("run_id", postgresql.UUID(as_uuid=True)),
+        sa.column("channel", sa.String()),
+        sa.column("bucket_start", sa.DateTime()),
+        sa.column("bucket_seconds", sa.Integer()),
+        sa.column("sample_count", sa.Integer()),
+        sa.column("first_recorded_at", sa.DateTime()),
+        sa.column("last_recorded_at", sa.DateTime()),
+        sa.column("encoding", sa.String()),
+        sa.column("samples", sa.LargeBinary()),
+        sa.column("created_at", sa.DateTime()),
+        sa.column("updated_at", sa.DateTime()),
+    )
+    grouped: dict[tuple, list[tuple[datetime, dict]]] = defaultdict(list)
+    rows = bind.execute(
+        sa.select(legacy.c.run_id, legacy.c.channel, legacy.c.payload, legacy.c.recorded_at)
+        .where(legacy.c.recorded_at.is_not(None))
+        .order_by(legacy.c.recorded_at)
+    )
+    for run_id, channel, payload, recorded_at in rows:
+        epoch = int(recorded_at.replace(tzinfo=timezone.utc).timestamp())
+        bucket_start = datetime.fromtimestamp(
+            epoch - epoch % _BACKFILL_BUCKET_SECONDS, tz=timezone.utc
+        ).replace(tzinfo=None)
+        grouped[(run_id, channel, bucket_start)].append((recorded_at, payload or {}))
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    inserts = []
+    for (run_id, channel, bucket_start), samples in grouped.items():
+        encoded = [
+            [int((recorded_at - bucket_start).total_seconds() * 1_000_000), payload]
+            for recorded_at, payload in samples
+        ]
+        inserts.append(
+            {
+                "id": uuid.uuid4(),
+                "run_id": run_id,
+                "channel": channel,
+                "bucket_start": bucket_start,
+                "bucket_seconds": _BACKFILL_BUCKET_SECONDS,
+                "sample_count": len(samples),
+                "first_recorded_at": samples[0][0],
+                "last_recorded_at": samples[-1][0],
+                "encoding": "zlib+json",
+                "samples": zlib.compress(json.dumps(encoded, separators=(",", ":")).encode("utf-8")),
+                "created_at": now,
+                "updated_at": now,
+            }
+        )
+    if inserts:
+        op.bulk_insert(chunks, inserts)
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_instrument_telemetry_chunks_run_bucket",
+        table_name="instrument_telemetry_chunks",
+    )
+    op.drop_table("instrument_telemetry_chunks")
@@ -0,0 +1,111 @@
+"""Add per-channel telemetry rollup tiers for instrument runs."""
+
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+import json
+import uuid
+import zlib
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "20241128_instrument_telemetry_rollups"
+down_revision = "20241126_instrument_telemetry_chunks"
+branch_labels = None
+depends_on = None
+
+_BACKFILL_TIERS = (1, 10, 60)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "instrument_telemetry_rollups",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "run_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("instrument_runs.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("channel", sa.String(), nullable=False),
+        sa.Column("tier_seconds", sa.Integer(), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(), nullable=False),
+        sa.Column("sample_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("stats", sa.JSON(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.UniqueConstraint(
+            "run_id",
+            "channel",
+            "tier_seconds",
+            "bucket_start",
+            name="uq_instrument_telemetry_rollup_bucket",
+        ),
+    )
+    _backfill_rollups()
+
+
+def _backfill_rollups() -> None:
+    bind = op.get_bind()
+    chunks = sa.table(
+        "instrument_telemetry_chunks",
+        sa.column("run_id", postgresql.UUID(as_uuid=True)),
+        sa.column("channel", sa.String()),
+        sa.column("bucket_start", sa.DateTime()),
+        sa.column("samples", sa.LargeBinary()),
+    )
+    rollups = sa.table(
+        "instrument_telemetry_rollups",
+        sa.column("id", postgresql.UUID(as_uuid=True)),
+        sa.column("run_id", postgresql.UUID(as_uuid=True)),
+        sa.column("channel", sa.String()),
+        sa.column("tier_seconds", sa.Integer()),
+        sa.column("bucket_start", sa.DateTime()),
+        sa.column("sample_count", sa.Integer()),
+        sa.column("stats", sa.JSON()),
+        sa.column("updated_at", sa.DateTime()),
+    )
+    counts: dict[tuple, int] = defaultdict(int)
+    stats: dict[tuple, dict] = defaultdict(dict)
+    for run_id, channel, chunk_start, blob in bind.execute(
+        sa.select(chunks.c.run_id, chunks.c.channel, chunks.c.bucket_start, chunks.c.samples)
+    ):
+        for offset, payload in json.loads(zlib.decompress(blob)):
+            recorded_at = chunk_start + timedelta(microseconds=offset)
+            epoch = int(recorded_at.replace(tzinfo=timezone.utc).timestamp())
+            for tier in _BACKFILL_TIERS:
+                bucket = datetime.fromtimestamp(epoch - epoch % tier, tz=timezone.utc).replace(tzinfo=None)
+                key = (run_id, channel, tier, bucket)
+                counts[key] += 1
+                for field, value in (payload or {}).items():
+                    if isinstance(value, bool) or not isinstance(value, (int, float)):
+                        continue
+                    current = stats[key].setdefault(
+                        field, {"min": value, "max": value, "sum": 0.0, "count": 0}
+                    )
+                    current["min"] = min(current["min"], value)
+                    current["max"] = max(current["max"], value)
+                    current["sum"] += value
+                    current["count"] += 1
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    inserts = [
+        {
+            "id": uuid.uuid4(),
+            "run_id": run_id,
+            "channel": channel,
+            "tier_seconds": tier,
+            "bucket_start": bucket,
+            "sample_count": count,
+            "stats": stats.get((run_id, channel, tier, bucket), {}),
+            "updated_at": now,
+        }
+        for (run_id, channel, tier, bucket), count in counts.items()
+    ]
+    if inserts:
+        op.bulk_insert(rollups, inserts)
+
+
+def downgrade() -> None:
+    op.drop_table("instrument_telemetry_rollups")
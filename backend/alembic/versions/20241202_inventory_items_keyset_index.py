@@ -0,0 +1,22 @@
+"""Index inventory items on (created_at, id) for keyset pagination."""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20241202_inventory_items_keyset_index"
+down_revision = "20241130_inventory_import_jobs"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_inventory_items_created_at_id",
+        "inventory_items",
+        ["created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_inventory_items_created_at_id", table_name="inventory_items")
@@ -0,0 +1,20 @@
+"""Index item relationship endpoints for graph traversal."""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20241204_item_relationship_endpoint_indexes"
+down_revision = "20241202_inventory_items_keyset_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_item_relationships_from_item", "item_relationships", ["from_item"])
+    op.create_index("ix_item_relationships_to_item", "item_relationships", ["to_item"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_item_relationships_to_item", table_name="item_relationships")
+    op.drop_index("ix_item_relationships_from_item", table_name="item_relationships")
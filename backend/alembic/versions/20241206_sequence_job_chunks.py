@@ -0,0 +1,33 @@
+"""Store streamed sequence job results as per-flush chunks."""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "20241206_sequence_job_chunks"
+down_revision = "20241204_item_relationship_endpoint_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sequence_job_chunks",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "job_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("sequence_jobs.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("start_index", sa.Integer(), nullable=False),
+        sa.Column("records", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.UniqueConstraint("job_id", "start_index", name="uq_sequence_job_chunk_start"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("sequence_job_chunks")
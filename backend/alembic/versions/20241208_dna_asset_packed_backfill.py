@@ -0,0 +1,77 @@
+"""Backfill packed 2-bit sequences for DNA asset versions written before packing."""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.services.packed_sequence import pack_sequence, unpack_sequence
+
+
+# revision identifiers, used by Alembic.
+revision = "20241208_dna_asset_packed_backfill"
+down_revision = "20241206_sequence_job_chunks"
+branch_labels = None
+depends_on = None
+
+_BATCH_SIZE = 500
+
+_versions = sa.table(
+    "dna_asset_versions",
+    sa.column("id", postgresql.UUID(as_uuid=True)),
+    sa.column("sequence", sa.Text()),
+    sa.column("sequence_packed", sa.LargeBinary()),
+)
+
+
+def _rewrite(source: sa.ColumnElement, convert) -> None:
+    # walk rows in id order so each batch is one short statement and rows that cannot be
+    # converted (non-ASCII text) are skipped instead of being selected again
+    bind = op.get_bind()
+    last_id = None
+    while True:
+        query = (
+            sa.select(_versions.c.id, source)
+            .where(source.is_not(None))
+            .order_by(_versions.c.id)
+            .limit(_BATCH_SIZE)
+        )
+        if last_id is not None:
+            query = query.where(_versions.c.id > last_id)
+        rows = bind.execute(query).all()
+        if not rows:
+            return
+        updates = []
+        for version_id, value in rows:
+            values = convert(value)
+            if values is not None:
+                updates.append({"version_id": version_id, **values})
+        if updates:
+            columns = {name: sa.bindparam(name) for name in updates[0] if name != "version_id"}
+            bind.execute(
+                _versions.update()
+                .where(_versions.c.id == sa.bindparam("version_id"))
+                .values(**columns),
+                updates,
+            )
+        last_id = rows[-1][0]
+
+
+def _pack(sequence: str) -> dict | None:
+    packed = pack_sequence(sequence)
+    if packed is None:
+        return None
+    return {"sequence_packed": packed, "sequence": None}
+
+
+def _unpack(packed: bytes) -> dict:
+    return {"sequence": unpack_sequence(packed), "sequence_packed": None}
+
+
+def upgrade() -> None:
+    # existing text payloads move to the packed column so readers see one format
+    _rewrite(_versions.c.sequence, _pack)
+
+
+def downgrade() -> None:
+    # restore text for every packed row so the previous revision can make `sequence` required again
+    _rewrite(_versions.c.sequence_packed, _unpack)
@@ -7,6 +7,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 from functools import lru_cache
 from pathlib import Path
@@ -60,3 +61,15 @@ def get_ligation_profile_catalog() -> tuple[dict[str, Any], ...]:
 
     payload = _load_json(_BASE_DIR / "ligation_profiles.json")
     return tuple(payload)
+
+
+@lru_cache(maxsize=None)
+def get_catalog_version() -> str:
+    """Return a digest identifying the bundled reference catalogs."""
+
+    # purpose: invalidate cached toolkit outputs whenever a catalog file changes
+    digest = hashlib.sha256()
+    for name in sorted(path.name for path in _BASE_DIR.glob("*.json")):
+        digest.update(name.encode("utf-8"))
+        digest.update((_BASE_DIR / name).read_bytes())
+    return digest.hexdigest()[:16]
@@ -1,6 +1,15 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator
 import os
+import threading
+import time
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./test.db")
 
@@ -9,7 +18,89 @@ if DATABASE_URL.startswith("sqlite"):
 else:
     sqlite_args = {}
 
-engine = create_engine(DATABASE_URL, connect_args=sqlite_args)
+# biolab: purpose: size connection pools per process role (API workers vs Celery workers)
+# biolab: note: DB_<ROLE>_POOL_SIZE overrides DB_POOL_SIZE, which overrides the role default
+PROCESS_ROLE = os.getenv("DB_POOL_ROLE", "api")
+_POOL_DEFAULTS = {
+    "api": {"POOL_SIZE": "10", "MAX_OVERFLOW": "20"},
+    "worker": {"POOL_SIZE": "2", "MAX_OVERFLOW": "2"},
+}
+
+# checkout wait totals per engine: "sync" for the Session engine, "async" for async routes
+_POOL_STATS = {
+    name: {"checkouts": 0, "timeouts": 0, "wait_seconds": 0.0, "max_wait_seconds": 0.0}
+    for name in ("sync", "async")
+}
+_POOL_STATS_LOCK = threading.Lock()
+_POOL_WAIT_LISTENERS: list[Callable[[float, bool, str], None]] = []
+
+
+def _pool_env(role: str, name: str, default: str) -> str:
+    return os.getenv(f"DB_{role.upper()}_{name}", os.getenv(f"DB_{name}", default))
+
+
+def pool_settings(role: str) -> dict:
+    # purpose: resolve engine pool keyword arguments for a process role from the environment
+    defaults = _POOL_DEFAULTS.get(role, _POOL_DEFAULTS["api"])
+    return {
+        "pool_size": int(_pool_env(role, "POOL_SIZE", defaults["POOL_SIZE"])),
+        "max_overflow": int(_pool_env(role, "MAX_OVERFLOW", defaults["MAX_OVERFLOW"])),
+        "pool_timeout": float(_pool_env(role, "POOL_TIMEOUT", "30")),
+        "pool_recycle": int(_pool_env(role, "POOL_RECYCLE", "1800")),
+        "pool_pre_ping": _pool_env(role, "POOL_PRE_PING", "1").lower() not in {"0", "false", "no"},
+    }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long callers wait for a connection."""
+
+    engine_label = "sync"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            _record_pool_wait(time.perf_counter() - started, timed_out, self.engine_label)
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """Async-adapted counterpart of InstrumentedQueuePool for the async engine."""
+
+    engine_label = "async"
+
+
+def _record_pool_wait(waited: float, timed_out: bool, engine_label: str = "sync") -> None:
+    with _POOL_STATS_LOCK:
+        stats = _POOL_STATS[engine_label]
+        stats["checkouts"] += 1
+        stats["timeouts"] += int(timed_out)
+        stats["wait_seconds"] += waited
+        stats["max_wait_seconds"] = max(stats["max_wait_seconds"], waited)
+    for listener in _POOL_WAIT_LISTENERS:
+        listener(waited, timed_out, engine_label)
+
+
+def on_pool_wait(listener: Callable[[float, bool, str], None]) -> None:
+    """Register a callback receiving (wait seconds, timed out, engine label) for every pool checkout."""
+
+    _POOL_WAIT_LISTENERS.append(listener)
+
+
+def _build_engine(role: str):
+    return create_engine(
+        DATABASE_URL,
+        connect_args=sqlite_args,
+        poolclass=InstrumentedQueuePool,
+        **pool_settings(role),
+    )
+
+
+engine = _build_engine(PROCESS_ROLE)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -20,3 +111,108 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def configure_engine(role: str) -> None:
+    # purpose: rebuild the sync engine for another process role (e.g. after a Celery worker fork)
+    global engine, PROCESS_ROLE
+    # connections inherited across fork belong to the parent; drop them without closing
+    engine.dispose(close=False)
+    PROCESS_ROLE = role
+    engine = _build_engine(role)
+    SessionLocal.configure(bind=engine)
+
+
+def pool_status(engine_label: str = "sync") -> dict:
+    # purpose: snapshot pool occupancy and checkout wait totals for metrics endpoints
+    with _POOL_STATS_LOCK:
+        stats = dict(_POOL_STATS[engine_label])
+    if engine_label == "async":
+        if _async_engine is None:
+            # never built in this process; report an empty pool rather than creating one
+            return {"role": PROCESS_ROLE, "size": 0, "checked_out": 0, "checked_in": 0, "overflow": 0, **stats}
+        pool = _async_engine.sync_engine.pool
+    else:
+        pool = engine.pool
+    return {
+        "role": PROCESS_ROLE,
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        **stats,
+    }
+
+
+# biolab: purpose: per-request query count and time, collected while `track_queries` is active
+_QUERY_STATS: ContextVar[dict | None] = ContextVar("db_query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[dict]:
+    stats = {"count": 0, "seconds": 0.0}
+    token = _QUERY_STATS.set(stats)
+    try:
+        yield stats
+    finally:
+        _QUERY_STATS.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    if _QUERY_STATS.get() is not None:
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _stop_query_timer(conn, cursor, statement, parameters, context, executemany):
+    stats = _QUERY_STATS.get()
+    started = conn.info.get("query_started")
+    if stats is None or not started:
+        return
+    stats["count"] += 1
+    stats["seconds"] += time.perf_counter() - started.pop()
+
+
+def _async_database_url(url: str) -> str:
+    # purpose: derive the async driver URL for the same database the sync engine targets
+    if url.startswith("sqlite:"):
+        return "sqlite+aiosqlite:" + url[len("sqlite:"):]
+    for prefix in ("postgresql+psycopg2:", "postgresql:", "postgres:"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg:" + url[len(prefix):]
+    return url
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or _async_database_url(DATABASE_URL)
+
+# biolab: purpose: async engine for read-heavy async routes so queries do not block the event loop
+# biolab: status: experimental
+# biolab: note: built lazily so processes that never touch async routes do not need aiosqlite/asyncpg
+_async_engine = None
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False, class_=AsyncSession)
+
+
+def get_async_engine():
+    global _async_engine
+    if _async_engine is None:
+        connect_args = {"timeout": 30} if ASYNC_DATABASE_URL.startswith("sqlite") else {}
+        settings = pool_settings(PROCESS_ROLE)
+        _async_engine = create_async_engine(
+            ASYNC_DATABASE_URL,
+            connect_args=connect_args,
+            poolclass=InstrumentedAsyncAdaptedQueuePool,
+            pool_size=settings["pool_size"],
+            max_overflow=settings["max_overflow"],
+            pool_timeout=settings["pool_timeout"],
+            pool_recycle=settings["pool_recycle"],
+            pool_pre_ping=settings["pool_pre_ping"],
+        )
+        AsyncSessionLocal.configure(bind=_async_engine)
+    return _async_engine
+
+
+async def get_async_db():
+    get_async_engine()
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -7,10 +7,11 @@ from slowapi.middleware import SlowAPIMiddleware
 import json
 import os
 import time
-from prometheus_client import Counter, Histogram, generate_latest, CONTENT_TYPE_LATEST
+from prometheus_client import Counter, Gauge, Histogram, generate_latest, CONTENT_TYPE_LATEST
 import sentry_sdk
 from sentry_sdk.integrations.fastapi import FastApiIntegration
-from . import pubsub
+from . import database, pubsub
+from .services import sequence_toolkit as sequence_toolkit_service
 from .database import Base, engine
 from .routes import (
     auth,
@@ -73,6 +74,48 @@ REQUEST_COUNT = Counter("request_count", "Total requests", ["method", "endpoint"
 REQUEST_LATENCY = Histogram(
     "request_latency_seconds", "Request latency", ["endpoint"]
 )
+# database pool occupancy is read from the live engines at scrape time, labelled sync/async
+DB_POOL_SIZE = Gauge("db_pool_size", "Configured database pool size", ["engine"])
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out", "Database connections currently checked out", ["engine"]
+)
+DB_POOL_OVERFLOW = Gauge("db_pool_overflow", "Database connections open beyond the pool size", ["engine"])
+for _engine_label in ("sync", "async"):
+    for _gauge, _key in (
+        (DB_POOL_SIZE, "size"),
+        (DB_POOL_CHECKED_OUT, "checked_out"),
+        (DB_POOL_OVERFLOW, "overflow"),
+    ):
+        _gauge.labels(_engine_label).set_function(
+            lambda label=_engine_label, key=_key: database.pool_status(label)[key]
+        )
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting for a pooled database connection",
+    ["engine"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30),
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total", "Database pool checkouts that timed out", ["engine"]
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request",
+    "Database queries issued per request",
+    ["endpoint"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 250),
+)
+DB_QUERY_SECONDS_PER_REQUEST = Histogram(
+    "db_query_seconds_per_request", "Database time spent per request", ["endpoint"]
+)
+
+
+def _observe_pool_wait(waited: float, timed_out: bool, engine_label: str) -> None:
+    DB_POOL_WAIT.labels(engine_label).observe(waited)
+    if timed_out:
+        DB_POOL_TIMEOUTS.labels(engine_label).inc()
+
+
+database.on_pool_wait(_observe_pool_wait)
 
 app = FastAPI(title="BioLabs API")
 
@@ -83,6 +126,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # inventory listing pagination metadata
+    expose_headers=["X-Next-Cursor", "X-Total-Count", "X-Total-Count-Estimated"],
 )
 
 limiter = Limiter(key_func=get_remote_address)
@@ -95,12 +140,24 @@ if os.getenv("TESTING") != "1":
 @app.middleware("http")
 async def record_metrics(request: Request, call_next):
     start = time.time()
-    response = await call_next(request)
+    with database.track_queries() as queries:
+        response = await call_next(request)
     endpoint = request.url.path
     REQUEST_COUNT.labels(request.method, endpoint).inc()
     REQUEST_LATENCY.labels(endpoint).observe(time.time() - start)
+    # label query metrics by route template so path parameters do not explode cardinality
+    route = getattr(request.scope.get("route"), "path", endpoint)
+    DB_QUERIES_PER_REQUEST.labels(route).observe(queries["count"])
+    DB_QUERY_SECONDS_PER_REQUEST.labels(route).observe(queries["seconds"])
     return response
 
+
+@app.on_event("shutdown")
+def _shutdown_batch_pool() -> None:
+    # purpose: reap the shared batch primer worker processes with the API process
+    sequence_toolkit_service.shutdown_batch_pool()
+
+
 @app.get("/metrics")
 def metrics():
     return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -184,15 +241,9 @@ audit_routes()
 @app.websocket("/ws/{team_id}")
 async def websocket_endpoint(websocket: WebSocket, team_id: str):
     await websocket.accept()
-    r = await pubsub.get_redis()
-    pub = r.pubsub()
-    await pub.subscribe(f"team:{team_id}")
-    try:
-        async for message in pub.listen():
-            if message["type"] == "message":
-                data = message["data"]
-                if isinstance(data, bytes):
-                    data = data.decode()
-                await websocket.send_text(data)
-    finally:
-        await pub.unsubscribe(f"team:{team_id}")
+    async with pubsub.get_subscription_hub().subscribe(f"team:{team_id}") as subscription:
+        async for _channel, data in subscription:
+            await websocket.send_text(data)
+    if subscription.evicted:
+        # client fell behind the per-subscriber buffer; ask it to reconnect
+        await websocket.close(code=1013)
@@ -12,6 +12,7 @@ from sqlalchemy import (
     Time,
     Text,
     Float,
+    LargeBinary,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
@@ -210,6 +211,12 @@ class InventoryItem(Base):
         order_by="GovernanceSampleCustodyLog.performed_at.desc()",
     )
 
+    # purpose: back keyset pagination over (created_at, id) in GET /api/inventory/items
+    # status: pilot
+    __table_args__ = (
+        sa.Index("ix_inventory_items_created_at_id", "created_at", "id"),
+    )
+
 class FieldDefinition(Base):
     __tablename__ = "field_definitions"
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -242,6 +249,13 @@ class ItemRelationship(Base):
     relationship_type = Column(String)
     meta = Column("metadata", JSON, default={})
 
+    # purpose: index both endpoints so graph traversal expands a frontier without table scans
+    # status: pilot
+    __table_args__ = (
+        sa.Index("ix_item_relationships_from_item", "from_item"),
+        sa.Index("ix_item_relationships_to_item", "to_item"),
+    )
+
 
 class File(Base):
     __tablename__ = "files"
@@ -1714,9 +1728,52 @@ class SequenceAnalysisJob(Base):
     status = Column(String, default="pending")
     format = Column(String)
     result = Column(JSON, default={})
+    progress = Column(JSON, nullable=True)
+    created_at = Column(DateTime, default=datetime.now(timezone.utc))
+    updated_at = Column(DateTime, default=datetime.now(timezone.utc), onupdate=datetime.now(timezone.utc))
+
+    # note: streamed jobs leave `result` empty and append their records as SequenceJobChunk rows
+    chunks = relationship(
+        "SequenceJobChunk",
+        back_populates="job",
+        order_by="SequenceJobChunk.start_index",
+        cascade="all, delete-orphan",
+    )
+
+
+class SequenceJobChunk(Base):
+    __tablename__ = "sequence_job_chunks"
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    job_id = Column(UUID(as_uuid=True), ForeignKey("sequence_jobs.id", ondelete="CASCADE"), nullable=False)
+    start_index = Column(Integer, nullable=False)
+    records = Column(JSON, nullable=False)
+    created_at = Column(DateTime, default=datetime.now(timezone.utc))
+
+    # purpose: hold one flush of a streamed sequence job so each flush writes only its own records
+    # status: pilot
+    job = relationship("SequenceAnalysisJob", back_populates="chunks")
+
+    __table_args__ = (
+        sa.UniqueConstraint("job_id", "start_index", name="uq_sequence_job_chunk_start"),
+    )
+
+
+class InventoryImportJob(Base):
+    __tablename__ = "inventory_import_jobs"
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
+    team_id = Column(UUID(as_uuid=True), ForeignKey("teams.id"), nullable=True)
+    status = Column(String, default="pending")
+    filename = Column(String)
+    storage_path = Column(String)
+    progress = Column(JSON, nullable=True)
+    result = Column(JSON, nullable=True)
     created_at = Column(DateTime, default=datetime.now(timezone.utc))
     updated_at = Column(DateTime, default=datetime.now(timezone.utc), onupdate=datetime.now(timezone.utc))
 
+    # purpose: track streamed CSV inventory imports processed in batches by a worker
+    # status: pilot
+
 
 class CloningPlannerSession(Base):
     """cloning planner orchestration session state"""
@@ -1811,6 +1868,22 @@ class CloningPlannerStageRecord(Base):
     session = relationship("CloningPlannerSession", back_populates="stage_history")
 
 
+class CloningPlannerStageCacheEntry(Base):
+    """Content-addressed toolkit output shared across planner sessions and branches."""
+
+    # purpose: reuse primer/restriction/assembly payloads when inputs and resolved config repeat
+    # status: experimental
+    __tablename__ = "cloning_planner_stage_cache"
+
+    cache_key = Column(String(64), primary_key=True)
+    stage = Column(String, nullable=False)
+    payload = Column(JSON, nullable=False)
+    size_bytes = Column(Integer, default=0, nullable=False)
+    hit_count = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime, default=datetime.now(timezone.utc), nullable=False)
+    last_accessed_at = Column(DateTime, default=datetime.now(timezone.utc), nullable=False, index=True)
+
+
 class CloningPlannerQCArtifact(Base):
     """Stored QC chromatogram artifacts tied to planner sessions."""
 
@@ -2115,6 +2188,18 @@ class InstrumentRun(Base):
     telemetry_samples = relationship(
         "InstrumentTelemetrySample", back_populates="run", cascade="all, delete-orphan"
     )
+    telemetry_chunks = relationship(
+        "InstrumentTelemetryChunk",
+        back_populates="run",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+    telemetry_rollups = relationship(
+        "InstrumentTelemetryRollup",
+        back_populates="run",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
 
 
 class InstrumentTelemetrySample(Base):
@@ -2128,9 +2213,62 @@ class InstrumentTelemetrySample(Base):
     recorded_at = Column(DateTime, default=datetime.now(timezone.utc))
 
     # purpose: retain instrument telemetry envelopes for replay and analytics
-    # status: active
+    # status: deprecated
+    # note: superseded by InstrumentTelemetryChunk; rows were backfilled into chunks
     run = relationship("InstrumentRun", back_populates="telemetry_samples")
 
+
+class InstrumentTelemetryChunk(Base):
+    __tablename__ = "instrument_telemetry_chunks"
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    run_id = Column(
+        UUID(as_uuid=True), ForeignKey("instrument_runs.id", ondelete="CASCADE"), nullable=False
+    )
+    channel = Column(String, nullable=False)
+    bucket_start = Column(DateTime, nullable=False)
+    bucket_seconds = Column(Integer, nullable=False)
+    sample_count = Column(Integer, nullable=False, default=0)
+    first_recorded_at = Column(DateTime, nullable=False)
+    last_recorded_at = Column(DateTime, nullable=False)
+    encoding = Column(String, nullable=False, default="zlib+json")
+    samples = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime, default=datetime.now(timezone.utc))
+    updated_at = Column(DateTime, default=datetime.now(timezone.utc), onupdate=datetime.now(timezone.utc))
+
+    # purpose: store one channel's telemetry for one time bucket as a compressed sample array
+    # status: pilot
+    run = relationship("InstrumentRun", back_populates="telemetry_chunks")
+
+    __table_args__ = (
+        sa.UniqueConstraint("run_id", "channel", "bucket_start", name="uq_instrument_telemetry_chunk_bucket"),
+        sa.Index("ix_instrument_telemetry_chunks_run_bucket", "run_id", "bucket_start"),
+    )
+
+
+class InstrumentTelemetryRollup(Base):
+    __tablename__ = "instrument_telemetry_rollups"
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    run_id = Column(
+        UUID(as_uuid=True), ForeignKey("instrument_runs.id", ondelete="CASCADE"), nullable=False
+    )
+    channel = Column(String, nullable=False)
+    tier_seconds = Column(Integer, nullable=False)
+    bucket_start = Column(DateTime, nullable=False)
+    sample_count = Column(Integer, nullable=False, default=0)
+    # {field: {"min": float, "max": float, "sum": float, "count": int}} for numeric payload fields
+    stats = Column(JSON, default=dict, nullable=False)
+    updated_at = Column(DateTime, default=datetime.now(timezone.utc), onupdate=datetime.now(timezone.utc))
+
+    # purpose: pre-aggregated min/max/mean per channel, rollup tier, and time bucket for dashboards
+    # status: pilot
+    run = relationship("InstrumentRun", back_populates="telemetry_rollups")
+
+    __table_args__ = (
+        sa.UniqueConstraint(
+            "run_id", "channel", "tier_seconds", "bucket_start", name="uq_instrument_telemetry_rollup_bucket"
+        ),
+    )
+
 class ComplianceRecord(Base):
     __tablename__ = "compliance_records"
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -2723,7 +2861,9 @@ class DNAAssetVersion(Base):
         index=True,
     )
     version_index = Column(Integer, nullable=False)
-    sequence = Column(Text, nullable=False)
+    # legacy rows keep plain text; new rows store the 2-bit packed payload only
+    sequence_text = Column("sequence", Text, nullable=True)
+    sequence_packed = Column(LargeBinary, nullable=True)
     sequence_checksum = Column(String, nullable=False)
     sequence_length = Column(Integer, nullable=False)
     gc_content = Column(Float, nullable=False)
@@ -2750,6 +2890,47 @@ class DNAAssetVersion(Base):
 
     __table_args__ = (sa.UniqueConstraint("asset_id", "version_index"),)
 
+    @property
+    def packed_sequence(self):
+        # purpose: expose the packed codec for windowed slicing, GC, and reverse complement
+        from .services.packed_sequence import PackedSequence
+
+        source = self.sequence_packed if self.sequence_packed is not None else self.sequence_text
+        if source is None:
+            return None
+        cached = self.__dict__.get("_packed_cache")
+        if cached is None or cached[0] is not source:
+            try:
+                if isinstance(source, str):
+                    packed = PackedSequence.encode(source)
+                else:
+                    packed = PackedSequence.from_bytes(source)
+            except UnicodeEncodeError:
+                packed = None
+            cached = (source, packed)
+            self.__dict__["_packed_cache"] = cached
+        return cached[1]
+
+    @property
+    def sequence(self) -> str:
+        if self.sequence_text is not None:
+            return self.sequence_text
+        if self.sequence_packed is None:
+            return ""
+        cached = self.__dict__.get("_sequence_cache")
+        if cached is None or cached[0] is not self.sequence_packed:
+            cached = (self.sequence_packed, self.packed_sequence.decode())
+            self.__dict__["_sequence_cache"] = cached
+        return cached[1]
+
+    @sequence.setter
+    def sequence(self, value: str) -> None:
+        from .services.packed_sequence import pack_sequence
+
+        packed = pack_sequence(value)
+        self.sequence_packed = packed
+        self.sequence_text = value if packed is None else None
+
 
 class DNAAssetAnnotation(Base):
     __tablename__ = "dna_asset_annotations"
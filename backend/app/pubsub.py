@@ -1,24 +1,70 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
 import json
 import os
+import queue
+import threading
+import time
+import weakref
 from contextlib import suppress
 from datetime import datetime
 from typing import Any, AsyncIterator
 
 import redis.asyncio as redis
+from prometheus_client import Counter, Gauge, Histogram
 
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+PUBLISH_QUEUE_SIZE = int(os.getenv("PUBSUB_PUBLISH_QUEUE_SIZE", "1000"))
+PUBLISH_BATCH_SIZE = int(os.getenv("PUBSUB_PUBLISH_BATCH_SIZE", "100"))
+# how long sync producers wait on a full queue before the event is dropped
+PUBLISH_BLOCK_SECONDS = float(os.getenv("PUBSUB_PUBLISH_BLOCK_SECONDS", "0.05"))
+PUBLISHER_MAX_CONNECTIONS = int(os.getenv("PUBSUB_PUBLISHER_MAX_CONNECTIONS", "4"))
+# per-client buffer for hub subscribers; a client that falls this far behind is evicted
+SUBSCRIBER_BUFFER_SIZE = int(os.getenv("PUBSUB_SUBSCRIBER_BUFFER_SIZE", "256"))
 _redis = None
+_fake_server = None
+
+PUBSUB_EVENTS_PUBLISHED = Counter(
+    "pubsub_events_published_total", "Events published by the background publisher"
+)
+PUBSUB_EVENTS_DROPPED = Counter(
+    "pubsub_events_dropped_total", "Events dropped by the background publisher", ["reason"]
+)
+PUBSUB_QUEUE_DEPTH = Gauge("pubsub_publish_queue_depth", "Events waiting for the background publisher")
+PUBSUB_HUB_SUBSCRIBERS = Gauge("pubsub_hub_subscribers", "Local subscribers attached to the fan-out hub")
+PUBSUB_HUB_CHANNELS = Gauge("pubsub_hub_channels", "Redis channels the fan-out hub is subscribed to")
+PUBSUB_HUB_EVICTIONS = Counter(
+    "pubsub_hub_evictions_total", "Slow subscribers evicted from the fan-out hub"
+)
+PUBSUB_FANOUT_LATENCY = Histogram(
+    "pubsub_fanout_seconds",
+    "Time to hand one Redis message to every local subscriber",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1),
+)
+
+
+def _create_client(max_connections: int | None = None):
+    global _fake_server
+    if os.getenv("TESTING") == "1":
+        from fakeredis import FakeServer, aioredis
+
+        # one in-memory server so clients on different loops see the same channels
+        if _fake_server is None:
+            _fake_server = FakeServer()
+        return aioredis.FakeRedis(server=_fake_server)
+    if max_connections is None:
+        return redis.from_url(REDIS_URL)
+    # a blocking pool waits for a free connection instead of raising "Too many connections"
+    pool = redis.BlockingConnectionPool.from_url(REDIS_URL, max_connections=max_connections)
+    return redis.Redis(connection_pool=pool)
+
 
 async def get_redis():
     global _redis
     if _redis is None:
-        if os.getenv("TESTING") == "1":
-            from fakeredis import aioredis
-            _redis = aioredis.FakeRedis()
-        else:
-            _redis = redis.from_url(REDIS_URL)
+        _redis = _create_client()
     return _redis
 
 def _json_default(value: Any) -> Any:
@@ -39,6 +85,19 @@ async def publish_team_event(team_id: str, event: dict[str, Any]) -> None:
     await r.publish(f"team:{team_id}", _serialize_event(event))
 
 
+async def publish_team_events(events: dict[str, dict[str, Any]]) -> None:
+    """Publish one event per team channel in a single pipelined round trip."""
+
+    # purpose: fan out coalesced bulk-operation events without a publish call per team
+    if not events:
+        return
+    r = await get_redis()
+    async with r.pipeline(transaction=False) as pipe:
+        for team_id, event in events.items():
+            pipe.publish(f"team:{team_id}", _serialize_event(event))
+        await pipe.execute()
+
+
 async def publish_governance_event(topic: str, event: dict[str, Any]) -> None:
     """Publish a governance lock event to subscribers."""
 
@@ -59,21 +118,384 @@ async def iter_planner_events(session_id: str) -> AsyncIterator[str]:
     """Yield planner pub/sub messages as a stream."""
 
     # purpose: provide async iterator for SSE/websocket consumers
-    r = await get_redis()
-    channel = f"planner:{session_id}"
-    pubsub = r.pubsub()
-    await pubsub.subscribe(channel)
-    try:
-        async for message in pubsub.listen():
-            if message.get("type") != "message":
+    async with get_subscription_hub().subscribe(f"planner:{session_id}") as subscription:
+        async for _channel, data in subscription:
+            yield data
+
+
+class Subscription:
+    """Bounded local queue fed by the fan-out hub for one client."""
+
+    # purpose: decouple each websocket/SSE client from the shared Redis connection
+    # inputs: channel names, buffer size
+    # outputs: (channel, data) tuples via `get` or async iteration; `evicted` once dropped as too slow
+    # status: experimental
+
+    def __init__(self, hub: "SubscriptionHub", channels: tuple[str, ...], maxsize: int):
+        self.hub = hub
+        self.channels = channels
+        self.evicted = False
+        self.closed = False
+        self._queue: asyncio.Queue[tuple[str, str] | None] = asyncio.Queue(maxsize)
+
+    async def get(self, timeout: float | None = None) -> tuple[str, str] | None:
+        """Return the next message, or None on timeout or once the subscription is closed."""
+
+        if self.closed:
+            return None
+        try:
+            item = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if item is None:
+            self.closed = True
+        return item
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> tuple[str, str]:
+        item = await self.get()
+        if item is None:
+            raise StopAsyncIteration
+        return item
+
+    async def close(self) -> None:
+        await self.hub.unsubscribe(self)
+
+    async def __aenter__(self) -> "Subscription":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+class SubscriptionHub:
+    """Share one Redis pub/sub connection per event loop across local subscribers."""
+
+    # purpose: keep one Redis subscription per channel per worker and fan messages out in-process
+    # inputs: `subscribe(*channels)` calls from websocket and SSE handlers
+    # outputs: Subscription objects; stats for subscribers, channels, messages, and evictions
+    # status: experimental
+
+    def __init__(self, *, buffer_size: int = SUBSCRIBER_BUFFER_SIZE):
+        self.buffer_size = buffer_size
+        self._channels: dict[str, set[Subscription]] = {}
+        self._client = None
+        self._pubsub = None
+        self._reader: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+        self._stats = {"messages": 0, "delivered": 0, "evicted": 0, "errors": 0}
+
+    def stats(self) -> dict[str, int]:
+        subscribers = {sub for subs in self._channels.values() for sub in subs}
+        return {**self._stats, "channels": len(self._channels), "subscribers": len(subscribers)}
+
+    def subscribe(self, *channels: str, buffer_size: int | None = None) -> _PendingSubscription:
+        """Attach a local subscriber; use as `async with hub.subscribe(...) as sub`."""
+
+        subscription = Subscription(self, tuple(dict.fromkeys(channels)), buffer_size or self.buffer_size)
+        return _PendingSubscription(self, subscription)
+
+    async def _attach(self, subscription: Subscription) -> None:
+        if not subscription.channels:
+            return
+        async with self._lock:
+            new_channels = [channel for channel in subscription.channels if channel not in self._channels]
+            for channel in subscription.channels:
+                self._channels.setdefault(channel, set()).add(subscription)
+            PUBSUB_HUB_SUBSCRIBERS.inc()
+            if not new_channels:
+                return
+            PUBSUB_HUB_CHANNELS.inc(len(new_channels))
+            if self._pubsub is None:
+                self._client = _create_client()
+                self._pubsub = self._client.pubsub()
+            await self._pubsub.subscribe(*new_channels)
+            if self._reader is None or self._reader.done():
+                self._reader = asyncio.get_running_loop().create_task(self._read())
+
+    def _detach(self, subscription: Subscription) -> list[str]:
+        """Remove a subscriber locally and return channels nobody listens to anymore."""
+
+        released = []
+        attached = False
+        for channel in subscription.channels:
+            subscribers = self._channels.get(channel)
+            if not subscribers or subscription not in subscribers:
                 continue
-            data = message.get("data")
-            if isinstance(data, bytes):
-                yield data.decode()
-            else:
-                yield str(data)
-    finally:
+            attached = True
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._channels[channel]
+                released.append(channel)
+        if attached:
+            PUBSUB_HUB_SUBSCRIBERS.dec()
+        if released:
+            PUBSUB_HUB_CHANNELS.dec(len(released))
+        return released
+
+    async def unsubscribe(self, subscription: Subscription) -> None:
+        subscription.closed = True
+        async with self._lock:
+            await self._release(self._detach(subscription))
+
+    async def _release(self, channels: list[str]) -> None:
+        if not channels or self._pubsub is None:
+            return
+        with suppress(Exception):
+            await self._pubsub.unsubscribe(*channels)
+        if self._channels:
+            return
+        # last subscriber gone: drop the reader and connection until the next client arrives
+        pubsub_conn, self._pubsub = self._pubsub, None
+        client, self._client = self._client, None
+        reader, self._reader = self._reader, None
+        if reader is not None and reader is not asyncio.current_task():
+            reader.cancel()
+            # the reader loop also exits on its own once it sees the connection detached
+            with suppress(BaseException):
+                await asyncio.wait_for(reader, 2.0)
         with suppress(Exception):
-            await pubsub.unsubscribe(channel)
-        with suppress(AttributeError):
-            await pubsub.close()
+            await pubsub_conn.aclose()
+        with suppress(Exception):
+            await client.aclose()
+
+    def _evict(self, subscription: Subscription) -> list[str]:
+        released = self._detach(subscription)
+        subscription.evicted = True
+        # make room for the end-of-stream marker so the consumer notices on its next read
+        while not subscription._queue.empty():
+            subscription._queue.get_nowait()
+        subscription._queue.put_nowait(None)
+        self._stats["evicted"] += 1
+        PUBSUB_HUB_EVICTIONS.inc()
+        return released
+
+    def _dispatch(self, channel: str, data: str) -> list[str]:
+        started = time.perf_counter()
+        released: list[str] = []
+        self._stats["messages"] += 1
+        for subscription in list(self._channels.get(channel, ())):
+            try:
+                subscription._queue.put_nowait((channel, data))
+                self._stats["delivered"] += 1
+            except asyncio.QueueFull:
+                released.extend(self._evict(subscription))
+        PUBSUB_FANOUT_LATENCY.observe(time.perf_counter() - started)
+        return released
+
+    async def _read(self) -> None:
+        pubsub_conn = self._pubsub
+        while pubsub_conn is not None and self._pubsub is pubsub_conn:
+            try:
+                message = await pubsub_conn.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # pragma: no cover - depends on Redis availability
+                self._stats["errors"] += 1
+                await asyncio.sleep(1.0)
+                continue
+            if not message or message.get("type") != "message":
+                continue
+            channel, data = message.get("channel"), message.get("data")
+            if isinstance(channel, bytes):
+                channel = channel.decode()
+            if isinstance(data, bytes):
+                data = data.decode()
+            released = self._dispatch(channel, data if isinstance(data, str) else str(data))
+            if released:
+                async with self._lock:
+                    await self._release([channel for channel in released if channel not in self._channels])
+
+
+class _PendingSubscription:
+    """Awaitable/async context wrapper that attaches a subscription to its hub."""
+
+    def __init__(self, hub: SubscriptionHub, subscription: Subscription):
+        self._hub = hub
+        self._subscription = subscription
+
+    def __await__(self):
+        return self._attached().__await__()
+
+    async def _attached(self) -> Subscription:
+        await self._hub._attach(self._subscription)
+        return self._subscription
+
+    async def __aenter__(self) -> Subscription:
+        return await self._attached()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._subscription.close()
+
+
+_hubs: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, SubscriptionHub]" = weakref.WeakKeyDictionary()
+
+
+def get_subscription_hub() -> SubscriptionHub:
+    """Return the fan-out hub bound to the running event loop."""
+
+    # asyncio queues and Redis connections are loop-bound, so each worker loop keeps its own hub
+    loop = asyncio.get_running_loop()
+    hub = _hubs.get(loop)
+    if hub is None:
+        hub = _hubs[loop] = SubscriptionHub()
+    return hub
+
+
+def hub_stats() -> dict[str, int]:
+    """Aggregate subscriber, channel, message, and eviction counts across live hubs."""
+
+    totals = {"messages": 0, "delivered": 0, "evicted": 0, "errors": 0, "channels": 0, "subscribers": 0}
+    for hub in list(_hubs.values()):
+        for key, value in hub.stats().items():
+            totals[key] += value
+    return totals
+
+
+class BackgroundPublisher:
+    """Publish events from sync code through one long-lived loop and Redis pool."""
+
+    # purpose: replace per-event asyncio.run() calls in Celery workers and sync routes
+    # inputs: (channel, event) pairs enqueued via `publish`
+    # outputs: pipelined Redis PUBLISH batches; stats for published, dropped, and blocked events
+    # status: experimental
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = PUBLISH_QUEUE_SIZE,
+        batch_size: int = PUBLISH_BATCH_SIZE,
+        block_seconds: float = PUBLISH_BLOCK_SECONDS,
+    ):
+        self.batch_size = batch_size
+        self.block_seconds = block_seconds
+        self._queue: queue.Queue[tuple[str, str] | None] = queue.Queue(maxsize)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._stats = {"published": 0, "dropped": 0, "blocked": 0, "batches": 0, "errors": 0}
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[key] += amount
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {**self._stats, "queued": self._queue.qsize()}
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="pubsub-publisher", daemon=True)
+            self._thread.start()
+
+    def publish(self, channel: str, event: dict[str, Any]) -> bool:
+        """Enqueue an event; waits briefly on a full queue, then drops it."""
+
+        self.start()
+        message = (channel, _serialize_event(event))
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            # backpressure: Redis is slower than producers, give the publisher a moment to drain
+            self._count("blocked")
+            try:
+                self._queue.put(message, timeout=self.block_seconds)
+            except queue.Full:
+                self._count("dropped")
+                PUBSUB_EVENTS_DROPPED.labels(reason="queue_full").inc()
+                return False
+        PUBSUB_QUEUE_DEPTH.set(self._queue.qsize())
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until every enqueued event has been handed to Redis."""
+
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def stop(self, timeout: float = 5.0) -> None:
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        with suppress(queue.Full):
+            self._queue.put(None, timeout=timeout)
+        thread.join(timeout)
+
+    def _next_batch(self) -> list[tuple[str, str] | None]:
+        batch = [self._queue.get()]
+        while len(batch) < self.batch_size and batch[-1] is not None:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        client = _create_client(PUBLISHER_MAX_CONNECTIONS)
+        try:
+            while True:
+                batch = self._next_batch()
+                messages = [item for item in batch if item is not None]
+                try:
+                    if messages:
+                        loop.run_until_complete(self._publish_batch(client, messages))
+                        self._count("published", len(messages))
+                        self._count("batches")
+                        PUBSUB_EVENTS_PUBLISHED.inc(len(messages))
+                except Exception:  # pragma: no cover - depends on Redis availability
+                    self._count("errors")
+                    self._count("dropped", len(messages))
+                    PUBSUB_EVENTS_DROPPED.labels(reason="redis_error").inc(len(messages))
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+                    PUBSUB_QUEUE_DEPTH.set(self._queue.qsize())
+                if len(messages) < len(batch):
+                    break
+        finally:
+            with suppress(Exception):
+                loop.run_until_complete(client.aclose())
+            loop.close()
+
+    @staticmethod
+    async def _publish_batch(client, messages: list[tuple[str, str]]) -> None:
+        async with client.pipeline(transaction=False) as pipe:
+            for channel, data in messages:
+                pipe.publish(channel, data)
+            await pipe.execute()
+
+
+_publisher: BackgroundPublisher | None = None
+_publisher_lock = threading.Lock()
+
+
+def get_publisher() -> BackgroundPublisher:
+    """Return the process-wide background publisher."""
+
+    global _publisher
+    with _publisher_lock:
+        if _publisher is None:
+            _publisher = BackgroundPublisher()
+            atexit.register(_publisher.stop)
+        return _publisher
+
+
+def enqueue_planner_event(session_id: str, event: dict[str, Any]) -> bool:
+    """Queue a planner event from sync code; see `publish_planner_event` for async callers."""
+
+    return get_publisher().publish(f"planner:{session_id}", event)
+
+
+def enqueue_governance_event(topic: str, event: dict[str, Any]) -> bool:
+    """Queue a governance event from sync code; see `publish_governance_event` for async callers."""
+
+    return get_publisher().publish(f"governance:{topic}", event)
@@ -200,6 +200,7 @@ def _dispatch_lock_event(topic: str, payload: dict[str, Any]) -> None:
     try:
         loop = asyncio.get_running_loop()
     except RuntimeError:
+        pubsub.enqueue_governance_event(topic, payload)
         return
     try:
         loop.create_task(pubsub.publish_governance_event(topic, payload))
@@ -316,7 +316,7 @@ def resume_cloning_planner_session(
     if planner.created_by_id not in {None, user.id} and not user.is_admin:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access to planner session denied")
     overrides = payload.overrides or {}
-    resume_step = (payload.step or planner.current_step or "primers").lower()
+    resume_step = (payload.step or cloning_planner.resolve_resume_stage(planner)).lower()
     product_size_range = overrides.get("product_size_range")
     size_range: tuple[int, int] | None = None
     if product_size_range and len(product_size_range) == 2:
@@ -15,7 +15,7 @@ from sqlalchemy.orm import Session
 from .. import models, schemas
 from ..auth import get_current_user
 from ..database import get_db
-from ..services import dna_assets
+from ..services import dna_assets, dna_viewer_tiles
 
 router = APIRouter(prefix="/api/dna-assets", tags=["dna-assets"])
 
@@ -137,6 +137,35 @@ def get_dna_asset_viewer(
     return dna_assets.build_viewer_payload(asset, compare_to=compare, db=db)
 
 
+@router.get("/{asset_id}/viewer/tiles", response_model=schemas.DNAViewerTilesResponse)
+def get_dna_asset_viewer_tiles(
+    asset_id: UUID,
+    start: int = Query(default=1, ge=1, description="1-based region start"),
+    end: int | None = Query(default=None, ge=1, description="1-based inclusive region end"),
+    zoom: int | None = Query(default=None, ge=0, description="Zoom level; each bin covers 2**zoom bases"),
+    version_id: UUID | None = Query(default=None, description="Version to tile; defaults to latest"),
+    db: Session = Depends(get_db),
+    user: models.User = Depends(get_current_user),
+) -> schemas.DNAViewerTilesResponse:
+    """Return cached viewer tiles for a region of an asset version."""
+
+    asset = dna_assets.get_asset(db, asset_id)
+    if not asset:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="DNA asset not found")
+    _assert_access(user, asset)
+    version = asset.latest_version
+    if version_id:
+        version = db.get(models.DNAAssetVersion, version_id)
+        if not version or version.asset_id != asset.id:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Version not found")
+    if version is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Asset has no versions")
+    try:
+        return dna_viewer_tiles.build_viewer_tiles(version, start=start, end=end, zoom=zoom)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
 @router.post("/{asset_id}/guardrails", response_model=schemas.DNAAssetGuardrailEventOut, status_code=status.HTTP_201_CREATED)
 def record_dna_asset_guardrail_event(
     asset_id: UUID,
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import copy
 import hashlib
 import io
@@ -3352,10 +3351,7 @@ async def stream_governance_timeline(
         channels.append(f"governance:override:{snapshot['override_id']}:locks")
 
     async def event_iterator() -> AsyncIterator[str]:
-        redis_conn = await pubsub.get_redis()
-        pubsub_conn = redis_conn.pubsub()
-        if channels:
-            await pubsub_conn.subscribe(*channels)
+        subscription = await pubsub.get_subscription_hub().subscribe(*channels)
         initial_payload = {
             "type": "snapshot",
             "execution_id": str(execution_uuid),
@@ -3367,16 +3363,14 @@ async def stream_governance_timeline(
         keepalive_at = datetime.now(timezone.utc)
         try:
             while True:
-                if await request.is_disconnected():
+                if await request.is_disconnected() or subscription.evicted:
                     break
-                message = None
-                if channels:
-                    message = await pubsub_conn.get_message(
-                        ignore_subscribe_messages=True, timeout=1.0
-                    )
-                if message and message.get("type") == "message":
+                # wait on the hub queue until the next cooldown tick instead of polling
+                wait_seconds = max(0.0, 1 - (datetime.now(timezone.utc) - last_tick).total_seconds())
+                message = await subscription.get(timeout=wait_seconds)
+                if message:
                     try:
-                        payload = json.loads(message.get("data"))
+                        payload = json.loads(message[1])
                     except (TypeError, json.JSONDecodeError):  # pragma: no cover - defensive
                         payload = None
                     if isinstance(payload, dict):
@@ -3450,11 +3444,8 @@ async def stream_governance_timeline(
                 if (now_tick - keepalive_at).total_seconds() >= 15:
                     yield ": keep-alive\n\n"
                     keepalive_at = now_tick
-                await asyncio.sleep(0.25)
         finally:
-            if channels:
-                await pubsub_conn.unsubscribe(*channels)
-            await pubsub_conn.close()
+            await subscription.close()
 
     headers = {
         "Cache-Control": "no-cache",
@@ -1,10 +1,9 @@
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Form
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Form, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 import os
 from uuid import uuid4, UUID
-import io
 
-from minio import Minio
 from fastapi.responses import StreamingResponse
 
 from ..sequence import parse_chromatogram, process_sequence_file
@@ -12,31 +11,7 @@ from ..sequence import parse_chromatogram, process_sequence_file
 from ..database import get_db
 from ..auth import get_current_user
 from ..rbac import ensure_item_access
-from .. import models, schemas
-
-UPLOAD_DIR = os.getenv("UPLOAD_DIR", "uploaded_files")
-MINIO_ENDPOINT = os.getenv("MINIO_ENDPOINT")
-MINIO_ACCESS_KEY = os.getenv("MINIO_ACCESS_KEY")
-MINIO_SECRET_KEY = os.getenv("MINIO_SECRET_KEY")
-MINIO_BUCKET = os.getenv("MINIO_BUCKET", "uploads")
-
-# Only initialize MinIO client if all required environment variables are set
-if MINIO_ENDPOINT and MINIO_ACCESS_KEY and MINIO_SECRET_KEY and MINIO_ENDPOINT.strip():
-    try:
-        minio_client = Minio(
-            MINIO_ENDPOINT.strip(),
-            access_key=MINIO_ACCESS_KEY,
-            secret_key=MINIO_SECRET_KEY,
-            secure=MINIO_ENDPOINT.strip().startswith("https"),
-        )
-        if not minio_client.bucket_exists(MINIO_BUCKET):
-            minio_client.make_bucket(MINIO_BUCKET)
-    except Exception as e:
-        print(f"Failed to initialize MinIO client: {e}")
-        minio_client = None
-else:
-    os.makedirs(UPLOAD_DIR, exist_ok=True)
-    minio_client = None
+from .. import models, schemas, storage
 
 router = APIRouter(prefix="/api/files", tags=["files"])
 
@@ -56,33 +31,24 @@ async def upload_file(
 
     file_id = uuid4()
     safe_name = os.path.basename(upload.filename)
-    object_name = f"{file_id}_{safe_name}"
-    data = await upload.read()
-    if MINIO_ENDPOINT:
-        minio_client.put_object(
-            MINIO_BUCKET,
-            object_name,
-            io.BytesIO(data),
-            length=len(data),
-            content_type=upload.content_type or "application/octet-stream",
-        )
-        storage_path = f"s3://{MINIO_BUCKET}/{object_name}"
-        file_size = len(data)
-    else:
-        save_path = os.path.join(UPLOAD_DIR, object_name)
-        with open(save_path, "wb") as f:
-            f.write(data)
-        storage_path = save_path
-        file_size = upload.size or 0
+    # UploadFile spools to disk; copy it to storage in chunks, hashing as we go
+    stored = await run_in_threadpool(
+        storage.save_stream,
+        upload.file,
+        safe_name,
+        content_type=upload.content_type or "application/octet-stream",
+        object_name=f"{file_id}_{safe_name}",
+    )
 
     db_file = models.File(
         id=file_id,
         item_id=item_uuid,
         filename=upload.filename,
         file_type=upload.content_type or "application/octet-stream",
-        file_size=file_size,
-        storage_path=storage_path,
+        file_size=stored.size,
+        storage_path=stored.storage_path,
         uploaded_by=user.id,
+        meta={"checksum": stored.checksum, "checksum_algorithm": stored.algorithm},
     )
     db.add(db_file)
     db.commit()
@@ -107,6 +73,7 @@ async def list_files(
 @router.get("/{file_id}/download")
 async def download_file(
     file_id: str,
+    request: Request,
     db: Session = Depends(get_db),
     user: models.User = Depends(get_current_user),
 ):
@@ -118,12 +85,38 @@ async def download_file(
     if not db_file:
         raise HTTPException(status_code=404, detail="File not found")
     ensure_item_access(db, user, db_file.item_id)
-    if MINIO_ENDPOINT:
-        data = minio_client.get_object(MINIO_BUCKET, db_file.storage_path.split("/")[-1]).read()
-    else:
-        with open(db_file.storage_path, "rb") as fh:
-            data = fh.read()
-    return StreamingResponse(io.BytesIO(data), media_type=db_file.file_type, headers={"Content-Disposition": f"attachment; filename={db_file.filename}"})
+    try:
+        size = await run_in_threadpool(storage.stat_payload, db_file.storage_path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Stored file missing")
+    headers = {
+        "Content-Disposition": f"attachment; filename={db_file.filename}",
+        "Accept-Ranges": "bytes",
+    }
+    try:
+        byte_range = storage.parse_range(request.headers.get("range"), size)
+    except ValueError:
+        raise HTTPException(
+            status_code=416,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    if byte_range is None:
+        headers["Content-Length"] = str(size)
+        return StreamingResponse(
+            storage.open_stream(db_file.storage_path),
+            media_type=db_file.file_type,
+            headers=headers,
+        )
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        storage.open_stream(db_file.storage_path, start=start, end=end),
+        status_code=206,
+        media_type=db_file.file_type,
+        headers=headers,
+    )
 
 
 @router.get("/{file_id}/chromatogram", response_model=schemas.ChromatogramOut)
@@ -140,11 +133,7 @@ async def file_chromatogram(
     if not db_file:
         raise HTTPException(status_code=404, detail="File not found")
     ensure_item_access(db, user, db_file.item_id)
-    if MINIO_ENDPOINT:
-        data = minio_client.get_object(MINIO_BUCKET, db_file.storage_path.split("/")[-1]).read()
-    else:
-        with open(db_file.storage_path, "rb") as fh:
-            data = fh.read()
+    data = await run_in_threadpool(storage.load_binary_payload, db_file.storage_path)
     try:
         return parse_chromatogram(data)
     except Exception:
@@ -166,11 +155,7 @@ async def file_sequence(
     if not db_file:
         raise HTTPException(status_code=404, detail="File not found")
     ensure_item_access(db, user, db_file.item_id)
-    if MINIO_ENDPOINT:
-        data = minio_client.get_object(MINIO_BUCKET, db_file.storage_path.split("/")[-1]).read()
-    else:
-        with open(db_file.storage_path, "rb") as fh:
-            data = fh.read()
+    data = await run_in_threadpool(storage.load_binary_payload, db_file.storage_path)
     fmt = format
     if not fmt:
         ext = db_file.filename.rsplit(".", 1)[-1].lower()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -230,7 +231,6 @@ def create_telemetry_sample(
     try:
         sample = instrumentation.record_telemetry_sample(db, run_id, payload)
         db.commit()
-        db.refresh(sample)
     except instrumentation.GuardrailViolation as exc:
         db.rollback()
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
@@ -240,6 +240,35 @@ def create_telemetry_sample(
     return sample
 
 
+@router.post(
+    "/runs/{run_id}/telemetry/batch",
+    status_code=status.HTTP_201_CREATED,
+    response_model=schemas.InstrumentTelemetryBatchResult,
+)
+def create_telemetry_batch(
+    run_id: UUID,
+    payload: schemas.InstrumentTelemetryBatchCreate,
+    db: Session = Depends(get_db),
+    user: models.User = Depends(get_current_user),
+):
+    run = db.get(models.InstrumentRun, run_id)
+    if not run:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="run not found")
+    team_scope = run.team_id or _resolve_equipment_team(db, run.equipment_id)
+    if team_scope:
+        check_team_role(db, user, team_scope, ["member", "manager", "owner"])
+    try:
+        result = instrumentation.record_telemetry_batch(db, run_id, payload)
+        db.commit()
+    except instrumentation.GuardrailViolation as exc:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+    except instrumentation.InstrumentNotFound as exc:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    return result
+
+
 @router.get("/runs", response_model=list[schemas.InstrumentRunOut])
 def list_runs(
     equipment_id: UUID | None = None,
@@ -267,6 +296,14 @@ def list_runs(
 )
 def get_run_telemetry(
     run_id: UUID,
+    channel: list[str] | None = Query(default=None),
+    start: datetime | None = None,
+    end: datetime | None = None,
+    cursor: str | None = None,
+    limit: int | None = Query(default=None, ge=1, le=instrumentation.TELEMETRY_MAX_PAGE_SIZE),
+    max_points: int | None = Query(default=None, ge=2, le=instrumentation.TELEMETRY_MAX_PAGE_SIZE),
+    downsample: str = Query(default="stride", pattern="^(stride|lttb)$"),
+    field: str | None = None,
     db: Session = Depends(get_db),
     user: models.User = Depends(get_current_user),
 ):
@@ -277,9 +314,58 @@ def get_run_telemetry(
     if team_scope:
         check_team_role(db, user, team_scope, ["member", "manager", "owner"])
     try:
-        return instrumentation.load_run_envelope(db, run_id)
+        return instrumentation.load_run_envelope(
+            db,
+            run_id,
+            channels=channel,
+            start=start,
+            end=end,
+            cursor=cursor,
+            limit=limit,
+            max_points=max_points,
+            downsample=downsample,
+            field=field,
+        )
     except instrumentation.InstrumentNotFound as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+@router.get(
+    "/runs/{run_id}/telemetry/rollups",
+    response_model=schemas.InstrumentTelemetryRollupEnvelope,
+)
+def get_run_telemetry_rollups(
+    run_id: UUID,
+    width: int = Query(default=800, ge=1, le=10000),
+    channel: list[str] | None = Query(default=None),
+    start: datetime | None = None,
+    end: datetime | None = None,
+    tier: int | None = Query(default=None, ge=1),
+    db: Session = Depends(get_db),
+    user: models.User = Depends(get_current_user),
+):
+    run = db.get(models.InstrumentRun, run_id)
+    if not run:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="run not found")
+    team_scope = run.team_id or _resolve_equipment_team(db, run.equipment_id)
+    if team_scope:
+        check_team_role(db, user, team_scope, ["member", "manager", "owner"])
+    try:
+        return instrumentation.load_run_rollups(
+            db,
+            run_id,
+            width=width,
+            channels=channel,
+            start=start,
+            end=end,
+            tier_seconds=tier,
+        )
+    except instrumentation.InstrumentNotFound as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
 
 def _resolve_equipment_team(db: Session, equipment_id: UUID) -> UUID | None:
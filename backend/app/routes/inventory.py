@@ -1,18 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException, Response, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Response, UploadFile, File, Query
 import json
 from sqlalchemy.orm import Session
 import sqlalchemy as sa
 from typing import Any, List, Optional
 import csv
 import io
-from uuid import UUID
+from uuid import UUID, uuid4
 from datetime import datetime
 
-from ..database import get_db
-from ..auth import get_current_user
-from .. import models, schemas, pubsub, search, barcodes, audit
-from ..services import sample_governance
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database import get_async_db, get_db
+from ..auth import get_current_user, get_current_user_async
+from .. import models, schemas, pubsub, search, barcodes, audit, storage
+from ..services import inventory_bulk, inventory_export, inventory_graph, inventory_listing, sample_governance
 from ..rbac import check_team_role, ensure_item_access
+from ..tasks import enqueue_inventory_import
 
 
 async def get_item_and_check_permission(
@@ -72,8 +79,17 @@ async def create_item(
     return db_item
 
 
+def _visible_items_filter(user: models.User):
+    # purpose: restrict inventory reads to owned items and the caller's teams
+    team_ids = [m.team_id for m in user.teams]
+    return (models.InventoryItem.owner_id == user.id) | (
+        models.InventoryItem.team_id.in_(team_ids)
+    )
+
+
 @router.get("/items", response_model=List[schemas.InventoryItemOut])
 async def list_items(
+    response: Response,
     item_type: Optional[str] = None,
     name: Optional[str] = None,
     barcode: Optional[str] = None,
@@ -82,74 +98,107 @@ async def list_items(
     created_from: Optional[str] = None,
     created_to: Optional[str] = None,
     custom: Optional[str] = None,
-    db: Session = Depends(get_db),
-    user: models.User = Depends(get_current_user),
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+    fields: Optional[str] = None,
+    count: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+    user: models.User = Depends(get_current_user_async),
 ):
-    query = db.query(models.InventoryItem)
+    # pages are keyset-ordered by (created_at, id); the body stays a list and the cursor for
+    # the next page travels in X-Next-Cursor, with X-Total-Count when count=exact|estimate
+    try:
+        page_size = inventory_listing.page_size(limit)
+        projection = inventory_listing.parse_fields(fields)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    query = sa.select(models.InventoryItem)
     if not user.is_admin:
-        team_ids = [m.team_id for m in user.teams]
-        query = query.filter(
-            (models.InventoryItem.owner_id == user.id)
-            | (models.InventoryItem.team_id.in_(team_ids))
-        )
+        query = query.where(_visible_items_filter(user))
     if item_type:
-        query = query.filter(models.InventoryItem.item_type == item_type)
+        query = query.where(models.InventoryItem.item_type == item_type)
     if name:
-        query = query.filter(models.InventoryItem.name.ilike(f"%{name}%"))
+        query = query.where(models.InventoryItem.name.ilike(f"%{name}%"))
     if barcode:
-        query = query.filter(models.InventoryItem.barcode == barcode)
+        query = query.where(models.InventoryItem.barcode == barcode)
     if status:
-        query = query.filter(models.InventoryItem.status == status)
+        query = query.where(models.InventoryItem.status == status)
     if team_id:
         try:
             team_uuid = UUID(team_id)
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid team id")
-        query = query.filter(models.InventoryItem.team_id == team_uuid)
+        query = query.where(models.InventoryItem.team_id == team_uuid)
     if created_from:
         try:
             dt_from = datetime.fromisoformat(created_from)
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid created_from")
-        query = query.filter(models.InventoryItem.created_at >= dt_from)
+        query = query.where(models.InventoryItem.created_at >= dt_from)
     if created_to:
         try:
             dt_to = datetime.fromisoformat(created_to)
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid created_to")
-        query = query.filter(models.InventoryItem.created_at <= dt_to)
+        query = query.where(models.InventoryItem.created_at <= dt_to)
     if custom:
         try:
             data = json.loads(custom)
         except json.JSONDecodeError:
             raise HTTPException(status_code=400, detail="Invalid custom filter")
-        query = query.filter(models.InventoryItem.custom_data.contains(data))
-    return query.all()
+        query = query.where(models.InventoryItem.custom_data.contains(data))
+    headers = {}
+    try:
+        if count:
+            total, estimated = await inventory_listing.count_items(db, query, count)
+            headers["X-Total-Count"] = str(total)
+            headers["X-Total-Count-Estimated"] = "true" if estimated else "false"
+        page = inventory_listing.paginate(query, cursor, page_size)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if projection:
+        page = page.with_only_columns(
+            *(getattr(models.InventoryItem, name) for name in projection)
+        )
+        rows = (await db.execute(page)).all()
+    else:
+        rows = (await db.execute(page)).scalars().all()
+    token = inventory_listing.next_cursor(rows, page_size)
+    if token:
+        headers["X-Next-Cursor"] = token
+    rows = rows[:page_size]
+    if projection:
+        return JSONResponse(
+            jsonable_encoder([dict(row._mapping) for row in rows]), headers=headers
+        )
+    response.headers.update(headers)
+    return rows
 
 
 @router.get("/facets", response_model=schemas.InventoryFacets)
 async def get_facets(
-    db: Session = Depends(get_db),
-    user: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    user: models.User = Depends(get_current_user_async),
 ):
-    team_ids = [m.team_id for m in user.teams]
-    query = db.query(models.InventoryItem)
-    if not user.is_admin:
-        query = query.filter(
-            (models.InventoryItem.owner_id == user.id)
-            | (models.InventoryItem.team_id.in_(team_ids))
-        )
-    else:
+    visible = sa.true() if user.is_admin else _visible_items_filter(user)
+    if user.is_admin:
         # admin can access all teams
-        team_ids = [t.id for t in db.query(models.Team.id).all()]
+        team_ids = list((await db.execute(sa.select(models.Team.id))).scalars())
+    else:
+        team_ids = [m.team_id for m in user.teams]
     # Get all item types from the table
-    all_types = db.query(models.ItemType).order_by(models.ItemType.name).all()
+    all_types = (
+        await db.execute(sa.select(models.ItemType).order_by(models.ItemType.name))
+    ).scalars().all()
+
+    async def _grouped(column):
+        rows = await db.execute(
+            sa.select(column, sa.func.count()).where(visible).group_by(column)
+        )
+        return rows.all()
+
     # Count usage for each type scoped to the user's visibility
-    type_counts = dict(
-        query.with_entities(models.InventoryItem.item_type, sa.func.count())
-        .group_by(models.InventoryItem.item_type)
-        .all()
-    )
+    type_counts = dict(await _grouped(models.InventoryItem.item_type))
     observed_keys = {key for key in type_counts.keys() if key}
     declared_keys = {it.name for it in all_types}
     combined_keys = sorted(declared_keys | observed_keys)
@@ -157,30 +206,26 @@ async def get_facets(
         schemas.FacetCount(key=key, count=type_counts.get(key, 0))
         for key in combined_keys
     ]
-    statuses = (
-        query.with_entities(models.InventoryItem.status, sa.func.count())
-        .group_by(models.InventoryItem.status)
-        .all()
-    )
-    teams = (
-        query.with_entities(models.InventoryItem.team_id, sa.func.count())
-        .group_by(models.InventoryItem.team_id)
-        .all()
-    )
+    statuses = await _grouped(models.InventoryItem.status)
+    teams = await _grouped(models.InventoryItem.team_id)
     team_names = {
         str(t.id): t.name
-        for t in db.query(models.Team).filter(
-            models.Team.id.in_([t[0] for t in teams if t[0]])
-        ).all()
+        for t in (
+            await db.execute(
+                sa.select(models.Team).where(
+                    models.Team.id.in_([t[0] for t in teams if t[0]])
+                )
+            )
+        ).scalars()
     }
     fields = (
-        db.query(models.FieldDefinition)
-        .filter(
-            (models.FieldDefinition.team_id.is_(None))
-            | (models.FieldDefinition.team_id.in_(team_ids))
+        await db.execute(
+            sa.select(models.FieldDefinition).where(
+                (models.FieldDefinition.team_id.is_(None))
+                | (models.FieldDefinition.team_id.in_(team_ids))
+            )
         )
-        .all()
-    )
+    ).scalars().all()
     return schemas.InventoryFacets(
         item_types=item_types,
         statuses=[schemas.FacetCount(key=st[0], count=st[1]) for st in statuses],
@@ -197,53 +242,31 @@ async def get_facets(
 
 @router.get("/export")
 async def export_items(
-    db: Session = Depends(get_db),
+    export_format: str = Query("csv", alias="format"),
     user: models.User = Depends(get_current_user),
 ):
-    query = db.query(models.InventoryItem)
-    if not user.is_admin:
-        team_ids = [m.team_id for m in user.teams]
-        query = query.filter(
-            (models.InventoryItem.owner_id == user.id)
-            | (models.InventoryItem.team_id.in_(team_ids))
+    # rows stream from a server-side cursor in batches; nothing is materialized up front
+    # resolve the visibility scope now: the body runs on its own session after this one is gone
+    team_ids = None if user.is_admin else [membership.team_id for membership in user.teams]
+    if export_format == "csv":
+        return StreamingResponse(
+            inventory_export.iter_csv(user.id, team_ids),
+            media_type="text/csv",
+            headers={
+                "Content-Disposition": "attachment; filename=inventory_export.csv"
+            },
         )
-    items = query.order_by(models.InventoryItem.created_at.asc()).all()
-
-    buffer = io.StringIO()
-    writer = csv.writer(buffer)
-    writer.writerow(
-        [
-            "id",
-            "item_type",
-            "name",
-            "status",
-            "barcode",
-            "team_id",
-            "owner_id",
-            "created_at",
-        ]
-    )
-    for item in items:
-        writer.writerow(
-            [
-                str(item.id),
-                item.item_type,
-                item.name,
-                item.status,
-                item.barcode or "",
-                str(item.team_id) if item.team_id else "",
-                str(item.owner_id) if item.owner_id else "",
-                item.created_at.isoformat() if item.created_at else "",
-            ]
+    if export_format == "parquet":
+        if not inventory_export.parquet_supported():
+            raise HTTPException(status_code=501, detail="Parquet export requires pyarrow")
+        return StreamingResponse(
+            inventory_export.iter_parquet(user.id, team_ids),
+            media_type="application/vnd.apache.parquet",
+            headers={
+                "Content-Disposition": "attachment; filename=inventory_export.parquet"
+            },
         )
-
-    return Response(
-        content=buffer.getvalue(),
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": "attachment; filename=inventory_export.csv"
-        },
-    )
+    raise HTTPException(status_code=400, detail="Unsupported export format")
 
 
 @router.post("/import", response_model=List[schemas.InventoryItemOut])
@@ -279,6 +302,56 @@ async def import_items(
     return items
 
 
+@router.post("/import/jobs", response_model=schemas.InventoryImportJobOut, status_code=202)
+async def create_import_job(
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    user: models.User = Depends(get_current_user),
+):
+    job_id = uuid4()
+    filename = file.filename or "inventory.csv"
+    stored = await run_in_threadpool(
+        storage.save_stream,
+        file.file,
+        filename,
+        content_type="text/csv",
+        namespace=f"inventory-imports/{job_id}",
+    )
+    job = models.InventoryImportJob(
+        id=job_id,
+        user_id=user.id,
+        team_id=user.teams[0].team_id if user.teams else None,
+        status="pending",
+        filename=filename,
+        storage_path=stored.storage_path,
+        progress={"rows": 0, "created": 0, "failed": 0, "bytes_read": 0, "total_bytes": stored.size},
+    )
+    db.add(job)
+    db.commit()
+    await run_in_threadpool(enqueue_inventory_import, str(job_id))
+    db.refresh(job)
+    return job
+
+
+@router.get("/import/jobs/{job_id}", response_model=schemas.InventoryImportJobOut)
+async def get_import_job(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    user: models.User = Depends(get_current_user),
+):
+    job = (
+        db.query(models.InventoryImportJob)
+        .filter(
+            models.InventoryImportJob.id == job_id,
+            models.InventoryImportJob.user_id == user.id,
+        )
+        .first()
+    )
+    if not job:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return job
+
+
 @router.put("/items/{item_id}", response_model=schemas.InventoryItemOut)
 async def update_item(
     item: schemas.InventoryItemUpdate,
@@ -286,10 +359,14 @@ async def update_item(
     db: Session = Depends(get_db),
     user: models.User = Depends(get_current_user),
 ):
+    previous_team_id = db_item.team_id
     for key, value in item.model_dump(exclude_unset=True).items():
         setattr(db_item, key, value)
     db.commit()
     db.refresh(db_item)
+    if db_item.team_id != previous_team_id:
+        # both teams' cached adjacency still reflects the old membership
+        inventory_graph.get_adjacency_cache().invalidate([previous_team_id, db_item.team_id])
     audit.log_action(db, str(user.id), "update_item", "inventory", str(db_item.id))
     if db_item.team_id:
         await pubsub.publish_team_event(
@@ -307,6 +384,7 @@ async def delete_item(
 ):
     db.delete(db_item)
     db.commit()
+    inventory_graph.get_adjacency_cache().invalidate([db_item.team_id])
     audit.log_action(db, str(user.id), "delete_item", "inventory", str(db_item.id))
     search.delete_item(str(db_item.id))
     if db_item.team_id:
@@ -323,11 +401,12 @@ async def create_relationship(
     db: Session = Depends(get_db),
     user: models.User = Depends(get_current_user),
 ):
-    ensure_item_access(db, user, rel.from_item, roles=("manager", "owner"))
-    ensure_item_access(db, user, rel.to_item, roles=("manager", "owner"))
+    from_item = ensure_item_access(db, user, rel.from_item, roles=("manager", "owner"))
+    to_item = ensure_item_access(db, user, rel.to_item, roles=("manager", "owner"))
     db_rel = models.ItemRelationship(**rel.model_dump())
     db.add(db_rel)
     db.commit()
+    inventory_graph.get_adjacency_cache().invalidate([from_item.team_id, to_item.team_id])
     db.refresh(db_rel)
     return db_rel
 
@@ -368,38 +447,11 @@ async def relationship_graph(
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid item id")
     ensure_item_access(db, user, start_id)
-
-    visited = set()
-    nodes = []
-    edges = []
-    queue = [(start_id, 0)]
-    while queue:
-        current_id, level = queue.pop(0)
-        if current_id in visited or level > depth:
-            continue
-        visited.add(current_id)
-        item = (
-            db.query(models.InventoryItem)
-            .filter(models.InventoryItem.id == current_id)
-            .first()
-        )
-        if item:
-            nodes.append(item)
-        rels = (
-            db.query(models.ItemRelationship)
-            .filter(
-                (models.ItemRelationship.from_item == current_id)
-                | (models.ItemRelationship.to_item == current_id)
-            )
-            .all()
-        )
-        for rel in rels:
-            edges.append(rel)
-            other_id = rel.to_item if rel.from_item == current_id else rel.from_item
-            if other_id not in visited:
-                queue.append((other_id, level + 1))
-
-    return {"nodes": nodes, "edges": edges}
+    try:
+        graph = inventory_graph.build_item_graph(db, start_id, depth)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return {"nodes": graph.nodes, "edges": graph.edges, "truncated": graph.truncated}
 
 
 @router.post("/items/{item_id}/barcode")
@@ -430,54 +482,16 @@ async def bulk_update_items(
     db: Session = Depends(get_db),
     user: models.User = Depends(get_current_user),
 ):
-    results = []
-    successful = 0
-    failed = 0
-    
-    for item_update in request.items:
-        try:
-            # Check permissions
-            item = ensure_item_access(db, user, item_update.id, roles=("manager", "owner"))
-            
-            # Apply updates
-            for key, value in item_update.data.model_dump(exclude_unset=True).items():
-                setattr(item, key, value)
-            
-            db.commit()
-            db.refresh(item)
-            
-            # Audit and search indexing
-            audit.log_action(db, str(user.id), "bulk_update_item", "inventory", str(item.id))
-            search.index_item(item)
-            
-            # Publish team event if applicable
-            if item.team_id:
-                await pubsub.publish_team_event(
-                    str(item.team_id),
-                    {"type": "item_updated", "id": str(item.id)},
-                )
-            
-            results.append(schemas.BulkOperationResult(
-                success=True,
-                item_id=item_update.id
-            ))
-            successful += 1
-            
-        except Exception as e:
-            db.rollback()
-            results.append(schemas.BulkOperationResult(
-                success=False,
-                item_id=item_update.id,
-                error=str(e)
-            ))
-            failed += 1
-    
-    return schemas.BulkOperationResponse(
-        results=results,
-        total=len(request.items),
-        successful=successful,
-        failed=failed
+    outcome = inventory_bulk.bulk_update_items(db, user, request.items)
+    inventory_graph.get_adjacency_cache().invalidate(outcome.moved_teams)
+    search.bulk_index_items(outcome.items)
+    await pubsub.publish_team_events(
+        {
+            str(team_id): {"type": "items_updated", "ids": [str(item_id) for item_id in item_ids]}
+            for team_id, item_ids in outcome.team_items.items()
+        }
     )
+    return outcome.response()
 
 
 @router.post("/bulk/delete", response_model=schemas.BulkOperationResponse)
@@ -486,51 +500,16 @@ async def bulk_delete_items(
     db: Session = Depends(get_db),
     user: models.User = Depends(get_current_user),
 ):
-    results = []
-    successful = 0
-    failed = 0
-    
-    for item_id in request.item_ids:
-        try:
-            # Check permissions
-            item = ensure_item_access(db, user, item_id, roles=("manager", "owner"))
-            
-            # Delete item
-            db.delete(item)
-            db.commit()
-            
-            # Audit and search cleanup
-            audit.log_action(db, str(user.id), "bulk_delete_item", "inventory", str(item_id))
-            search.delete_item(str(item_id))
-            
-            # Publish team event if applicable
-            if item.team_id:
-                await pubsub.publish_team_event(
-                    str(item.team_id),
-                    {"type": "item_deleted", "id": str(item_id)},
-                )
-            
-            results.append(schemas.BulkOperationResult(
-                success=True,
-                item_id=item_id
-            ))
-            successful += 1
-            
-        except Exception as e:
-            db.rollback()
-            results.append(schemas.BulkOperationResult(
-                success=False,
-                item_id=item_id,
-                error=str(e)
-            ))
-            failed += 1
-    
-    return schemas.BulkOperationResponse(
-        results=results,
-        total=len(request.item_ids),
-        successful=successful,
-        failed=failed
+    outcome = inventory_bulk.bulk_delete_items(db, user, request.item_ids)
+    inventory_graph.get_adjacency_cache().invalidate(outcome.team_items)
+    search.bulk_delete_items(str(item_id) for item_id in outcome.applied)
+    await pubsub.publish_team_events(
+        {
+            str(team_id): {"type": "items_deleted", "ids": [str(item_id) for item_id in item_ids]}
+            for team_id, item_ids in outcome.team_items.items()
+        }
     )
+    return outcome.response()
 
 
 @router.get("/item-types", response_model=List[schemas.ItemTypeOut])
@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from uuid import UUID
 from datetime import datetime, timezone
 
-from ..database import get_db
-from ..auth import get_current_user
+from ..database import get_async_db, get_db
+from ..auth import get_current_user, get_current_user_async
 from .. import models, schemas
 from ..eventlog import record_execution_event
 
@@ -38,10 +40,11 @@ async def create_entry(
 
 @router.get("/entries", response_model=list[schemas.NotebookEntryOut])
 async def list_entries(
-    db: Session = Depends(get_db),
-    user: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    user: models.User = Depends(get_current_user_async),
 ):
-    return db.query(models.NotebookEntry).all()
+    result = await db.execute(select(models.NotebookEntry))
+    return result.scalars().all()
 
 
 @router.get("/entries/evidence", response_model=schemas.NarrativeEvidencePage)
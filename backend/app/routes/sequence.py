@@ -1,10 +1,15 @@
 from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from ..auth import get_current_user
-from .. import models, schemas
+from .. import models, schemas, storage
 from ..database import get_db
 from ..services import billing as billing_service
+from ..services.sequence_alignment import AlignmentBudgetExceeded
+from ..services.sequence_search import search_library
 from ..sequence import (
     process_sequence_file,
     align_sequences,
@@ -14,8 +19,9 @@ from ..sequence import (
     parse_chromatogram,
     blast_search,
 )
+from ..storage import load_binary_payload
 from ..tasks import enqueue_analyze_sequence_job
-from uuid import UUID
+from uuid import UUID, uuid4
 
 router = APIRouter(prefix="/api/sequence", tags=["sequence"])
 
@@ -39,15 +45,38 @@ async def align(
     db: Session = Depends(get_db),
     user: models.User = Depends(get_current_user),
 ):
-    return align_sequences(payload.seq1, payload.seq2, payload.mode)
+    try:
+        # CPU-bound for up to the alignment time budget; keep it off the event loop
+        return await run_in_threadpool(
+            align_sequences, payload.seq1, payload.seq2, payload.mode, payload.band
+        )
+    except AlignmentBudgetExceeded as exc:
+        raise HTTPException(status_code=413, detail=str(exc))
 
 
-@router.post("/blast", response_model=schemas.BlastSearchOut)
+@router.post(
+    "/blast",
+    response_model=schemas.BlastSearchOut | schemas.BlastLibrarySearchOut,
+)
 async def blast(
     payload: schemas.BlastSearchIn,
     db: Session = Depends(get_db),
     user: models.User = Depends(get_current_user),
 ):
+    if payload.search_library:
+        version_ids = None
+        if not user.is_admin:
+            version_ids = db.scalars(
+                select(models.DNAAssetVersion.id)
+                .join(models.DNAAsset, models.DNAAsset.id == models.DNAAssetVersion.asset_id)
+                .where(models.DNAAsset.created_by_id == user.id)
+            ).all()
+        hits = await run_in_threadpool(
+            search_library, db, payload.query, top_n=payload.top_n, version_ids=version_ids
+        )
+        return {"query_length": len(payload.query), "hits": hits}
+    if not payload.subject:
+        raise HTTPException(status_code=400, detail="subject is required unless search_library is set")
     return blast_search(payload.query, payload.subject)
 
 
@@ -70,7 +99,7 @@ async def restriction(
     user: models.User = Depends(get_current_user),
 ):
     try:
-        mapping = restriction_map(payload.sequence, payload.enzymes)
+        mapping = restriction_map(payload.sequence, payload.enzymes, payload.circular)
         return {"map": mapping}
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid input")
@@ -112,14 +141,30 @@ async def create_analysis_job(
     db: Session = Depends(get_db),
     user: models.User = Depends(get_current_user),
 ):
-    data = await upload.read()
-    job = models.SequenceAnalysisJob(user_id=user.id, format=format, result=None)
+    job_id = uuid4()
+    filename = upload.filename or f"upload.{format}"
+    # the worker re-reads the upload from storage, so only its locator crosses the broker
+    stored = await run_in_threadpool(
+        storage.save_stream,
+        upload.file,
+        filename,
+        content_type=upload.content_type or "text/plain",
+        # kept apart from sequence-jobs/{job_id}, which holds spilled results; the task deletes it
+        namespace=f"sequence-uploads/{job_id}",
+    )
+    job = models.SequenceAnalysisJob(
+        id=job_id,
+        user_id=user.id,
+        format=format,
+        result=None,
+        progress={"records": 0, "bytes_read": 0, "total_bytes": stored.size},
+    )
     db.add(job)
     db.flush()
     _emit_sequence_usage_event(db, user, job)
     db.commit()
+    await run_in_threadpool(enqueue_analyze_sequence_job, str(job_id), stored.storage_path, format)
     db.refresh(job)
-    enqueue_analyze_sequence_job(str(job.id), data, format)
     return job
 
 
@@ -137,12 +182,7 @@ async def list_analysis_jobs(
     return jobs
 
 
-@router.get("/jobs/{job_id}", response_model=schemas.SequenceJobOut)
-async def get_analysis_job(
-    job_id: str,
-    db: Session = Depends(get_db),
-    user: models.User = Depends(get_current_user),
-):
+def _get_owned_job(job_id: str, db: Session, user: models.User) -> models.SequenceAnalysisJob:
     try:
         job_uuid = UUID(job_id)
     except ValueError:
@@ -160,6 +200,52 @@ async def get_analysis_job(
     return job
 
 
+@router.get("/jobs/{job_id}", response_model=schemas.SequenceJobOut)
+async def get_analysis_job(
+    job_id: str,
+    db: Session = Depends(get_db),
+    user: models.User = Depends(get_current_user),
+):
+    job = _get_owned_job(job_id, db, user)
+    out = schemas.SequenceJobOut.model_validate(job)
+    if job.result is None and job.chunks:
+        # streamed jobs: concatenate the chunks flushed so far
+        out.result = [
+            schemas.SequenceRead.model_validate(record) for chunk in job.chunks for record in chunk.records
+        ]
+    return out
+
+
+@router.get("/jobs/{job_id}/records/{index}/sequence", response_class=PlainTextResponse)
+async def get_analysis_job_sequence(
+    job_id: str,
+    index: int,
+    db: Session = Depends(get_db),
+    user: models.User = Depends(get_current_user),
+):
+    job = _get_owned_job(job_id, db, user)
+    record = None
+    if index >= 0 and job.result:
+        record = job.result[index] if index < len(job.result) else None
+    elif index >= 0:
+        chunk = (
+            db.query(models.SequenceJobChunk)
+            .filter(
+                models.SequenceJobChunk.job_id == job.id,
+                models.SequenceJobChunk.start_index <= index,
+            )
+            .order_by(models.SequenceJobChunk.start_index.desc())
+            .first()
+        )
+        if chunk and index - chunk.start_index < len(chunk.records):
+            record = chunk.records[index - chunk.start_index]
+    if record is None:
+        raise HTTPException(status_code=404, detail="Record not found")
+    if record.get("sequence_path"):
+        return load_binary_payload(record["sequence_path"]).decode("utf-8")
+    return record.get("seq", "")
+
+
 def _emit_sequence_usage_event(db: Session, user: models.User, job: models.SequenceAnalysisJob) -> None:
     team_id, organization_id = _resolve_user_team_scope(db, user)
     if not organization_id:
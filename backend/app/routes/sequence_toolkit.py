@@ -1,14 +1,16 @@
-"""Sequence toolkit API surface exposing preset catalogs."""
+"""Sequence toolkit API surface exposing preset catalogs and batch primer design."""
 
-# purpose: provide HTTP access to sequence toolkit preset metadata for planners
+# purpose: provide HTTP access to sequence toolkit preset metadata and batch design for planners
 # status: experimental
 # depends_on: backend.app.services.sequence_toolkit, backend.app.schemas.sequence_toolkit
 
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 
 from .. import schemas
 from ..auth import get_current_user
@@ -34,3 +36,28 @@ def list_sequence_toolkit_presets(
         count=len(presets),
         generated_at=datetime.now(timezone.utc),
     )
+
+
+@router.post("/primers/batch", response_class=StreamingResponse)
+def design_primers_batch(
+    payload: schemas.PrimerDesignBatchRequest,
+    user=Depends(get_current_user),  # noqa: U100 - enforces authentication
+) -> StreamingResponse:
+    """Stream per-template primer designs as NDJSON while the process pool works."""
+
+    # purpose: let cloning campaigns submit hundreds of templates without serial latency
+    # outputs: one JSON line per template as it completes, then a summary line
+    templates = [template.model_dump() for template in payload.templates]
+
+    def line_iterator():
+        for envelope in sequence_toolkit.design_primers_batch(
+            templates,
+            config=payload.config,
+            product_size_range=payload.product_size_range,
+            target_tm=payload.target_tm,
+            preset_id=payload.preset_id,
+            max_workers=payload.max_workers,
+        ):
+            yield json.dumps(envelope, default=str) + "\n"
+
+    return StreamingResponse(line_iterator(), media_type="application/x-ndjson")
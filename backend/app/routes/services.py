@@ -5,11 +5,11 @@ from sqlalchemy.orm import Session
 
 from ..database import get_db
 from ..auth import get_current_user
-from .. import models, schemas
-from .files import MINIO_ENDPOINT, minio_client, UPLOAD_DIR, MINIO_BUCKET
-import os, io
+from .. import models, schemas, storage
+import os
 from uuid import uuid4
 from fastapi import UploadFile, File
+from fastapi.concurrency import run_in_threadpool
 
 router = APIRouter(prefix="/api/services", tags=["services"])
 
@@ -144,33 +144,21 @@ async def deliver_service_result(
 
     file_id = uuid4()
     safe_name = os.path.basename(upload.filename)
-    object_name = f"{file_id}_{safe_name}"
-    data = await upload.read()
-    if MINIO_ENDPOINT:
-        minio_client.put_object(
-            MINIO_BUCKET,
-            object_name,
-            io.BytesIO(data),
-            length=len(data),
-            content_type=upload.content_type or "application/octet-stream",
-        )
-        storage_path = f"s3://{MINIO_BUCKET}/{object_name}"
-        file_size = len(data)
-    else:
-        os.makedirs(UPLOAD_DIR, exist_ok=True)
-        save_path = os.path.join(UPLOAD_DIR, object_name)
-        with open(save_path, "wb") as f:
-            f.write(data)
-        storage_path = save_path
-        file_size = upload.size or 0
+    stored = await run_in_threadpool(
+        storage.save_stream,
+        upload.file,
+        safe_name,
+        content_type=upload.content_type or "application/octet-stream",
+        object_name=f"{file_id}_{safe_name}",
+    )
 
     db_file = models.File(
         id=file_id,
         item_id=req.item_id,
         filename=upload.filename,
         file_type=upload.content_type or "application/octet-stream",
-        file_size=file_size,
-        storage_path=storage_path,
+        file_size=stored.size,
+        storage_path=stored.storage_path,
         uploaded_by=user.id,
     )
     db.add(db_file)
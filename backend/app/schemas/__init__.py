@@ -32,6 +32,9 @@ from .dna_assets import (
     DNAViewerFeature,
     DNAViewerPlannerContext,
     DNAViewerPayload,
+    DNAViewerTile,
+    DNAViewerTileBin,
+    DNAViewerTilesResponse,
     DNAViewerTrack,
     DNAViewerTranslation,
 )
@@ -73,8 +76,13 @@ from .instrumentation import (
     InstrumentSimulationResult,
     InstrumentSOPLinkCreate,
     InstrumentSOPSummary,
+    InstrumentTelemetryBatchCreate,
+    InstrumentTelemetryBatchResult,
+    InstrumentTelemetryRollupEnvelope,
+    InstrumentTelemetryRollupPoint,
     InstrumentTelemetrySampleCreate,
     InstrumentTelemetrySampleOut,
+    InstrumentTelemetrySeries,
 )
 from .sharing import (
     DNARepositoryCollaboratorAdd,
@@ -103,8 +111,10 @@ from .sharing import (
 from .sequence_toolkit import (
     AssemblySimulationConfig,
     AssemblySimulationResult,
+    PrimerDesignBatchRequest,
     PrimerDesignConfig,
     PrimerDesignResponse,
+    PrimerDesignTemplate,
     PrimerMultiplexCompatibility,
     QCConfig,
     QCReportResponse,
@@ -319,6 +329,8 @@ class FileOut(FileUpload):
 class ItemGraphOut(BaseModel):
     nodes: list[InventoryItemOut]
     edges: list[ItemRelationshipOut]
+    # set when the server node/edge caps cut the graph short
+    truncated: bool = False
 
 
 class FacetCount(BaseModel):
@@ -2152,6 +2164,7 @@ class SequenceRead(BaseModel):
     seq: str
     length: int
     gc_content: float
+    sequence_path: Optional[str] = None
 
 
 class SequenceJobOut(BaseModel):
@@ -2159,6 +2172,18 @@ class SequenceJobOut(BaseModel):
     status: str
     format: str
     result: list[SequenceRead] | None = None
+    progress: Dict[str, Any] | None = None
+    created_at: datetime
+    updated_at: datetime
+    model_config = ConfigDict(from_attributes=True)
+
+
+class InventoryImportJobOut(BaseModel):
+    id: UUID
+    status: str
+    filename: Optional[str] = None
+    progress: Dict[str, Any] | None = None
+    result: Dict[str, Any] | None = None
     created_at: datetime
     updated_at: datetime
     model_config = ConfigDict(from_attributes=True)
@@ -2168,16 +2193,19 @@ class SequenceAlignmentIn(BaseModel):
     seq1: str
     seq2: str
     mode: str = "global"
+    band: Optional[int] = Field(default=None, ge=0)
 
 class SequenceAlignmentOut(BaseModel):
     aligned_seq1: str
     aligned_seq2: str
     score: float
+    banded: bool = False
 
 
 class RestrictionMapIn(BaseModel):
     sequence: str
     enzymes: list[str]
+    circular: bool = False
 
 
 class RestrictionMapOut(BaseModel):
@@ -2216,8 +2244,10 @@ class ChromatogramOut(BaseModel):
 
 class BlastSearchIn(BaseModel):
     query: str
-    subject: str
+    subject: Optional[str] = None
     mode: str = "blastn"
+    search_library: bool = False
+    top_n: int = Field(default=10, ge=1, le=100)
 
 
 class BlastSearchOut(BaseModel):
@@ -2227,6 +2257,28 @@ class BlastSearchOut(BaseModel):
     identity: float
 
 
+class BlastLibraryHit(BaseModel):
+    version_id: UUID
+    asset_id: UUID
+    asset_name: str
+    version_index: int
+    strand: str
+    score: float
+    identity: float
+    seed_count: int
+    query_start: int
+    query_end: int
+    subject_start: int
+    subject_end: int
+    query_aligned: str
+    subject_aligned: str
+
+
+class BlastLibrarySearchOut(BaseModel):
+    query_length: int
+    hits: list[BlastLibraryHit] = Field(default_factory=list)
+
+
 class ProjectCreate(BaseModel):
     name: str
     description: Optional[str] = None
@@ -3114,6 +3166,8 @@ class CloningPlannerSessionOut(BaseModel):
     qc_artifacts: list[CloningPlannerQCArtifactOut]
     replay_window: list[CloningPlannerStageRecordOut] = Field(default_factory=list)
     toolkit_recommendations: dict[str, Any] = Field(default_factory=dict)
+    pipeline_metrics: dict[str, Any] = Field(default_factory=dict)
+    stage_cache: dict[str, Any] = Field(default_factory=dict)
 
 
 class CloningPlannerGuardrailStatus(BaseModel):
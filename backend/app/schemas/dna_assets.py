@@ -315,3 +315,43 @@ class DNAViewerPayload(BaseModel):
     governance_context: DNAViewerGovernanceContext = Field(default_factory=DNAViewerGovernanceContext)
     toolkit_recommendations: dict[str, Any] = Field(default_factory=dict)
 
+
+
+class DNAViewerTileBin(BaseModel):
+    """Summary bin aggregated inside a viewer tile."""
+
+    # purpose: carry low-zoom GC and ambiguity overlays without base-level sequence
+    start: int
+    end: int
+    gc_content: float
+    gc_skew: float
+    ambiguous_bases: int = 0
+
+
+class DNAViewerTile(BaseModel):
+    """Fixed-span window of a DNA asset version at a given zoom level."""
+
+    # purpose: cacheable unit of the windowed viewer API
+    index: int
+    start: int
+    end: int
+    sequence: Optional[str] = None
+    bins: List[DNAViewerTileBin] = Field(default_factory=list)
+    motif_hotspots: List[dict[str, Any]] = Field(default_factory=list)
+
+
+class DNAViewerTilesResponse(BaseModel):
+    """Tiles and overlapping features for a requested viewer region."""
+
+    # purpose: windowed alternative to DNAViewerPayload for large constructs
+    asset_id: UUID
+    version_id: UUID
+    sequence_checksum: str
+    sequence_length: int
+    zoom: int
+    bases_per_bin: int
+    tile_span: int
+    start: int
+    end: int
+    tiles: List[DNAViewerTile] = Field(default_factory=list)
+    features: List[DNAViewerFeature] = Field(default_factory=list)
@@ -100,6 +100,20 @@ class InstrumentRunOut(BaseModel):
 class InstrumentTelemetrySampleCreate(BaseModel):
     channel: str
     payload: dict[str, Any] = Field(default_factory=dict)
+    # instrument clock time; defaults to server receipt time
+    recorded_at: Optional[datetime] = None
+
+
+class InstrumentTelemetryBatchCreate(BaseModel):
+    samples: list[InstrumentTelemetrySampleCreate] = Field(min_length=1, max_length=10000)
+
+
+class InstrumentTelemetryBatchResult(BaseModel):
+    run_id: UUID
+    accepted: int
+    chunk_count: int
+    first_recorded_at: datetime
+    last_recorded_at: datetime
 
 
 class InstrumentTelemetrySampleOut(BaseModel):
@@ -128,6 +142,31 @@ class InstrumentProfile(BaseModel):
 class InstrumentRunTelemetryEnvelope(BaseModel):
     run: InstrumentRunOut
     samples: list[InstrumentTelemetrySampleOut] = Field(default_factory=list)
+    total_samples: int = 0
+    next_cursor: Optional[str] = None
+    downsampled: bool = False
+
+
+class InstrumentTelemetryRollupPoint(BaseModel):
+    bucket_start: datetime
+    count: int
+    min: float
+    max: float
+    mean: float
+
+
+class InstrumentTelemetrySeries(BaseModel):
+    channel: str
+    field: str
+    points: list[InstrumentTelemetryRollupPoint] = Field(default_factory=list)
+
+
+class InstrumentTelemetryRollupEnvelope(BaseModel):
+    run_id: UUID
+    tier_seconds: int
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    series: list[InstrumentTelemetrySeries] = Field(default_factory=list)
 
 
 class InstrumentSimulationRequest(BaseModel):
@@ -324,6 +324,26 @@ class PrimerDesignResponse(BaseModel):
     recommendations: Dict[str, Any] = Field(default_factory=dict)
 
 
+class PrimerDesignTemplate(BaseModel):
+    """Template descriptor submitted for batch primer design."""
+
+    # purpose: validate per-template payloads in batch design requests
+    name: str
+    sequence: str
+
+
+class PrimerDesignBatchRequest(BaseModel):
+    """Batch primer design request spanning many templates."""
+
+    # purpose: drive process-pool primer design for cloning campaigns
+    templates: List[PrimerDesignTemplate] = Field(min_length=1, max_length=5000)
+    preset_id: Optional[str] = None
+    config: Optional[PrimerDesignConfig] = None
+    product_size_range: Optional[Tuple[int, int]] = None
+    target_tm: Optional[float] = Field(default=None, ge=0.0)
+    max_workers: Optional[int] = Field(default=None, ge=1)
+
+
 class AssemblyStepMetrics(BaseModel):
     """Per-template assembly assessment."""
 
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from elasticsearch import Elasticsearch
 from elasticsearch.helpers import bulk
 import os
@@ -14,17 +14,20 @@ if ES_URL:
 INDEX_NAME = "inventory_items"
 
 
-def index_item(item: InventoryItem):
-    if not _es_client:
-        return
-    doc = {
+def _item_document(item: InventoryItem) -> dict:
+    return {
         "id": str(item.id),
         "name": item.name,
         "item_type": item.item_type,
         "custom_data": item.custom_data,
         "status": item.status,
     }
-    _es_client.index(index=INDEX_NAME, id=str(item.id), document=doc)
+
+
+def index_item(item: InventoryItem):
+    if not _es_client:
+        return
+    _es_client.index(index=INDEX_NAME, id=str(item.id), document=_item_document(item))
 
 
 def delete_item(item_id: str):
@@ -33,6 +36,31 @@ def delete_item(item_id: str):
     _es_client.delete(index=INDEX_NAME, id=item_id, ignore=[404])
 
 
+def bulk_index_items(items: Iterable[InventoryItem]) -> None:
+    # purpose: reindex many items with one bulk request instead of one call per item
+    if not _es_client:
+        return
+    bulk(
+        _es_client,
+        (
+            {"_op_type": "index", "_index": INDEX_NAME, "_id": str(item.id), "_source": _item_document(item)}
+            for item in items
+        ),
+        raise_on_error=False,
+    )
+
+
+def bulk_delete_items(item_ids: Iterable[str]) -> None:
+    # purpose: drop many items from the index in one bulk request; missing documents are ignored
+    if not _es_client:
+        return
+    bulk(
+        _es_client,
+        ({"_op_type": "delete", "_index": INDEX_NAME, "_id": item_id} for item_id in item_ids),
+        raise_on_error=False,
+    )
+
+
 def search_items(query: str, db_session) -> List[InventoryItem]:
     if _es_client:
         res = _es_client.search(
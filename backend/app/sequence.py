@@ -1,38 +1,43 @@
 from Bio import SeqIO
 import io
+from typing import BinaryIO, Iterator
+
+
+def _gc_content(seq: str) -> float:
+    length = len(seq)
+    if not length:
+        return 0
+    return (seq.count("G") + seq.count("C")) / length * 100
+
+
+def iter_sequence_records(stream: BinaryIO, fmt: str) -> Iterator[dict]:
+    """Lazily parse records from a byte stream, one record in memory at a time."""
+    handle = io.TextIOWrapper(stream, encoding="utf-8")
+    try:
+        for r in SeqIO.parse(handle, fmt):
+            seq_str = str(r.seq)
+            yield {
+                "id": r.id,
+                "seq": seq_str,
+                "length": len(seq_str),
+                "gc_content": _gc_content(seq_str),
+            }
+    finally:
+        # leave the caller's stream open
+        handle.detach()
+
 
 def process_sequence_file(file_content: bytes, fmt: str):
-    with io.StringIO(file_content.decode()) as handle:
-        records = list(SeqIO.parse(handle, fmt))
-    result = []
-    for r in records:
-        seq_str = str(r.seq)
-        length = len(seq_str)
-        gc = 0
-        if length:
-            gc = (seq_str.count("G") + seq_str.count("C")) / length * 100
-        result.append({
-            "id": r.id,
-            "seq": seq_str,
-            "length": length,
-            "gc_content": gc,
-        })
-    return result
-
-from Bio import pairwise2
+    return list(iter_sequence_records(io.BytesIO(file_content), fmt))
+
 from Bio.Seq import Seq
 from Bio.SeqUtils import MeltingTemp as mt
-from Bio.Restriction import RestrictionBatch
 
-def align_sequences(seq1: str, seq2: str, mode: str = "global"):
-    if mode == "local":
-        alignments = pairwise2.align.localms(seq1, seq2, 2, -1, -0.5, -0.1, one_alignment_only=True)
-    else:
-        alignments = pairwise2.align.globalms(seq1, seq2, 2, -1, -0.5, -0.1, one_alignment_only=True)
-    if not alignments:
-        return {"aligned_seq1": "", "aligned_seq2": "", "score": 0}
-    a = alignments[0]
-    return {"aligned_seq1": a.seqA, "aligned_seq2": a.seqB, "score": a.score}
+def align_sequences(seq1: str, seq2: str, mode: str = "global", band: int | None = None):
+    # PairwiseAligner engine with banding, budgets, and a checksum-keyed result cache
+    from .services.sequence_alignment import align_pair
+
+    return align_pair(seq1, seq2, mode=mode, band=band).as_dict()
 
 
 def design_primers(sequence: str, size: int = 20):
@@ -50,11 +55,11 @@ def design_primers(sequence: str, size: int = 20):
     return {"forward": stats(fwd), "reverse": stats(rev)}
 
 
-def restriction_map(sequence: str, enzymes: list[str]):
-    rb = RestrictionBatch(enzymes)
-    sites = rb.search(Seq(sequence))
-    # convert sets/lists to sorted lists for JSON serialization
-    return {enz.__name__: sorted(pos) for enz, pos in sites.items()}
+def restriction_map(sequence: str, enzymes: list[str], circular: bool = False):
+    # one Aho-Corasick pass over the template covers every requested enzyme
+    from .services.restriction_index import map_restriction_sites
+
+    return map_restriction_sites(sequence, enzymes, linear=not circular)
 
 
 def parse_genbank_features(file_content: bytes):
@@ -91,20 +96,23 @@ def parse_chromatogram(file_content: bytes):
 
 def blast_search(query: str, subject: str):
     """Perform a simple local BLAST-like search using Smith-Waterman."""
-    alignments = pairwise2.align.localms(
-        query, subject, 2, -1, -0.5, -0.1, one_alignment_only=True
-    )
-    if not alignments:
+    from .services.sequence_alignment import align_pair
+
+    aln = align_pair(query, subject, mode="local")
+    if not aln.aligned_seq1:
         return {"query_aligned": "", "subject_aligned": "", "score": 0, "identity": 0}
-    aln = alignments[0]
     matches = sum(
-        1 for a, b in zip(aln.seqA, aln.seqB) if a == b and a != "-" and b != "-"
+        1
+        for a, b in zip(aln.aligned_seq1, aln.aligned_seq2)
+        if a == b and a != "-" and b != "-"
+    )
+    length = sum(
+        1 for a, b in zip(aln.aligned_seq1, aln.aligned_seq2) if a != "-" and b != "-"
     )
-    length = sum(1 for a, b in zip(aln.seqA, aln.seqB) if a != "-" and b != "-")
     identity = (matches / length * 100) if length else 0
     return {
-        "query_aligned": aln.seqA,
-        "subject_aligned": aln.seqB,
+        "query_aligned": aln.aligned_seq1,
+        "subject_aligned": aln.aligned_seq2,
         "score": aln.score,
         "identity": identity,
     }
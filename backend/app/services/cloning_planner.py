@@ -9,13 +9,14 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import json
+import os
 from contextlib import suppress
 from datetime import datetime, timezone
 from copy import deepcopy
 from typing import Any, Callable, Sequence
 from uuid import UUID, uuid4
 
-from celery import chain
+from celery import chain, group
 from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload
 
@@ -26,6 +27,7 @@ from ..schemas.sequence_toolkit import SequenceToolkitProfile
 from . import (
     billing as billing_service,
     compliance as compliance_service,
+    planner_stage_cache,
     qc_ingestion,
     sequence_toolkit,
 )
@@ -34,6 +36,42 @@ from ..tasks import celery_app
 
 DEFAULT_TOOLKIT_PROFILE = SequenceToolkitProfile()
 
+# canonical stage order; resume_from reruns the named stage and every stage after it
+PIPELINE_STAGE_ORDER: tuple[str, ...] = ("primers", "restriction", "assembly", "qc", "finalize")
+# stage -> stages whose outputs it consumes; stages without a path between them run in parallel
+PIPELINE_STAGE_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    "primers": (),
+    "restriction": (),
+    "qc_ingest": (),
+    "assembly": ("primers", "restriction"),
+    "qc": ("assembly", "qc_ingest"),
+    "finalize": ("qc",),
+}
+_SHARED_STATE_ATTRIBUTES = (
+    "stage_timings",
+    "guardrail_state",
+    "branch_state",
+    "primer_set",
+    "restriction_digest",
+    "assembly_plan",
+    "qc_reports",
+    "current_step",
+    "status",
+)
+STAGE_RESOURCE_CLASSES: dict[str, str] = {
+    "primers": "cpu",
+    "restriction": "cpu",
+    "qc_ingest": "io",
+    "assembly": "cpu",
+    "qc": "io",
+    "finalize": "io",
+}
+# optional Celery queues per resource class; unset keeps stages on the default queue
+STAGE_RESOURCE_QUEUES: dict[str, str | None] = {
+    "cpu": os.getenv("CLONING_PLANNER_CPU_QUEUE") or None,
+    "io": os.getenv("CLONING_PLANNER_IO_QUEUE") or None,
+}
+
 
 def _json_default(value: Any) -> Any:
     """Normalise complex values for JSON serialisation."""
@@ -762,7 +800,8 @@ def _dispatch_planner_event(
     try:
         loop = asyncio.get_running_loop()
     except RuntimeError:
-        asyncio.run(pubsub.publish_planner_event(str(planner.id), message))
+        # sync callers (Celery stages, threadpool routes) hand off to the shared publisher loop
+        pubsub.enqueue_planner_event(str(planner.id), message)
         return event_identifier
     loop.create_task(pubsub.publish_planner_event(str(planner.id), message))
     return event_identifier
@@ -1179,6 +1218,7 @@ def _record_guardrail_hold(
 ) -> None:
     """Persist guardrail hold metadata and emit orchestration events."""
 
+    _lock_shared_state(db, planner)
     active_branch_id, _ = _ensure_branch_state(planner)
     hold_gate = json.loads(json.dumps(gate, default=_json_default))
     previous_gate = _evaluate_guardrail_gate(planner.guardrail_state or {})
@@ -1486,12 +1526,24 @@ def run_primer_design(
     # status: experimental
     profile = DEFAULT_TOOLKIT_PROFILE
     resolved_preset = _resolve_toolkit_preset(planner, override=preset_id)
-    primer_payload = sequence_toolkit.design_primers(
-        planner.input_sequences,
-        config=profile,
-        product_size_range=product_size_range or (80, 280),
-        target_tm=target_tm or 60.0,
-        preset_id=resolved_preset,
+    size_range = product_size_range or (80, 280)
+    primer_payload, cache_status = planner_stage_cache.cached_stage_result(
+        db,
+        "primers",
+        inputs=planner.input_sequences,
+        config={
+            "profile": profile,
+            "product_size_range": list(size_range),
+            "target_tm": target_tm or 60.0,
+            "preset_id": resolved_preset,
+        },
+        compute=lambda: sequence_toolkit.design_primers(
+            planner.input_sequences,
+            config=profile,
+            product_size_range=size_range,
+            target_tm=target_tm or 60.0,
+            preset_id=resolved_preset,
+        ),
     )
     recommendations = _compose_toolkit_recommendations(
         planner,
@@ -1511,13 +1563,10 @@ def run_primer_design(
         fallback=(planner.guardrail_state or {}).get("toolkit"),
         recommendations=recommendations,
     )
-    guardrail_state = _merge_guardrail_state(
-        planner,
-        {
-            "primers": _primer_guardrail_summary(primer_payload),
-            "toolkit": toolkit_snapshot,
-        },
-    )
+    guardrail_updates = {
+        "primers": _primer_guardrail_summary(primer_payload),
+        "toolkit": toolkit_snapshot,
+    }
     return record_stage_progress(
         db,
         planner=planner,
@@ -1525,7 +1574,8 @@ def run_primer_design(
         payload=primer_payload,
         next_step="restriction",
         status="primer_complete",
-        guardrail_state=guardrail_state,
+        guardrail_updates=guardrail_updates,
+        cache_status=cache_status,
         task_id=task_id,
     )
 
@@ -1550,11 +1600,21 @@ def run_restriction_analysis(
         planner,
         override=(preset_id or (upstream_profile or {}).get("preset_id")),
     )
-    digest_payload = sequence_toolkit.analyze_restriction_digest(
-        planner.input_sequences,
-        config=profile,
-        enzymes=enzymes,
-        preset_id=resolved_preset,
+    digest_payload, cache_status = planner_stage_cache.cached_stage_result(
+        db,
+        "restriction",
+        inputs=planner.input_sequences,
+        config={
+            "profile": profile,
+            "enzymes": list(enzymes) if enzymes else None,
+            "preset_id": resolved_preset,
+        },
+        compute=lambda: sequence_toolkit.analyze_restriction_digest(
+            planner.input_sequences,
+            config=profile,
+            enzymes=enzymes,
+            preset_id=resolved_preset,
+        ),
     )
     recommendations = _compose_toolkit_recommendations(
         planner,
@@ -1574,13 +1634,10 @@ def run_restriction_analysis(
         fallback=upstream_profile or None,
         recommendations=recommendations,
     )
-    guardrail_state = _merge_guardrail_state(
-        planner,
-        {
-            "restriction": _restriction_guardrail_summary(digest_payload),
-            "toolkit": toolkit_snapshot,
-        },
-    )
+    guardrail_updates = {
+        "restriction": _restriction_guardrail_summary(digest_payload),
+        "toolkit": toolkit_snapshot,
+    }
     return record_stage_progress(
         db,
         planner=planner,
@@ -1588,7 +1645,8 @@ def run_restriction_analysis(
         payload=digest_payload,
         next_step="assembly",
         status="restriction_complete",
-        guardrail_state=guardrail_state,
+        guardrail_updates=guardrail_updates,
+        cache_status=cache_status,
         task_id=task_id,
     )
 
@@ -1613,12 +1671,23 @@ def run_assembly_planning(
         planner,
         override=(preset_id or (upstream_profile or {}).get("preset_id")),
     )
-    plan_payload = sequence_toolkit.simulate_assembly(
-        planner.primer_set,
-        planner.restriction_digest,
-        config=profile,
-        strategy=strategy or planner.assembly_strategy,
-        preset_id=resolved_preset,
+    resolved_strategy = strategy or planner.assembly_strategy
+    plan_payload, cache_status = planner_stage_cache.cached_stage_result(
+        db,
+        "assembly",
+        inputs={"primers": planner.primer_set, "restriction": planner.restriction_digest},
+        config={
+            "profile": profile,
+            "strategy": resolved_strategy,
+            "preset_id": resolved_preset,
+        },
+        compute=lambda: sequence_toolkit.simulate_assembly(
+            planner.primer_set,
+            planner.restriction_digest,
+            config=profile,
+            strategy=resolved_strategy,
+            preset_id=resolved_preset,
+        ),
     )
     recommendations = _compose_toolkit_recommendations(
         planner,
@@ -1638,13 +1707,10 @@ def run_assembly_planning(
         fallback=upstream_profile or None,
         recommendations=recommendations,
     )
-    guardrail_state = _merge_guardrail_state(
-        planner,
-        {
-            "assembly": _assembly_guardrail_summary(plan_payload),
-            "toolkit": toolkit_snapshot,
-        },
-    )
+    guardrail_updates = {
+        "assembly": _assembly_guardrail_summary(plan_payload),
+        "toolkit": toolkit_snapshot,
+    }
     return record_stage_progress(
         db,
         planner=planner,
@@ -1652,7 +1718,8 @@ def run_assembly_planning(
         payload=plan_payload,
         next_step="qc",
         status="assembly_complete",
-        guardrail_state=guardrail_state,
+        guardrail_updates=guardrail_updates,
+        cache_status=cache_status,
         task_id=task_id,
     )
 
@@ -1672,7 +1739,11 @@ def run_qc_checks(
     # status: experimental
     profile = DEFAULT_TOOLKIT_PROFILE
     upstream_profile = (planner.assembly_plan or {}).get("profile") if planner.assembly_plan else {}
-    ingestion = qc_ingestion.ingest_chromatograms(db, planner, chromatograms)
+    if chromatograms:
+        ingestion = qc_ingestion.ingest_chromatograms(db, planner, chromatograms)
+    else:
+        # chromatograms parsed ahead of time by the parallel qc_ingest stage
+        ingestion = qc_ingestion.collect_pending_artifacts(db, planner)
     qc_payload = sequence_toolkit.evaluate_qc_reports(
         planner.assembly_plan,
         config=profile,
@@ -1692,17 +1763,14 @@ def run_qc_checks(
         )
     qc_summary = _qc_guardrail_summary(qc_payload)
     qc_summary["breaches"] = ingestion["breaches"]
-    guardrail_state = _merge_guardrail_state(
-        planner,
-        {
-            "qc": qc_summary,
-            "toolkit": _toolkit_snapshot_from_profile(
-                qc_payload.get("profile"),
-                fallback=upstream_profile or None,
-                recommendations=recommendations,
-            ),
-        },
-    )
+    guardrail_updates = {
+        "qc": qc_summary,
+        "toolkit": _toolkit_snapshot_from_profile(
+            qc_payload.get("profile"),
+            fallback=upstream_profile or None,
+            recommendations=recommendations,
+        ),
+    }
     status = "qc_guardrail_blocked" if ingestion["breaches"] else "qc_complete"
     return record_stage_progress(
         db,
@@ -1711,12 +1779,60 @@ def run_qc_checks(
         payload=qc_payload,
         next_step="finalize",
         status=status,
-        guardrail_state=guardrail_state,
+        guardrail_updates=guardrail_updates,
         task_id=task_id,
         artifacts=ingestion.get("records"),
     )
 
 
+def run_qc_ingestion(
+    db: Session,
+    *,
+    planner: models.CloningPlannerSession,
+    chromatograms: Sequence[dict[str, Any]] | None = None,
+    task_id: str | None = None,
+) -> models.CloningPlannerSession:
+    """Parse and persist chromatograms ahead of QC evaluation."""
+
+    # purpose: overlap I/O-bound chromatogram parsing with primer and digest stages
+    # inputs: planner record with chromatogram descriptors
+    # outputs: planner with qc_ingest checkpoint; artifacts stay unlinked until run_qc_checks
+    # status: experimental
+    ingestion = qc_ingestion.ingest_chromatograms(db, planner, chromatograms)
+    _lock_shared_state(db, planner)
+    active_branch_id, _ = _ensure_branch_state(planner)
+    previous_gate = _evaluate_guardrail_gate(planner.guardrail_state or {})
+    now = _utcnow()
+    timings = dict(planner.stage_timings or {})
+    entry = dict(timings.get("qc_ingest") or {})
+    entry.update(
+        {
+            "status": "qc_ingest_complete",
+            "completed_at": now.isoformat(),
+            "task_id": task_id,
+            "error": None,
+            "artifact_count": len(ingestion["records"]),
+            "breach_count": len(ingestion["breaches"]),
+            "branch_id": str(active_branch_id) if active_branch_id else None,
+        }
+    )
+    timings["qc_ingest"] = entry
+    planner.stage_timings = timings
+    planner.updated_at = now
+    db.add(planner)
+    db.flush()
+    _dispatch_planner_event(
+        planner,
+        "stage_completed",
+        {"stage": "qc_ingest", "status": "qc_ingest_complete", "task_id": task_id},
+        previous_guardrail_gate=previous_gate,
+        branch_id=active_branch_id,
+        checkpoint={"key": "qc_ingest", "payload": entry},
+        event_id=str(uuid4()),
+    )
+    return planner
+
+
 def run_full_pipeline(
     db: Session,
     planner: models.CloningPlannerSession,
@@ -1770,6 +1886,8 @@ def _mark_stage_started(
     """Record the start of a pipeline stage for checkpoint tracking."""
 
     # purpose: capture resumable checkpoint metadata before stage execution
+    # note: parallel stages write the same JSON columns; merge into the locked, current row
+    _lock_shared_state(db, planner)
     now = _utcnow()
     active_branch_id, _ = _ensure_branch_state(planner)
     previous_gate = _evaluate_guardrail_gate(planner.guardrail_state or {})
@@ -1785,6 +1903,7 @@ def _mark_stage_started(
             "retries": previous_runs,
             "error": None,
             "branch_id": str(active_branch_id) if active_branch_id else None,
+            "resource_class": STAGE_RESOURCE_CLASSES.get(stage),
         }
     )
     if task_id is not None:
@@ -1793,8 +1912,10 @@ def _mark_stage_started(
         entry.setdefault("task_id", None)
     timings[stage] = entry
     planner.stage_timings = timings
-    planner.current_step = stage
-    planner.status = f"{stage}_running"
+    if stage in PIPELINE_STAGE_ORDER:
+        # auxiliary stages (qc_ingest) run alongside checkpoints without moving the cursor
+        planner.current_step = stage
+        planner.status = f"{stage}_running"
     if task_id is not None:
         planner.celery_task_id = task_id
     planner.updated_at = now
@@ -1823,6 +1944,7 @@ def _record_stage_failure(
 ) -> None:
     """Persist failure metadata when a stage errors during execution."""
 
+    _lock_shared_state(db, planner)
     now = _utcnow()
     active_branch_id, _ = _ensure_branch_state(planner)
     previous_gate = _evaluate_guardrail_gate(planner.guardrail_state or {})
@@ -1883,6 +2005,7 @@ def _complete_pipeline_stage(
 ) -> models.CloningPlannerSession:
     """Summarise guardrail state and mark pipeline completion checkpoint."""
 
+    _lock_shared_state(db, planner)
     active_branch_id, _ = _ensure_branch_state(planner)
     previous_gate = _evaluate_guardrail_gate(planner.guardrail_state or {})
     guardrails = refresh_planner_guardrails(db, planner)
@@ -1903,6 +2026,17 @@ def _complete_pipeline_stage(
         }
     )
     timings["finalize"] = entry
+    pipeline = dict(timings.get("pipeline") or {})
+    enqueued_at = _parse_stage_timestamp(pipeline, "enqueued_at")
+    if enqueued_at is not None:
+        pipeline.update(
+            {
+                "status": "pipeline_complete",
+                "completed_at": now.isoformat(),
+                "latency_seconds": round((now - enqueued_at).total_seconds(), 3),
+            }
+        )
+        timings["pipeline"] = pipeline
     planner.stage_timings = timings
     planner.status = status
     planner.current_step = "finalize"
@@ -1958,6 +2092,8 @@ def _execute_stage_task(
         planner = db.get(models.CloningPlannerSession, UUID(planner_id))
         if not planner:
             return planner_id
+        # the guardrail refresh rewrites guardrail_state; hold the row so sibling stages merge
+        _lock_shared_state(db, planner)
         guardrail_snapshot = refresh_planner_guardrails(db, planner)
         gate_state = _evaluate_guardrail_gate(guardrail_snapshot)
         if gate_state.get("active"):
@@ -1965,6 +2101,8 @@ def _execute_stage_task(
             db.commit()
             return str(planner.id)
         _mark_stage_started(db, planner, stage, task_id=task_id)
+        # release the planner row while the stage computes so parallel stages can start
+        db.commit()
         planner = runner(db, planner, task_id)
         db.commit()
         return str(planner.id)
@@ -2101,6 +2239,35 @@ def qc_stage_task(
     )
 
 
+@celery_app.task(
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    max_retries=3,
+    name="app.workers.cloning_planner.qc_ingest_stage",
+)
+def qc_ingest_stage_task(
+    self,
+    planner_id: str,
+    *,
+    chromatograms: Sequence[dict[str, Any]] | None = None,
+) -> str:
+    """Celery task parsing chromatograms ahead of the QC stage."""
+
+    chroma_payload = list(chromatograms) if chromatograms else None
+    return _execute_stage_task(
+        self,
+        planner_id,
+        "qc_ingest",
+        lambda db, planner, task_id: run_qc_ingestion(
+            db,
+            planner=planner,
+            chromatograms=chroma_payload,
+            task_id=task_id,
+        ),
+    )
+
+
 @celery_app.task(
     bind=True,
     autoretry_for=(Exception,),
@@ -2123,8 +2290,8 @@ def finalize_stage_task(self, planner_id: str) -> str:
     )
 
 
-def _prepare_enqueued_state(planner_id: UUID, stage: str) -> None:
-    """Initialise queue metadata for a planner stage."""
+def _prepare_enqueued_state(planner_id: UUID, levels: Sequence[Sequence[str]]) -> None:
+    """Initialise queue metadata for the first stage level and the pipeline envelope."""
 
     db = SessionLocal()
     try:
@@ -2133,19 +2300,29 @@ def _prepare_enqueued_state(planner_id: UUID, stage: str) -> None:
             return
         now = _utcnow()
         timings = dict(record.stage_timings or {})
-        entry = dict(timings.get(stage) or {})
-        entry.update(
-            {
-                "status": f"{stage}_queued",
-                "queued_at": now.isoformat(),
-                "error": None,
-            }
-        )
-        entry.setdefault("task_id", None)
-        timings[stage] = entry
+        for stage in levels[0]:
+            entry = dict(timings.get(stage) or {})
+            entry.update(
+                {
+                    "status": f"{stage}_queued",
+                    "queued_at": now.isoformat(),
+                    "error": None,
+                    "resource_class": STAGE_RESOURCE_CLASSES.get(stage),
+                }
+            )
+            entry.setdefault("task_id", None)
+            timings[stage] = entry
+        timings["pipeline"] = {
+            "status": "pipeline_running",
+            "enqueued_at": now.isoformat(),
+            "completed_at": None,
+            "latency_seconds": None,
+            "levels": [list(level) for level in levels],
+        }
+        primary = levels[0][0]
         record.stage_timings = timings
-        record.current_step = stage
-        record.status = f"{stage}_queued"
+        record.current_step = primary
+        record.status = f"{primary}_queued"
         record.celery_task_id = None
         record.updated_at = now
         db.add(record)
@@ -2176,6 +2353,51 @@ def _assign_task_reference(planner_id: UUID, task_id: str | None) -> None:
         db.close()
 
 
+def schedule_stage_levels(stages: Sequence[str]) -> list[list[str]]:
+    """Group stages into dependency levels; stages within a level run in parallel."""
+
+    # purpose: compile PIPELINE_STAGE_DEPENDENCIES into Celery group/chord layers
+    # inputs: stages to run (dependencies outside this set are treated as satisfied checkpoints)
+    # outputs: ordered levels, each listing stages whose dependencies finished in earlier levels
+    selected = set(stages)
+    pending = list(stages)
+    done: set[str] = set()
+    levels: list[list[str]] = []
+    while pending:
+        ready = [
+            stage
+            for stage in pending
+            if all(dep in done or dep not in selected for dep in PIPELINE_STAGE_DEPENDENCIES.get(stage, ()))
+        ]
+        if not ready:
+            raise ValueError("Cloning planner stage graph contains a cycle")
+        levels.append(ready)
+        done.update(ready)
+        pending = [stage for stage in pending if stage not in done]
+    return levels
+
+
+def resolve_resume_stage(planner: models.CloningPlannerSession) -> str:
+    """Return the earliest checkpoint stage that has not completed since it last started."""
+
+    # purpose: parallel stages make current_step ambiguous; resume from the first unfinished checkpoint
+    timings = planner.stage_timings or {}
+    for stage in PIPELINE_STAGE_ORDER:
+        entry = timings.get(stage)
+        if not isinstance(entry, dict):
+            return stage
+        started = _parse_stage_timestamp(entry, "started_at")
+        completed = _parse_stage_timestamp(entry, "completed_at")
+        if entry.get("error") or completed is None or (started and started > completed):
+            return stage
+    return planner.current_step or PIPELINE_STAGE_ORDER[0]
+
+
+def _stage_signature(stage: str, signature):
+    queue = STAGE_RESOURCE_QUEUES.get(STAGE_RESOURCE_CLASSES.get(stage, ""))
+    return signature.set(queue=queue) if queue else signature
+
+
 def enqueue_pipeline(
     planner_id: UUID,
     *,
@@ -2188,49 +2410,48 @@ def enqueue_pipeline(
 ) -> str | None:
     """Schedule cloning planner orchestration via Celery."""
 
+    # purpose: run independent stages as Celery groups with chords joining at dependent stages
+    # inputs: planner id, stage overrides, optional resume checkpoint
+    # outputs: Celery task id of the final stage
+    # status: experimental
     start_stage = (resume_from or "primers").lower()
     if start_stage == "intake":
         start_stage = "primers"
-    stage_plan = [
-        (
-            "primers",
-            primer_stage_task.s(
-                str(planner_id),
-                product_size_range=product_size_range,
-                target_tm=target_tm,
-                preset_id=preset_id,
-            ),
-        ),
-        (
-            "restriction",
-            restriction_stage_task.s(
-                enzymes=list(enzymes) if enzymes else None,
-                preset_id=preset_id,
-            ),
-        ),
-        (
-            "assembly",
-            assembly_stage_task.s(preset_id=preset_id),
+    elif start_stage == "qc_ingest":
+        start_stage = "qc"
+    planner_ref = str(planner_id)
+    stage_signatures = {
+        "primers": primer_stage_task.si(
+            planner_ref,
+            product_size_range=product_size_range,
+            target_tm=target_tm,
+            preset_id=preset_id,
         ),
-        (
-            "qc",
-            qc_stage_task.s(chromatograms=list(chromatograms) if chromatograms else None),
+        "restriction": restriction_stage_task.si(
+            planner_ref,
+            enzymes=list(enzymes) if enzymes else None,
+            preset_id=preset_id,
         ),
-        (
-            "finalize",
-            finalize_stage_task.s(),
+        "qc_ingest": qc_ingest_stage_task.si(
+            planner_ref,
+            chromatograms=list(chromatograms) if chromatograms else None,
         ),
-    ]
-    start_index = next((idx for idx, (name, _) in enumerate(stage_plan) if name == start_stage), 0)
-    signatures = [sig.clone() for _, sig in stage_plan[start_index:]]
-    if signatures:
-        if start_index > 0:
-            existing_args = tuple(signatures[0].args or ())
-            signatures[0].args = (str(planner_id),) + existing_args
-    if not signatures:
-        return None
-    _prepare_enqueued_state(planner_id, stage_plan[start_index][0])
-    pipeline = chain(*signatures)
+        "assembly": assembly_stage_task.si(planner_ref, preset_id=preset_id),
+        "qc": qc_stage_task.si(planner_ref),
+        "finalize": finalize_stage_task.si(planner_ref),
+    }
+    start_index = PIPELINE_STAGE_ORDER.index(start_stage) if start_stage in PIPELINE_STAGE_ORDER else 0
+    stages = list(PIPELINE_STAGE_ORDER[start_index:])
+    if chromatograms and "qc" in stages:
+        stages.insert(0, "qc_ingest")
+    levels = schedule_stage_levels(stages)
+    layers = []
+    for level in levels:
+        signatures = [_stage_signature(stage, stage_signatures[stage].clone()) for stage in level]
+        layers.append(group(signatures) if len(signatures) > 1 else signatures[0])
+    _prepare_enqueued_state(planner_id, levels)
+    # a group followed by a task is upgraded to a chord, so dependents wait for every parallel stage
+    pipeline = chain(*layers)
     if celery_app.conf.task_always_eager:
         result = pipeline.apply()
     else:  # pragma: no cover - exercised in production deployments
@@ -2240,6 +2461,14 @@ def enqueue_pipeline(
     return task_id
 
 
+def _lock_shared_state(db: Session, planner: models.CloningPlannerSession) -> None:
+    """Reload the planner's shared JSON state under a row lock before merging stage output."""
+
+    # purpose: let stages running in parallel merge timings and guardrails instead of overwriting them
+    db.flush()
+    db.refresh(planner, attribute_names=_SHARED_STATE_ATTRIBUTES, with_for_update=True)
+
+
 def record_stage_progress(
     db: Session,
     *,
@@ -2252,13 +2481,19 @@ def record_stage_progress(
     task_id: str | None = None,
     error: str | None = None,
     artifacts: Sequence[models.CloningPlannerQCArtifact] | None = None,
+    guardrail_updates: dict[str, Any] | None = None,
+    cache_status: str | None = None,
 ) -> models.CloningPlannerSession:
     """Persist outputs for a planner stage and advance state tracking."""
 
     # purpose: centralise stage persistence semantics across API surfaces and Celery tasks
-    # inputs: db session, planner record, stage identifier, stage payload, optional status/guardrail/task details
+    # inputs: db session, planner record, stage identifier, stage payload, optional status/guardrail/task details;
+    #   guardrail_updates are merged into the freshly locked guardrail state (parallel-safe)
     # outputs: updated CloningPlannerSession instance with refreshed metadata
     # status: experimental
+    _lock_shared_state(db, planner)
+    if guardrail_state is None and guardrail_updates is not None:
+        guardrail_state = _merge_guardrail_state(planner, guardrail_updates)
     now = _utcnow()
     active_branch_id, _ = _ensure_branch_state(planner)
     previous_gate = _evaluate_guardrail_gate(planner.guardrail_state or {})
@@ -2311,6 +2546,10 @@ def record_stage_progress(
             "branch_id": str(active_branch_id) if active_branch_id else None,
         }
     )
+    if cache_status is not None:
+        checkpoint_payload["cache"] = cache_status
+        counter = "cache_hits" if cache_status == "hit" else "cache_misses"
+        checkpoint_payload[counter] = int(checkpoint_payload.get(counter) or 0) + 1
     gate_state = _evaluate_guardrail_gate(guardrail_snapshot)
     checkpoint_payload["guardrail_gate"] = gate_state
     stage_guardrail: dict[str, Any] = {}
@@ -2883,6 +3122,65 @@ def compose_branch_comparison(
     }
 
 
+def compose_pipeline_metrics(planner: models.CloningPlannerSession) -> dict[str, Any]:
+    """Summarise end-to-end and per-stage planner latency from stage timings."""
+
+    # purpose: report how long a session's stage graph took and where the time went
+    # inputs: CloningPlannerSession ORM instance
+    # outputs: dict with pipeline latency, stage levels, and per-stage durations/resource classes
+    timings = planner.stage_timings or {}
+    pipeline = timings.get("pipeline") if isinstance(timings.get("pipeline"), dict) else {}
+    stages: dict[str, Any] = {}
+    for stage in PIPELINE_STAGE_DEPENDENCIES:
+        entry = timings.get(stage)
+        if not isinstance(entry, dict):
+            continue
+        started = _parse_stage_timestamp(entry, "started_at")
+        completed = _parse_stage_timestamp(entry, "completed_at")
+        duration = (
+            round((completed - started).total_seconds(), 3)
+            if started and completed and completed >= started
+            else None
+        )
+        stages[stage] = {
+            "duration_seconds": duration,
+            "resource_class": entry.get("resource_class") or STAGE_RESOURCE_CLASSES.get(stage),
+        }
+    return {
+        "status": pipeline.get("status"),
+        "enqueued_at": pipeline.get("enqueued_at"),
+        "completed_at": pipeline.get("completed_at"),
+        "latency_seconds": pipeline.get("latency_seconds"),
+        "levels": pipeline.get("levels", []),
+        "stages": stages,
+    }
+
+
+def compose_stage_cache_metrics(planner: models.CloningPlannerSession) -> dict[str, Any]:
+    """Summarise stage cache hits and misses recorded on a session's checkpoints."""
+
+    # purpose: show how often branched/resumed runs reused content-addressed toolkit outputs
+    timings = planner.stage_timings or {}
+    stages: dict[str, Any] = {}
+    hits = misses = 0
+    for stage in ("primers", "restriction", "assembly"):
+        entry = timings.get(stage)
+        if not isinstance(entry, dict) or "cache" not in entry:
+            continue
+        stage_hits = int(entry.get("cache_hits") or 0)
+        stage_misses = int(entry.get("cache_misses") or 0)
+        hits += stage_hits
+        misses += stage_misses
+        stages[stage] = {"last": entry.get("cache"), "hits": stage_hits, "misses": stage_misses}
+    lookups = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / lookups, 4) if lookups else None,
+        "stages": stages,
+    }
+
+
 def serialize_session(planner: models.CloningPlannerSession) -> dict[str, Any]:
     """Render a cloning planner session into a JSON-serialisable dict."""
 
@@ -3001,6 +3299,8 @@ def serialize_session(planner: models.CloningPlannerSession) -> dict[str, Any]:
         "toolkit_recommendations": toolkit_bundle,
         "recovery_bundle": recovery_bundle,
         "drill_summaries": recovery_bundle.get("drill_summaries", []),
+        "pipeline_metrics": compose_pipeline_metrics(planner),
+        "stage_cache": compose_stage_cache_metrics(planner),
     }
 
 
@@ -2,20 +2,23 @@
 
 # purpose: provide persistence, diffing, and governance hooks for DNA asset workflows
 # status: experimental
-# depends_on: backend.app.models, backend.app.schemas.dna_assets, backend.app.services.sequence_toolkit
+# depends_on: backend.app.models, backend.app.schemas.dna_assets, backend.app.services.sequence_toolkit, backend.app.services.packed_sequence, backend.app.services.sequence_features, backend.app.services.sequence_search
 # related_docs: docs/dna_assets.md
 
 from __future__ import annotations
 
-import hashlib
+import copy
+import logging
 import math
+import os
 from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Iterable, Sequence
 from uuid import UUID
 
 import sqlalchemy as sa
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.orm import Session, aliased, joinedload
 
 from .. import models
@@ -48,9 +51,19 @@ from ..schemas import (
     DNAViewerTrack,
     DNAViewerTranslation,
 )
-from . import cloning_planner, sequence_toolkit
+from . import cloning_planner, sequence_search, sequence_toolkit
+from .packed_sequence import PackedSequence, sequence_checksum
+from .sequence_features import (
+    AnalysisCache,
+    SequenceFeatureAnalysis,
+    get_sequence_features,
+    seed_sequence_features,
+)
+
+logger = logging.getLogger(__name__)
 
 _DEFAULT_PROFILE = SequenceToolkitProfile()
+_GUARDRAIL_CACHE = AnalysisCache(int(os.getenv("DNA_ASSET_GUARDRAIL_CACHE_SIZE", "128")))
 
 
 def _utcnow() -> datetime:
@@ -80,10 +93,6 @@ def _apply_tags(asset: models.DNAAsset, tags: Sequence[str]) -> None:
         )
 
 
-def _sequence_checksum(sequence: str) -> str:
-    return hashlib.sha256(sequence.encode("utf-8")).hexdigest()
-
-
 _CODON_TABLE: dict[str, str] = {
     "TTT": "F",
     "TTC": "F",
@@ -424,13 +433,18 @@ def _compute_thermodynamic_risk(
     guardrails: DNAAssetGuardrailHeuristics,
     *,
     gc_skew: list[float] | None = None,
+    features: SequenceFeatureAnalysis | None = None,
 ) -> dict[str, Any]:
     """Derive thermodynamic risk overlays for viewer analytics."""
 
     # purpose: tie importer guardrail heuristics to viewer-facing overlays
-    normalised = _normalize_sequence(sequence)
-    homopolymers = _find_homopolymer_runs(normalised)
-    gc_hotspots = _compute_gc_hotspots(normalised)
+    if features is not None:
+        homopolymers = features.homopolymers
+        gc_hotspots = features.gc_hotspots
+    else:
+        normalised = _normalize_sequence(sequence)
+        homopolymers = _find_homopolymer_runs(normalised)
+        gc_hotspots = _compute_gc_hotspots(normalised)
     primer_summary = guardrails.primers or {}
     tm_span = primer_summary.get("tm_span")
     primer_warnings = primer_summary.get("primer_warnings", 0)
@@ -596,196 +610,25 @@ def _kinetics_summary(digest: dict[str, Any], assembly: dict[str, Any]) -> dict[
     }
 
 
-def _analyse_sequence_guardrails(sequence: str, profile: SequenceToolkitProfile) -> dict[str, Any]:
+def _analyse_sequence_guardrails(
+    sequence: str,
+    profile: SequenceToolkitProfile,
+    *,
+    checksum: str | None = None,
+) -> dict[str, Any]:
     """Run toolkit analyses to derive guardrail and kinetics summaries."""
 
     # purpose: ensure DNA asset serialization reflects kinetics-aware toolkit outputs
-    template = [{"name": "asset_version", "sequence": sequence}]
-    primer_payload = sequence_toolkit.design_primers(template, config=profile)
-    digest_payload = sequence_toolkit.analyze_restriction_digest(template, config=profile)
-    assembly_payload = sequence_toolkit.simulate_assembly(
-        primer_payload,
-        digest_payload,
-        config=profile,
-        strategy=profile.assembly.strategy,
-    )
-    qc_payload = sequence_toolkit.evaluate_qc_reports(
-        assembly_payload,
-        config=profile,
-    )
-    recommendations = sequence_toolkit.build_strategy_recommendations(
-        template,
-        preset_id=profile.preset_id,
-        primer_payload=primer_payload,
-        restriction_payload=digest_payload,
-        assembly_payload=assembly_payload,
-        qc_payload=qc_payload,
-    )
-    guardrails = {
-        "primers": _primer_guardrail_summary(primer_payload),
-        "restriction": _restriction_guardrail_summary(digest_payload),
-        "assembly": _assembly_guardrail_summary(assembly_payload),
-    }
-    kinetics = _kinetics_summary(digest_payload, assembly_payload)
-    presets: set[str] = {profile.assembly.strategy}
-    for step in assembly_payload.get("steps", []):
-        strategy = step.get("strategy")
-        if strategy:
-            presets.add(strategy)
-        ligation = step.get("ligation_profile") or {}
-        ligation_strategy = ligation.get("strategy")
-        if ligation_strategy:
-            presets.add(ligation_strategy)
-    return {
-        "guardrails": guardrails,
-        "kinetics": kinetics,
-        "assembly_presets": sorted(presets),
-        "toolkit_recommendations": recommendations,
-    }
-
-
-def _primer_guardrail_summary(result: dict[str, Any]) -> dict[str, Any]:
-    """Summarise primer metrics for DNA asset guardrails."""
-
-    # purpose: share planner-aligned primer heuristics with asset serialization
-    primers = [p for p in result.get("primers", []) if p.get("status") == "ok"]
-    warning_count = sum(len(p.get("warnings", [])) for p in primers)
-    tm_values = [
-        p.get("forward", {}).get("thermodynamics", {}).get("tm")
-        for p in primers
-        if p.get("forward")
-    ] + [
-        p.get("reverse", {}).get("thermodynamics", {}).get("tm")
-        for p in primers
-        if p.get("reverse")
-    ]
-    tm_values = [value for value in tm_values if isinstance(value, (int, float))]
-    tm_span = max(tm_values) - min(tm_values) if tm_values else 0.0
-    metadata_tags = sorted({
-        tag
-        for primer in primers
-        for tag in primer.get("metadata_tags", [])
-    })
-    return {
-        "primer_sets": len(primers),
-        "primer_warnings": warning_count,
-        "primer_state": "review" if warning_count else "ok",
-        "metadata_tags": metadata_tags,
-        "tm_span": tm_span,
-    }
-
-
-def _restriction_guardrail_summary(result: dict[str, Any]) -> dict[str, Any]:
-    """Summarise restriction digest guardrail metadata."""
-
-    # purpose: propagate kinetics, buffer, and tag details to asset views
-    alerts = result.get("alerts", [])
-    digests = result.get("digests", [])
-    metadata_tags = sorted({
-        tag
-        for digest in digests
-        for tag in digest.get("metadata_tags", [])
-    })
-    buffers = sorted({
-        (digest.get("buffer") or {}).get("name")
-        for digest in digests
-        if (digest.get("buffer") or {}).get("name")
-    })
-    kinetics = sorted({
-        profile.get("name")
-        for digest in digests
-        for profile in digest.get("kinetics_profiles", [])
-        if profile.get("name")
-    })
-    return {
-        "restriction_alerts": alerts,
-        "restriction_state": "review" if alerts else "ok",
-        "metadata_tags": metadata_tags,
-        "buffers": buffers,
-        "kinetics": kinetics,
-    }
-
-
-def _assembly_guardrail_summary(result: dict[str, Any]) -> dict[str, Any]:
-    """Summarise assembly simulation outputs for guardrails."""
-
-    # purpose: align asset summaries with planner assembly heuristics
-    success = result.get("average_success", 0.0)
-    state = "ok" if success >= 0.7 else "review"
-    steps = result.get("steps", [])
-    metadata_tags = sorted({
-        tag
-        for step in steps
-        for tag in step.get("metadata_tags", [])
-    })
-    ligation_profiles = sorted({
-        (step.get("ligation_profile") or {}).get("strategy")
-        for step in steps
-        if (step.get("ligation_profile") or {}).get("strategy")
-    })
-    buffers = sorted({
-        (step.get("buffer") or {}).get("name")
-        for step in steps
-        if (step.get("buffer") or {}).get("name")
-    })
-    kinetics = sorted({
-        profile.get("name")
-        for step in steps
-        for profile in step.get("kinetics_profiles", [])
-        if profile.get("name")
-    })
-    return {
-        "assembly_success": success,
-        "assembly_state": state,
-        "metadata_tags": metadata_tags,
-        "ligation_profiles": ligation_profiles,
-        "buffers": buffers,
-        "kinetics": kinetics,
-    }
-
-
-def _kinetics_summary(digest: dict[str, Any], assembly: dict[str, Any]) -> dict[str, Any]:
-    """Aggregate kinetics descriptors across digest and assembly outputs."""
-
-    # purpose: provide reusable kinetics summaries for DNA asset serialization
-    enzymes: set[str] = set()
-    buffers: set[str] = set()
-    ligation_profiles: set[str] = set()
-    metadata_tags: set[str] = set()
-    for entry in digest.get("digests", []):
-        metadata_tags.update(entry.get("metadata_tags", []))
-        buffer = (entry.get("buffer") or {}).get("name")
-        if buffer:
-            buffers.add(buffer)
-        for profile in entry.get("kinetics_profiles", []):
-            if profile.get("name"):
-                enzymes.add(profile["name"])
-            metadata_tags.update(profile.get("metadata_tags", []))
-    for step in assembly.get("steps", []):
-        metadata_tags.update(step.get("metadata_tags", []))
-        buffer = (step.get("buffer") or {}).get("name")
-        if buffer:
-            buffers.add(buffer)
-        ligation = step.get("ligation_profile") or {}
-        strategy = ligation.get("strategy")
-        if strategy:
-            ligation_profiles.add(strategy)
-        for profile in step.get("kinetics_profiles", []):
-            if profile.get("name"):
-                enzymes.add(profile["name"])
-            metadata_tags.update(profile.get("metadata_tags", []))
-    return {
-        "enzymes": sorted(enzymes),
-        "buffers": sorted(buffers),
-        "ligation_profiles": sorted(ligation_profiles),
-        "metadata_tags": sorted(metadata_tags),
-    }
+    # versions are immutable, so results are memoized per sequence checksum and profile
+    key = (checksum or sequence_checksum(sequence), profile.model_dump_json())
+    cached = _GUARDRAIL_CACHE.get(key)
+    if cached is None:
+        cached = _run_sequence_guardrails(sequence, profile)
+        _GUARDRAIL_CACHE.put(key, cached)
+    return copy.deepcopy(cached)
 
 
-def _analyse_sequence_guardrails(sequence: str, profile: SequenceToolkitProfile) -> dict[str, Any]:
-    """Run toolkit analyses to derive guardrail and kinetics summaries."""
-
-    # purpose: ensure DNA asset serialization reflects kinetics-aware toolkit outputs
+def _run_sequence_guardrails(sequence: str, profile: SequenceToolkitProfile) -> dict[str, Any]:
     template = [{"name": "asset_version", "sequence": sequence}]
     primer_payload = sequence_toolkit.design_primers(template, config=profile)
     digest_payload = sequence_toolkit.analyze_restriction_digest(template, config=profile)
@@ -832,6 +675,53 @@ def _analyse_sequence_guardrails(sequence: str, profile: SequenceToolkitProfile)
     }
 
 
+@dataclass(frozen=True)
+class _PendingIndexVersion:
+    """Snapshot of a flushed version, taken while its attributes are still loaded."""
+
+    id: UUID
+    sequence: str
+    sequence_checksum: str
+    sequence_length: int
+
+
+_PENDING_INDEX_KEY = "dna_assets_pending_index"
+
+
+def _index_version(db: Session, version: models.DNAAssetVersion) -> None:
+    # purpose: keep library BLAST current without syncing on the search path
+    # note: queued on the session and written only after commit, so rolled-back versions never
+    #       reach the index; failures are left to the periodic reconcile task
+    db.info.setdefault(_PENDING_INDEX_KEY, []).append(
+        _PendingIndexVersion(
+            id=version.id,
+            sequence=version.sequence,
+            sequence_checksum=version.sequence_checksum,
+            sequence_length=version.sequence_length,
+        )
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _index_committed_versions(db: Session) -> None:
+    pending = db.info.pop(_PENDING_INDEX_KEY, None)
+    if not pending:
+        return
+    try:
+        sequence_search.index_library_versions(pending)
+    except OSError:
+        logger.warning(
+            "library index update failed for versions %s",
+            ", ".join(str(entry.id) for entry in pending),
+            exc_info=True,
+        )
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_index(db: Session) -> None:
+    db.info.pop(_PENDING_INDEX_KEY, None)
+
+
 def _build_version(
     asset: models.DNAAsset,
     payload: DNAAssetVersionCreate | DNAAssetCreate,
@@ -839,20 +729,26 @@ def _build_version(
     created_by_id: UUID | None,
     profile: SequenceToolkitProfile,
 ) -> models.DNAAssetVersion:
-    metrics = sequence_toolkit.compute_sequence_metrics(payload.sequence)
     version_index = len(asset.versions) + 1
     version = models.DNAAssetVersion(
         asset_id=asset.id,
         version_index=version_index,
         sequence=payload.sequence,
-        sequence_checksum=_sequence_checksum(payload.sequence),
-        sequence_length=metrics["length"],
-        gc_content=metrics["gc_content"],
+        sequence_checksum=sequence_checksum(payload.sequence),
         meta=dict(payload.metadata or {}),
         comment=getattr(payload, "comment", None),
         created_at=_utcnow(),
         created_by_id=created_by_id,
     )
+    # GC and length come straight from the packed payload when the sequence packs
+    packed = version.packed_sequence
+    if packed is not None:
+        version.sequence_length = len(packed)
+        version.gc_content = packed.gc_content()
+    else:
+        metrics = sequence_toolkit.compute_sequence_metrics(payload.sequence)
+        version.sequence_length = metrics["length"]
+        version.gc_content = metrics["gc_content"]
     annotations = _normalise_annotations(getattr(payload, "annotations", None))
     for descriptor in annotations:
         version.annotations.append(
@@ -932,6 +828,7 @@ def create_asset(
     asset.latest_version = version
     _apply_tags(asset, payload.tags)
     db.flush()
+    _index_version(db, version)
     if evaluation and organization:
         compliance_meta = dict(asset.meta.get("compliance") or {})
         compliance_meta.update(
@@ -1026,12 +923,21 @@ def add_version(
                     .one_or_none()
                 )
 
+    parent = asset.latest_version
     version = _build_version(
         asset,
         payload,
         created_by_id=getattr(created_by, "id", None),
         profile=profile,
     )
+    if parent is not None:
+        # derive feature overlays from the parent's cached analysis, rescanning only edited windows
+        seed_sequence_features(
+            parent.sequence,
+            version.sequence,
+            parent_checksum=parent.sequence_checksum,
+            checksum=version.sequence_checksum,
+        )
     asset.versions.append(version)
     asset.latest_version = version
     asset.updated_at = _utcnow()
@@ -1085,6 +991,7 @@ def add_version(
                 created_by=created_by,
             )
     db.flush()
+    _index_version(db, version)
     return version
 
 
@@ -1132,7 +1039,9 @@ def serialize_version(version: models.DNAAssetVersion) -> DNAAssetVersionOut:
         )
         for annotation in version.annotations
     ]
-    analysis = _analyse_sequence_guardrails(version.sequence, _DEFAULT_PROFILE)
+    analysis = _analyse_sequence_guardrails(
+        version.sequence, _DEFAULT_PROFILE, checksum=version.sequence_checksum
+    )
     kinetics_summary = DNAAssetKineticsSummary(**analysis["kinetics"])
     guardrails = DNAAssetGuardrailHeuristics(**analysis["guardrails"])
     return DNAAssetVersionOut(
@@ -1325,7 +1234,9 @@ def _build_viewer_tracks(
 
 
 def _generate_translations(
-    sequence: str, features: list[DNAViewerFeature]
+    sequence: str,
+    features: list[DNAViewerFeature],
+    packed: PackedSequence | None = None,
 ) -> list[DNAViewerTranslation]:
     translations: list[DNAViewerTranslation] = []
     for feature in features:
@@ -1334,10 +1245,15 @@ def _generate_translations(
             continue
         start = max(1, feature.start)
         end = max(start, feature.end)
-        subseq = sequence[start - 1 : end]
         strand = feature.strand or 1
-        if strand < 0:
-            subseq = _reverse_complement(subseq)
+        if packed is not None:
+            # decode only the feature window; reverse strands complement on packed bytes
+            window = packed.subsequence(start - 1, end)
+            subseq = window.reverse_complement().decode() if strand < 0 else window.decode()
+        else:
+            subseq = sequence[start - 1 : end]
+            if strand < 0:
+                subseq = _reverse_complement(subseq)
         amino_acids = feature.qualifiers.get("translation") or _translate_codons(subseq)
         frame_base = ((start - 1) % 3) + 1
         frame = frame_base if strand >= 0 else -frame_base
@@ -1368,7 +1284,9 @@ def build_viewer_payload(
     version_out = serialize_version(latest)
     guardrails = version_out.guardrail_heuristics
     tracks = _build_viewer_tracks(version_out, guardrails)
-    translations = _generate_translations(latest.sequence, tracks[0].features)
+    translations = _generate_translations(
+        latest.sequence, tracks[0].features, latest.packed_sequence
+    )
     frame_summary = _compute_translation_frame_summary(translations)
     topology = (
         (asset.meta or {}).get("topology")
@@ -1379,18 +1297,16 @@ def build_viewer_payload(
     diff = None
     if compare_to is not None:
         diff = diff_versions(compare_to, latest)
-    gc_skew = _compute_gc_skew(latest.sequence)
-    cai = _compute_codon_adaptation_index(latest.sequence)
-    motif_hotspots = _find_motif_hotspots(latest.sequence)
+    features = get_sequence_features(latest.sequence, checksum=latest.sequence_checksum)
     analytics = DNAViewerAnalytics(
-        codon_usage=_compute_codon_usage(latest.sequence),
-        gc_skew=gc_skew,
+        codon_usage=features.codon_usage,
+        gc_skew=features.gc_skew,
         thermodynamic_risk=_compute_thermodynamic_risk(
-            latest.sequence, guardrails, gc_skew=gc_skew
+            latest.sequence, guardrails, gc_skew=features.gc_skew, features=features
         ),
         translation_frames=frame_summary,
-        codon_adaptation_index=cai,
-        motif_hotspots=motif_hotspots,
+        codon_adaptation_index=features.codon_adaptation_index,
+        motif_hotspots=features.motif_hotspots,
     )
     governance_context = _build_viewer_governance_context(asset, version_out, db=db)
     return DNAViewerPayload(
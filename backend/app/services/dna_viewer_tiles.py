@@ -0,0 +1,224 @@
+"""Windowed, tile-based viewer payloads for large DNA assets."""
+
+# purpose: serve region + zoom viewer tiles with summary bins instead of whole-sequence payloads
+# status: experimental
+# depends_on: backend.app.models, backend.app.services.packed_sequence, backend.app.services.dna_assets
+# related_docs: docs/dna_assets.md
+
+from __future__ import annotations
+
+import math
+import os
+import threading
+from collections import OrderedDict
+from typing import Any
+
+import numpy as np
+
+from .. import models
+from ..schemas import (
+    DNAViewerFeature,
+    DNAViewerTile,
+    DNAViewerTileBin,
+    DNAViewerTilesResponse,
+)
+from .packed_sequence import PackedSequence
+
+# display bins per tile; a tile spans TILE_BINS * 2**zoom bases
+TILE_BINS = int(os.getenv("DNA_VIEWER_TILE_BINS", "1024"))
+MAX_TILES_PER_REQUEST = int(os.getenv("DNA_VIEWER_MAX_TILES", "8"))
+TILE_CACHE_SIZE = int(os.getenv("DNA_VIEWER_TILE_CACHE_SIZE", "512"))
+MAX_ZOOM = 24
+
+
+class TileCache:
+    """Thread-safe LRU of sequence-derived tile content keyed by checksum, zoom, and index."""
+
+    # purpose: generate tiles lazily once per sequence checksum and reuse them across versions
+    # status: experimental
+
+    def __init__(self, maxsize: int = TILE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, int, int], dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple[str, int, int]) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: tuple[str, int, int], entry: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_CACHE = TileCache()
+
+
+def get_tile_cache() -> TileCache:
+    """Return the process-wide viewer tile cache."""
+
+    return _CACHE
+
+
+def choose_zoom(region_length: int) -> int:
+    """Pick the lowest zoom whose bins fit the region into one tile."""
+
+    if region_length <= TILE_BINS:
+        return 0
+    return min(MAX_ZOOM, math.ceil(math.log2(region_length / TILE_BINS)))
+
+
+def _summary_bins(window: str, start: int, bases_per_bin: int) -> list[dict[str, Any]]:
+    """Aggregate GC content, GC skew, and ambiguous bases per bin."""
+
+    raw = np.frombuffer(window.upper().encode("ascii"), dtype=np.uint8)
+    count = math.ceil(len(raw) / bases_per_bin)
+    padded = np.zeros(count * bases_per_bin, dtype=np.uint8)
+    padded[: len(raw)] = raw
+    rows = padded.reshape(count, bases_per_bin)
+    g = (rows == ord("G")).sum(axis=1)
+    c = (rows == ord("C")).sum(axis=1)
+    bases = np.isin(rows, np.frombuffer(b"ACGTU", dtype=np.uint8)).sum(axis=1)
+    ambiguous = (rows != 0).sum(axis=1) - bases
+    sizes = np.minimum(bases_per_bin, len(raw) - np.arange(count) * bases_per_bin)
+    bins = []
+    for index in range(count):
+        gc = int(g[index] + c[index])
+        bins.append(
+            {
+                "start": start + index * bases_per_bin + 1,
+                "end": start + index * bases_per_bin + int(sizes[index]),
+                "gc_content": round(gc / int(sizes[index]) * 100, 4),
+                "gc_skew": round((int(g[index]) - int(c[index])) / gc, 4) if gc else 0.0,
+                "ambiguous_bases": int(ambiguous[index]),
+            }
+        )
+    return bins
+
+
+def _build_tile(packed: PackedSequence, zoom: int, index: int) -> dict[str, Any]:
+    """Render the sequence-derived part of one tile."""
+
+    from .dna_assets import _MOTIF_LIBRARY, _find_motif_hotspots
+
+    bases_per_bin = 1 << zoom
+    span = TILE_BINS * bases_per_bin
+    start = index * span
+    end = min(start + span, len(packed))
+    window = packed.slice(start, end)
+    tile: dict[str, Any] = {
+        "index": index,
+        "start": start + 1,
+        "end": end,
+        "sequence": None,
+        "bins": _summary_bins(window, start, bases_per_bin),
+        "motif_hotspots": [],
+    }
+    if zoom == 0:
+        tile["sequence"] = window
+        # extend the scan window so motifs straddling the tile edge are kept by their start tile
+        overlap = max(len(motif["sequence"]) for motif in _MOTIF_LIBRARY) - 1
+        scan = window + packed.slice(end, end + overlap)
+        tile["motif_hotspots"] = [
+            {**hit, "start": hit["start"] + start, "end": hit["end"] + start}
+            for hit in _find_motif_hotspots(scan)
+            if hit["start"] <= len(window)
+        ]
+    return tile
+
+
+def _region_features(version: models.DNAAssetVersion, start: int, end: int) -> list[DNAViewerFeature]:
+    features = []
+    for annotation in version.annotations:
+        if annotation.end < start or annotation.start > end:
+            continue
+        features.append(
+            DNAViewerFeature(
+                label=annotation.label,
+                feature_type=annotation.feature_type,
+                start=annotation.start,
+                end=annotation.end,
+                strand=annotation.strand,
+                qualifiers=dict(annotation.qualifiers or {}),
+            )
+        )
+    features.sort(key=lambda feature: (feature.start, feature.end))
+    return features
+
+
+def build_viewer_tiles(
+    version: models.DNAAssetVersion,
+    *,
+    start: int = 1,
+    end: int | None = None,
+    zoom: int | None = None,
+) -> DNAViewerTilesResponse:
+    """Return the cached tiles covering a 1-based inclusive region at a zoom level."""
+
+    # purpose: windowed replacement for build_viewer_payload on 50-200 kb constructs
+    # inputs: asset version, 1-based region bounds, optional zoom (bases per bin = 2**zoom)
+    # outputs: DNAViewerTilesResponse with summary bins, base-level sequence at zoom 0, and region features
+    # status: experimental
+    length = version.sequence_length
+    end = length if end is None else min(end, length)
+    start = max(1, start)
+    if end < start:
+        raise ValueError("Region end must not precede start")
+    if zoom is None:
+        zoom = choose_zoom(end - start + 1)
+    if not 0 <= zoom <= MAX_ZOOM:
+        raise ValueError(f"Zoom must be between 0 and {MAX_ZOOM}")
+    span = TILE_BINS << zoom
+    first, last = (start - 1) // span, (end - 1) // span
+    if last - first + 1 > MAX_TILES_PER_REQUEST:
+        raise ValueError("Region spans too many tiles for the requested zoom")
+    packed = version.packed_sequence
+    if packed is None:
+        raise ValueError("Version sequence cannot be tiled")
+    tiles = []
+    for index in range(first, last + 1):
+        key = (version.sequence_checksum, zoom, index)
+        tile = _CACHE.get(key)
+        if tile is None:
+            tile = _build_tile(packed, zoom, index)
+            _CACHE.put(key, tile)
+        tiles.append(
+            DNAViewerTile(
+                index=tile["index"],
+                start=tile["start"],
+                end=tile["end"],
+                sequence=tile["sequence"],
+                bins=[DNAViewerTileBin(**item) for item in tile["bins"]],
+                motif_hotspots=list(tile["motif_hotspots"]),
+            )
+        )
+    return DNAViewerTilesResponse(
+        asset_id=version.asset_id,
+        version_id=version.id,
+        sequence_checksum=version.sequence_checksum,
+        sequence_length=length,
+        zoom=zoom,
+        bases_per_bin=1 << zoom,
+        tile_span=span,
+        start=start,
+        end=end,
+        tiles=tiles,
+        features=_region_features(version, start, end),
+    )
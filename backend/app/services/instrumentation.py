@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import heapq
+import json
+import os
+import zlib
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
-from typing import Iterable
-from uuid import UUID
+from typing import Iterable, Iterator, Sequence
+from uuid import UUID, uuid4, uuid5
 
+import numpy as np
 import sqlalchemy as sa
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
 
 from .. import models, schemas
@@ -15,13 +21,21 @@ from . import billing as billing_service
 
 # purpose: orchestrate robotic instrument reservations, runs, and telemetry with custody guardrails
 # status: pilot
-# depends_on: backend.app.models.Equipment, backend.app.models.InstrumentRunReservation
+# depends_on: backend.app.models.Equipment, backend.app.models.InstrumentRunReservation, numpy
 # related_docs: docs/instrumentation/README.md
 
 _ACTIVE_RESERVATION_STATUSES = {"scheduled", "pending_clearance", "in_progress"}
 _ACTIVE_RUN_STATUSES = {"queued", "running"}
 _GUARDRAIL_BLOCKING_SEVERITY = {"critical"}
 
+TELEMETRY_CHUNK_SECONDS = int(os.getenv("INSTRUMENT_TELEMETRY_CHUNK_SECONDS", "60"))
+TELEMETRY_PAGE_SIZE = int(os.getenv("INSTRUMENT_TELEMETRY_PAGE_SIZE", "1000"))
+TELEMETRY_MAX_PAGE_SIZE = 10000
+# rollup tiers in seconds, maintained on ingest; queries pick the finest tier that fits the width
+TELEMETRY_ROLLUP_TIERS = tuple(
+    sorted(int(tier) for tier in os.getenv("INSTRUMENT_TELEMETRY_ROLLUP_TIERS", "1,10,60").split(",") if tier.strip())
+)
+
 _SIMULATION_SCENARIOS: dict[str, list[dict[str, object]]] = {
     "thermal_cycle": [
         {"event_type": "telemetry", "channel": "temperature", "payload": {"value": 25.0}, "offset_seconds": 0},
@@ -336,29 +350,288 @@ def update_run_status(
     return run
 
 
-def record_telemetry_sample(
+def _naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _bucket_start(recorded_at: datetime, bucket_seconds: int) -> datetime:
+    epoch = int(recorded_at.replace(tzinfo=timezone.utc).timestamp())
+    return datetime.fromtimestamp(epoch - epoch % bucket_seconds, tz=timezone.utc).replace(tzinfo=None)
+
+
+def _encode_chunk(entries: list[list]) -> bytes:
+    # chunk layout: zlib-compressed JSON array of [microseconds since bucket_start, payload]
+    return zlib.compress(json.dumps(entries, separators=(",", ":"), default=str).encode("utf-8"))
+
+
+def _decode_chunk(blob: bytes) -> list[list]:
+    return json.loads(zlib.decompress(blob))
+
+
+def _sample_id(chunk_id: UUID, index: int) -> UUID:
+    """Derive a stable sample identifier from its chunk and append position."""
+
+    return uuid5(chunk_id, str(index))
+
+
+def _ingest_samples(
     db: Session,
     run_id: UUID,
-    payload: schemas.InstrumentTelemetrySampleCreate,
-) -> models.InstrumentTelemetrySample:
-    """Persist telemetry envelope for a running instrument."""
+    samples: Sequence[schemas.InstrumentTelemetrySampleCreate],
+) -> tuple[list[tuple[UUID, int, datetime]], int]:
+    """Append samples to their (channel, time bucket) chunks with bulk inserts and updates."""
+
+    # purpose: write a batch with one chunk lookup, one bulk INSERT, and one bulk UPDATE
+    # inputs: session, active run id, samples in arrival order
+    # outputs: ((chunk id, position, recorded_at) per input sample, number of chunks touched)
+    # status: pilot
+    received_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    grouped: dict[tuple[str, datetime], list[tuple[int, datetime, dict]]] = defaultdict(list)
+    for position, sample in enumerate(samples):
+        recorded_at = _naive_utc(sample.recorded_at) if sample.recorded_at else received_at
+        key = (sample.channel, _bucket_start(recorded_at, TELEMETRY_CHUNK_SECONDS))
+        grouped[key].append((position, recorded_at, sample.payload))
+
+    chunk_table = models.InstrumentTelemetryChunk
+    existing = {
+        (row.channel, row.bucket_start): row
+        for row in db.execute(
+            sa.select(
+                chunk_table.id,
+                chunk_table.channel,
+                chunk_table.bucket_start,
+                chunk_table.sample_count,
+                chunk_table.first_recorded_at,
+                chunk_table.last_recorded_at,
+                chunk_table.samples,
+            )
+            .where(
+                chunk_table.run_id == run_id,
+                chunk_table.channel.in_({channel for channel, _ in grouped}),
+                chunk_table.bucket_start.in_({bucket for _, bucket in grouped}),
+            )
+            # lock touched chunks (in id order, to avoid deadlocks) until commit: a concurrent
+            # batch for the same bucket waits here and then decodes the updated sample array
+            .order_by(chunk_table.id)
+            .with_for_update()
+        )
+    }
+
+    placements: list[tuple[UUID, int, datetime] | None] = [None] * len(samples)
+    inserts: list[dict] = []
+    updates: list[dict] = []
+    for (channel, bucket_start), members in grouped.items():
+        current = existing.get((channel, bucket_start))
+        entries = _decode_chunk(current.samples) if current else []
+        chunk_id = current.id if current else uuid4()
+        for position, recorded_at, payload in members:
+            offset = int((recorded_at - bucket_start).total_seconds() * 1_000_000)
+            placements[position] = (chunk_id, len(entries), recorded_at)
+            entries.append([offset, payload])
+        times = [recorded_at for _, recorded_at, _ in members]
+        first = min(times + ([current.first_recorded_at] if current else []))
+        last = max(times + ([current.last_recorded_at] if current else []))
+        values = {
+            "id": chunk_id,
+            "sample_count": len(entries),
+            "first_recorded_at": first,
+            "last_recorded_at": last,
+            "samples": _encode_chunk(entries),
+            "updated_at": received_at,
+        }
+        if current:
+            updates.append(values)
+        else:
+            inserts.append(
+                {
+                    **values,
+                    "run_id": run_id,
+                    "channel": channel,
+                    "bucket_start": bucket_start,
+                    "bucket_seconds": TELEMETRY_CHUNK_SECONDS,
+                    "encoding": "zlib+json",
+                    "created_at": received_at,
+                }
+            )
+    if inserts:
+        db.execute(sa.insert(chunk_table), inserts)
+    if updates:
+        db.execute(sa.update(chunk_table), updates)
+    _update_rollups(
+        db,
+        run_id,
+        [
+            (channel, recorded_at, payload)
+            for (channel, _), members in grouped.items()
+            for _, recorded_at, payload in members
+        ],
+        received_at,
+    )
+    return placements, len(grouped)
+
+
+def _numeric_fields(payload: dict) -> Iterator[tuple[str, float]]:
+    for field in payload or {}:
+        value = _numeric_value(payload, field)
+        if value is not None:
+            yield field, value
 
+
+def _merge_field_stats(stats: dict, field: str, value: float) -> None:
+    current = stats.setdefault(field, {"min": value, "max": value, "sum": 0.0, "count": 0})
+    current["min"] = min(current["min"], value)
+    current["max"] = max(current["max"], value)
+    current["sum"] += value
+    current["count"] += 1
+
+
+def _update_rollups(
+    db: Session,
+    run_id: UUID,
+    rows: Sequence[tuple[str, datetime, dict]],
+    received_at: datetime,
+) -> None:
+    """Fold a batch of samples into every rollup tier with one lookup and bulk writes."""
+
+    # purpose: keep min/max/sum/count per (channel, tier, bucket) current as samples arrive
+    # inputs: session, run id, (channel, recorded_at, payload) rows of the batch being ingested
+    # outputs: none; inserts new rollup buckets and updates touched ones
+    # status: pilot
+    if not TELEMETRY_ROLLUP_TIERS:
+        return
+    counts: dict[tuple[str, int, datetime], int] = defaultdict(int)
+    batch_stats: dict[tuple[str, int, datetime], dict] = defaultdict(dict)
+    for channel, recorded_at, payload in rows:
+        for tier in TELEMETRY_ROLLUP_TIERS:
+            key = (channel, tier, _bucket_start(recorded_at, tier))
+            counts[key] += 1
+            for field, value in _numeric_fields(payload):
+                _merge_field_stats(batch_stats[key], field, value)
+
+    rollup_table = models.InstrumentTelemetryRollup
+    existing = {
+        (row.channel, row.tier_seconds, row.bucket_start): row
+        for row in db.execute(
+            sa.select(
+                rollup_table.id,
+                rollup_table.channel,
+                rollup_table.tier_seconds,
+                rollup_table.bucket_start,
+                rollup_table.sample_count,
+                rollup_table.stats,
+            )
+            .where(
+                rollup_table.run_id == run_id,
+                rollup_table.channel.in_({channel for channel, _, _ in counts}),
+                rollup_table.bucket_start.in_({bucket for _, _, bucket in counts}),
+            )
+            # same row locking as the chunk lookup so concurrent batches merge, not overwrite
+            .order_by(rollup_table.id)
+            .with_for_update()
+        )
+    }
+    inserts: list[dict] = []
+    updates: list[dict] = []
+    for key, count in counts.items():
+        channel, tier, bucket_start = key
+        current = existing.get(key)
+        if current is None:
+            inserts.append(
+                {
+                    "id": uuid4(),
+                    "run_id": run_id,
+                    "channel": channel,
+                    "tier_seconds": tier,
+                    "bucket_start": bucket_start,
+                    "sample_count": count,
+                    "stats": batch_stats.get(key, {}),
+                    "updated_at": received_at,
+                }
+            )
+            continue
+        merged = {field: dict(values) for field, values in (current.stats or {}).items()}
+        for field, values in batch_stats.get(key, {}).items():
+            target = merged.get(field)
+            if target is None:
+                merged[field] = dict(values)
+                continue
+            target["min"] = min(target["min"], values["min"])
+            target["max"] = max(target["max"], values["max"])
+            target["sum"] += values["sum"]
+            target["count"] += values["count"]
+        updates.append(
+            {
+                "id": current.id,
+                "sample_count": current.sample_count + count,
+                "stats": merged,
+                "updated_at": received_at,
+            }
+        )
+    if inserts:
+        db.execute(sa.insert(rollup_table), inserts)
+    if updates:
+        db.execute(sa.update(rollup_table), updates)
+
+
+def _write_samples(
+    db: Session,
+    run_id: UUID,
+    samples: Sequence[schemas.InstrumentTelemetrySampleCreate],
+) -> tuple[list[tuple[UUID, int, datetime]], int]:
     run = db.get(models.InstrumentRun, run_id)
     if not run:
         raise InstrumentNotFound(f"run {run_id} not found")
     if run.status not in _ACTIVE_RUN_STATUSES:
         raise GuardrailViolation("cannot stream telemetry for inactive run")
+    try:
+        with db.begin_nested():
+            return _ingest_samples(db, run_id, samples)
+    except IntegrityError:
+        # a concurrent batch created one of the bucket chunks first; merge into it instead
+        with db.begin_nested():
+            return _ingest_samples(db, run_id, samples)
+
+
+def record_telemetry_sample(
+    db: Session,
+    run_id: UUID,
+    payload: schemas.InstrumentTelemetrySampleCreate,
+) -> schemas.InstrumentTelemetrySampleOut:
+    """Persist telemetry envelope for a running instrument."""
 
-    sample = models.InstrumentTelemetrySample(
+    placements, _ = _write_samples(db, run_id, [payload])
+    chunk_id, index, recorded_at = placements[0]
+    return schemas.InstrumentTelemetrySampleOut(
+        id=_sample_id(chunk_id, index),
         run_id=run_id,
         channel=payload.channel,
         payload=payload.payload,
-        recorded_at=datetime.now(timezone.utc),
+        recorded_at=recorded_at,
+    )
+
+
+def record_telemetry_batch(
+    db: Session,
+    run_id: UUID,
+    payload: schemas.InstrumentTelemetryBatchCreate,
+) -> schemas.InstrumentTelemetryBatchResult:
+    """Persist an array of telemetry samples for a running instrument in one write."""
+
+    # purpose: batched ingest for high-frequency instruments (plate readers, qPCR)
+    # inputs: session, run id, batch of samples with optional instrument timestamps
+    # outputs: InstrumentTelemetryBatchResult with accepted count and chunk span
+    # status: pilot
+    placements, chunk_count = _write_samples(db, run_id, payload.samples)
+    times = [recorded_at for _, _, recorded_at in placements]
+    return schemas.InstrumentTelemetryBatchResult(
+        run_id=run_id,
+        accepted=len(placements),
+        chunk_count=chunk_count,
+        first_recorded_at=min(times),
+        last_recorded_at=max(times),
     )
-    db.add(sample)
-    db.flush()
-    db.refresh(sample)
-    return sample
 
 
 def list_runs(
@@ -378,24 +651,302 @@ def list_runs(
     return run_query.limit(limit).all()
 
 
-def load_run_envelope(db: Session, run_id: UUID) -> schemas.InstrumentRunTelemetryEnvelope:
-    """Load run metadata with telemetry samples."""
+def _parse_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        recorded_at, sample_id = cursor.split("~", 1)
+        return _naive_utc(datetime.fromisoformat(recorded_at)), str(UUID(sample_id))
+    except ValueError as exc:
+        raise ValueError("Invalid telemetry cursor") from exc
 
-    run = (
-        db.query(models.InstrumentRun)
-        .options(joinedload(models.InstrumentRun.telemetry_samples))
-        .filter(models.InstrumentRun.id == run_id)
-        .one_or_none()
+
+def _iter_chunk_samples(
+    db: Session,
+    run_id: UUID,
+    *,
+    channels: Sequence[str] | None,
+    start: datetime | None,
+    end: datetime | None,
+) -> Iterator[tuple[datetime, str, str, dict]]:
+    """Yield (recorded_at, sample id, channel, payload) in time order across channel chunks."""
+
+    # chunks are read in first-sample order and merged through a heap, so only chunks whose
+    # time spans overlap are decoded at the same time
+    chunk_table = models.InstrumentTelemetryChunk
+    query = (
+        sa.select(
+            chunk_table.id,
+            chunk_table.channel,
+            chunk_table.bucket_start,
+            chunk_table.first_recorded_at,
+            chunk_table.samples,
+        )
+        .where(chunk_table.run_id == run_id)
+        .order_by(chunk_table.first_recorded_at, chunk_table.id)
+        .execution_options(yield_per=64)
+    )
+    if channels:
+        query = query.where(chunk_table.channel.in_(channels))
+    if start:
+        query = query.where(chunk_table.last_recorded_at >= start)
+    if end:
+        query = query.where(chunk_table.first_recorded_at <= end)
+
+    pending: list[tuple[datetime, str, str, dict]] = []
+    for chunk in db.execute(query):
+        while pending and pending[0][0] < chunk.first_recorded_at:
+            yield heapq.heappop(pending)
+        for index, (offset, payload) in enumerate(_decode_chunk(chunk.samples)):
+            recorded_at = chunk.bucket_start + timedelta(microseconds=offset)
+            if (start and recorded_at < start) or (end and recorded_at > end):
+                continue
+            heapq.heappush(pending, (recorded_at, str(_sample_id(chunk.id, index)), chunk.channel, payload))
+    while pending:
+        yield heapq.heappop(pending)
+
+
+def _channel_sample_counts(
+    db: Session,
+    run_id: UUID,
+    *,
+    channels: Sequence[str] | None,
+    start: datetime | None,
+    end: datetime | None,
+) -> dict[str, int]:
+    # counts whole chunks overlapping the window; edge chunks may include samples outside it
+    chunk_table = models.InstrumentTelemetryChunk
+    query = (
+        sa.select(chunk_table.channel, sa.func.sum(chunk_table.sample_count))
+        .where(chunk_table.run_id == run_id)
+        .group_by(chunk_table.channel)
     )
+    if channels:
+        query = query.where(chunk_table.channel.in_(channels))
+    if start:
+        query = query.where(chunk_table.last_recorded_at >= start)
+    if end:
+        query = query.where(chunk_table.first_recorded_at <= end)
+    return {channel: int(total or 0) for channel, total in db.execute(query)}
+
+
+def load_run_envelope(
+    db: Session,
+    run_id: UUID,
+    *,
+    channels: Sequence[str] | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    cursor: str | None = None,
+    limit: int | None = None,
+    max_points: int | None = None,
+    downsample: str = "stride",
+    field: str | None = None,
+) -> schemas.InstrumentRunTelemetryEnvelope:
+    """Load run metadata with one page, or a per-channel decimation, of telemetry samples."""
+
+    # purpose: serve replay dashboards without materializing every sample of a run
+    # inputs: run id, optional channel/time window, keyset cursor and page size, or max_points
+    #         with "stride" (every n-th sample) or "lttb" (shape-preserving, by numeric `field`)
+    # outputs: InstrumentRunTelemetryEnvelope with next_cursor when more samples remain
+    # status: pilot
+    run = db.get(models.InstrumentRun, run_id)
     if not run:
         raise InstrumentNotFound(f"run {run_id} not found")
-
-    return schemas.InstrumentRunTelemetryEnvelope(
+    start = _naive_utc(start) if start else None
+    end = _naive_utc(end) if end else None
+    counts = _channel_sample_counts(db, run_id, channels=channels, start=start, end=end)
+    envelope = schemas.InstrumentRunTelemetryEnvelope(
         run=schemas.InstrumentRunOut.model_validate(run),
-        samples=[schemas.InstrumentTelemetrySampleOut.model_validate(s) for s in sorted(
-            run.telemetry_samples, key=lambda sample: sample.recorded_at
-        )],
+        total_samples=sum(counts.values()),
+    )
+
+    def _sample(recorded_at: datetime, sample_id: str, channel: str, payload: dict):
+        return schemas.InstrumentTelemetrySampleOut(
+            id=UUID(sample_id),
+            run_id=run_id,
+            channel=channel,
+            payload=payload,
+            recorded_at=recorded_at,
+        )
+
+    if downsample not in {"stride", "lttb"}:
+        raise ValueError(f"Unsupported downsample mode '{downsample}'")
+    after = _parse_cursor(cursor) if cursor and not max_points else None
+    stream_start = start
+    if after and (stream_start is None or after[0] > stream_start):
+        # the cursor time becomes the chunk lower bound, so a page never decodes earlier chunks
+        stream_start = after[0]
+    stream = _iter_chunk_samples(db, run_id, channels=channels, start=stream_start, end=end)
+    if max_points and downsample == "lttb":
+        by_channel: dict[str, list[tuple[datetime, str, str, dict]]] = defaultdict(list)
+        for row in stream:
+            by_channel[row[2]].append(row)
+        kept: list[tuple[datetime, str, str, dict]] = []
+        for channel, rows in by_channel.items():
+            selected = _lttb_select(rows, max_points, field)
+            envelope.downsampled = envelope.downsampled or len(selected) < len(rows)
+            kept.extend(selected)
+        kept.sort(key=lambda row: (row[0], row[1]))
+        envelope.samples = [_sample(*row) for row in kept]
+        return envelope
+    if max_points:
+        # keep every n-th sample per channel so each channel contributes about max_points
+        strides = {channel: max(1, -(-count // max_points)) for channel, count in counts.items()}
+        seen: dict[str, int] = defaultdict(int)
+        for recorded_at, sample_id, channel, payload in stream:
+            if seen[channel] % strides.get(channel, 1) == 0:
+                envelope.samples.append(_sample(recorded_at, sample_id, channel, payload))
+            seen[channel] += 1
+        envelope.downsampled = any(stride > 1 for stride in strides.values())
+        return envelope
+
+    page_size = min(limit or TELEMETRY_PAGE_SIZE, TELEMETRY_MAX_PAGE_SIZE)
+    for recorded_at, sample_id, channel, payload in stream:
+        if after and (recorded_at, sample_id) <= after:
+            continue
+        if len(envelope.samples) == page_size:
+            last = envelope.samples[-1]
+            envelope.next_cursor = f"{last.recorded_at.isoformat()}~{last.id}"
+            break
+        envelope.samples.append(_sample(recorded_at, sample_id, channel, payload))
+    return envelope
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> list[int]:
+    """Largest-Triangle-Three-Buckets: pick `threshold` points that preserve the series shape."""
+
+    count = len(x)
+    if threshold >= count:
+        return list(range(count))
+    if threshold < 3:
+        # no interior buckets to rank; keep the endpoints that anchor the series
+        return [0, count - 1][:max(threshold, 0)]
+    bucket_width = (count - 2) / (threshold - 2)
+    selected = [0]
+    anchor = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_width) + 1
+        stop = int((bucket + 1) * bucket_width) + 1
+        next_stop = min(int((bucket + 2) * bucket_width) + 1, count)
+        average_x = x[stop:next_stop].mean()
+        average_y = y[stop:next_stop].mean()
+        areas = np.abs(
+            (x[anchor] - average_x) * (y[start:stop] - y[anchor])
+            - (x[anchor] - x[start:stop]) * (average_y - y[anchor])
+        )
+        anchor = start + int(areas.argmax())
+        selected.append(anchor)
+    selected.append(count - 1)
+    return selected
+
+
+def _lttb_select(
+    rows: list[tuple[datetime, str, str, dict]],
+    threshold: int,
+    field: str | None,
+) -> list[tuple[datetime, str, str, dict]]:
+    # channels without a numeric field to rank by fall back to even striding
+    field = field or next(
+        (name for row in rows for name, _ in _numeric_fields(row[3])),
+        None,
     )
+    numeric = [row for row in rows if field and _numeric_value(row[3], field) is not None]
+    if not numeric:
+        stride = max(1, -(-len(rows) // threshold))
+        return rows[::stride]
+    x = np.array([row[0].replace(tzinfo=timezone.utc).timestamp() for row in numeric], dtype=float)
+    y = np.array([_numeric_value(row[3], field) for row in numeric], dtype=float)
+    return [numeric[index] for index in _lttb_indices(x, y, threshold)]
+
+
+def _numeric_value(payload: dict, field: str) -> float | None:
+    value = (payload or {}).get(field)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return None
+
+
+def select_rollup_tier(span: timedelta, width: int) -> int:
+    """Return the finest rollup tier that yields at most one bucket per pixel of `width`."""
+
+    for tier in TELEMETRY_ROLLUP_TIERS:
+        if span.total_seconds() / tier <= width:
+            return tier
+    return TELEMETRY_ROLLUP_TIERS[-1]
+
+
+def load_run_rollups(
+    db: Session,
+    run_id: UUID,
+    *,
+    width: int,
+    channels: Sequence[str] | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    tier_seconds: int | None = None,
+) -> schemas.InstrumentTelemetryRollupEnvelope:
+    """Return min/max/mean series per channel and numeric field from the best-fitting rollup tier."""
+
+    # purpose: dashboard-sized telemetry reads that never touch raw sample chunks
+    # inputs: run id, chart pixel width, optional channels and time window, optional forced tier
+    # outputs: InstrumentTelemetryRollupEnvelope ordered by channel, field, and bucket
+    # status: pilot
+    run = db.get(models.InstrumentRun, run_id)
+    if not run:
+        raise InstrumentNotFound(f"run {run_id} not found")
+    if tier_seconds is not None and tier_seconds not in TELEMETRY_ROLLUP_TIERS:
+        raise ValueError(f"Unknown rollup tier {tier_seconds}s; expected one of {list(TELEMETRY_ROLLUP_TIERS)}")
+    start = _naive_utc(start) if start else None
+    end = _naive_utc(end) if end else None
+
+    if start is None or end is None:
+        chunk_table = models.InstrumentTelemetryChunk
+        bounds_query = sa.select(
+            sa.func.min(chunk_table.first_recorded_at), sa.func.max(chunk_table.last_recorded_at)
+        ).where(chunk_table.run_id == run_id)
+        if channels:
+            bounds_query = bounds_query.where(chunk_table.channel.in_(channels))
+        first, last = db.execute(bounds_query).one()
+        start = start or first
+        end = end or last
+    tier = tier_seconds or (
+        select_rollup_tier(end - start, width) if start and end else TELEMETRY_ROLLUP_TIERS[0]
+    )
+    envelope = schemas.InstrumentTelemetryRollupEnvelope(
+        run_id=run_id, tier_seconds=tier, start=start, end=end
+    )
+    if start is None or end is None:
+        return envelope
+
+    rollup_table = models.InstrumentTelemetryRollup
+    query = (
+        sa.select(rollup_table.channel, rollup_table.bucket_start, rollup_table.stats)
+        .where(
+            rollup_table.run_id == run_id,
+            rollup_table.tier_seconds == tier,
+            rollup_table.bucket_start >= _bucket_start(start, tier),
+            rollup_table.bucket_start <= end,
+        )
+        .order_by(rollup_table.channel, rollup_table.bucket_start)
+    )
+    if channels:
+        query = query.where(rollup_table.channel.in_(channels))
+    series: dict[tuple[str, str], schemas.InstrumentTelemetrySeries] = {}
+    for channel, bucket_start, stats in db.execute(query):
+        for field, values in (stats or {}).items():
+            key = (channel, field)
+            if key not in series:
+                series[key] = schemas.InstrumentTelemetrySeries(channel=channel, field=field)
+            series[key].points.append(
+                schemas.InstrumentTelemetryRollupPoint(
+                    bucket_start=bucket_start,
+                    count=values["count"],
+                    min=values["min"],
+                    max=values["max"],
+                    mean=values["sum"] / values["count"] if values["count"] else 0.0,
+                )
+            )
+    envelope.series = [series[key] for key in sorted(series)]
+    return envelope
 
 
 def simulate_run(
@@ -450,10 +1001,9 @@ def simulate_run(
             sample_payload = schemas.InstrumentTelemetrySampleCreate(
                 channel=str(step.get("channel", "unknown")),
                 payload={**(step.get("payload") or {}), "simulated": True},
+                recorded_at=recorded_at_naive,
             )
             sample = record_telemetry_sample(db, run.id, sample_payload)
-            sample.recorded_at = recorded_at_naive
-            db.flush()
             events.append(
                 schemas.InstrumentSimulationEvent(
                     sequence=sequence,
@@ -0,0 +1,241 @@
+"""Set-based bulk update and delete engine for inventory items."""
+
+# purpose: apply inventory bulk operations with one permission query and set-based writes per request
+# status: pilot
+# depends_on: backend.app.models, backend.app.search, backend.app.pubsub
+# related_docs: backend/app/services/README.md
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, Sequence
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from .. import models, schemas
+
+_NOT_FOUND = "404: Item not found"
+_NOT_AUTHORIZED = "403: Not authorized"
+
+
+@dataclass
+class BulkOutcome:
+    """Per-item results plus what the caller must index and publish after commit."""
+
+    results: list[schemas.BulkOperationResult] = field(default_factory=list)
+    # team id -> ids of items that changed, for one coalesced event per team
+    team_items: dict[UUID, list[UUID]] = field(default_factory=dict)
+    applied: list[UUID] = field(default_factory=list)
+    # refreshed rows of updated items, for search reindexing
+    items: list[models.InventoryItem] = field(default_factory=list)
+    # old and new teams of items whose team_id changed, for relationship graph cache invalidation
+    moved_teams: set[UUID] = field(default_factory=set)
+
+    def response(self) -> schemas.BulkOperationResponse:
+        successful = sum(1 for result in self.results if result.success)
+        return schemas.BulkOperationResponse(
+            results=self.results,
+            total=len(self.results),
+            successful=successful,
+            failed=len(self.results) - successful,
+        )
+
+
+def resolve_item_access(
+    db: Session,
+    user: models.User,
+    item_ids: Iterable[UUID],
+    roles: Sequence[str] = ("manager", "owner"),
+) -> tuple[dict[UUID, UUID | None], dict[UUID, str]]:
+    """Return (allowed item id -> team id, denied item id -> error) from a single query."""
+
+    # purpose: set-based equivalent of rbac.ensure_item_access for many items at once
+    # inputs: session, acting user, item ids, team roles that grant write access
+    # outputs: allowed ids mapped to their team, plus 404/403 messages for the rest
+    # status: pilot
+    wanted = set(item_ids)
+    if not wanted:
+        return {}, {}
+    rows = db.execute(
+        sa.select(
+            models.InventoryItem.id,
+            models.InventoryItem.team_id,
+            models.InventoryItem.owner_id,
+            models.TeamMember.role,
+        )
+        .outerjoin(
+            models.TeamMember,
+            sa.and_(
+                models.TeamMember.team_id == models.InventoryItem.team_id,
+                models.TeamMember.user_id == user.id,
+            ),
+        )
+        .where(models.InventoryItem.id.in_(wanted))
+    )
+    allowed: dict[UUID, UUID | None] = {}
+    denied: dict[UUID, str] = {}
+    for item_id, team_id, owner_id, role in rows:
+        if user.is_admin or owner_id == user.id or (team_id and role in roles):
+            allowed[item_id] = team_id
+        else:
+            denied[item_id] = _NOT_AUTHORIZED
+    for item_id in wanted - allowed.keys() - denied.keys():
+        denied[item_id] = _NOT_FOUND
+    return allowed, denied
+
+
+def _apply_set_based(
+    db: Session,
+    item_ids: list[UUID],
+    statement: Callable[[list[UUID]], Any],
+) -> dict[UUID, str]:
+    """Run one statement for all ids; if it fails, retry per item to attribute the failures."""
+
+    try:
+        with db.begin_nested():
+            db.execute(statement(item_ids))
+        return {}
+    except SQLAlchemyError:
+        pass
+    failures: dict[UUID, str] = {}
+    for item_id in item_ids:
+        try:
+            with db.begin_nested():
+                db.execute(statement([item_id]))
+        except SQLAlchemyError as exc:
+            failures[item_id] = str(getattr(exc, "orig", None) or exc)
+    return failures
+
+
+def _audit_rows(user: models.User, action: str, item_ids: Iterable[UUID], now: datetime) -> list[dict]:
+    return [
+        {
+            "user_id": user.id,
+            "action": action,
+            "target_type": "inventory",
+            "target_id": item_id,
+            "details": {},
+            "created_at": now,
+        }
+        for item_id in item_ids
+    ]
+
+
+def _finish(
+    db: Session,
+    user: models.User,
+    action: str,
+    ordered_ids: list[UUID],
+    allowed: dict[UUID, UUID | None],
+    failures: dict[UUID, str],
+    now: datetime,
+) -> BulkOutcome:
+    outcome = BulkOutcome()
+    applied = [item_id for item_id in allowed if item_id not in failures]
+    if applied:
+        db.execute(sa.insert(models.AuditLog), _audit_rows(user, action, applied, now))
+    db.commit()
+    applied_set = set(applied)
+    for item_id in ordered_ids:
+        if item_id in applied_set:
+            outcome.results.append(schemas.BulkOperationResult(success=True, item_id=item_id))
+        else:
+            outcome.results.append(
+                schemas.BulkOperationResult(success=False, item_id=item_id, error=failures[item_id])
+            )
+    for item_id in applied:
+        team_id = allowed[item_id]
+        if team_id:
+            outcome.team_items.setdefault(team_id, []).append(item_id)
+    outcome.applied = applied
+    return outcome
+
+
+def bulk_update_items(
+    db: Session,
+    user: models.User,
+    updates: Sequence[schemas.BulkUpdateItem],
+) -> BulkOutcome:
+    """Apply per-item field changes with one UPDATE per distinct change set, in one transaction."""
+
+    # purpose: replace the per-item commit/refresh/audit loop behind POST /api/inventory/bulk/update
+    # inputs: session, acting user, ordered update requests (later entries win for repeated ids)
+    # outputs: BulkOutcome with one result per request entry, committed
+    # status: pilot
+    # note: items sharing identical changes (e.g. a status flip across 5,000 items) share one statement
+    changes: dict[UUID, dict[str, Any]] = {}
+    for update in updates:
+        changes.setdefault(update.id, {}).update(update.data.model_dump(exclude_unset=True))
+    allowed, failures = resolve_item_access(db, user, changes.keys())
+    now = datetime.now(timezone.utc)
+
+    # request order is kept so per-item fallbacks resolve conflicts first-come, as the loop did
+    groups: dict[str, list[UUID]] = {}
+    for item_id, change in changes.items():
+        if item_id in allowed:
+            groups.setdefault(json.dumps(change, sort_keys=True, default=str), []).append(item_id)
+    for item_ids in groups.values():
+        values = {**changes[item_ids[0]], "updated_at": now}
+        failures.update(
+            _apply_set_based(
+                db,
+                item_ids,
+                lambda ids, values=values: sa.update(models.InventoryItem)
+                .where(models.InventoryItem.id.in_(ids))
+                .values(**values)
+                .execution_options(synchronize_session=False),
+            )
+        )
+    outcome = _finish(
+        db, user, "bulk_update_item", [update.id for update in updates], allowed, failures, now
+    )
+    # reload once for reindexing; events go to each item's team after the update, as before
+    outcome.items = (
+        db.query(models.InventoryItem).filter(models.InventoryItem.id.in_(outcome.applied)).all()
+        if outcome.applied
+        else []
+    )
+    outcome.team_items = {}
+    for item in outcome.items:
+        if item.team_id:
+            outcome.team_items.setdefault(item.team_id, []).append(item.id)
+        if item.team_id != allowed[item.id]:
+            outcome.moved_teams.update(team for team in (allowed[item.id], item.team_id) if team)
+    return outcome
+
+
+def bulk_delete_items(
+    db: Session,
+    user: models.User,
+    item_ids: Sequence[UUID],
+) -> BulkOutcome:
+    """Delete permitted items with set-based DELETEs in one transaction."""
+
+    # purpose: replace the per-item delete/commit/audit loop behind POST /api/inventory/bulk/delete
+    # inputs: session, acting user, ordered item ids
+    # outputs: BulkOutcome with one result per requested id, committed
+    # status: pilot
+    allowed, failures = resolve_item_access(db, user, item_ids)
+    now = datetime.now(timezone.utc)
+
+    def _delete(ids: list[UUID]):
+        # custody logs are removed by the ORM cascade on single deletes; mirror it before the DELETE
+        db.execute(
+            sa.delete(models.GovernanceSampleCustodyLog)
+            .where(models.GovernanceSampleCustodyLog.inventory_item_id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
+        return (
+            sa.delete(models.InventoryItem)
+            .where(models.InventoryItem.id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
+
+    ordered = list(dict.fromkeys(item_id for item_id in item_ids if item_id in allowed))
+    failures.update(_apply_set_based(db, ordered, _delete))
+    return _finish(db, user, "bulk_delete_item", list(item_ids), allowed, failures, now)
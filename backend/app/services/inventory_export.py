@@ -0,0 +1,246 @@
+"""Streaming CSV and Parquet exports for inventory items."""
+
+# purpose: export any inventory size with flat memory by streaming rows from a server-side cursor
+# status: pilot
+# depends_on: backend.app.models, backend.app.database
+# related_docs: backend/app/services/README.md
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import os
+from typing import Any, Iterator
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..database import SessionLocal
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:  # pragma: no cover - dependency optional in tests
+    pa = None  # type: ignore
+    pq = None  # type: ignore
+
+EXPORT_BATCH_SIZE = int(os.getenv("INVENTORY_EXPORT_BATCH_SIZE", "1000"))
+CSV_COLUMNS = ("id", "item_type", "name", "status", "barcode", "team_id", "owner_id", "created_at")
+CUSTOM_DATA_PREFIX = "custom_data."
+
+_ITEM_COLUMNS = (
+    models.InventoryItem.id,
+    models.InventoryItem.item_type,
+    models.InventoryItem.name,
+    models.InventoryItem.status,
+    models.InventoryItem.barcode,
+    models.InventoryItem.team_id,
+    models.InventoryItem.owner_id,
+    models.InventoryItem.created_at,
+    models.InventoryItem.updated_at,
+)
+
+
+def parquet_supported() -> bool:
+    return pa is not None
+
+
+def _visible(statement: sa.Select, owner_id: UUID, team_ids: list[UUID] | None) -> sa.Select:
+    # team_ids is None for admins, who see every item
+    if team_ids is None:
+        return statement
+    return statement.where(
+        sa.or_(
+            models.InventoryItem.owner_id == owner_id,
+            models.InventoryItem.team_id.in_(team_ids),
+        )
+    )
+
+
+def _iter_partitions(
+    db: Session, owner_id: UUID, team_ids: list[UUID] | None, *columns
+) -> Iterator[list[sa.Row]]:
+    """Yield visible rows in batches from a server-side cursor, oldest first."""
+
+    statement = _visible(sa.select(*columns), owner_id, team_ids).order_by(
+        models.InventoryItem.created_at.asc(), models.InventoryItem.id.asc()
+    )
+    # yield_per streams results (server-side cursor on PostgreSQL) and selecting plain columns
+    # keeps rows out of the identity map, so memory is bounded by one batch
+    result = db.execute(statement.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    try:
+        yield from result.partitions()
+    finally:
+        result.close()
+
+
+def iter_csv(owner_id: UUID, team_ids: list[UUID] | None) -> Iterator[str]:
+    """Yield the CSV export one batch of rows at a time."""
+
+    # purpose: body of GET /api/inventory/export?format=csv
+    # inputs: requesting user id and team ids (None for admins); non-admins see owned and team items
+    # outputs: CSV text chunks with the same columns as the original in-memory export
+    # status: pilot
+    # note: the body outlives the request, so it reads through its own session, never the request's
+    db = SessionLocal()
+    try:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(CSV_COLUMNS)
+        yield buffer.getvalue()
+        for partition in _iter_partitions(db, owner_id, team_ids, *_ITEM_COLUMNS[:-1]):
+            buffer.seek(0)
+            buffer.truncate(0)
+            for item_id, item_type, name, status, barcode, team_id, item_owner_id, created_at in partition:
+                writer.writerow(
+                    [
+                        str(item_id),
+                        item_type,
+                        name,
+                        status,
+                        barcode or "",
+                        str(team_id) if team_id else "",
+                        str(item_owner_id) if item_owner_id else "",
+                        created_at.isoformat() if created_at else "",
+                    ]
+                )
+            yield buffer.getvalue()
+    finally:
+        db.close()
+
+
+def _flatten(data: Any, prefix: str = CUSTOM_DATA_PREFIX) -> Iterator[tuple[str, Any]]:
+    """Yield (dotted column name, value) pairs for nested custom_data objects."""
+
+    if not isinstance(data, dict):
+        return
+    for key, value in data.items():
+        if isinstance(value, dict) and value:
+            yield from _flatten(value, f"{prefix}{key}.")
+        else:
+            yield f"{prefix}{key}", value
+
+
+def _value_kind(value: Any) -> str:
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "float"
+    return "string"
+
+
+def _merge_kind(current: str | None, kind: str) -> str:
+    if current is None or current == kind:
+        return kind
+    if {current, kind} == {"int", "float"}:
+        return "float"
+    return "string"
+
+
+def _custom_field_kinds(db: Session, owner_id: UUID, team_ids: list[UUID] | None) -> dict[str, str]:
+    # first pass over custom_data only; memory holds the column set, not the rows
+    kinds: dict[str, str | None] = {}
+    for partition in _iter_partitions(db, owner_id, team_ids, models.InventoryItem.custom_data):
+        for (custom_data,) in partition:
+            for column, value in _flatten(custom_data):
+                current = kinds.get(column)
+                kinds[column] = current if value is None else _merge_kind(current, _value_kind(value))
+    return {column: kind or "string" for column, kind in kinds.items()}
+
+
+def _coerce(value: Any, kind: str) -> Any:
+    if value is None:
+        return None
+    if kind == "float":
+        return float(value)
+    if kind == "string" and not isinstance(value, str):
+        return json.dumps(value, sort_keys=True, default=str)
+    return value
+
+
+class _ChunkSink:
+    """Write-only file object that hands back what was written since the last drain."""
+
+    def __init__(self) -> None:
+        self._buffer = io.BytesIO()
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        written = self._buffer.write(data)
+        self._position += written
+        return written
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate(0)
+        return data
+
+
+def iter_parquet(owner_id: UUID, team_ids: list[UUID] | None) -> Iterator[bytes]:
+    """Yield a Parquet file with one row group per batch and custom_data flattened to columns."""
+
+    # purpose: body of GET /api/inventory/export?format=parquet for analytics consumers
+    # inputs: requesting user id and team ids (None for admins); non-admins see owned and team items
+    # outputs: Parquet bytes; custom_data keys become `custom_data.<path>` columns typed as
+    #          bool/int64/float64 when every value agrees, otherwise JSON-encoded strings
+    # status: pilot
+    # note: scans twice (custom_data keys, then rows) because Parquet needs the schema up front
+    if pa is None:
+        raise RuntimeError("pyarrow is required for Parquet exports")
+    db = SessionLocal()
+    try:
+        kinds = _custom_field_kinds(db, owner_id, team_ids)
+        arrow_types = {"bool": pa.bool_(), "int": pa.int64(), "float": pa.float64(), "string": pa.string()}
+        custom_columns = sorted(kinds)
+        schema = pa.schema(
+            [
+                *((name, pa.string()) for name in CSV_COLUMNS[:-1]),
+                ("created_at", pa.timestamp("us")),
+                ("updated_at", pa.timestamp("us")),
+                *((column, arrow_types[kinds[column]]) for column in custom_columns),
+            ]
+        )
+        sink = _ChunkSink()
+        writer = pq.ParquetWriter(sink, schema, compression="zstd")
+        try:
+            partitions = _iter_partitions(
+                db, owner_id, team_ids, *_ITEM_COLUMNS, models.InventoryItem.custom_data
+            )
+            for partition in partitions:
+                columns: dict[str, list[Any]] = {name: [] for name in schema.names}
+                for row in partition:
+                    columns["id"].append(str(row.id))
+                    columns["item_type"].append(row.item_type)
+                    columns["name"].append(row.name)
+                    columns["status"].append(row.status)
+                    columns["barcode"].append(row.barcode)
+                    columns["team_id"].append(str(row.team_id) if row.team_id else None)
+                    columns["owner_id"].append(str(row.owner_id) if row.owner_id else None)
+                    columns["created_at"].append(row.created_at)
+                    columns["updated_at"].append(row.updated_at)
+                    flat = dict(_flatten(row.custom_data))
+                    for column in custom_columns:
+                        columns[column].append(_coerce(flat.get(column), kinds[column]))
+                writer.write_batch(pa.RecordBatch.from_pydict(columns, schema=schema))
+                yield sink.drain()
+        finally:
+            writer.close()
+        yield sink.drain()
+    finally:
+        db.close()
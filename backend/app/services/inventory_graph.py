@@ -0,0 +1,237 @@
+"""Relationship graph traversal for inventory items."""
+
+# purpose: build item lineage graphs with a bounded number of queries instead of two per node
+# status: pilot
+# depends_on: backend.app.models
+# related_docs: backend/app/services/README.md
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Iterable
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+from .. import models
+
+GRAPH_MAX_DEPTH = int(os.getenv("INVENTORY_GRAPH_MAX_DEPTH", "10"))
+GRAPH_MAX_NODES = int(os.getenv("INVENTORY_GRAPH_MAX_NODES", "500"))
+GRAPH_MAX_EDGES = int(os.getenv("INVENTORY_GRAPH_MAX_EDGES", "2000"))
+# seconds a team's adjacency stays cached; 0 disables the cache. Entries are invalidated
+# in-process on relationship/item writes, so other workers may serve them until they expire
+GRAPH_CACHE_TTL = float(os.getenv("INVENTORY_GRAPH_CACHE_TTL", "0"))
+GRAPH_CACHE_SIZE = int(os.getenv("INVENTORY_GRAPH_CACHE_SIZE", "64"))
+
+# dialects whose WITH RECURSIVE we rely on for single-query discovery
+_RECURSIVE_CTE_DIALECTS = {"postgresql", "sqlite"}
+
+
+@dataclass
+class ItemGraph:
+    nodes: list[models.InventoryItem] = field(default_factory=list)
+    edges: list[models.ItemRelationship] = field(default_factory=list)
+    truncated: bool = False
+
+
+@dataclass(frozen=True)
+class TeamAdjacency:
+    """Neighbours of every item in one team, including edges that leave the team."""
+
+    members: frozenset[UUID]
+    neighbors: dict[UUID, tuple[UUID, ...]]
+
+
+class AdjacencyCache:
+    """Thread-safe LRU of per-team adjacency with a time-to-live."""
+
+    # purpose: serve repeated graph views of the same team without touching item_relationships
+
+    def __init__(self, maxsize: int = GRAPH_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[UUID, tuple[float, TeamAdjacency]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, team_id: UUID) -> TeamAdjacency | None:
+        with self._lock:
+            entry = self._entries.get(team_id)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[team_id]
+                return None
+            self._entries.move_to_end(team_id)
+            return entry[1]
+
+    def put(self, team_id: UUID, adjacency: TeamAdjacency, ttl: float) -> None:
+        if self.maxsize <= 0 or ttl <= 0:
+            return
+        with self._lock:
+            self._entries[team_id] = (time.monotonic() + ttl, adjacency)
+            self._entries.move_to_end(team_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, team_ids: Iterable[UUID | None]) -> None:
+        with self._lock:
+            for team_id in team_ids:
+                self._entries.pop(team_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_CACHE = AdjacencyCache()
+
+
+def get_adjacency_cache() -> AdjacencyCache:
+    """Return the process-wide adjacency cache."""
+
+    return _CACHE
+
+
+def _other_end(node: sa.ColumnElement) -> sa.ColumnElement:
+    rel = models.ItemRelationship
+    return sa.case((rel.from_item == node, rel.to_item), else_=rel.from_item)
+
+
+def _team_adjacency(db: Session, team_id: UUID) -> TeamAdjacency:
+    cached = _CACHE.get(team_id)
+    if cached is not None:
+        return cached
+    rel = models.ItemRelationship
+    members = frozenset(
+        db.execute(sa.select(models.InventoryItem.id).where(models.InventoryItem.team_id == team_id)).scalars()
+    )
+    team_items = sa.select(models.InventoryItem.id).where(models.InventoryItem.team_id == team_id)
+    neighbors: dict[UUID, list[UUID]] = {member: [] for member in members}
+    for from_item, to_item in db.execute(
+        sa.select(rel.from_item, rel.to_item).where(
+            sa.or_(rel.from_item.in_(team_items), rel.to_item.in_(team_items))
+        )
+    ):
+        if from_item in neighbors:
+            neighbors[from_item].append(to_item)
+        if to_item in neighbors:
+            neighbors[to_item].append(from_item)
+    adjacency = TeamAdjacency(
+        members=members, neighbors={node: tuple(others) for node, others in neighbors.items()}
+    )
+    _CACHE.put(team_id, adjacency, GRAPH_CACHE_TTL)
+    return adjacency
+
+
+def _discover_frontier(
+    db: Session, start: UUID, depth: int, limit: int, adjacency: TeamAdjacency | None = None
+) -> dict[UUID, int]:
+    """Breadth-first discovery with one query per level for nodes the adjacency does not cover."""
+
+    rel = models.ItemRelationship
+    levels = {start: 0}
+    frontier = [start]
+    for level in range(1, depth + 1):
+        if not frontier or len(levels) >= limit:
+            break
+        found: list[UUID] = []
+        uncached = frontier
+        if adjacency is not None:
+            uncached = [node for node in frontier if node not in adjacency.members]
+            for node in frontier:
+                found.extend(adjacency.neighbors.get(node, ()))
+        if uncached:
+            pending = set(uncached)
+            for from_item, to_item in db.execute(
+                sa.select(rel.from_item, rel.to_item).where(
+                    sa.or_(rel.from_item.in_(pending), rel.to_item.in_(pending))
+                )
+            ):
+                if from_item in pending:
+                    found.append(to_item)
+                if to_item in pending:
+                    found.append(from_item)
+        frontier = []
+        for other in found:
+            if other not in levels and len(levels) < limit:
+                levels[other] = level
+                frontier.append(other)
+    return levels
+
+
+def _discover_recursive(db: Session, start: UUID, depth: int, limit: int) -> dict[UUID, int]:
+    """Single-query discovery via WITH RECURSIVE over the undirected relationship graph."""
+
+    rel = models.ItemRelationship
+    reach = sa.select(
+        sa.literal(start, rel.from_item.type).label("node"),
+        sa.literal(0).label("level"),
+    ).cte("reach", recursive=True)
+    step = (
+        sa.select(_other_end(reach.c.node), reach.c.level + 1)
+        .select_from(rel)
+        .join(reach, sa.or_(rel.from_item == reach.c.node, rel.to_item == reach.c.node))
+        .where(reach.c.level < depth)
+    )
+    reach = reach.union(step)
+    # UNION drops repeated (node, level) pairs, so each node appears at most depth + 1 times;
+    # this row budget is enough to see `limit` distinct nodes and lets PostgreSQL stop early
+    rows = db.execute(sa.select(reach.c.node, reach.c.level).limit(limit * (depth + 1)))
+    levels: dict[UUID, int] = {}
+    for node, level in rows:
+        if node in levels:
+            levels[node] = min(levels[node], level)
+        elif len(levels) < limit:
+            levels[node] = level
+    return levels
+
+
+def build_item_graph(db: Session, start: UUID, depth: int = 1) -> ItemGraph:
+    """Return the items within `depth` hops of `start` and the relationships between them."""
+
+    # purpose: engine behind GET /api/inventory/items/{item_id}/graph
+    # inputs: session, starting item id (access already checked), hop depth
+    # outputs: ItemGraph with nodes ordered by hop distance, deduplicated edges among them, and
+    #          truncated=True when GRAPH_MAX_NODES or GRAPH_MAX_EDGES cut the result
+    # status: pilot
+    # note: discovery is one recursive CTE where supported, else one query per level; with
+    #       INVENTORY_GRAPH_CACHE_TTL set, the start item's team adjacency is served from cache
+    if depth < 0:
+        raise ValueError("depth must not be negative")
+    depth = min(depth, GRAPH_MAX_DEPTH)
+    start_item = db.get(models.InventoryItem, start)
+    if start_item is None:
+        return ItemGraph()
+    limit = GRAPH_MAX_NODES + 1
+    if GRAPH_CACHE_TTL > 0 and start_item.team_id:
+        adjacency = _team_adjacency(db, start_item.team_id)
+        levels = _discover_frontier(db, start, depth, limit, adjacency)
+    elif db.get_bind().dialect.name in _RECURSIVE_CTE_DIALECTS:
+        levels = _discover_recursive(db, start, depth, limit)
+    else:
+        levels = _discover_frontier(db, start, depth, limit)
+
+    graph = ItemGraph(truncated=len(levels) > GRAPH_MAX_NODES)
+    node_ids = sorted(levels, key=lambda node: (levels[node], str(node)))[:GRAPH_MAX_NODES]
+    items = {
+        item.id: item
+        for item in db.query(models.InventoryItem).filter(models.InventoryItem.id.in_(node_ids))
+    }
+    graph.nodes = [items[node] for node in node_ids if node in items]
+    rel = models.ItemRelationship
+    edges = (
+        db.query(rel)
+        .filter(rel.from_item.in_(node_ids), rel.to_item.in_(node_ids))
+        .order_by(rel.id)
+        .limit(GRAPH_MAX_EDGES + 1)
+        .all()
+    )
+    if len(edges) > GRAPH_MAX_EDGES:
+        graph.truncated = True
+        edges = edges[:GRAPH_MAX_EDGES]
+    graph.edges = edges
+    return graph
@@ -0,0 +1,123 @@
+"""Keyset pagination, projection, and counting for inventory listings."""
+
+# purpose: keep GET /api/inventory/items latency and payload flat as inventories grow
+# status: pilot
+# depends_on: backend.app.models, backend.app.schemas
+# related_docs: backend/app/services/README.md
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+from datetime import datetime
+from typing import Any, Sequence
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import models, schemas
+
+DEFAULT_PAGE_SIZE = int(os.getenv("INVENTORY_PAGE_SIZE", "100"))
+MAX_PAGE_SIZE = int(os.getenv("INVENTORY_MAX_PAGE_SIZE", "500"))
+# count=estimate counts exactly up to this many rows before falling back to an estimate
+COUNT_ESTIMATE_CAP = int(os.getenv("INVENTORY_COUNT_ESTIMATE_CAP", "10000"))
+
+PROJECTABLE_FIELDS = tuple(schemas.InventoryItemOut.model_fields)
+# always selected so every projected row can anchor the next cursor
+_KEY_FIELDS = ("id", "created_at")
+
+
+def page_size(limit: int | None) -> int:
+    if limit is None:
+        return DEFAULT_PAGE_SIZE
+    if limit < 1:
+        raise ValueError("limit must be positive")
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def encode_cursor(created_at: datetime, item_id: UUID) -> str:
+    """Return an opaque token for the position after (created_at, id)."""
+
+    payload = json.dumps({"created_at": created_at.isoformat(), "id": str(item_id)})
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("utf-8")
+
+
+def decode_cursor(token: str) -> tuple[datetime, UUID]:
+    try:
+        raw = json.loads(base64.urlsafe_b64decode(token.encode("utf-8")).decode("utf-8"))
+        return datetime.fromisoformat(raw["created_at"]), UUID(raw["id"])
+    except (ValueError, KeyError, TypeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def parse_fields(fields: str | None) -> list[str] | None:
+    """Return the requested response fields (plus the cursor keys), or None for full items."""
+
+    if not fields:
+        return None
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = sorted(set(requested) - set(PROJECTABLE_FIELDS))
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return list(dict.fromkeys([*_KEY_FIELDS, *requested]))
+
+
+def paginate(query: sa.Select, cursor: str | None, limit: int) -> sa.Select:
+    """Order by (created_at, id) and seek past the cursor; fetches one extra row to detect more."""
+
+    # purpose: keyset pagination so deep pages cost the same as the first (no OFFSET scans)
+    # inputs: filtered select over InventoryItem, opaque cursor from the previous page, page size
+    # outputs: select returning up to limit + 1 rows; backed by ix_inventory_items_created_at_id
+    # status: pilot
+    if cursor:
+        created_at, item_id = decode_cursor(cursor)
+        query = query.where(
+            sa.tuple_(models.InventoryItem.created_at, models.InventoryItem.id)
+            > sa.tuple_(
+                sa.literal(created_at, models.InventoryItem.created_at.type),
+                sa.literal(item_id, models.InventoryItem.id.type),
+            )
+        )
+    return query.order_by(models.InventoryItem.created_at.asc(), models.InventoryItem.id.asc()).limit(
+        limit + 1
+    )
+
+
+def next_cursor(rows: Sequence[Any], limit: int) -> str | None:
+    if len(rows) <= limit:
+        return None
+    last = rows[limit - 1]
+    return encode_cursor(last.created_at, last.id)
+
+
+async def count_items(db: AsyncSession, query: sa.Select, mode: str) -> tuple[int, bool]:
+    """Return (count, estimated) for a filtered listing query."""
+
+    # purpose: back count=exact|estimate without scanning 100k+ rows on every estimate request
+    # inputs: async session, filtered (unpaginated) select, count mode
+    # outputs: exact count, or for large results the PostgreSQL planner estimate (other dialects
+    #          report COUNT_ESTIMATE_CAP as a lower bound)
+    # status: pilot
+    if mode == "exact":
+        return await db.scalar(sa.select(sa.func.count()).select_from(query.subquery())), False
+    if mode != "estimate":
+        raise ValueError("count must be exact or estimate")
+    capped = await db.scalar(
+        sa.select(sa.func.count()).select_from(
+            query.with_only_columns(models.InventoryItem.id).limit(COUNT_ESTIMATE_CAP + 1).subquery()
+        )
+    )
+    if capped <= COUNT_ESTIMATE_CAP:
+        return capped, False
+    if db.bind.dialect.name == "postgresql":
+        try:
+            compiled = query.compile(dialect=db.bind.dialect, compile_kwargs={"literal_binds": True})
+            plan = await db.scalar(sa.text(f"EXPLAIN (FORMAT JSON) {compiled}"))
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"]), True
+        except (sa.exc.SQLAlchemyError, NotImplementedError, KeyError, TypeError, ValueError):
+            pass
+    return COUNT_ESTIMATE_CAP, True
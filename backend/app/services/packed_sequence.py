@@ -0,0 +1,274 @@
+"""Compact 2-bit storage codec for DNA asset sequences."""
+
+# purpose: pack ACGT bases four per byte with exception and case masks so asset versions store ~4x smaller
+# status: experimental
+# depends_on: numpy
+# related_docs: docs/dna_assets.md
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import struct
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+
+MAGIC = b"2BIT"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sBIII")  # magic, version, length, exception runs, lowercase runs
+_RUN = struct.Struct("<II")
+_BASES = "ACGT"
+_ENCODE_TABLE = bytes(_BASES.index(chr(code)) if chr(code) in _BASES else 0 for code in range(256))
+_IS_BASE = np.zeros(256, dtype=bool)
+_IS_BASE[[ord(base) for base in _BASES]] = True
+_DECODE = np.frombuffer(_BASES.encode("ascii"), dtype=np.uint8)
+_SHIFTS = np.array([6, 4, 2, 0], dtype=np.uint8)
+# number of C/G codes (1, 2) among the four 2-bit slots of each byte
+_GC_PER_BYTE = np.array(
+    [sum(((value >> shift) & 3) in (1, 2) for shift in (6, 4, 2, 0)) for value in range(256)],
+    dtype=np.int64,
+)
+# complement every slot (code ^ 3) and reverse slot order within the byte
+_RC_BYTE = np.array(
+    [
+        sum((3 - ((value >> (2 * slot)) & 3)) << (6 - 2 * slot) for slot in range(4))
+        for value in range(256)
+    ],
+    dtype=np.uint8,
+)
+# exception complements mirror dna_assets._reverse_complement (U reads as T, N stays N)
+_EXCEPTION_COMPLEMENT = str.maketrans({"U": "A"})
+
+
+def sequence_checksum(sequence: str) -> str:
+    """Return the sha256 hex digest identifying a sequence's text content."""
+
+    # purpose: shared content address for asset versions and the feature and alignment caches
+    return hashlib.sha256(sequence.encode("utf-8")).hexdigest()
+
+
+def _runs(mask: np.ndarray) -> list[tuple[int, int]]:
+    """Return [start, end) runs where mask is True."""
+
+    if not mask.any():
+        return []
+    edges = np.diff(np.concatenate([[0], mask.view(np.int8), [0]]))
+    starts = np.nonzero(edges == 1)[0]
+    ends = np.nonzero(edges == -1)[0]
+    return list(zip(starts.tolist(), ends.tolist()))
+
+
+def _pack_codes(codes: np.ndarray) -> bytes:
+    padded = np.zeros(((len(codes) + 3) // 4) * 4, dtype=np.uint8)
+    padded[: len(codes)] = codes
+    quads = padded.reshape(-1, 4)
+    return (
+        (quads[:, 0] << 6) | (quads[:, 1] << 4) | (quads[:, 2] << 2) | quads[:, 3]
+    ).astype(np.uint8).tobytes()
+
+
+def _unpack_codes(packed: np.ndarray, start: int, end: int) -> np.ndarray:
+    """Unpack codes for [start, end) from bytes covering start // 4 onwards."""
+
+    codes = ((packed[:, None] >> _SHIFTS) & 3).reshape(-1)
+    offset = start % 4
+    return codes[offset : offset + (end - start)]
+
+
+@dataclass(frozen=True)
+class PackedSequence:
+    """Immutable 2-bit packed sequence with exception and lowercase run masks."""
+
+    # purpose: lossless compact representation of asset versions supporting windowed decode
+    # inputs: serialized payload produced by `PackedSequence.encode(...).to_bytes()`
+    # outputs: decoded strings, zero-copy packed windows, GC and reverse complement on packed data
+    # status: experimental
+    length: int
+    packed: bytes
+    exceptions: tuple[tuple[int, str], ...] = ()
+    lowercase: tuple[tuple[int, int], ...] = ()
+
+    # -- construction ----------------------------------------------------
+    @classmethod
+    def encode(cls, sequence: str) -> "PackedSequence":
+        """Pack a sequence; raises ValueError for non-ASCII input."""
+
+        raw = (sequence or "").encode("ascii")
+        upper = raw.upper()
+        view = np.frombuffer(upper, dtype=np.uint8)
+        codes = np.frombuffer(upper.translate(_ENCODE_TABLE), dtype=np.uint8)
+        exceptions = tuple(
+            (start, upper[start:end].decode("ascii"))
+            for start, end in _runs(~_IS_BASE[view])
+        )
+        lowercase = tuple(
+            _runs(np.frombuffer(raw, dtype=np.uint8) != view)
+        )
+        return cls(len(raw), _pack_codes(codes), exceptions, lowercase)
+
+    @classmethod
+    def from_bytes(cls, payload: bytes | memoryview) -> "PackedSequence":
+        """Deserialize the on-disk layout written by `to_bytes`."""
+
+        view = memoryview(payload)
+        magic, version, length, exception_count, lowercase_count = _HEADER.unpack_from(view, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("Unsupported packed sequence payload")
+        offset = _HEADER.size
+        packed_size = (length + 3) // 4
+        packed = bytes(view[offset : offset + packed_size])
+        offset += packed_size
+        exceptions = []
+        for _ in range(exception_count):
+            start, size = _RUN.unpack_from(view, offset)
+            offset += _RUN.size
+            exceptions.append((start, bytes(view[offset : offset + size]).decode("ascii")))
+            offset += size
+        lowercase = []
+        for _ in range(lowercase_count):
+            lowercase.append(_RUN.unpack_from(view, offset))
+            offset += _RUN.size
+        return cls(length, packed, tuple(exceptions), tuple(lowercase))
+
+    def to_bytes(self) -> bytes:
+        parts = [
+            _HEADER.pack(MAGIC, FORMAT_VERSION, self.length, len(self.exceptions), len(self.lowercase)),
+            self.packed,
+        ]
+        for start, chars in self.exceptions:
+            encoded = chars.encode("ascii")
+            parts.append(_RUN.pack(start, len(encoded)))
+            parts.append(encoded)
+        for start, end in self.lowercase:
+            parts.append(_RUN.pack(start, end))
+        return b"".join(parts)
+
+    # -- access ----------------------------------------------------------
+    @cached_property
+    def _exception_starts(self) -> list[int]:
+        return [start for start, _ in self.exceptions]
+
+    @cached_property
+    def _lowercase_starts(self) -> list[int]:
+        return [start for start, _ in self.lowercase]
+
+    def __len__(self) -> int:
+        return self.length
+
+    def window(self, start: int, end: int) -> memoryview:
+        """Return a zero-copy view of the packed bytes covering [start, end)."""
+
+        start, end = self._clamp(start, end)
+        return memoryview(self.packed)[start // 4 : (end + 3) // 4]
+
+    def _clamp(self, start: int, end: int) -> tuple[int, int]:
+        start = min(max(start, 0), self.length)
+        return start, min(max(end, start), self.length)
+
+    def slice(self, start: int, end: int) -> str:
+        """Decode only the bases in [start, end)."""
+
+        start, end = self._clamp(start, end)
+        if start == end:
+            return ""
+        packed = np.frombuffer(self.window(start, end), dtype=np.uint8)
+        chars = _DECODE[_unpack_codes(packed, start, end)]
+        first = max(bisect.bisect_right(self._exception_starts, start) - 1, 0)
+        for exception_start, exception in self.exceptions[first:]:
+            if exception_start >= end:
+                break
+            lo = max(exception_start, start)
+            hi = min(exception_start + len(exception), end)
+            if lo < hi:
+                chars[lo - start : hi - start] = np.frombuffer(
+                    exception[lo - exception_start : hi - exception_start].encode("ascii"),
+                    dtype=np.uint8,
+                )
+        first = max(bisect.bisect_right(self._lowercase_starts, start) - 1, 0)
+        for run_start, run_end in self.lowercase[first:]:
+            if run_start >= end:
+                break
+            lo, hi = max(run_start, start), min(run_end, end)
+            if lo < hi:
+                chars[lo - start : hi - start] |= 0x20
+        return chars.tobytes().decode("ascii")
+
+    def decode(self) -> str:
+        return self.slice(0, self.length)
+
+    def subsequence(self, start: int, end: int) -> "PackedSequence":
+        """Return [start, end) as its own packed sequence without decoding bases."""
+
+        start, end = self._clamp(start, end)
+        packed = np.frombuffer(self.window(start, end), dtype=np.uint8)
+        codes = _unpack_codes(packed, start, end) if end > start else np.empty(0, dtype=np.uint8)
+        exceptions = tuple(
+            (max(run_start, start) - start, chars[max(start - run_start, 0) : end - run_start])
+            for run_start, chars in self.exceptions
+            if run_start < end and run_start + len(chars) > start
+        )
+        lowercase = tuple(
+            (max(run_start, start) - start, min(run_end, end) - start)
+            for run_start, run_end in self.lowercase
+            if run_start < end and run_end > start
+        )
+        return PackedSequence(end - start, _pack_codes(codes), exceptions, lowercase)
+
+    def gc_count(self) -> int:
+        """Count G/C bases (case-insensitive) straight from the packed bytes."""
+
+        codes = np.frombuffer(self.packed, dtype=np.uint8)
+        # padding and exception slots are encoded as A, so they never count
+        return int(_GC_PER_BYTE[codes].sum())
+
+    def gc_content(self) -> float:
+        """Match sequence_toolkit.compute_sequence_metrics GC percentage."""
+
+        if not self.length:
+            return 0.0
+        return (self.gc_count() / self.length) * 100
+
+    def reverse_complement(self) -> "PackedSequence":
+        """Return the uppercase reverse complement computed on packed bytes."""
+
+        # purpose: mirror dna_assets._reverse_complement without decoding to text
+        codes = np.frombuffer(self.packed, dtype=np.uint8)
+        reversed_bytes = _RC_BYTE[codes[::-1]]
+        pad = (-self.length) % 4
+        if pad and len(reversed_bytes):
+            # padding slots moved to the front; shift the whole stream left by pad slots
+            shift = np.uint8(2 * pad)
+            following = np.concatenate([reversed_bytes[1:], np.zeros(1, dtype=np.uint8)])
+            reversed_bytes = (reversed_bytes << shift) | (following >> np.uint8(8 - 2 * pad))
+            # clear trailing padding bits
+            reversed_bytes[-1] &= np.uint8((0xFF << (2 * pad)) & 0xFF)
+        exceptions = tuple(
+            (self.length - start - len(chars), chars[::-1].translate(_EXCEPTION_COMPLEMENT))
+            for start, chars in reversed(self.exceptions)
+        )
+        packed = reversed_bytes.astype(np.uint8).tobytes()
+        if exceptions:
+            # exception slots were encoded as A; after complementing they read T, reset to A
+            codes = _unpack_codes(np.frombuffer(packed, dtype=np.uint8), 0, self.length).copy()
+            for start, chars in exceptions:
+                codes[start : start + len(chars)] = 0
+            packed = _pack_codes(codes)
+        return PackedSequence(self.length, packed, exceptions, ())
+
+
+def pack_sequence(sequence: str) -> bytes | None:
+    """Serialize a sequence to the packed layout, or None when it cannot be packed."""
+
+    # purpose: storage entry point for DNAAssetVersion; non-ASCII text stays in the text column
+    try:
+        return PackedSequence.encode(sequence).to_bytes()
+    except UnicodeEncodeError:
+        return None
+
+
+def unpack_sequence(payload: bytes) -> str:
+    """Decode a payload written by `pack_sequence`."""
+
+    return PackedSequence.from_bytes(payload).decode()
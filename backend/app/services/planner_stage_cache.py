@@ -0,0 +1,136 @@
+"""Content-addressed cache for cloning planner toolkit stage outputs."""
+
+# purpose: reuse primer, restriction, and assembly payloads across planner sessions and branches
+# status: experimental
+# depends_on: backend.app.models, backend.app.data.loaders
+# related_docs: docs/planning/cloning_planner_scope.md
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..data.loaders import get_catalog_version
+
+STAGE_CACHE_ENABLED = os.getenv("CLONING_PLANNER_STAGE_CACHE", "1").lower() not in {"0", "false", "no"}
+STAGE_CACHE_MAX_ENTRIES = int(os.getenv("CLONING_PLANNER_STAGE_CACHE_MAX_ENTRIES", "512"))
+
+_STATS = {"hits": 0, "misses": 0, "evictions": 0}
+_STATS_LOCK = threading.Lock()
+
+
+def _record(counter: str, amount: int = 1) -> None:
+    with _STATS_LOCK:
+        _STATS[counter] += amount
+
+
+def cache_stats() -> dict[str, int]:
+    """Return process-wide hit, miss, and eviction counters."""
+
+    with _STATS_LOCK:
+        return dict(_STATS)
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    return str(value)
+
+
+def compute_cache_key(stage: str, *, inputs: Any, config: Any) -> str:
+    """Hash a stage name, its normalized inputs, resolved config, and the catalog version."""
+
+    # purpose: derive content addresses that change whenever any toolkit input changes
+    # inputs: stage name, JSON-like stage inputs, resolved toolkit config (profile, preset, overrides)
+    # outputs: hex sha256 digest
+    canonical = json.dumps(
+        {
+            "stage": stage,
+            "inputs": inputs,
+            "config": config,
+            "catalog_version": get_catalog_version(),
+        },
+        default=_default,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _evict(db: Session) -> None:
+    """Drop least recently used entries beyond the configured capacity."""
+
+    total = db.query(models.CloningPlannerStageCacheEntry).count()
+    overflow = total - STAGE_CACHE_MAX_ENTRIES
+    if overflow <= 0:
+        return
+    stale_keys = [
+        key
+        for (key,) in db.query(models.CloningPlannerStageCacheEntry.cache_key)
+        .order_by(models.CloningPlannerStageCacheEntry.last_accessed_at.asc())
+        .limit(overflow)
+    ]
+    db.query(models.CloningPlannerStageCacheEntry).filter(
+        models.CloningPlannerStageCacheEntry.cache_key.in_(stale_keys)
+    ).delete(synchronize_session=False)
+    _record("evictions", len(stale_keys))
+
+
+def cached_stage_result(
+    db: Session,
+    stage: str,
+    *,
+    inputs: Any,
+    config: Any,
+    compute: Callable[[], Any],
+) -> tuple[Any, str | None]:
+    """Return a stage payload from the cache or compute and store it."""
+
+    # purpose: skip identical toolkit recomputation on branched and resumed planner sessions
+    # inputs: db session, stage name, key material, zero-argument toolkit call
+    # outputs: (payload safe to mutate, "hit" | "miss" | None when caching is disabled)
+    # status: experimental
+    if not STAGE_CACHE_ENABLED:
+        return compute(), None
+    key = compute_cache_key(stage, inputs=inputs, config=config)
+    now = datetime.now(timezone.utc)
+    entry = db.get(models.CloningPlannerStageCacheEntry, key)
+    if entry is not None:
+        entry.hit_count = (entry.hit_count or 0) + 1
+        entry.last_accessed_at = now
+        db.add(entry)
+        _record("hits")
+        return copy.deepcopy(entry.payload), "hit"
+    payload = compute()
+    serialised = json.loads(json.dumps(payload, default=_default))
+    try:
+        with db.begin_nested():
+            db.add(
+                models.CloningPlannerStageCacheEntry(
+                    cache_key=key,
+                    stage=stage,
+                    payload=serialised,
+                    size_bytes=len(json.dumps(serialised)),
+                    hit_count=0,
+                    created_at=now,
+                    last_accessed_at=now,
+                )
+            )
+            db.flush()
+            _evict(db)
+    except IntegrityError:
+        # a concurrent run stored the same content address first
+        pass
+    _record("misses")
+    return copy.deepcopy(serialised), "miss"
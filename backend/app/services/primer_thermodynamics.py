@@ -0,0 +1,244 @@
+"""Vectorized primer thermodynamics engine for batch candidate scoring."""
+
+# purpose: score nearest-neighbor tm and complement-run heuristics for whole primer sets in one pass
+# status: experimental
+# depends_on: numpy, backend.app.services.sequence_toolkit
+# related_docs: docs/planning/cloning_planner_scope.md
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+_BASE_CODES = {"A": 0, "C": 1, "G": 2, "T": 3}
+_UNKNOWN_CODE = 4
+_DEFAULT_NN_PARAMS = (-7.0, -20.0)
+_COMPLEMENT_TABLE = str.maketrans("ACGTN", "TGCAN")
+# Pairs per chunk when scoring all-pairs cross-dimers; bounds the L×L match tensor
+_CROSS_DIMER_CHUNK = 4096
+
+
+@dataclass
+class EncodedPrimerBatch:
+    """Padded integer encodings for a primer candidate set."""
+
+    # purpose: share one encoding pass between tm, hairpin, homodimer, and cross-dimer kernels
+    # status: experimental
+    forward: np.ndarray
+    reverse_complement: np.ndarray
+    nn_codes: np.ndarray
+    lengths: np.ndarray
+
+    @property
+    def width(self) -> int:
+        return int(self.forward.shape[1])
+
+
+@dataclass
+class PrimerBatchThermodynamics:
+    """Per-primer thermodynamic metrics computed for a candidate set."""
+
+    # purpose: expose vectorized tm and complement-run metrics in input order
+    # status: experimental
+    tm: np.ndarray
+    hairpin_runs: np.ndarray
+    homodimer_runs: np.ndarray
+
+
+def _normalize(seq: str) -> str:
+    return (seq or "").upper().replace("U", "T")
+
+
+def _codepoints(value: str, dtype: np.dtype) -> np.ndarray:
+    if dtype == np.uint8:
+        return np.frombuffer(value.encode("ascii"), dtype=np.uint8)
+    return np.frombuffer(value.encode("utf-32-le"), dtype=np.uint32)
+
+
+def encode_primers(sequences: Sequence[str]) -> EncodedPrimerBatch:
+    """Encode primers as padded uint8 matrices for vectorized scoring."""
+
+    # purpose: convert primer strings into forward, reverse-complement, and NN code arrays
+    # inputs: primer sequences in any case, RNA bases tolerated
+    # outputs: EncodedPrimerBatch with zero padding and per-row lengths
+    normalized = [_normalize(seq) for seq in sequences]
+    lengths = np.fromiter((len(seq) for seq in normalized), dtype=np.int64, count=len(normalized))
+    width = int(lengths.max()) if len(normalized) else 0
+    # uint8 covers DNA alphabets; exotic symbols widen to codepoints so equality stays exact
+    dtype = np.uint8 if all(seq.isascii() for seq in normalized) else np.uint32
+    forward = np.zeros((len(normalized), width), dtype=dtype)
+    reverse = np.zeros((len(normalized), width), dtype=dtype)
+    nn_codes = np.full((len(normalized), width), _UNKNOWN_CODE, dtype=np.uint8)
+    for row, seq in enumerate(normalized):
+        if not seq:
+            continue
+        size = len(seq)
+        forward[row, :size] = _codepoints(seq, dtype)
+        rc = seq.translate(_COMPLEMENT_TABLE)[::-1]
+        reverse[row, :size] = _codepoints(rc, dtype)
+        nn_codes[row, :size] = [_BASE_CODES.get(base, _UNKNOWN_CODE) for base in seq]
+    return EncodedPrimerBatch(
+        forward=forward,
+        reverse_complement=reverse,
+        nn_codes=nn_codes,
+        lengths=lengths,
+    )
+
+
+@lru_cache(maxsize=1)
+def _nn_parameter_tables() -> tuple[np.ndarray, np.ndarray, float]:
+    """Return 5×5 enthalpy/entropy lookup tables plus the gas constant."""
+
+    from .sequence_toolkit import _GAS_CONSTANT, _NEAREST_NEIGHBOR_PARAMS
+
+    enthalpy = np.full((5, 5), _DEFAULT_NN_PARAMS[0], dtype=np.float64)
+    entropy = np.full((5, 5), _DEFAULT_NN_PARAMS[1], dtype=np.float64)
+    for pair, (delta_h, delta_s) in _NEAREST_NEIGHBOR_PARAMS.items():
+        first, second = _BASE_CODES[pair[0]], _BASE_CODES[pair[1]]
+        enthalpy[first, second] = delta_h
+        entropy[first, second] = delta_s
+    return enthalpy, entropy, _GAS_CONSTANT
+
+
+def batch_nearest_neighbor_tm(
+    batch: EncodedPrimerBatch,
+    *,
+    na_conc_mM: float,
+    primer_conc_nM: float,
+) -> np.ndarray:
+    """Compute nearest-neighbor melting temperatures for every encoded primer."""
+
+    # purpose: vectorized equivalent of sequence_toolkit._nearest_neighbor_tm
+    count = len(batch.lengths)
+    result = np.zeros(count, dtype=np.float64)
+    if count == 0 or batch.width < 2:
+        return result
+    enthalpy_table, entropy_table, gas_constant = _nn_parameter_tables()
+    left = batch.nn_codes[:, :-1]
+    right = batch.nn_codes[:, 1:]
+    # cumsum accumulates left-to-right exactly like the scalar loop
+    delta_h = np.cumsum(enthalpy_table[left, right], axis=1)
+    delta_s = np.cumsum(entropy_table[left, right], axis=1)
+    valid = batch.lengths >= 2
+    last = np.clip(batch.lengths - 2, 0, None)
+    rows = np.arange(count)
+    delta_h = delta_h[rows, last] * 1000
+    delta_s = delta_s[rows, last]
+    primer_conc = max(primer_conc_nM * 1e-9, 1e-12)
+    salt_conc = max(na_conc_mM * 1e-3, 1e-6)
+    denominator = delta_s + (gas_constant * math.log(primer_conc / 4))
+    salt_term = 16.6 * math.log10(salt_conc)
+    nonzero = valid & (denominator != 0)
+    safe_denominator = np.where(nonzero, denominator, 1.0)
+    tm_celsius = ((delta_h / safe_denominator) + salt_term) - 273.15
+    result[nonzero] = np.maximum(0.0, tm_celsius[nonzero])
+    return result
+
+
+def _iter_diagonal_runs(
+    left: np.ndarray,
+    left_lengths: np.ndarray,
+    right: np.ndarray,
+    right_lengths: np.ndarray,
+) -> Iterator[tuple[int, np.ndarray]]:
+    """Yield (i, R[:, i, :]) where R holds consecutive-match run lengths ending at (i, j)."""
+
+    # purpose: longest-common-run DP along diagonals, vectorized over the batch and j axes
+    batch, width_left = left.shape
+    width_right = right.shape[1]
+    if batch == 0 or width_left == 0 or width_right == 0:
+        return
+    valid_right = np.arange(width_right)[None, :] < right_lengths[:, None]
+    previous = np.zeros((batch, width_right), dtype=np.int32)
+    for i in range(width_left):
+        matches = (left[:, i : i + 1] == right) & valid_right
+        matches &= (i < left_lengths)[:, None]
+        current = np.zeros_like(previous)
+        current[:, 0] = matches[:, 0]
+        current[:, 1:] = np.where(matches[:, 1:], previous[:, :-1] + 1, 0)
+        yield i, current
+        previous = current
+
+
+def _self_complement_runs(batch: EncodedPrimerBatch) -> tuple[np.ndarray, np.ndarray]:
+    """Return (hairpin, homodimer) run maxima from one primer-vs-reverse-complement scan."""
+
+    count = len(batch.lengths)
+    hairpin = np.zeros(count, dtype=np.int64)
+    homodimer = np.zeros(count, dtype=np.int64)
+    columns = np.arange(batch.width)
+    for i, runs in _iter_diagonal_runs(
+        batch.forward, batch.lengths, batch.reverse_complement, batch.lengths
+    ):
+        # hairpins only consider loops of at least three bases (j - i >= 3)
+        hairpin_runs = runs[:, i + 3 :]
+        if hairpin_runs.size:
+            np.maximum(hairpin, hairpin_runs.max(axis=1), out=hairpin)
+        # homodimers slide the primer along its own reverse complement (j <= i)
+        np.maximum(homodimer, runs[:, columns <= i].max(axis=1), out=homodimer)
+    return hairpin, homodimer
+
+
+def batch_hairpin_runs(batch: EncodedPrimerBatch) -> np.ndarray:
+    """Return the longest hairpin complement run for each primer."""
+
+    # purpose: vectorized equivalent of sequence_toolkit._max_hairpin_run
+    return _self_complement_runs(batch)[0]
+
+
+def batch_homodimer_runs(batch: EncodedPrimerBatch) -> np.ndarray:
+    """Return the longest homodimer complement run for each primer."""
+
+    # purpose: vectorized equivalent of sequence_toolkit._max_homodimer_run
+    return _self_complement_runs(batch)[1]
+
+
+def cross_dimer_matrix(batch: EncodedPrimerBatch) -> np.ndarray:
+    """Return the all-pairs cross-dimer run matrix for an encoded primer set."""
+
+    # purpose: vectorized equivalent of sequence_toolkit._max_cross_dimer_run over every pair
+    # outputs: matrix M where M[a, b] == _max_cross_dimer_run(primer_a, primer_b)
+    count = len(batch.lengths)
+    matrix = np.zeros((count, count), dtype=np.int64)
+    if count == 0 or batch.width == 0:
+        return matrix
+    left_index, right_index = np.indices((count, count)).reshape(2, -1)
+    for start in range(0, len(left_index), _CROSS_DIMER_CHUNK):
+        rows = left_index[start : start + _CROSS_DIMER_CHUNK]
+        cols = right_index[start : start + _CROSS_DIMER_CHUNK]
+        best = np.zeros(len(rows), dtype=np.int64)
+        for _, runs in _iter_diagonal_runs(
+            batch.forward[rows],
+            batch.lengths[rows],
+            batch.reverse_complement[cols],
+            batch.lengths[cols],
+        ):
+            np.maximum(best, runs.max(axis=1), out=best)
+        matrix[rows, cols] = best
+    return matrix
+
+
+def score_primer_batch(
+    sequences: Sequence[str],
+    *,
+    na_conc_mM: float,
+    primer_conc_nM: float,
+) -> PrimerBatchThermodynamics:
+    """Score tm, hairpin, and homodimer heuristics for a primer set in one pass."""
+
+    # purpose: batch entry point used by sequence_toolkit.design_primers
+    # inputs: primer sequences and reaction concentrations
+    # outputs: PrimerBatchThermodynamics aligned with the input order
+    batch = encode_primers(sequences)
+    hairpin, homodimer = _self_complement_runs(batch)
+    return PrimerBatchThermodynamics(
+        tm=batch_nearest_neighbor_tm(
+            batch, na_conc_mM=na_conc_mM, primer_conc_nM=primer_conc_nM
+        ),
+        hairpin_runs=hairpin,
+        homodimer_runs=homodimer,
+    )
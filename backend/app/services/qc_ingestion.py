@@ -90,13 +90,67 @@ def ingest_chromatograms(
         )
         db.add(record)
         records.append(record)
-        if snr and snr < thresholds["min_signal_to_noise"]:
-            guardrail_breaches.append(
-                f"Chromatogram {entry.get('name') or entry.get('sample_id') or '#'} has low SNR ({snr:.1f})"
-            )
-        if len(trace) < thresholds["min_trace_length"]:
-            guardrail_breaches.append(
-                f"Chromatogram {entry.get('name') or entry.get('sample_id') or '#'} trace too short ({len(trace)} pts)"
+        guardrail_breaches.extend(
+            _artifact_breaches(entry.get("name") or entry.get("sample_id"), snr, len(trace), thresholds)
+        )
+    return {
+        "artifacts": normalised,
+        "breaches": guardrail_breaches,
+        "records": records,
+        "thresholds": thresholds,
+    }
+
+
+def _artifact_breaches(
+    label: str | None, snr: float, length: int, thresholds: dict[str, Any]
+) -> list[str]:
+    breaches = []
+    if snr and snr < thresholds["min_signal_to_noise"]:
+        breaches.append(f"Chromatogram {label or '#'} has low SNR ({snr:.1f})")
+    if length < thresholds["min_trace_length"]:
+        breaches.append(f"Chromatogram {label or '#'} trace too short ({length} pts)")
+    return breaches
+
+
+def collect_pending_artifacts(
+    db: Session,
+    planner: models.CloningPlannerSession,
+) -> dict[str, Any]:
+    """Return artifacts ingested ahead of the QC stage in `ingest_chromatograms` shape."""
+
+    # purpose: let the QC stage evaluate chromatograms parsed earlier by the parallel ingest stage
+    # inputs: database session, planner row
+    # outputs: dict with normalised artifacts, breaches, and the ORM records not yet linked to a stage
+    # status: experimental
+    records = (
+        db.query(models.CloningPlannerQCArtifact)
+        .filter(
+            models.CloningPlannerQCArtifact.session_id == planner.id,
+            models.CloningPlannerQCArtifact.stage_record_id.is_(None),
+        )
+        .order_by(models.CloningPlannerQCArtifact.created_at)
+        .all()
+    )
+    normalised: list[dict[str, Any]] = []
+    guardrail_breaches: list[str] = []
+    thresholds: dict[str, Any] = {}
+    for record in records:
+        metrics = record.metrics or {}
+        thresholds = record.thresholds or thresholds
+        snr = metrics.get("signal_to_noise") or 0.0
+        length = int(metrics.get("length") or 0)
+        normalised.append(
+            {
+                "name": record.artifact_name,
+                "sample_id": record.sample_id,
+                "signal_to_noise": snr,
+                "length": length,
+                "metadata": metrics.get("metadata", {}),
+            }
+        )
+        if thresholds:
+            guardrail_breaches.extend(
+                _artifact_breaches(record.artifact_name or record.sample_id, snr, length, thresholds)
             )
     return {
         "artifacts": normalised,
@@ -0,0 +1,419 @@
+"""Aho-Corasick restriction site index for single-pass digest mapping."""
+
+# purpose: locate every enzyme's cut positions with one automaton pass per template
+# status: experimental
+# depends_on: Bio.Restriction, backend.app.data.loaders
+# related_docs: docs/planning/cloning_planner_scope.md
+
+from __future__ import annotations
+
+import re
+import string
+from collections import deque
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import product
+
+from Bio import Restriction
+from Bio.Restriction.Restriction import NoCut, NotDefined, OneCut, RestrictionType, TwoCuts
+
+from ..data.loaders import get_enzyme_catalog
+
+_IUPAC_BASES: dict[str, str] = {
+    "A": "A",
+    "C": "C",
+    "G": "G",
+    "T": "T",
+    "R": "AG",
+    "Y": "CT",
+    "S": "CG",
+    "W": "AT",
+    "K": "GT",
+    "M": "AC",
+    "B": "CGT",
+    "D": "AGT",
+    "H": "ACT",
+    "V": "ACG",
+    "N": "ACGT",
+}
+_IUPAC_COMPLEMENT = str.maketrans("ACGTRYSWKMBDHVN", "TGCAYRSWMKVHDBN")
+_ALPHABET = "ACGT"
+_OTHER_CODE = len(_ALPHABET)
+_CODE_TABLE = bytes(
+    _ALPHABET.index(chr(byte)) if chr(byte) in _ALPHABET else _OTHER_CODE
+    for byte in range(256)
+)
+# Upper bound on concrete strings generated per anchor when expanding ambiguity codes
+_MAX_ANCHOR_EXPANSION = 256
+_STRIP_PATTERN = re.compile(f"[{re.escape(string.whitespace + string.digits)}]")
+_CATALOG_TYPE_IIS = re.compile(r"^(?P<site>[A-Z]+)\(N\)(?P<top>-?\d+)/N(?P<bottom>-?\d+)$")
+
+
+@dataclass(frozen=True)
+class RestrictionSiteDefinition:
+    """Recognition site and cut geometry for one enzyme."""
+
+    # purpose: carry the Bio.Restriction cut semantics needed to turn site hits into cut positions
+    # status: experimental
+    name: str
+    site: str
+    palindromic: bool
+    cut_count: int
+    fst5: int | None = None
+    fst3: int | None = None
+    scd5: int | None = None
+    scd3: int | None = None
+    ovhg: int | None = None
+    drop_linear: bool = True
+
+    @property
+    def size(self) -> int:
+        return len(self.site)
+
+    def forward_cuts(self, location: int) -> list[int]:
+        if self.cut_count == 0:
+            return [location]
+        cuts = [location + self.fst5]
+        if self.cut_count == 2:
+            cuts.append(location + self.scd5)
+        return cuts
+
+    def reverse_cuts(self, location: int) -> list[int]:
+        if self.cut_count == 0:
+            return [location]
+        cuts = [location - self.fst3]
+        if self.cut_count == 2:
+            cuts.append(location - self.scd3)
+        return cuts
+
+
+@dataclass(frozen=True)
+class _AnchorEntry:
+    """Automaton output linking an anchor hit back to its full recognition site."""
+
+    definition: int
+    reverse: bool
+    offset: int
+    length: int
+    allowed: tuple[frozenset[str] | None, ...]
+
+
+def _definition_from_bio(name: str, enzyme: RestrictionType) -> RestrictionSiteDefinition:
+    if any(base not in _IUPAC_BASES for base in str(enzyme.site).upper()):
+        raise ValueError(f"{name} recognition site {enzyme.site} is not indexable")
+    if issubclass(enzyme, TwoCuts):
+        cut_count = 2
+    elif issubclass(enzyme, OneCut):
+        cut_count = 1
+    else:
+        cut_count = 0
+    return RestrictionSiteDefinition(
+        name=name,
+        site=str(enzyme.site).upper(),
+        palindromic=enzyme.is_palindromic(),
+        cut_count=cut_count if not issubclass(enzyme, NoCut) else 0,
+        fst5=enzyme.fst5,
+        fst3=enzyme.fst3,
+        scd5=enzyme.scd5,
+        scd3=enzyme.scd3,
+        ovhg=enzyme.ovhg,
+        drop_linear=not issubclass(enzyme, NotDefined),
+    )
+
+
+def _definition_from_catalog(entry: dict) -> RestrictionSiteDefinition | None:
+    """Derive cut geometry from a catalog `cut_pattern` such as `G^AATTC` or `GGTCTC(N)1/N5`."""
+
+    site = str(entry.get("recognition_site") or "").upper()
+    pattern = str(entry.get("cut_pattern") or "").upper()
+    if not site or any(base not in _IUPAC_BASES for base in site):
+        return None
+    size = len(site)
+    palindromic = site == site.translate(_IUPAC_COMPLEMENT)[::-1]
+    type_iis = _CATALOG_TYPE_IIS.match(pattern)
+    if type_iis:
+        top = int(type_iis.group("top"))
+        bottom = int(type_iis.group("bottom"))
+        fst5 = size + top
+        ovhg = top - bottom
+    elif "^" in pattern and pattern.replace("^", "") == site:
+        fst5 = pattern.index("^")
+        ovhg = fst5 - (size - fst5)
+    else:
+        return None
+    return RestrictionSiteDefinition(
+        name=str(entry["name"]),
+        site=site,
+        palindromic=palindromic,
+        cut_count=1,
+        fst5=fst5,
+        fst3=fst5 - ovhg - size,
+        ovhg=ovhg,
+    )
+
+
+def resolve_site_definition(name: str) -> RestrictionSiteDefinition:
+    """Return the site definition for an enzyme name from Bio.Restriction or the curated catalog."""
+
+    # purpose: accept both REBASE names (EcoRI) and curated catalog names (BamHI-HF)
+    enzyme = getattr(Restriction, name, None)
+    if isinstance(enzyme, RestrictionType):
+        return _definition_from_bio(name, enzyme)
+    for entry in get_enzyme_catalog():
+        if str(entry.get("name", "")).lower() != name.lower():
+            continue
+        base = getattr(Restriction, name.split("-")[0], None)
+        site = str(entry.get("recognition_site") or "").upper()
+        if isinstance(base, RestrictionType) and str(base.site).upper() == site:
+            return _definition_from_bio(name, base)
+        definition = _definition_from_catalog(entry)
+        if definition:
+            return definition
+    raise ValueError(f"{name} is not a known restriction enzyme")
+
+
+def _reverse_complement_site(site: str) -> str:
+    return site.translate(_IUPAC_COMPLEMENT)[::-1]
+
+
+def _choose_anchor(site: str) -> tuple[int, int]:
+    """Return (offset, length) of the most specific window whose expansion stays bounded."""
+
+    best = (0, 0)
+    best_score = -1.0
+    for start in range(len(site)):
+        expansion = 1
+        for stop in range(start, len(site)):
+            base = site[stop]
+            if base == "N":
+                break
+            expansion *= len(_IUPAC_BASES[base])
+            if expansion > _MAX_ANCHOR_EXPANSION:
+                break
+            length = stop - start + 1
+            # prefer long anchors, then fewer expansions
+            score = length - (expansion - 1) / (_MAX_ANCHOR_EXPANSION + 1)
+            if score > best_score:
+                best, best_score = (start, length), score
+    return best
+
+
+def _allowed_bases(site: str) -> tuple[frozenset[str] | None, ...]:
+    # N mirrors Bio.Restriction's "." wildcard and accepts any template symbol
+    return tuple(
+        None if base == "N" else frozenset(_IUPAC_BASES[base]) for base in site
+    )
+
+
+class RestrictionSiteIndex:
+    """Compiled multi-pattern automaton over recognition sites and their reverse complements."""
+
+    # purpose: replace per-enzyme scans with one Aho-Corasick pass per template
+    # inputs: site definitions resolved from Bio.Restriction or the curated catalog
+    # outputs: Bio.Restriction-compatible cut positions keyed by enzyme name
+    # status: experimental
+
+    def __init__(self, definitions: Iterable[RestrictionSiteDefinition]):
+        self.definitions: tuple[RestrictionSiteDefinition, ...] = tuple(definitions)
+        self._names = {definition.name: idx for idx, definition in enumerate(self.definitions)}
+        self._max_site = max((definition.size for definition in self.definitions), default=0)
+        patterns: dict[str, list[_AnchorEntry]] = {}
+        for idx, definition in enumerate(self.definitions):
+            strands = [(False, definition.site)]
+            if not definition.palindromic:
+                strands.append((True, _reverse_complement_site(definition.site)))
+            for reverse, site in strands:
+                offset, length = _choose_anchor(site)
+                if not length:
+                    continue
+                entry = _AnchorEntry(
+                    definition=idx,
+                    reverse=reverse,
+                    offset=offset,
+                    length=length,
+                    allowed=_allowed_bases(site),
+                )
+                window = site[offset : offset + length]
+                for concrete in product(*(_IUPAC_BASES[base] for base in window)):
+                    patterns.setdefault("".join(concrete), []).append(entry)
+        self._transitions, self._outputs = self._compile(patterns)
+
+    def covers(self, enzymes: Iterable[str]) -> bool:
+        """Return True when every enzyme name is compiled into this automaton."""
+
+        return all(name in self._names for name in enzymes)
+
+    @staticmethod
+    def _compile(
+        patterns: dict[str, list[_AnchorEntry]],
+    ) -> tuple[list[int], list[tuple[_AnchorEntry, ...]]]:
+        """Build a dense DFA (goto + failure links folded in) over the ACGT alphabet."""
+
+        width = _OTHER_CODE + 1
+        goto: list[dict[int, int]] = [{}]
+        outputs: list[list[_AnchorEntry]] = [[]]
+        for pattern, entries in patterns.items():
+            state = 0
+            for base in pattern:
+                code = _ALPHABET.index(base)
+                nxt = goto[state].get(code)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][code] = nxt
+                    goto.append({})
+                    outputs.append([])
+                state = nxt
+            outputs[state].extend(entries)
+        transitions = [0] * (len(goto) * width)
+        failure = [0] * len(goto)
+        queue: deque[int] = deque()
+        for code in range(width):
+            nxt = goto[0].get(code)
+            if nxt is not None:
+                transitions[code] = nxt
+                queue.append(nxt)
+        while queue:
+            state = queue.popleft()
+            outputs[state].extend(outputs[failure[state]])
+            for code in range(width):
+                nxt = goto[state].get(code)
+                fallback = transitions[failure[state] * width + code]
+                if nxt is None:
+                    transitions[state * width + code] = fallback
+                else:
+                    failure[nxt] = fallback
+                    transitions[state * width + code] = nxt
+                    queue.append(nxt)
+        return transitions, [tuple(entries) for entries in outputs]
+
+    def search(
+        self,
+        sequence: str,
+        *,
+        linear: bool = True,
+        enzymes: Sequence[str] | None = None,
+    ) -> dict[str, list[int]]:
+        """Return sorted cut positions (1-based, first base after the cut) for each enzyme."""
+
+        # purpose: one automaton pass per template covering every indexed enzyme
+        selected = list(enzymes) if enzymes is not None else [d.name for d in self.definitions]
+        wanted: set[int] = set()
+        for name in selected:
+            if name not in self._names:
+                raise ValueError(f"{name} is not indexed")
+            wanted.add(self._names[name])
+        data = _STRIP_PATTERN.sub("", sequence or "").upper()
+        length = len(data)
+        scan = data if linear else data + data[: max(self._max_site - 1, 0)]
+        codes = scan.encode("ascii", errors="replace").translate(_CODE_TABLE)
+        forward_hits: dict[int, list[int]] = {idx: [] for idx in wanted}
+        reverse_hits: dict[int, list[int]] = {idx: [] for idx in wanted}
+        transitions = self._transitions
+        outputs = self._outputs
+        width = _OTHER_CODE + 1
+        state = 0
+        for position, code in enumerate(codes):
+            state = transitions[state * width + code]
+            matched = outputs[state]
+            if not matched:
+                continue
+            for entry in matched:
+                if entry.definition not in wanted:
+                    continue
+                start = position - entry.length + 1 - entry.offset
+                size = len(entry.allowed)
+                # circular scans only accept sites starting inside the original sequence
+                if start < 0 or start >= length:
+                    continue
+                stop = start + size
+                if stop > len(scan):
+                    continue
+                window = scan[start:stop]
+                if all(allowed is None or base in allowed for base, allowed in zip(window, entry.allowed)):
+                    bucket = reverse_hits if entry.reverse else forward_hits
+                    bucket[entry.definition].append(start + 1)
+        mapping: dict[str, list[int]] = {}
+        for idx in sorted(wanted, key=lambda item: selected.index(self.definitions[item].name)):
+            definition = self.definitions[idx]
+            forward = sorted(forward_hits[idx])
+            results = [cut for location in forward for cut in definition.forward_cuts(location)]
+            if not definition.palindromic:
+                # a forward match takes precedence at the same start, mirroring Bio's regex alternation
+                seen = set(forward)
+                results += [
+                    cut
+                    for location in sorted(reverse_hits[idx])
+                    if location not in seen
+                    for cut in definition.reverse_cuts(location)
+                ]
+                results.sort()
+            mapping[definition.name] = sorted(_drop_cuts(results, definition, length, linear))
+        return mapping
+
+
+def _drop_cuts(
+    results: list[int],
+    definition: RestrictionSiteDefinition,
+    length: int,
+    linear: bool,
+) -> list[int]:
+    """Apply Bio.Restriction boundary rules to raw cut positions."""
+
+    if not results:
+        return results
+    if linear:
+        if not definition.drop_linear:
+            return results
+        ovhg = definition.ovhg or 0
+        return [
+            cut
+            for cut in results
+            if 1 < cut <= length and 1 < cut - ovhg <= length
+        ]
+    adjusted = list(results)
+    for index, location in enumerate(adjusted):
+        if location < 1:
+            adjusted[index] += length
+        else:
+            break
+    for index in range(len(adjusted) - 1, -1, -1):
+        if adjusted[index] > length:
+            adjusted[index] -= length
+        else:
+            break
+    return adjusted
+
+
+@lru_cache(maxsize=32)
+def _cached_index(names: tuple[str, ...]) -> RestrictionSiteIndex:
+    return RestrictionSiteIndex(resolve_site_definition(name) for name in names)
+
+
+def get_catalog_site_index() -> RestrictionSiteIndex:
+    """Return the cached automaton spanning every enzyme in `data/enzymes.json`."""
+
+    # purpose: build the catalog-wide automaton once per process
+    return _cached_index(tuple(sorted(str(entry["name"]) for entry in get_enzyme_catalog())))
+
+
+def get_site_index(enzymes: Sequence[str]) -> RestrictionSiteIndex:
+    """Return a cached automaton covering the requested enzymes."""
+
+    # purpose: reuse compiled automata across templates and requests for the same enzyme panel
+    catalog = get_catalog_site_index()
+    if catalog.covers(enzymes):
+        return catalog
+    return _cached_index(tuple(sorted(set(enzymes))))
+
+
+def map_restriction_sites(
+    sequence: str,
+    enzymes: Sequence[str],
+    *,
+    linear: bool = True,
+) -> dict[str, list[int]]:
+    """Return cut positions for each enzyme using the cached site index."""
+
+    # purpose: drop-in replacement for per-enzyme Bio.Restriction scans
+    return get_site_index(enzymes).search(sequence, linear=linear, enzymes=enzymes)
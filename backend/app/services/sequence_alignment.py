@@ -0,0 +1,325 @@
+"""Pairwise alignment engine with banding, budgets, and a content-addressed cache."""
+
+# purpose: replace pairwise2 with Bio.Align.PairwiseAligner plus a banded Gotoh path for near-identical sequences
+# status: experimental
+# depends_on: Bio.Align, numpy, backend.app.services.packed_sequence
+# related_docs: docs/dna_assets.md
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+from Bio.Align import PairwiseAligner
+
+from .packed_sequence import sequence_checksum
+
+MATCH_SCORE = 2.0
+MISMATCH_SCORE = -1.0
+OPEN_GAP_SCORE = -0.5
+EXTEND_GAP_SCORE = -0.1
+
+ALIGNMENT_CACHE_SIZE = int(os.getenv("SEQUENCE_ALIGNMENT_CACHE_SIZE", "256"))
+ALIGNMENT_TIMEOUT_SECONDS = float(os.getenv("SEQUENCE_ALIGNMENT_TIMEOUT_SECONDS", "10"))
+ALIGNMENT_MAX_MEMORY_MB = float(os.getenv("SEQUENCE_ALIGNMENT_MAX_MEMORY_MB", "256"))
+# half-width used when a full alignment would exceed the budget and no band was requested
+ALIGNMENT_AUTO_BAND = int(os.getenv("SEQUENCE_ALIGNMENT_AUTO_BAND", "100"))
+# measured PairwiseAligner throughput for affine-gap traceback alignments
+_ALIGNER_CELLS_PER_SECOND = 5e7
+_ALIGNER_BYTES_PER_CELL = 4
+_BANDED_BYTES_PER_CELL = 3
+_DEADLINE_CHECK_ROWS = 256
+
+_STATE_MATCH, _STATE_GAP_SEQ2, _STATE_GAP_SEQ1, _STATE_START = 0, 1, 2, 3
+
+
+class AlignmentBudgetExceeded(ValueError):
+    """Raised when an alignment cannot complete within the configured budgets."""
+
+
+@dataclass(frozen=True)
+class AlignmentBudget:
+    """Per-request time and memory limits for a pairwise alignment."""
+
+    # purpose: bound DP matrix size and wall-clock time so long plasmid comparisons fail fast
+    # status: experimental
+    timeout_seconds: float = ALIGNMENT_TIMEOUT_SECONDS
+    max_memory_mb: float = ALIGNMENT_MAX_MEMORY_MB
+
+    @property
+    def max_bytes(self) -> float:
+        return self.max_memory_mb * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class AlignmentResult:
+    """Single optimal (or band-optimal) alignment between two sequences."""
+
+    # purpose: immutable payload shared between callers through the alignment cache
+    # status: experimental
+    aligned_seq1: str
+    aligned_seq2: str
+    score: float
+    banded: bool = False
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "aligned_seq1": self.aligned_seq1,
+            "aligned_seq2": self.aligned_seq2,
+            "score": self.score,
+            "banded": self.banded,
+        }
+
+
+class AlignmentCache:
+    """Thread-safe LRU of alignment results keyed by sequence checksums."""
+
+    # purpose: skip recomputation when the same pair of sequences is aligned repeatedly
+    # status: experimental
+
+    def __init__(self, maxsize: int = ALIGNMENT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple, AlignmentResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> AlignmentResult | None:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: tuple, result: AlignmentResult) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+_CACHE = AlignmentCache()
+
+
+def get_alignment_cache() -> AlignmentCache:
+    """Return the process-wide alignment cache."""
+
+    return _CACHE
+
+
+def _build_aligner(mode: str) -> PairwiseAligner:
+    aligner = PairwiseAligner()
+    aligner.mode = "local" if mode == "local" else "global"
+    aligner.match_score = MATCH_SCORE
+    aligner.mismatch_score = MISMATCH_SCORE
+    aligner.open_gap_score = OPEN_GAP_SCORE
+    aligner.extend_gap_score = EXTEND_GAP_SCORE
+    return aligner
+
+
+def _full_alignment(seq1: str, seq2: str, mode: str) -> AlignmentResult:
+    if not seq1 or not seq2:
+        if mode == "local":
+            return AlignmentResult("", "", 0.0)
+        gap = OPEN_GAP_SCORE + EXTEND_GAP_SCORE * (max(len(seq1), len(seq2)) - 1)
+        return AlignmentResult(
+            seq1 or "-" * len(seq2),
+            seq2 or "-" * len(seq1),
+            gap if seq1 or seq2 else 0.0,
+        )
+    alignments = _build_aligner(mode).align(seq1, seq2)
+    alignment = next(iter(alignments), None)
+    if alignment is None:
+        return AlignmentResult("", "", 0.0)
+    return AlignmentResult(alignment[0], alignment[1], float(alignment.score))
+
+
+def _banded_alignment(
+    seq1: str,
+    seq2: str,
+    mode: str,
+    band: int,
+    deadline: float | None,
+) -> AlignmentResult:
+    """Affine-gap Gotoh alignment restricted to a diagonal band, vectorized per row."""
+
+    # purpose: O(n·band) alignment for near-identical sequences such as plasmid revisions
+    # inputs: sequences, mode, band half-width, optional monotonic deadline
+    # outputs: AlignmentResult that is optimal among alignments staying inside the band
+    local = mode == "local"
+    n, m = len(seq1), len(seq2)
+    skew = m - n
+    width = 2 * band + abs(skew) + 1
+    offset = min(0, skew) - band  # column of band slot 0 in row i is i + offset
+    a = np.frombuffer(seq1.encode("utf-32-le"), dtype=np.uint32)
+    b = np.frombuffer(seq2.encode("utf-32-le"), dtype=np.uint32)
+    slots = np.arange(width)
+    slot_extend = slots * EXTEND_GAP_SCORE
+    neg = -np.inf
+
+    pointer_match = np.full((n + 1, width), _STATE_START, dtype=np.uint8)
+    pointer_gap2 = np.zeros((n + 1, width), dtype=np.uint8)
+    pointer_gap1 = np.zeros((n + 1, width), dtype=np.uint8)
+    best_score, best_cell = 0.0, None
+
+    def horizontal(row: int, match: np.ndarray, gap2: np.ndarray, valid: np.ndarray) -> np.ndarray:
+        # Y[t] = max_{u<t}(max(M, X)[u] + open + (t-1-u)·extend); extensions of Y are implied
+        opened = np.where(valid, np.maximum(match, gap2), neg) + OPEN_GAP_SCORE - slot_extend
+        running = np.maximum.accumulate(opened)
+        gap1 = np.full(width, neg)
+        gap1[1:] = running[:-1] + slot_extend[:-1]
+        gap1 = np.where(valid & (slots > 0), gap1, neg)
+        previous_gap1 = np.concatenate([[neg], gap1[:-1]])
+        previous_open = np.concatenate([[neg], (np.maximum(match, gap2) + OPEN_GAP_SCORE)[:-1]])
+        pointer_gap1[row] = np.where(
+            previous_gap1 + EXTEND_GAP_SCORE >= previous_open,
+            _STATE_GAP_SEQ1,
+            np.where(
+                np.concatenate([[True], (match >= gap2)[:-1]]),
+                _STATE_MATCH,
+                _STATE_GAP_SEQ2,
+            ),
+        )
+        return gap1
+
+    columns = slots + offset
+    valid = (columns >= 0) & (columns <= m)
+    match = np.full(width, neg)
+    gap2 = np.full(width, neg)
+    if not local:
+        match[columns == 0] = 0.0
+    gap1 = horizontal(0, match, gap2, valid)
+
+    for row in range(1, n + 1):
+        if deadline is not None and row % _DEADLINE_CHECK_ROWS == 0 and time.monotonic() > deadline:
+            raise AlignmentBudgetExceeded("Alignment exceeded the configured time budget")
+        columns = slots + row + offset
+        valid = (columns >= 0) & (columns <= m)
+        # diagonal predecessor (row-1, col-1) sits in the same band slot
+        diagonal = np.stack([match, gap2, gap1])
+        previous_state = np.argmax(diagonal, axis=0).astype(np.uint8)
+        previous_best = diagonal.max(axis=0)
+        if local:
+            previous_state = np.where(previous_best > 0, previous_state, _STATE_START).astype(np.uint8)
+            previous_best = np.maximum(previous_best, 0.0)
+        subject = b[np.clip(columns - 1, 0, max(m - 1, 0))] if m else np.zeros(width, dtype=np.uint32)
+        substitution = np.where(subject == a[row - 1], MATCH_SCORE, MISMATCH_SCORE)
+        new_match = np.where(valid & (columns >= 1), previous_best + substitution, neg)
+        pointer_match[row] = previous_state
+        # vertical predecessor (row-1, col) sits one slot to the right
+        up_match = np.concatenate([match[1:], [neg]])
+        up_gap2 = np.concatenate([gap2[1:], [neg]])
+        up_gap1 = np.concatenate([gap1[1:], [neg]])
+        extend = up_gap2 + EXTEND_GAP_SCORE
+        opened = np.maximum(up_match, up_gap1) + OPEN_GAP_SCORE
+        new_gap2 = np.where(valid, np.maximum(extend, opened), neg)
+        pointer_gap2[row] = np.where(
+            extend >= opened,
+            _STATE_GAP_SEQ2,
+            np.where(up_match >= up_gap1, _STATE_MATCH, _STATE_GAP_SEQ1),
+        )
+        match, gap2 = new_match, new_gap2
+        gap1 = horizontal(row, match, gap2, valid)
+        if local:
+            slot = int(np.argmax(match))
+            if match[slot] > best_score:
+                best_score, best_cell = float(match[slot]), (row, slot)
+
+    if local:
+        if best_cell is None:
+            return AlignmentResult("", "", 0.0, banded=True)
+        row, slot = best_cell
+        state, score = _STATE_MATCH, best_score
+    else:
+        row, slot = n, m - (n + offset)
+        finals = (match[slot], gap2[slot], gap1[slot])
+        state = int(np.argmax(finals))
+        score = float(finals[state])
+
+    aligned1: list[str] = []
+    aligned2: list[str] = []
+    while True:
+        column = row + offset + slot
+        if not local and row == 0 and column == 0:
+            break
+        if state == _STATE_MATCH:
+            aligned1.append(seq1[row - 1])
+            aligned2.append(seq2[column - 1])
+            state = int(pointer_match[row, slot])
+            row -= 1
+            if local and state == _STATE_START:
+                break
+        elif state == _STATE_GAP_SEQ2:
+            aligned1.append(seq1[row - 1])
+            aligned2.append("-")
+            state = int(pointer_gap2[row, slot])
+            row -= 1
+            slot += 1
+        else:
+            aligned1.append("-")
+            aligned2.append(seq2[column - 1])
+            state = int(pointer_gap1[row, slot])
+            slot -= 1
+    return AlignmentResult("".join(reversed(aligned1)), "".join(reversed(aligned2)), score, banded=True)
+
+
+def align_pair(
+    seq1: str,
+    seq2: str,
+    *,
+    mode: str = "global",
+    band: int | None = None,
+    budget: AlignmentBudget | None = None,
+    use_cache: bool = True,
+) -> AlignmentResult:
+    """Align two sequences with caching, optional banding, and budget enforcement."""
+
+    # purpose: single alignment entry point for sequence.align_sequences and blast_search
+    # inputs: sequences, "global" or "local" mode, optional band half-width, optional budget
+    # outputs: AlignmentResult; raises AlignmentBudgetExceeded when no strategy fits the budget
+    # status: experimental
+    mode = "local" if mode == "local" else "global"
+    budget = budget or AlignmentBudget()
+    key = (sequence_checksum(seq1), sequence_checksum(seq2), mode, band)
+    if use_cache:
+        cached = _CACHE.get(key)
+        if cached is not None:
+            return cached
+    n, m = len(seq1), len(seq2)
+    full_cells = (n + 1) * (m + 1)
+    full_fits = (
+        full_cells * _ALIGNER_BYTES_PER_CELL <= budget.max_bytes
+        and full_cells / _ALIGNER_CELLS_PER_SECOND <= budget.timeout_seconds
+    )
+    if band is None and full_fits:
+        result = _full_alignment(seq1, seq2, mode)
+    else:
+        half_width = ALIGNMENT_AUTO_BAND if band is None else max(0, band)
+        banded_cells = (n + 1) * (2 * half_width + abs(m - n) + 1)
+        if banded_cells * _BANDED_BYTES_PER_CELL > budget.max_bytes:
+            raise AlignmentBudgetExceeded("Alignment exceeds the configured memory budget")
+        deadline = time.monotonic() + budget.timeout_seconds
+        result = _banded_alignment(seq1, seq2, mode, half_width, deadline)
+    if use_cache:
+        _CACHE.put(key, result)
+    return result
@@ -0,0 +1,535 @@
+"""Fused single-pass sequence feature kernel for DNA asset analytics."""
+
+# purpose: compute GC skew, GC hotspots, homopolymers, motifs, codon usage, and CAI from one encoded array
+# status: experimental
+# depends_on: numpy, backend.app.services.dna_assets, backend.app.services.packed_sequence, backend.app.services.sequence_toolkit
+# related_docs: docs/dna_assets.md
+
+from __future__ import annotations
+
+import math
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+
+from .packed_sequence import sequence_checksum
+from .sequence_toolkit import locate_sequence_edit
+
+FEATURE_CACHE_SIZE = int(os.getenv("DNA_ASSET_FEATURE_CACHE_SIZE", "128"))
+# compare every incremental update against a full recomputation (falls back on mismatch)
+INCREMENTAL_VERIFY = os.getenv("DNA_ASSET_INCREMENTAL_VERIFY", "0").lower() in {"1", "true", "yes"}
+HOMOPOLYMER_MINIMUM = 6
+GC_HOTSPOT_THRESHOLD = 0.68
+_BASES = "ACGT"
+
+
+@dataclass
+class SequenceFeatureAnalysis:
+    """Window statistics and codon metrics derived from one sequence pass."""
+
+    # purpose: share one analysis between viewer overlays, thermodynamic risk, and guardrail summaries
+    # status: experimental
+    length: int
+    gc_skew: list[float] = field(default_factory=list)
+    gc_hotspots: list[dict[str, Any]] = field(default_factory=list)
+    homopolymers: list[dict[str, Any]] = field(default_factory=list)
+    motif_hotspots: list[dict[str, Any]] = field(default_factory=list)
+    codon_counts: dict[str, int] = field(default_factory=dict)
+    codon_usage: dict[str, float] = field(default_factory=dict)
+    codon_adaptation_index: float = 0.0
+
+
+def _normalize(sequence: str) -> str:
+    return (sequence or "").upper().replace("U", "T")
+
+
+def _encode(normalised: str) -> np.ndarray:
+    if normalised.isascii():
+        return np.frombuffer(normalised.encode("ascii"), dtype=np.uint8)
+    return np.frombuffer(normalised.encode("utf-32-le"), dtype=np.uint32)
+
+
+@lru_cache(maxsize=1)
+def _codon_tables() -> tuple[tuple[str, ...], np.ndarray, np.ndarray]:
+    """Return (codon names by index, in-table mask, CAI log-weight table) for 64 ACGT codons."""
+
+    from .dna_assets import _CODON_TABLE, _DEFAULT_CAI_REFERENCE
+
+    names = tuple(a + b + c for a in _BASES for b in _BASES for c in _BASES)
+    in_table = np.array([name in _CODON_TABLE for name in names], dtype=bool)
+    log_weights = np.full(64, np.nan)
+    for index, codon in enumerate(names):
+        amino_acid = _CODON_TABLE.get(codon)
+        if not amino_acid or amino_acid == "*":
+            continue
+        weight = _DEFAULT_CAI_REFERENCE.get(codon)
+        if weight is None:
+            synonyms = [
+                candidate
+                for candidate, aa in _CODON_TABLE.items()
+                if aa == amino_acid and _DEFAULT_CAI_REFERENCE.get(candidate)
+            ]
+            if synonyms:
+                weight = max(_DEFAULT_CAI_REFERENCE[candidate] for candidate in synonyms)
+        if weight is None or weight <= 0:
+            continue
+        # math.log keeps the per-codon terms bit-identical to the scalar helper
+        log_weights[index] = math.log(weight)
+    return names, in_table, log_weights
+
+
+@lru_cache(maxsize=1)
+def _motif_patterns() -> tuple[tuple[str, int, np.ndarray], ...]:
+    """Return (motif name, strand, encoded pattern) in the scalar helper's scan order."""
+
+    from .dna_assets import _MOTIF_LIBRARY, _reverse_complement
+
+    patterns: list[tuple[str, int, np.ndarray]] = []
+    for motif in _MOTIF_LIBRARY:
+        forward = motif["sequence"]
+        patterns.append((motif["name"], 1, _encode(forward).astype(np.uint32)))
+        reverse = _reverse_complement(forward)
+        if reverse != forward:
+            patterns.append((motif["name"], -1, _encode(reverse).astype(np.uint32)))
+    return tuple(patterns)
+
+
+def _window_counts(cumulative: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    return cumulative[ends] - cumulative[starts]
+
+
+def _skew_window(length: int) -> int:
+    window = max(50, length // 12)
+    return max(25, min(window, length))
+
+
+def _hotspot_window(length: int) -> int:
+    return max(30, length // 20)
+
+
+def _skew_values(g: list[int], c: list[int]) -> list[float]:
+    return [round((gi - ci) / (gi + ci), 4) if gi + ci else 0.0 for gi, ci in zip(g, c)]
+
+
+def _hotspot_entries(starts: list[int], ends: list[int], gc: list[int]) -> list[dict[str, Any]]:
+    hotspots = []
+    for start, end, count in zip(starts, ends, gc):
+        fraction = count / (end - start)
+        if fraction >= GC_HOTSPOT_THRESHOLD:
+            hotspots.append({"start": start + 1, "end": end, "gc_fraction": round(fraction, 4)})
+    return hotspots
+
+
+def _gc_skew(g_cum: np.ndarray, c_cum: np.ndarray, length: int) -> list[float]:
+    window = _skew_window(length)
+    starts = np.arange(0, length, window)
+    ends = np.minimum(starts + window, length)
+    g = _window_counts(g_cum, starts, ends).tolist()
+    c = _window_counts(c_cum, starts, ends).tolist()
+    return _skew_values(g, c)
+
+
+def _gc_hotspots(g_cum: np.ndarray, c_cum: np.ndarray, length: int) -> list[dict[str, Any]]:
+    window = _hotspot_window(length)
+    starts = np.arange(0, length, window)
+    ends = np.minimum(starts + window, length)
+    gc = (_window_counts(g_cum, starts, ends) + _window_counts(c_cum, starts, ends)).tolist()
+    return _hotspot_entries(starts.tolist(), ends.tolist(), gc)
+
+
+def _homopolymers(data: np.ndarray, normalised: str) -> list[dict[str, Any]]:
+    if not len(data):
+        return []
+    boundaries = np.flatnonzero(data[1:] != data[:-1]) + 1
+    starts = np.concatenate([[0], boundaries])
+    ends = np.concatenate([boundaries, [len(data)]])
+    lengths = ends - starts
+    keep = lengths >= HOMOPOLYMER_MINIMUM
+    return [
+        {"base": normalised[start], "start": start + 1, "end": end, "length": size}
+        for start, end, size in zip(
+            starts[keep].tolist(), ends[keep].tolist(), lengths[keep].tolist()
+        )
+    ]
+
+
+def _motifs(data: np.ndarray) -> list[dict[str, Any]]:
+    findings: list[dict[str, Any]] = []
+    for name, strand, pattern in _motif_patterns():
+        size = len(pattern)
+        if len(data) < size:
+            continue
+        windows = np.lib.stride_tricks.sliding_window_view(data, size)
+        for index in np.flatnonzero((windows == pattern).all(axis=1)).tolist():
+            findings.append({"motif": name, "start": index + 1, "end": index + size, "strand": strand})
+    findings.sort(key=lambda item: (item["start"], item["strand"]))
+    return findings
+
+
+def _codon_indices(data: np.ndarray) -> np.ndarray:
+    """Return table-codon indices (0-63) for frame-0 codons in order."""
+
+    _, in_table, _ = _codon_tables()
+    count = len(data) // 3
+    if count == 0:
+        return np.empty(0, dtype=np.int64)
+    lookup = np.full(max(int(data.max()) + 1, 256), 4, dtype=np.int64)
+    for code, base in enumerate(_BASES):
+        lookup[ord(base)] = code
+    codes = lookup[data[: count * 3]].reshape(count, 3)
+    valid = (codes < 4).all(axis=1)
+    index = codes[valid, 0] * 16 + codes[valid, 1] * 4 + codes[valid, 2]
+    return index[in_table[index]]
+
+
+def _codon_summary(counts: np.ndarray) -> tuple[dict[str, int], dict[str, float]]:
+    names, _, _ = _codon_tables()
+    total = int(counts.sum())
+    codon_counts = {names[i]: int(counts[i]) for i in np.flatnonzero(counts).tolist()}
+    usage = (
+        {codon: round(value / total, 6) for codon, value in sorted(codon_counts.items())}
+        if total
+        else {}
+    )
+    return codon_counts, usage
+
+
+def _codons(data: np.ndarray) -> tuple[dict[str, int], dict[str, float], float]:
+    _, _, log_weights = _codon_tables()
+    if len(data) // 3 == 0:
+        return {}, {}, 0.0
+    index = _codon_indices(data)
+    codon_counts, usage = _codon_summary(np.bincount(index, minlength=64))
+    terms = log_weights[index]
+    terms = terms[~np.isnan(terms)]
+    if not len(terms):
+        return codon_counts, usage, 0.0
+    # sequential sum in codon order matches the scalar helper's float accumulation
+    log_sum = sum(terms.tolist())
+    return codon_counts, usage, round(math.exp(log_sum / len(terms)), 4)
+
+
+def analyse_sequence_features(sequence: str) -> SequenceFeatureAnalysis:
+    """Run the fused feature kernel over a sequence."""
+
+    # purpose: replace separate full-sequence walks with one encode plus cumulative sums
+    # inputs: raw sequence (any case, RNA tolerated)
+    # outputs: SequenceFeatureAnalysis matching the scalar dna_assets helpers
+    normalised = _normalize(sequence)
+    length = len(normalised)
+    if not length:
+        return SequenceFeatureAnalysis(length=0)
+    data = _encode(normalised)
+    g_cum = np.concatenate([[0], np.cumsum(data == ord("G"))])
+    c_cum = np.concatenate([[0], np.cumsum(data == ord("C"))])
+    codon_counts, usage, cai = _codons(data)
+    return SequenceFeatureAnalysis(
+        length=length,
+        gc_skew=_gc_skew(g_cum, c_cum, length),
+        gc_hotspots=_gc_hotspots(g_cum, c_cum, length),
+        homopolymers=_homopolymers(data, normalised),
+        motif_hotspots=_motifs(data),
+        codon_counts=codon_counts,
+        codon_usage=usage,
+        codon_adaptation_index=cai,
+    )
+
+
+def _affected_windows(
+    parent_length: int,
+    length: int,
+    window_size: Callable[[int], int],
+    prefix: int,
+    edit_end: int,
+) -> tuple[int, int, int, bool]:
+    """Return (window, first, last, keep_tail) for the child windows a diff touched."""
+
+    window = window_size(length)
+    total = -(-length // window)
+    if window_size(parent_length) != window:
+        return window, 0, total, False
+    first = prefix // window
+    if parent_length != length:
+        # insertions/deletions shift the window grid for everything after the edit
+        return window, first, total, False
+    return window, first, max(first, -(-edit_end // window)), True
+
+
+def _window_gc(
+    normalised: str, window: int, first: int, last: int
+) -> tuple[list[int], list[int], list[int], list[int]]:
+    """Return (starts, ends, G counts, C counts) for windows [first, last) of a sequence."""
+
+    length = len(normalised)
+    offset = first * window
+    data = _encode(normalised[offset : min(last * window, length)])
+    g_cum = np.concatenate([[0], np.cumsum(data == ord("G"))])
+    c_cum = np.concatenate([[0], np.cumsum(data == ord("C"))])
+    starts = np.arange(first, last) * window
+    ends = np.minimum(starts + window, length)
+    g = _window_counts(g_cum, starts - offset, ends - offset).tolist()
+    c = _window_counts(c_cum, starts - offset, ends - offset).tolist()
+    return starts.tolist(), ends.tolist(), g, c
+
+
+def _update_gc_windows(
+    parent: SequenceFeatureAnalysis, child: str, parent_length: int, prefix: int, edit_end: int
+) -> tuple[list[float], list[dict[str, Any]]]:
+    length = len(child)
+    window, first, last, keep_tail = _affected_windows(
+        parent_length, length, _skew_window, prefix, edit_end
+    )
+    _, _, g, c = _window_gc(child, window, first, last)
+    skew = parent.gc_skew[:first] + _skew_values(g, c)
+    if keep_tail:
+        skew += parent.gc_skew[last:]
+
+    window, first, last, keep_tail = _affected_windows(
+        parent_length, length, _hotspot_window, prefix, edit_end
+    )
+    starts, ends, g, c = _window_gc(child, window, first, last)
+    hotspots = [item for item in parent.gc_hotspots if (item["start"] - 1) // window < first]
+    hotspots += _hotspot_entries(starts, ends, [gi + ci for gi, ci in zip(g, c)])
+    if keep_tail:
+        hotspots += [item for item in parent.gc_hotspots if (item["start"] - 1) // window >= last]
+    return skew, hotspots
+
+
+def _update_homopolymers(
+    parent: SequenceFeatureAnalysis, child: str, prefix: int, edit_end: int, delta: int
+) -> list[dict[str, Any]]:
+    length = len(child)
+    # widen the edit to the runs it borders; both bounds are run boundaries in parent and child
+    lo = prefix
+    if lo > 0:
+        base = child[lo - 1]
+        lo -= 1
+        while lo > 0 and child[lo - 1] == base:
+            lo -= 1
+    hi = edit_end
+    if hi < length:
+        base = child[hi]
+        hi += 1
+        while hi < length and child[hi] == base:
+            hi += 1
+    window = child[lo:hi]
+    runs = [item for item in parent.homopolymers if item["end"] <= lo]
+    runs += [
+        {**item, "start": item["start"] + lo, "end": item["end"] + lo}
+        for item in _homopolymers(_encode(window), window)
+    ]
+    runs += [
+        {**item, "start": item["start"] + delta, "end": item["end"] + delta}
+        for item in parent.homopolymers
+        if item["start"] - 1 >= hi - delta
+    ]
+    return runs
+
+
+def _update_motifs(
+    parent: SequenceFeatureAnalysis,
+    child: str,
+    prefix: int,
+    parent_end: int,
+    edit_end: int,
+    delta: int,
+) -> list[dict[str, Any]]:
+    overlap = max(len(pattern) for _, _, pattern in _motif_patterns()) - 1
+    offset = max(0, prefix - overlap)
+    window = child[offset : min(len(child), edit_end + overlap)]
+    findings = [item for item in parent.motif_hotspots if item["end"] <= prefix]
+    findings += [
+        {**item, "start": item["start"] + offset, "end": item["end"] + offset}
+        for item in _motifs(_encode(window))
+        if not (item["end"] + offset <= prefix or item["start"] + offset - 1 >= edit_end)
+    ]
+    findings += [
+        {**item, "start": item["start"] + delta, "end": item["end"] + delta}
+        for item in parent.motif_hotspots
+        if item["start"] - 1 >= parent_end
+    ]
+    findings.sort(key=lambda item: (item["start"], item["strand"]))
+    return findings
+
+
+def _update_codons(
+    parent: SequenceFeatureAnalysis,
+    parent_sequence: str,
+    child: str,
+    prefix: int,
+    parent_end: int,
+    edit_end: int,
+) -> tuple[dict[str, int], dict[str, float], float]:
+    names, _, log_weights = _codon_tables()
+    if len(child) // 3 == 0:
+        return {}, {}, 0.0
+    counts = np.zeros(64, dtype=np.int64)
+    for codon, value in parent.codon_counts.items():
+        counts[names.index(codon)] = value
+    first = prefix // 3
+    if (len(child) - len(parent_sequence)) % 3 == 0:
+        # in-frame edit: only codons overlapping the edited span change
+        parent_last = min(-(-parent_end // 3), len(parent_sequence) // 3)
+        child_last = min(-(-edit_end // 3), len(child) // 3)
+    else:
+        parent_last, child_last = len(parent_sequence) // 3, len(child) // 3
+    removed = _codon_indices(_encode(parent_sequence[first * 3 : parent_last * 3]))
+    added = _codon_indices(_encode(child[first * 3 : child_last * 3]))
+    counts -= np.bincount(removed, minlength=64)
+    counts += np.bincount(added, minlength=64)
+    codon_counts, usage = _codon_summary(counts)
+    weighted = ~np.isnan(log_weights)
+    total = int(counts[weighted].sum())
+    if not total:
+        return codon_counts, usage, 0.0
+    # CAI from aggregated counts; summation order differs from the scalar helper only in the last ulp
+    log_sum = math.fsum((counts[weighted] * log_weights[weighted]).tolist())
+    return codon_counts, usage, round(math.exp(log_sum / total), 4)
+
+
+def features_match(left: SequenceFeatureAnalysis, right: SequenceFeatureAnalysis) -> bool:
+    """Compare two analyses, allowing CAI to differ by one rounding step."""
+
+    return (
+        left.length == right.length
+        and left.gc_skew == right.gc_skew
+        and left.gc_hotspots == right.gc_hotspots
+        and left.homopolymers == right.homopolymers
+        and left.motif_hotspots == right.motif_hotspots
+        and left.codon_counts == right.codon_counts
+        and left.codon_usage == right.codon_usage
+        and abs(left.codon_adaptation_index - right.codon_adaptation_index) <= 1e-4 + 1e-12
+    )
+
+
+def update_sequence_features(
+    parent_sequence: str,
+    parent: SequenceFeatureAnalysis,
+    sequence: str,
+    *,
+    verify: bool | None = None,
+) -> SequenceFeatureAnalysis:
+    """Derive a child version's analysis from its parent's by recomputing only the edited span."""
+
+    # purpose: keep add_version cheap for small edits on large constructs
+    # inputs: parent sequence and its analysis, child sequence, optional verification override
+    # outputs: SequenceFeatureAnalysis equal to analyse_sequence_features(sequence)
+    # status: experimental
+    parent_normalised = _normalize(parent_sequence)
+    child = _normalize(sequence)
+    if not parent_normalised or not child or parent.length != len(parent_normalised):
+        return analyse_sequence_features(sequence)
+    edit = locate_sequence_edit(parent_normalised, child)
+    prefix, parent_end, edit_end = edit["prefix"], edit["reference_end"], edit["candidate_end"]
+    delta = len(child) - len(parent_normalised)
+    skew, hotspots = _update_gc_windows(parent, child, len(parent_normalised), prefix, edit_end)
+    codon_counts, usage, cai = _update_codons(
+        parent, parent_normalised, child, prefix, parent_end, edit_end
+    )
+    result = SequenceFeatureAnalysis(
+        length=len(child),
+        gc_skew=skew,
+        gc_hotspots=hotspots,
+        homopolymers=_update_homopolymers(parent, child, prefix, edit_end, delta),
+        motif_hotspots=_update_motifs(parent, child, prefix, parent_end, edit_end, delta),
+        codon_counts=codon_counts,
+        codon_usage=usage,
+        codon_adaptation_index=cai,
+    )
+    _record_incremental("updates")
+    if INCREMENTAL_VERIFY if verify is None else verify:
+        full = analyse_sequence_features(sequence)
+        _record_incremental("verified")
+        if not features_match(result, full):
+            _record_incremental("mismatches")
+            return full
+    return result
+
+
+_INCREMENTAL_STATS = {"updates": 0, "verified": 0, "mismatches": 0}
+_INCREMENTAL_LOCK = threading.Lock()
+
+
+def _record_incremental(counter: str) -> None:
+    with _INCREMENTAL_LOCK:
+        _INCREMENTAL_STATS[counter] += 1
+
+
+def incremental_stats() -> dict[str, int]:
+    """Return counters for incremental updates, verifications, and verification mismatches."""
+
+    with _INCREMENTAL_LOCK:
+        return dict(_INCREMENTAL_STATS)
+
+
+class AnalysisCache:
+    """Thread-safe LRU keyed by sequence checksum."""
+
+    # purpose: memoize per-version analyses (features, toolkit guardrails) across requests
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Any, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_FEATURE_CACHE = AnalysisCache(FEATURE_CACHE_SIZE)
+
+
+def get_sequence_features(sequence: str, *, checksum: str | None = None) -> SequenceFeatureAnalysis:
+    """Return memoized feature analysis for a sequence keyed by its checksum."""
+
+    # purpose: avoid re-walking large asset versions on repeated viewer and version requests
+    key = checksum or sequence_checksum(sequence)
+    cached = _FEATURE_CACHE.get(key)
+    if cached is None:
+        cached = analyse_sequence_features(sequence)
+        _FEATURE_CACHE.put(key, cached)
+    return cached
+
+
+def seed_sequence_features(
+    parent_sequence: str,
+    sequence: str,
+    *,
+    parent_checksum: str,
+    checksum: str,
+    verify: bool | None = None,
+) -> SequenceFeatureAnalysis | None:
+    """Populate the feature cache for a new version from its parent's cached analysis."""
+
+    # purpose: carry unchanged windows over from the parent so new versions skip a full pass
+    # outputs: the derived analysis, or None when the parent is not cached (analysis stays lazy)
+    cached = _FEATURE_CACHE.get(checksum)
+    if cached is not None:
+        return cached
+    parent = _FEATURE_CACHE.get(parent_checksum)
+    if parent is None:
+        return None
+    derived = update_sequence_features(parent_sequence, parent, sequence, verify=verify)
+    _FEATURE_CACHE.put(checksum, derived)
+    return derived
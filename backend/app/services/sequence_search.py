@@ -0,0 +1,509 @@
+"""Persistent k-mer seed index for searching the DNA asset library."""
+
+# purpose: replace quadratic pairwise2 scans with seed-and-extend search over every DNAAssetVersion
+# status: experimental
+# depends_on: numpy, backend.app.models
+# related_docs: docs/dna_assets.md
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import threading
+import uuid
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from .. import models
+
+DEFAULT_KMER_SIZE = int(os.getenv("SEQUENCE_INDEX_KMER", "11"))
+# k-mers occurring more often than this are treated as low-complexity repeats and not seeded
+MAX_SEED_OCCURRENCES = int(os.getenv("SEQUENCE_INDEX_MAX_OCCURRENCES", "5000"))
+# merge every segment and drop tombstoned postings once this share of indexed versions is deleted
+COMPACT_DELETED_RATIO = float(os.getenv("SEQUENCE_INDEX_COMPACT_DELETED_RATIO", "0.1"))
+MATCH_SCORE = 2
+MISMATCH_SCORE = -1
+_MANIFEST = "manifest.json"
+_LOCKFILE = ".lock"
+_ARRAYS = ("kmers", "ordinals", "positions")
+_CODE_TABLE = bytes(
+    "ACGT".index(chr(byte)) if chr(byte) in "ACGT" else 4 for byte in range(256)
+)
+_COMPLEMENT = str.maketrans("ACGTN", "TGCAN")
+
+
+def _index_directory() -> Path:
+    configured = os.getenv("SEQUENCE_INDEX_DIR")
+    if configured:
+        return Path(configured)
+    return Path(os.getenv("UPLOAD_DIR", "uploaded_files")) / "sequence_index"
+
+
+def _normalize(sequence: str) -> str:
+    return (sequence or "").upper().replace("U", "T")
+
+
+def encode_kmers(sequence: str, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return (kmer codes, start positions) for every ACGT-only window of length k."""
+
+    # purpose: 2-bit pack sliding windows so seeds compare as single integers
+    codes = np.frombuffer(
+        _normalize(sequence).encode("ascii", errors="replace").translate(_CODE_TABLE),
+        dtype=np.uint8,
+    )
+    if len(codes) < k:
+        return np.empty(0, dtype=np.uint32), np.empty(0, dtype=np.uint32)
+    windows = np.lib.stride_tricks.sliding_window_view(codes, k)
+    valid = ~(windows == 4).any(axis=1)
+    weights = (np.uint32(1) << (2 * np.arange(k - 1, -1, -1, dtype=np.uint32))).astype(np.uint32)
+    kmers = (windows[valid].astype(np.uint32) * weights).sum(axis=1, dtype=np.uint32)
+    positions = np.nonzero(valid)[0].astype(np.uint32)
+    return kmers, positions
+
+
+@dataclass
+class SequenceSearchHit:
+    """Ungapped high-scoring segment between a query and a library version."""
+
+    # purpose: report top-N library matches with identity and score for the blast route
+    # status: experimental
+    version_id: str
+    asset_id: str
+    asset_name: str
+    version_index: int
+    strand: str
+    score: float
+    identity: float
+    seed_count: int
+    query_start: int
+    query_end: int
+    subject_start: int
+    subject_end: int
+    query_aligned: str
+    subject_aligned: str
+
+    def as_dict(self) -> dict[str, Any]:
+        return dict(self.__dict__)
+
+
+class KmerSeedIndex:
+    """Memory-mapped k-mer postings over DNA asset versions, stored as sorted segments."""
+
+    # purpose: persist sorted (kmer, version ordinal, position) postings on disk and mmap them per search
+    # inputs: index directory plus DNAAssetVersion rows discovered through `sync`
+    # outputs: seed-and-extend hits ranked by ungapped HSP score
+    # status: experimental
+    # note: new versions land in a new segment and small tail segments are merged, so a sync costs
+    #       O(new postings) amortized; removed versions are tombstoned until `compact` drops them
+    # note: every API and worker process opens its own index over the same directory, so writers
+    #       hold an exclusive flock across load, merge, write and unlink and readers a shared one
+
+    def __init__(self, directory: Path, *, k: int = DEFAULT_KMER_SIZE):
+        if not 4 <= k <= 16:
+            raise ValueError("k-mer size must be between 4 and 16 to fit 32-bit codes")
+        self.directory = directory
+        self.k = k
+        self._lock = threading.Lock()
+        self._manifest: dict[str, Any] | None = None
+        self._segments: list[dict[str, np.ndarray]] = []
+        self._live = np.ones(0, dtype=bool)
+
+    # -- persistence -----------------------------------------------------
+    @contextmanager
+    def _locked(self, *, exclusive: bool) -> Iterator[None]:
+        """Hold the in-process lock plus a cross-process flock on the index directory."""
+
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.directory / _LOCKFILE, "a+b") as handle:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _reset(self) -> dict[str, Any]:
+        self._manifest = {"k": self.k, "generation": None, "versions": [], "segments": [], "deleted": []}
+        self._segments = []
+        self._live = np.ones(0, dtype=bool)
+        return self._manifest
+
+    def _load(self) -> dict[str, Any]:
+        manifest_path = self.directory / _MANIFEST
+        if not manifest_path.exists():
+            return self._reset()
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if self._manifest and manifest.get("generation") == self._manifest.get("generation"):
+            return self._manifest
+        if manifest.get("k") != self.k:
+            # a k change invalidates every posting; start over
+            return self._reset()
+        # manifests written before segmenting name their single postings set after the generation
+        manifest.setdefault("segments", [manifest["generation"]])
+        manifest.setdefault("deleted", [])
+        self._segments = [
+            {name: np.load(self.directory / f"{name}.{segment}.npy", mmap_mode="r") for name in _ARRAYS}
+            for segment in manifest["segments"]
+        ]
+        live = np.ones(len(manifest["versions"]), dtype=bool)
+        live[np.asarray(manifest["deleted"], dtype=np.int64)] = False
+        self._live = live
+        self._manifest = manifest
+        return manifest
+
+    def _write(
+        self,
+        manifest: dict[str, Any],
+        new_segments: dict[str, dict[str, np.ndarray]] | None = None,
+    ) -> None:
+        # callers hold the exclusive flock, so the manifest on disk is the newest generation and
+        # only the segments it lists but the replacement drops are unreferenced
+        manifest_path = self.directory / _MANIFEST
+        previous: set[str] = set()
+        if manifest_path.exists():
+            current = json.loads(manifest_path.read_text(encoding="utf-8"))
+            previous = set(current.get("segments") or [current.get("generation")])
+        for segment, arrays in (new_segments or {}).items():
+            for name, values in arrays.items():
+                np.save(self.directory / f"{name}.{segment}.npy", values)
+        generation = uuid.uuid4().hex
+        manifest = {**manifest, "k": self.k, "generation": generation}
+        staging = self.directory / f"{_MANIFEST}.{generation}"
+        staging.write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(staging, manifest_path)
+        for segment in previous - set(manifest["segments"]):
+            for name in _ARRAYS:
+                (self.directory / f"{name}.{segment}.npy").unlink(missing_ok=True)
+        self._manifest = None
+        self._load()
+
+    @staticmethod
+    def _merge(segments: list[dict[str, np.ndarray]], remap: np.ndarray | None = None) -> dict[str, np.ndarray]:
+        """Merge segments into one sorted posting set, renumbering ordinals through `remap` if given."""
+
+        merged = {
+            name: np.concatenate([np.asarray(segment[name]) for segment in segments])
+            if segments
+            else np.empty(0, dtype=np.uint32)
+            for name in _ARRAYS
+        }
+        if remap is not None:
+            keep = remap[merged["ordinals"]] >= 0
+            merged = {name: values[keep] for name, values in merged.items()}
+            merged["ordinals"] = remap[merged["ordinals"]].astype(np.uint32)
+        order = np.argsort(merged["kmers"], kind="stable")
+        return {name: values[order] for name, values in merged.items()}
+
+    # -- maintenance -----------------------------------------------------
+    def add_versions(self, versions: Iterable[models.DNAAssetVersion]) -> int:
+        """Write postings for new versions as a new segment, folding in undersized tail segments."""
+
+        # purpose: incremental update; existing segments are never re-encoded and only merged
+        #          while the one before them is at most twice their combined size
+        with self._locked(exclusive=True):
+            manifest = self._load()
+            known = {entry["id"] for entry in manifest["versions"]}
+            entries = list(manifest["versions"])
+            new_kmers: list[np.ndarray] = []
+            new_ordinals: list[np.ndarray] = []
+            new_positions: list[np.ndarray] = []
+            for version in versions:
+                version_id = str(version.id)
+                if version_id in known:
+                    continue
+                kmers, positions = encode_kmers(version.sequence, self.k)
+                ordinal = len(entries)
+                entries.append(
+                    {
+                        "id": version_id,
+                        "checksum": version.sequence_checksum,
+                        "length": version.sequence_length,
+                    }
+                )
+                known.add(version_id)
+                new_kmers.append(kmers)
+                new_ordinals.append(np.full(len(kmers), ordinal, dtype=np.uint32))
+                new_positions.append(positions)
+            if len(entries) == len(manifest["versions"]):
+                return 0
+            added = {
+                "kmers": np.concatenate(new_kmers),
+                "ordinals": np.concatenate(new_ordinals),
+                "positions": np.concatenate(new_positions),
+            }
+            segments = [*self._segments, added]
+            names = [*manifest["segments"], uuid.uuid4().hex]
+            sizes = [len(segment["kmers"]) for segment in segments]
+            start = len(segments) - 1
+            while start > 0 and sizes[start - 1] <= 2 * sum(sizes[start:]):
+                start -= 1
+            tail = self._merge(segments[start:])
+            segment = names[-1]
+            self._write(
+                {**manifest, "versions": entries, "segments": [*names[:start], segment]},
+                {segment: tail},
+            )
+            return len(entries) - len(manifest["versions"])
+
+    def remove_versions(self, version_ids: Iterable[str]) -> int:
+        """Tombstone indexed versions so searches skip them until the next `compact`."""
+
+        with self._locked(exclusive=True):
+            manifest = self._load()
+            drop = {str(version_id) for version_id in version_ids}
+            deleted = set(manifest["deleted"])
+            removed = {
+                ordinal
+                for ordinal, entry in enumerate(manifest["versions"])
+                if entry["id"] in drop and ordinal not in deleted
+            }
+            if not removed:
+                return 0
+            self._write({**manifest, "deleted": sorted(deleted | removed)})
+            return len(removed)
+
+    def compact(self) -> None:
+        """Merge every segment into one and drop the postings and entries of removed versions."""
+
+        # purpose: full rebuild from the existing postings; no sequence is re-encoded
+        with self._locked(exclusive=True):
+            manifest = self._load()
+            if len(manifest["segments"]) <= 1 and not manifest["deleted"]:
+                return
+            remap = np.where(self._live, np.cumsum(self._live) - 1, -1).astype(np.int64)
+            merged = self._merge(self._segments, remap)
+            entries = [entry for entry, live in zip(manifest["versions"], self._live) if live]
+            segment = uuid.uuid4().hex
+            self._write(
+                {**manifest, "versions": entries, "segments": [segment], "deleted": []},
+                {segment: merged},
+            )
+
+    def sync(self, db: Session, *, batch_size: int = 200) -> int:
+        """Index every new DNAAssetVersion and drop versions that no longer exist."""
+
+        # purpose: periodic reconcile; new versions are normally indexed as they are created
+        # outputs: number of versions added; removals compact once tombstones pass COMPACT_DELETED_RATIO
+        with self._locked(exclusive=False):
+            manifest = self._load()
+        known = {entry["id"] for entry in manifest["versions"]}
+        existing = db.scalars(select(models.DNAAssetVersion.id)).all()
+        present = {str(version_id) for version_id in existing}
+        self.remove_versions(known - present)
+        with self._locked(exclusive=False):
+            manifest = self._load()
+        if manifest["deleted"] and len(manifest["deleted"]) > COMPACT_DELETED_RATIO * len(manifest["versions"]):
+            self.compact()
+        version_ids = [version_id for version_id in existing if str(version_id) not in known]
+        added = 0
+        for start in range(0, len(version_ids), batch_size):
+            chunk = version_ids[start : start + batch_size]
+            versions = db.scalars(
+                select(models.DNAAssetVersion).where(models.DNAAssetVersion.id.in_(chunk))
+            ).all()
+            added += self.add_versions(versions)
+        return added
+
+    # -- search ----------------------------------------------------------
+    def _seed_groups(
+        self,
+        query: str,
+        segments: list[dict[str, np.ndarray]],
+        allowed: np.ndarray,
+    ) -> list[tuple[int, int, int]]:
+        """Return (seed count, ordinal, diagonal) groups for one query strand."""
+
+        query_kmers, query_positions = encode_kmers(query, self.k)
+        if not len(query_kmers) or not segments:
+            return []
+        bounds = [
+            (
+                np.searchsorted(segment["kmers"], query_kmers, side="left"),
+                np.searchsorted(segment["kmers"], query_kmers, side="right"),
+            )
+            for segment in segments
+        ]
+        # the repeat cutoff applies to a k-mer's occurrences across all segments
+        totals = sum(upper - lower for lower, upper in bounds)
+        keep = (totals > 0) & (totals <= MAX_SEED_OCCURRENCES)
+        if not keep.any():
+            return []
+        query_positions = query_positions[keep]
+        ordinal_parts: list[np.ndarray] = []
+        diagonal_parts: list[np.ndarray] = []
+        for segment, (lower, upper) in zip(segments, bounds):
+            lower, counts = lower[keep], (upper - lower)[keep]
+            if not counts.any():
+                continue
+            offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            posting = np.repeat(lower, counts) + offsets
+            ordinal_parts.append(np.asarray(segment["ordinals"][posting], dtype=np.int64))
+            diagonal_parts.append(
+                np.asarray(segment["positions"][posting], dtype=np.int64)
+                - np.repeat(query_positions, counts).astype(np.int64)
+            )
+        ordinals = np.concatenate(ordinal_parts)
+        diagonals = np.concatenate(diagonal_parts)
+        mask = allowed[ordinals]
+        ordinals, diagonals = ordinals[mask], diagonals[mask]
+        if not len(ordinals):
+            return []
+        pairs, seed_counts = np.unique(
+            np.stack([ordinals, diagonals], axis=1), axis=0, return_counts=True
+        )
+        return [
+            (int(count), int(ordinal), int(diagonal))
+            for (ordinal, diagonal), count in zip(pairs, seed_counts)
+        ]
+
+    @staticmethod
+    def _extend(query: str, subject: str, diagonal: int) -> tuple[int, int, int, int]:
+        """Return (score, query_start, query_end, matches) of the best ungapped segment on a diagonal."""
+
+        query_start = max(0, -diagonal)
+        query_stop = min(len(query), len(subject) - diagonal)
+        if query_stop <= query_start:
+            return 0, 0, 0, 0
+        q = np.frombuffer(query[query_start:query_stop].encode("ascii", errors="replace"), dtype=np.uint8)
+        s = np.frombuffer(
+            subject[query_start + diagonal : query_stop + diagonal].encode("ascii", errors="replace"),
+            dtype=np.uint8,
+        )
+        equal = q == s
+        steps = np.where(equal, MATCH_SCORE, MISMATCH_SCORE)
+        running = np.concatenate([[0], np.cumsum(steps)])
+        # best segment = max over j of running[j] - min(running[:j])
+        minima = np.minimum.accumulate(running)
+        gains = running[1:] - minima[:-1]
+        end = int(np.argmax(gains))
+        score = int(gains[end])
+        if score <= 0:
+            return 0, 0, 0, 0
+        start = int(np.argmin(running[: end + 1]))
+        matches = int(equal[start : end + 1].sum())
+        return score, query_start + start, query_start + end + 1, matches
+
+    def search(
+        self,
+        db: Session,
+        query: str,
+        *,
+        top_n: int = 10,
+        version_ids: Iterable[str] | None = None,
+        candidates_per_strand: int | None = None,
+    ) -> list[SequenceSearchHit]:
+        """Return the top-N library hits for a query, best HSP per version."""
+
+        # purpose: seed with shared k-mers, extend the densest diagonals, rank by score
+        # inputs: query sequence, optional version id allow-list for RBAC scoping
+        # outputs: SequenceSearchHit list sorted by descending score
+        normalized = _normalize(query)
+        with self._locked(exclusive=False):
+            manifest = self._load()
+            segments, allowed = self._segments, self._live.copy()
+        entries = manifest["versions"]
+        if version_ids is not None:
+            allow = {str(version_id) for version_id in version_ids}
+            allowed &= np.fromiter((entry["id"] in allow for entry in entries), dtype=bool, count=len(entries))
+        limit = candidates_per_strand or max(top_n * 5, 20)
+        strands = {"+": normalized, "-": normalized.translate(_COMPLEMENT)[::-1]}
+        candidates: list[tuple[int, str, int, int]] = []
+        for strand, sequence in strands.items():
+            groups = sorted(self._seed_groups(sequence, segments, allowed), reverse=True)[:limit]
+            candidates.extend((count, strand, ordinal, diagonal) for count, ordinal, diagonal in groups)
+        if not candidates:
+            return []
+        ordinal_ids = {ordinal: entries[ordinal]["id"] for _, _, ordinal, _ in candidates}
+        rows = db.execute(
+            select(models.DNAAssetVersion, models.DNAAsset.name)
+            .join(models.DNAAsset, models.DNAAsset.id == models.DNAAssetVersion.asset_id)
+            .where(models.DNAAssetVersion.id.in_([uuid.UUID(value) for value in set(ordinal_ids.values())]))
+        ).all()
+        subjects = {str(version.id): (version, name) for version, name in rows}
+        best: dict[str, SequenceSearchHit] = {}
+        for seed_count, strand, ordinal, diagonal in candidates:
+            version_id = ordinal_ids[ordinal]
+            if version_id not in subjects:
+                # deleted since the last sync; the next sync tombstones it
+                continue
+            version, asset_name = subjects[version_id]
+            subject = _normalize(version.sequence)
+            sequence = strands[strand]
+            score, q_start, q_end, matches = self._extend(sequence, subject, diagonal)
+            if score <= 0:
+                continue
+            length = q_end - q_start
+            hit = SequenceSearchHit(
+                version_id=version_id,
+                asset_id=str(version.asset_id),
+                asset_name=asset_name,
+                version_index=version.version_index,
+                strand=strand,
+                score=float(score),
+                identity=(matches / length * 100) if length else 0.0,
+                seed_count=seed_count,
+                query_start=q_start if strand == "+" else len(sequence) - q_end,
+                query_end=q_end if strand == "+" else len(sequence) - q_start,
+                subject_start=q_start + diagonal,
+                subject_end=q_end + diagonal,
+                query_aligned=sequence[q_start:q_end],
+                subject_aligned=subject[q_start + diagonal : q_end + diagonal],
+            )
+            current = best.get(version_id)
+            if current is None or hit.score > current.score:
+                best[version_id] = hit
+        return sorted(best.values(), key=lambda item: (-item.score, -item.identity))[:top_n]
+
+
+_INDEXES: dict[tuple[str, int], KmerSeedIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_library_index(*, k: int = DEFAULT_KMER_SIZE) -> KmerSeedIndex:
+    """Return the process-wide index bound to the configured index directory."""
+
+    # purpose: share mmap handles and manifest state across requests
+    directory = _index_directory()
+    key = (str(directory.resolve()), k)
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = KmerSeedIndex(directory, k=k)
+            _INDEXES[key] = index
+        return index
+
+
+def index_library_versions(versions: Iterable[models.DNAAssetVersion]) -> int:
+    """Add freshly created versions to the library index."""
+
+    # purpose: called from dna_assets on create so searches never pay for indexing
+    return get_library_index().add_versions(versions)
+
+
+def reconcile_library_index(db: Session) -> int:
+    """Bring the library index in line with the database, dropping deleted versions."""
+
+    # purpose: periodic Celery task body; catches versions whose inline indexing failed
+    return get_library_index().sync(db)
+
+
+def search_library(
+    db: Session,
+    query: str,
+    *,
+    top_n: int = 10,
+    version_ids: Iterable[str] | None = None,
+) -> list[dict[str, Any]]:
+    """Return ranked library hits as dicts from the current index."""
+
+    # purpose: entry point for the /api/sequence/blast library mode
+    hits = get_library_index().search(db, query, top_n=top_n, version_ids=version_ids)
+    return [hit.as_dict() for hit in hits]
@@ -2,21 +2,29 @@
 
 # purpose: provide deterministic scientific computations shared across planner and dna asset workflows
 # status: experimental
-# depends_on: primer3, backend.app.sequence
+# depends_on: primer3, numpy, backend.app.sequence, backend.app.services.primer_thermodynamics,
+#   backend.app.services.restriction_index
 # related_docs: docs/planning/cloning_planner_scope.md, docs/dna_assets.md
 
 from __future__ import annotations
 
 import math
-from collections.abc import Sequence
+import multiprocessing
+import os
+import threading
+from collections.abc import Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from functools import lru_cache
 from statistics import mean
 from typing import Any
 
+import numpy as np
 import primer3
 
 from .. import sequence as sequence_utils
+from . import primer_thermodynamics, restriction_index
 from ..data.loaders import (
     get_assembly_strategy_catalog,
     get_buffer_catalog,
@@ -81,6 +89,27 @@ class PrimerSet:
     warnings: list[str]
 
 
+@dataclass
+class _PendingPrimerPair:
+    """Primer3 output awaiting batch thermodynamic scoring."""
+
+    # purpose: defer per-primer heuristics so a whole template set is scored in one pass
+    name: str
+    template: str
+    design: dict[str, Any]
+    forward_seq: str
+    reverse_seq: str
+    forward_stats: dict[str, Any] | None
+    reverse_stats: dict[str, Any] | None
+    primer_source: str
+
+
+BATCH_MAX_WORKERS = max(
+    1, int(os.getenv("SEQUENCE_TOOLKIT_BATCH_WORKERS", str(os.cpu_count() or 2)))
+)
+_BATCH_POOL: ProcessPoolExecutor | None = None
+_BATCH_POOL_LOCK = threading.Lock()
+
 _GAS_CONSTANT = 1.987
 _NEAREST_NEIGHBOR_PARAMS: dict[str, tuple[float, float]] = {
     "AA": (-7.9, -22.2),
@@ -491,6 +520,19 @@ def _thermodynamic_profile(
     return tm_value, _delta_g_from_run(hairpin_match), _delta_g_from_run(homodimer_match)
 
 
+def _batch_thermodynamic_profile(
+    batch: primer_thermodynamics.PrimerBatchThermodynamics, index: int
+) -> tuple[float, float | None, float | None]:
+    """Return tm and secondary structure heuristics for one primer of a scored batch."""
+
+    # purpose: mirror _thermodynamic_profile on top of the vectorized batch engine
+    return (
+        float(batch.tm[index]),
+        _delta_g_from_run(int(batch.hairpin_runs[index])),
+        _delta_g_from_run(int(batch.homodimer_runs[index])),
+    )
+
+
 @lru_cache(maxsize=1)
 def get_enzyme_catalog() -> list[EnzymeMetadata]:
     """Load and cache curated enzyme metadata records."""
@@ -695,6 +737,32 @@ def diff_sequences(reference: str, candidate: str) -> dict[str, int]:
     }
 
 
+def locate_sequence_edit(reference: str, candidate: str) -> dict[str, int]:
+    """Return the shared prefix length and the edited span in each sequence."""
+
+    # purpose: bound the region a version diff touched so analyses can be recomputed locally
+    # outputs: prefix (shared leading bases), reference_end/candidate_end (exclusive ends of the edit)
+    ref = reference or ""
+    cand = candidate or ""
+    limit = min(len(ref), len(cand))
+    if ref.isascii() and cand.isascii():
+        left = np.frombuffer(ref.encode("ascii"), dtype=np.uint8)
+        right = np.frombuffer(cand.encode("ascii"), dtype=np.uint8)
+    else:
+        left = np.frombuffer(ref.encode("utf-32-le"), dtype=np.uint32)
+        right = np.frombuffer(cand.encode("utf-32-le"), dtype=np.uint32)
+    mismatches = np.flatnonzero(left[:limit] != right[:limit])
+    prefix = int(mismatches[0]) if len(mismatches) else limit
+    tail = limit - prefix
+    mismatches = np.flatnonzero(left[len(ref) - tail :][::-1] != right[len(cand) - tail :][::-1])
+    suffix = int(mismatches[0]) if len(mismatches) else tail
+    return {
+        "prefix": prefix,
+        "reference_end": len(ref) - suffix,
+        "candidate_end": len(cand) - suffix,
+    }
+
+
 def _evaluate_restriction_strategies(
     digests: Sequence[RestrictionDigestResult],
     *,
@@ -986,11 +1054,12 @@ def design_primers(
     )
     records: list[PrimerDesignRecord] = []
     tm_values: list[float] = []
+    pending: list[PrimerDesignRecord | _PendingPrimerPair] = []
     for descriptor in template_sequences:
         name = descriptor.get("name") or descriptor.get("id") or "template"
         template = (descriptor.get("sequence") or "").upper()
         if len(template) < size_range[0]:
-            records.append(
+            pending.append(
                 PrimerDesignRecord(
                     name=name,
                     status="insufficient_sequence",
@@ -1029,12 +1098,49 @@ def design_primers(
             forward_stats = None
             reverse_stats = None
             primer_source = "primer3"
-        forward_tm, forward_hairpin, forward_dimer = _thermodynamic_profile(
-            forward_seq, primer_config
+        pending.append(
+            _PendingPrimerPair(
+                name=name,
+                template=template,
+                design=design,
+                forward_seq=forward_seq,
+                reverse_seq=reverse_seq,
+                forward_stats=forward_stats,
+                reverse_stats=reverse_stats,
+                primer_source=primer_source,
+            )
+        )
+    batch_sequences = [
+        seq
+        for entry in pending
+        if isinstance(entry, _PendingPrimerPair)
+        for seq in (entry.forward_seq, entry.reverse_seq)
+    ]
+    batch_thermo = primer_thermodynamics.score_primer_batch(
+        batch_sequences,
+        na_conc_mM=primer_config.na_concentration_mM,
+        primer_conc_nM=primer_config.primer_concentration_nM,
+    )
+    batch_cursor = 0
+    for entry in pending:
+        if isinstance(entry, PrimerDesignRecord):
+            records.append(entry)
+            continue
+        name = entry.name
+        template = entry.template
+        design = entry.design
+        forward_seq = entry.forward_seq
+        reverse_seq = entry.reverse_seq
+        forward_stats = entry.forward_stats
+        reverse_stats = entry.reverse_stats
+        primer_source = entry.primer_source
+        forward_tm, forward_hairpin, forward_dimer = _batch_thermodynamic_profile(
+            batch_thermo, batch_cursor
         )
-        reverse_tm, reverse_hairpin, reverse_dimer = _thermodynamic_profile(
-            reverse_seq, primer_config
+        reverse_tm, reverse_hairpin, reverse_dimer = _batch_thermodynamic_profile(
+            batch_thermo, batch_cursor + 1
         )
+        batch_cursor += 2
         forward = PrimerDesignResult(
             sequence=forward_seq,
             tm=(
@@ -1152,11 +1258,16 @@ def design_primers(
         if record.reverse:
             primer_pairs.append((f"{record.name}:reverse", record.reverse))
     cross_dimer_flags: list[PrimerCrossDimerFlag] = []
+    overlap_matrix = primer_thermodynamics.cross_dimer_matrix(
+        primer_thermodynamics.encode_primers(
+            [primer.sequence for _, primer in primer_pairs]
+        )
+    )
     for idx in range(len(primer_pairs)):
         name_a, primer_a = primer_pairs[idx]
         for jdx in range(idx + 1, len(primer_pairs)):
             name_b, primer_b = primer_pairs[jdx]
-            overlap = _max_cross_dimer_run(primer_a.sequence, primer_b.sequence)
+            overlap = int(overlap_matrix[idx, jdx])
             if overlap < 5:
                 continue
             delta_g = _delta_g_from_run(overlap)
@@ -1229,6 +1340,163 @@ def design_primers(
     return payload
 
 
+def _design_primers_batch_worker(
+    index: int,
+    descriptor: dict[str, Any],
+    profile_payload: dict[str, Any],
+    size_range: tuple[int, int],
+    tm_target: float,
+) -> dict[str, Any]:
+    """Design primers for a single template inside a worker process."""
+
+    # purpose: picklable process-pool entry point wrapping design_primers
+    profile = SequenceToolkitProfile(**profile_payload)
+    result = design_primers(
+        [descriptor],
+        config=profile,
+        product_size_range=size_range,
+        target_tm=tm_target,
+    )
+    record = result["primers"][0]
+    return {
+        "type": "result",
+        "index": index,
+        "name": record["name"],
+        "status": record["status"],
+        "record": record,
+        "error": None,
+    }
+
+
+def _get_batch_pool() -> ProcessPoolExecutor:
+    """Return the process-wide batch primer pool, creating it on first use."""
+
+    # purpose: bound batch primer design to BATCH_MAX_WORKERS processes across all requests
+    # note: spawned rather than forked so children never inherit the API's threads, DB or redis pools
+    global _BATCH_POOL
+    with _BATCH_POOL_LOCK:
+        if _BATCH_POOL is None:
+            _BATCH_POOL = ProcessPoolExecutor(
+                max_workers=BATCH_MAX_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _BATCH_POOL
+
+
+def _discard_batch_pool(pool: ProcessPoolExecutor) -> None:
+    # purpose: drop a pool whose worker died so the next batch starts a fresh one
+    global _BATCH_POOL
+    with _BATCH_POOL_LOCK:
+        if _BATCH_POOL is pool:
+            _BATCH_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_batch_pool() -> None:
+    """Stop the shared batch primer pool; called on application shutdown."""
+
+    global _BATCH_POOL
+    with _BATCH_POOL_LOCK:
+        pool, _BATCH_POOL = _BATCH_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def design_primers_batch(
+    template_sequences: Sequence[dict[str, Any]],
+    *,
+    config: PrimerDesignConfig | SequenceToolkitProfile | None = None,
+    product_size_range: tuple[int, int] | None = None,
+    target_tm: float | None = None,
+    preset_id: str | None = None,
+    max_workers: int | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Design primers for many templates across a process pool, yielding as each completes."""
+
+    # purpose: fan large cloning campaigns out across CPU cores with bounded concurrency
+    # inputs: sequence descriptors, primer config/preset, optional worker ceiling
+    # outputs: iterator of per-template result envelopes followed by a summary envelope
+    # status: experimental
+    profile, _, size_range, tm_target = _resolve_primer_config(
+        config,
+        product_size_range=product_size_range,
+        target_tm=target_tm,
+        preset_id=preset_id,
+    )
+    profile_payload = profile.model_dump()
+    in_flight_limit = max(1, min(max_workers or BATCH_MAX_WORKERS, BATCH_MAX_WORKERS)) * 2
+    descriptors = list(enumerate(template_sequences))
+    status_counts: dict[str, int] = {}
+    tm_values: list[float] = []
+
+    def _track(envelope: dict[str, Any]) -> dict[str, Any]:
+        status_counts[envelope["status"]] = status_counts.get(envelope["status"], 0) + 1
+        record = envelope.get("record") or {}
+        for side in ("forward", "reverse"):
+            candidate = record.get(side)
+            if candidate:
+                tm_values.append(candidate["thermodynamics"]["tm"])
+        return envelope
+
+    # the pool is shared; `max_workers` only caps how many of this batch's templates are queued on it
+    executor = _get_batch_pool()
+    pending: dict[Future, tuple[int, str, ProcessPoolExecutor]] = {}
+    cursor = 0
+    try:
+        while cursor < len(descriptors) or pending:
+            while cursor < len(descriptors) and len(pending) < in_flight_limit:
+                index, descriptor = descriptors[cursor]
+                name = descriptor.get("name") or descriptor.get("id") or "template"
+                try:
+                    future = executor.submit(
+                        _design_primers_batch_worker,
+                        index,
+                        dict(descriptor),
+                        profile_payload,
+                        size_range,
+                        tm_target,
+                    )
+                except BrokenProcessPool:  # pragma: no cover - a worker died in another batch
+                    _discard_batch_pool(executor)
+                    executor = _get_batch_pool()
+                    continue
+                pending[future] = (index, name, executor)
+                cursor += 1
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, name, pool = pending.pop(future)
+                try:
+                    envelope = future.result()
+                except Exception as exc:  # pragma: no cover - worker crash surfaced per template
+                    if isinstance(exc, BrokenProcessPool):
+                        _discard_batch_pool(pool)
+                        executor = _get_batch_pool()
+                    envelope = {
+                        "type": "result",
+                        "index": index,
+                        "name": name,
+                        "status": "error",
+                        "record": None,
+                        "error": str(exc),
+                    }
+                yield _track(envelope)
+    finally:
+        # a client that disconnects mid-stream must not leave its queued templates on the shared pool
+        for future in pending:
+            future.cancel()
+    yield {
+        "type": "summary",
+        "template_count": len(descriptors),
+        "status_counts": status_counts,
+        "primer_count": len(tm_values) // 2,
+        "average_tm": mean(tm_values) if tm_values else 0.0,
+        "min_tm": min(tm_values) if tm_values else 0.0,
+        "max_tm": max(tm_values) if tm_values else 0.0,
+        "workers": BATCH_MAX_WORKERS,
+        "profile": profile_payload,
+    }
+
+
 def analyze_restriction_digest(
     template_sequences: Sequence[dict[str, Any]],
     *,
@@ -1277,10 +1545,15 @@ def analyze_restriction_digest(
                     compatible_buffers=[],
                 )
             )
+    site_index = restriction_index.get_site_index(enzyme_list)
     for descriptor in template_sequences:
         name = descriptor.get("name") or descriptor.get("id") or "template"
         template = descriptor.get("sequence") or ""
-        site_map = sequence_utils.restriction_map(template, enzyme_list)
+        site_map = site_index.search(
+            template,
+            linear=(descriptor.get("topology") or "linear") != "circular",
+            enzymes=enzyme_list,
+        )
         if digest_config.require_all:
             compatible = all(len(positions) > 0 for positions in site_map.values())
         else:
@@ -6,8 +6,9 @@ import hashlib
 import io
 import os
 import re
+from dataclasses import dataclass
 from datetime import timedelta
-from typing import Optional
+from typing import BinaryIO, Iterable, Iterator, Optional
 from uuid import uuid4
 
 try:
@@ -20,6 +21,9 @@ except ImportError:  # pragma: no cover - dependency optional in tests
 # related_docs: backend/app/README.md
 
 _MINIO_CLIENT: Optional["Minio"] = None
+STREAM_CHUNK_SIZE = int(os.getenv("STORAGE_STREAM_CHUNK_SIZE", str(1024 * 1024)))
+# MinIO multipart parts must be at least 5 MiB
+MINIO_PART_SIZE = max(int(os.getenv("MINIO_PART_SIZE", str(10 * 1024 * 1024))), 5 * 1024 * 1024)
 
 
 def _get_upload_dir() -> str:
@@ -129,23 +133,7 @@ def load_binary_payload(storage_path: str) -> bytes:
     # inputs: storage locator string persisted in database metadata
     # outputs: binary payload
     # status: pilot
-    if storage_path.startswith("s3://"):
-        client = _ensure_minio_client()
-        if not client:
-            raise FileNotFoundError("Object storage client unavailable for s3 path")
-        _, bucket, *key_parts = storage_path.split("/", 3)
-        if not key_parts:
-            raise FileNotFoundError("Invalid s3 storage path")
-        object_name = key_parts[-1]
-        response = client.get_object(bucket, object_name)
-        try:
-            return response.read()
-        finally:
-            response.close()
-            response.release_conn()
-
-    with open(storage_path, "rb") as handle:
-        return handle.read()
+    return b"".join(open_stream(storage_path))
 
 
 def generate_signed_download_url(storage_path: str, expires_in: int = 3600) -> str:
@@ -159,10 +147,7 @@ def generate_signed_download_url(storage_path: str, expires_in: int = 3600) -> s
         client = _ensure_minio_client()
         if not client:
             raise FileNotFoundError("Object storage client unavailable for presigned URL")
-        _, bucket, *key_parts = storage_path.split("/", 3)
-        object_name = key_parts[-1] if key_parts else ""
-        if not object_name:
-            raise FileNotFoundError("Invalid s3 storage path for presigned URL")
+        bucket, object_name = _split_s3_path(storage_path)
         return client.presigned_get_object(bucket, object_name, expires=timedelta(seconds=expires_in))
     return storage_path
 
@@ -174,7 +159,254 @@ def validate_checksum(storage_path: str, expected_checksum: str, algorithm: str
     # inputs: storage locator, expected checksum string, hashing algorithm identifier
     # outputs: boolean result of checksum comparison
     # status: pilot
-    data = load_binary_payload(storage_path)
+    return compute_checksum(storage_path, algorithm) == expected_checksum
+
+
+@dataclass(frozen=True)
+class StoredObject:
+    """Result of a streamed write: locator, byte count, and digest computed while writing."""
+
+    storage_path: str
+    size: int
+    checksum: str
+    algorithm: str = "sha256"
+
+
+class _HashingReader(io.RawIOBase):
+    """File-like adapter that hashes and counts bytes as they are read."""
+
+    # purpose: let MinIO multipart uploads and local copies compute digests in the same pass
+    def __init__(self, source: BinaryIO | Iterable[bytes], algorithm: str):
+        self._read = getattr(source, "read", None)
+        self._chunks = None if self._read else iter(source)
+        self._pending = b""
+        self.hasher = hashlib.new(algorithm)
+        self.size = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def _next_chunk(self, size: int) -> bytes:
+        if self._read is not None:
+            return self._read(size)
+        # empty chunks from generators are not end-of-stream
+        for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = STREAM_CHUNK_SIZE
+        buffer = bytearray(self._pending)
+        while len(buffer) < size:
+            chunk = self._next_chunk(size - len(buffer))
+            if not chunk:
+                break
+            buffer += chunk
+        data, self._pending = bytes(buffer[:size]), bytes(buffer[size:])
+        self.hasher.update(data)
+        self.size += len(data)
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def _split_s3_path(storage_path: str) -> tuple[str, str]:
+    _, _, bucket, *key_parts = storage_path.split("/", 3)
+    if not key_parts or not key_parts[-1]:
+        raise FileNotFoundError("Invalid s3 storage path")
+    return bucket, key_parts[-1]
+
+
+def save_stream(
+    source: BinaryIO | Iterable[bytes],
+    filename: str,
+    *,
+    content_type: str = "application/octet-stream",
+    namespace: str | None = None,
+    encrypt: bool = False,
+    object_name: str | None = None,
+    algorithm: str = "sha256",
+) -> StoredObject:
+    """Persist a file-like object or chunk iterator without buffering it in memory."""
+
+    # purpose: chunked counterpart of save_binary_payload for multi-GB uploads and generated archives
+    # inputs: readable file object or iterable of byte chunks, logical filename, storage options
+    # outputs: StoredObject with locator, size, and checksum computed during the write
+    # status: pilot
+    object_suffix = object_name or _build_object_name(namespace, filename)
+    reader = _HashingReader(source, algorithm)
+    client = _ensure_minio_client()
+    if client:
+        bucket = os.getenv("MINIO_BUCKET", "uploads")
+        extra_headers = None
+        if encrypt:
+            extra_headers = {"X-Amz-Server-Side-Encryption": "AES256"}
+        # unknown length: the client issues a multipart upload with MINIO_PART_SIZE parts
+        client.put_object(
+            bucket,
+            object_suffix,
+            reader,
+            length=-1,
+            part_size=MINIO_PART_SIZE,
+            content_type=content_type,
+            metadata=extra_headers,
+        )
+        return StoredObject(f"s3://{bucket}/{object_suffix}", reader.size, reader.hasher.hexdigest(), algorithm)
+
+    upload_dir = _get_upload_dir()
+    if namespace:
+        namespace_dir = os.path.join(upload_dir, *namespace.strip("/").split("/"))
+        os.makedirs(namespace_dir, exist_ok=True)
+        storage_path = os.path.join(namespace_dir, os.path.basename(object_suffix))
+    else:
+        storage_path = os.path.join(upload_dir, os.path.basename(object_suffix))
+    with open(storage_path, "wb") as handle:
+        while chunk := reader.read(STREAM_CHUNK_SIZE):
+            handle.write(chunk)
+    return StoredObject(storage_path, reader.size, reader.hasher.hexdigest(), algorithm)
+
+
+def stat_payload(storage_path: str) -> int:
+    """Return the stored size in bytes without reading the payload."""
+
+    if storage_path.startswith("s3://"):
+        client = _ensure_minio_client()
+        if not client:
+            raise FileNotFoundError("Object storage client unavailable for s3 path")
+        bucket, object_name = _split_s3_path(storage_path)
+        return client.stat_object(bucket, object_name).size
+    return os.path.getsize(storage_path)
+
+
+def delete_payload(storage_path: str) -> None:
+    """Remove a stored payload; a payload that is already gone is not an error."""
+
+    # purpose: clean up intermediate artifacts that nothing references any more
+    if storage_path.startswith("s3://"):
+        client = _ensure_minio_client()
+        if not client:
+            raise FileNotFoundError("Object storage client unavailable for s3 path")
+        bucket, object_name = _split_s3_path(storage_path)
+        client.remove_object(bucket, object_name)
+        return
+    try:
+        os.remove(storage_path)
+    except FileNotFoundError:
+        pass
+
+
+def open_stream(
+    storage_path: str,
+    *,
+    start: int = 0,
+    end: int | None = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Yield stored bytes in chunks, optionally limited to the inclusive range [start, end]."""
+
+    # purpose: serve downloads, Range requests, and checksums with constant memory per request
+    # inputs: storage locator, optional inclusive byte range, chunk size
+    # outputs: iterator of byte chunks
+    # status: pilot
+    remaining = None if end is None else end - start + 1
+    if storage_path.startswith("s3://"):
+        client = _ensure_minio_client()
+        if not client:
+            raise FileNotFoundError("Object storage client unavailable for s3 path")
+        bucket, object_name = _split_s3_path(storage_path)
+        response = client.get_object(bucket, object_name, offset=start, length=remaining or 0)
+        try:
+            yield from response.stream(chunk_size)
+        finally:
+            response.close()
+            response.release_conn()
+        return
+
+    with open(storage_path, "rb") as handle:
+        handle.seek(start)
+        while remaining is None or remaining > 0:
+            chunk = handle.read(chunk_size if remaining is None else min(chunk_size, remaining))
+            if not chunk:
+                break
+            if remaining is not None:
+                remaining -= len(chunk)
+            yield chunk
+
+
+class ChunkStream(io.RawIOBase):
+    """Readable adapter over a byte chunk iterator that counts bytes consumed."""
+
+    # purpose: let line-oriented parsers (csv, SeqIO) read an open_stream payload incrementally
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._pending = b""
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = chunk
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        self.bytes_read += size
+        return size
+
+    def close(self) -> None:
+        # release the underlying open_stream generator (file handle or object response) early
+        close = getattr(self._chunks, "close", None)
+        if close is not None:
+            close()
+        super().close()
+
+
+def compute_checksum(storage_path: str, algorithm: str = "sha256") -> str:
+    """Hash a stored payload chunk by chunk."""
+
     hasher = hashlib.new(algorithm)
-    hasher.update(data)
-    return hasher.hexdigest() == expected_checksum
+    for chunk in open_stream(storage_path):
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """Resolve a single `bytes=` Range header against a payload size.
+
+    Returns an inclusive (start, end) pair, None when the header is absent or
+    should be ignored, and raises ValueError when the range is unsatisfiable.
+    """
+
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        # multi-range responses are not supported; fall back to the full payload
+        return None
+    first, _, last = spec.strip().partition("-")
+    try:
+        start = int(first) if first else None
+        last_byte = int(last) if last else None
+    except ValueError:
+        return None
+    if start is None:
+        if last_byte is None:
+            return None
+        # suffix range: the final N bytes
+        start, end = max(size - last_byte, 0), size - 1
+        if last_byte == 0:
+            raise ValueError("Unsatisfiable range")
+    else:
+        end = size - 1 if last_byte is None else min(last_byte, size - 1)
+    if start >= size or start > end:
+        raise ValueError("Unsatisfiable range")
+    return start, end
@@ -1,13 +1,17 @@
+import io
 import os
 import datetime
 from datetime import timezone
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init
 from sqlalchemy.orm import joinedload
 from uuid import UUID
 
+from . import database
 from .database import SessionLocal
-from .sequence import process_sequence_file
+from .sequence import iter_sequence_records
+from .storage import ChunkStream, delete_payload, open_stream, save_binary_payload, stat_payload
 from .eventlog import record_execution_event
 from .analytics.governance import invalidate_governance_analytics_cache
 from . import models, notify
@@ -19,29 +23,123 @@ celery_app.conf.task_always_eager = (
     CELERY_BROKER_URL == "memory://" or os.getenv("TESTING") == "1"
 )
 
+
+@worker_process_init.connect
+def _configure_worker_database(**_kwargs) -> None:
+    # purpose: give each forked worker its own right-sized pool instead of the parent's connections
+    database.configure_engine("worker")
+
+
+SEQUENCE_JOB_CHUNK_RECORDS = int(os.getenv("SEQUENCE_JOB_CHUNK_RECORDS", "100"))
+# sequences longer than this are spilled to object storage instead of the job JSON column
+SEQUENCE_JOB_INLINE_LIMIT = int(os.getenv("SEQUENCE_JOB_INLINE_LIMIT", "1000"))
+
+
 @celery_app.task
-def analyze_sequence_job(job_id: str, data: bytes, fmt: str):
+def analyze_sequence_job(job_id: str, storage_path: str, fmt: str):
+    # purpose: parse a stored upload record by record, appending each flush as one chunk row
+    # note: a flush writes only its own SEQUENCE_JOB_CHUNK_RECORDS records, never the records before it
+    # note: the upload is deleted once the job reaches a terminal status, whatever the outcome
     db = SessionLocal()
-    job = db.get(models.SequenceAnalysisJob, UUID(job_id))
-    if not job:
+    stream: ChunkStream | None = None
+    try:
+        job = db.get(models.SequenceAnalysisJob, UUID(job_id))
+        if not job:
+            return
+        pending: list[dict] = []
+        # sequences spilled to storage; removed again if the job fails and its chunks are dropped
+        spilled: list[str] = []
+        records = 0
+        total_length = 0
+        total_gc = 0.0
+        # the route recorded the upload size; stat_payload confirms it once inside the try
+        total_bytes = (job.progress or {}).get("total_bytes")
+        job.status = "running"
+        job.result = None
+        job.progress = {"records": 0, "bytes_read": 0, "total_bytes": total_bytes}
+        db.commit()
+
+        def _flush() -> None:
+            db.add(models.SequenceJobChunk(job_id=job.id, start_index=records - len(pending), records=pending))
+            # flush a chunk so pollers see partial results and progress
+            job.progress = {"records": records, "bytes_read": stream.bytes_read, "total_bytes": total_bytes}
+            db.commit()
+
+        try:
+            total_bytes = stat_payload(storage_path)
+            stream = ChunkStream(open_stream(storage_path))
+            for record in iter_sequence_records(io.BufferedReader(stream), fmt):
+                sequence = record["seq"]
+                if len(sequence) > SEQUENCE_JOB_INLINE_LIMIT:
+                    path, _ = save_binary_payload(
+                        sequence.encode("utf-8"),
+                        f"{record['id']}.txt",
+                        content_type="text/plain",
+                        namespace=f"sequence-jobs/{job_id}",
+                    )
+                    spilled.append(path)
+                    record = {**record, "seq": "", "sequence_path": path}
+                pending.append(record)
+                records += 1
+                total_length += record["length"]
+                total_gc += record["gc_content"] * record["length"] / 100
+                if len(pending) >= SEQUENCE_JOB_CHUNK_RECORDS:
+                    _flush()
+                    pending = []
+            if pending:
+                _flush()
+            job.status = "completed"
+        except Exception:
+            db.rollback()
+            db.query(models.SequenceJobChunk).filter(models.SequenceJobChunk.job_id == job.id).delete()
+            job.status = "failed"
+            job.result = []
+            for path in spilled:
+                try:
+                    delete_payload(path)
+                except Exception:  # pragma: no cover - depends on object storage availability
+                    pass
+        job.progress = {
+            "records": records,
+            "bytes_read": stream.bytes_read if stream else 0,
+            "total_bytes": total_bytes,
+            "total_length": total_length,
+            "gc_content": (total_gc / total_length * 100) if total_length else 0,
+        }
+        db.commit()
+    finally:
+        if stream is not None:
+            stream.close()
         db.close()
-        return
+        try:
+            delete_payload(storage_path)
+        except Exception:  # pragma: no cover - depends on object storage availability
+            pass
+
+
+def enqueue_analyze_sequence_job(job_id: str, storage_path: str, fmt: str):
+    if celery_app.conf.task_always_eager:
+        analyze_sequence_job(job_id, storage_path, fmt)
+    else:
+        analyze_sequence_job.delay(job_id, storage_path, fmt)
+
+
+@celery_app.task
+def import_inventory_csv(job_id: str):
+    from .services import inventory_import
+
+    db = SessionLocal()
     try:
-        result = process_sequence_file(data, fmt)
-        job.result = result
-        job.status = "completed"
-    except Exception:
-        job.status = "failed"
-        job.result = []
-    db.commit()
-    db.close()
+        inventory_import.run_import_job(db, UUID(job_id))
+    finally:
+        db.close()
 
 
-def enqueue_analyze_sequence_job(job_id: str, data: bytes, fmt: str):
+def enqueue_inventory_import(job_id: str):
     if celery_app.conf.task_always_eager:
-        analyze_sequence_job(job_id, data, fmt)
+        import_inventory_csv(job_id)
     else:
-        analyze_sequence_job.delay(job_id, data, fmt)
+        import_inventory_csv.delay(job_id)
 
 
 celery_app.conf.beat_schedule = {
@@ -57,9 +155,25 @@ celery_app.conf.beat_schedule = {
         "task": "app.tasks.monitor_narrative_approval_slas",
         "schedule": crontab(minute="*/15"),
     },
+    "sequence-index-reconcile": {
+        "task": "app.tasks.reconcile_sequence_index",
+        "schedule": crontab(minute="*/30"),
+    },
 }
 
 
+@celery_app.task
+def reconcile_sequence_index() -> int:
+    # purpose: index versions missed on create and tombstone deleted ones off the search path
+    from .services import sequence_search
+
+    db = SessionLocal()
+    try:
+        return sequence_search.reconcile_library_index(db)
+    finally:
+        db.close()
+
+
 @celery_app.task
 def backup_database():
     dest = os.getenv("BACKUP_DIR", "/tmp/backups")
@@ -4,7 +4,9 @@ os.environ.setdefault("SECRET_KEY", "test-secret")
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 import sys
 from pathlib import Path
@@ -16,7 +18,7 @@ import uuid
 sys.path.append(str(Path(__file__).resolve().parents[2]))
 
 from app.main import app
-from app.database import Base, get_db
+from app.database import Base, get_async_db, get_db
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
 engine = create_engine(
@@ -37,6 +39,25 @@ def override_get_db():
 
 app.dependency_overrides[get_db] = override_get_db
 
+# async routes read the same file through aiosqlite; NullPool keeps connections from
+# outliving the event loop of the TestClient that opened them
+ASYNC_SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+async_engine = create_async_engine(
+    ASYNC_SQLALCHEMY_DATABASE_URL,
+    connect_args={"timeout": 30},
+    poolclass=NullPool,
+)
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False, class_=AsyncSession
+)
+
+
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+app.dependency_overrides[get_async_db] = override_get_async_db
+
 
 @pytest.fixture(autouse=True)
 def upload_dir(tmp_path):
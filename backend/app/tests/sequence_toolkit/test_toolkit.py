@@ -241,3 +241,72 @@ def test_simulate_assembly_penalizes_buffer_incompatibility():
     assert step["junction_success"] < 1.0
     assert plan["payload_contract"]["metadata_tags"]
     assert "buffer:high_salt" in plan["payload_contract"]["metadata_tags"]
+
+
+def test_vectorized_thermodynamics_match_scalar_heuristics():
+    """Batch primer scoring should reproduce the scalar heuristics exactly."""
+
+    from ...services import primer_thermodynamics
+
+    primers = [
+        "ATGCGTCTAGATCGATCGAT",
+        "GAATTCGAATTCGAATTC",
+        "ggatccuuagcNNacgt",
+        "CGCGCGATATATGCGC",
+        "A",
+        "",
+    ]
+    scored = primer_thermodynamics.score_primer_batch(
+        primers, na_conc_mM=50.0, primer_conc_nM=250.0
+    )
+    cross = primer_thermodynamics.cross_dimer_matrix(
+        primer_thermodynamics.encode_primers(primers)
+    )
+    for idx, primer in enumerate(primers):
+        assert scored.tm[idx] == sequence_toolkit._nearest_neighbor_tm(
+            primer, na_conc_mM=50.0, primer_conc_nM=250.0
+        )
+        assert scored.hairpin_runs[idx] == sequence_toolkit._max_hairpin_run(primer)
+        assert scored.homodimer_runs[idx] == sequence_toolkit._max_homodimer_run(primer)
+        for jdx, other in enumerate(primers):
+            assert cross[idx, jdx] == sequence_toolkit._max_cross_dimer_run(primer, other)
+
+
+def test_restriction_site_index_matches_bio_restriction():
+    """The Aho-Corasick index should reproduce Bio.Restriction cut positions."""
+
+    from Bio.Restriction import RestrictionBatch
+    from Bio.Seq import Seq
+
+    from ...services import restriction_index
+
+    enzymes = ["EcoRI", "BamHI", "BsaI", "BsmBI", "SapI", "BglI", "HindIII", "NotI"]
+    template = (
+        "GGTCTCAGAATTCTTGCCAGTCGGCAAGCTTGCTCTTCAGGATCCNNGAAGAGCGAGACC"
+        "GCGGCCGCATGCGTCTCGAATTCCGTCTCAAAGCTT"
+    )
+    index = restriction_index.get_site_index(enzymes)
+    for linear in (True, False):
+        expected = {
+            str(enzyme): sorted(positions)
+            for enzyme, positions in RestrictionBatch(enzymes)
+            .search(Seq(template), linear=linear)
+            .items()
+        }
+        assert index.search(template, linear=linear, enzymes=enzymes) == {
+            name: expected[name] for name in enzymes
+        }
+
+
+def test_restriction_site_index_resolves_catalog_names():
+    """Catalog-only names such as BamHI-HF reuse the catalog-wide automaton."""
+
+    from ...services import restriction_index
+
+    catalog_index = restriction_index.get_catalog_site_index()
+    assert restriction_index.get_site_index(["BamHI-HF", "EcoRI"]) is catalog_index
+    wrapped = "GATCCAAAAAAAAG"
+    assert catalog_index.search(wrapped, enzymes=["BamHI-HF"]) == {"BamHI-HF": []}
+    assert catalog_index.search(wrapped, linear=False, enzymes=["BamHI-HF"]) == {
+        "BamHI-HF": [1]
+    }
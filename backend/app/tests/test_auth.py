@@ -1,5 +1,13 @@
-from .conftest import client
+from .conftest import client, TestingAsyncSessionLocal, TestingSessionLocal
+import uuid
+
 import pyotp
+import pytest
+import sqlalchemy as sa
+from fastapi import HTTPException
+
+from app import models
+from app.auth import create_access_token, get_current_user_async
 
 def test_register_and_login(client):
     resp = client.post("/api/auth/register", json={"email": "test@example.com", "password": "secret"})
@@ -40,3 +48,36 @@ def test_password_reset_flow(client):
     assert reset.status_code == 200
     login = client.post("/api/auth/login", json={"email": "reset@example.com", "password": "new"})
     assert login.status_code == 200
+
+
+def test_async_routes_reject_bad_and_unknown_tokens(client):
+    bad = client.get("/api/inventory/items", headers={"Authorization": "Bearer not-a-token"})
+    assert bad.status_code == 401
+    ghost = create_access_token({"sub": f"ghost-{uuid.uuid4()}@example.com"})
+    unknown = client.get("/api/inventory/items", headers={"Authorization": f"Bearer {ghost}"})
+    assert unknown.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_async_eager_loads_team_memberships():
+    email = f"async-{uuid.uuid4()}@example.com"
+    db = TestingSessionLocal()
+    try:
+        user = models.User(email=email, hashed_password="x")
+        team = models.Team(name="Async Team")
+        db.add_all([user, team])
+        db.flush()
+        db.add(models.TeamMember(team_id=team.id, user_id=user.id))
+        db.commit()
+        team_id = team.id
+    finally:
+        db.close()
+
+    async with TestingAsyncSessionLocal() as session:
+        resolved = await get_current_user_async(create_access_token({"sub": email}), session)
+        # async sessions cannot lazy load, so the memberships must already be in the identity map
+        assert "teams" not in sa.inspect(resolved).unloaded
+        with pytest.raises(HTTPException) as exc:
+            await get_current_user_async("not-a-token", session)
+        assert exc.value.status_code == 401
+    assert [membership.team_id for membership in resolved.teams] == [team_id]
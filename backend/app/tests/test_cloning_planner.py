@@ -386,10 +386,11 @@ def test_cloning_planner_dispatch_event_includes_branch_metadata(client, monkeyp
     db = TestingSessionLocal()
     messages: list[dict[str, Any]] = []
 
-    async def fake_publish(target_session_id: str, message: dict[str, Any]) -> None:
+    def fake_enqueue(target_session_id: str, message: dict[str, Any]) -> bool:
         messages.append(message)
+        return True
 
-    monkeypatch.setattr(pubsub, "publish_planner_event", fake_publish)
+    monkeypatch.setattr(pubsub, "enqueue_planner_event", fake_enqueue)
 
     try:
         planner = db.get(models.CloningPlannerSession, session_id)
@@ -439,6 +440,125 @@ def test_qc_guardrail_blocked_state_exposed(client):
     assert any(entry["stage"] == "qc" for entry in qc_data["stage_history"])
 
 
+def test_pipeline_runs_stage_graph_and_reports_latency(client):
+    assert cloning_planner.schedule_stage_levels(["qc_ingest", *cloning_planner.PIPELINE_STAGE_ORDER]) == [
+        ["qc_ingest", "primers", "restriction"],
+        ["assembly"],
+        ["qc"],
+        ["finalize"],
+    ]
+    assert cloning_planner.schedule_stage_levels(["assembly", "qc", "finalize"]) == [
+        ["assembly"],
+        ["qc"],
+        ["finalize"],
+    ]
+
+    headers, body = _create_session(client)
+    metrics = body["pipeline_metrics"]
+    assert metrics["levels"] == [["primers", "restriction"], ["assembly"], ["qc"], ["finalize"]]
+    assert metrics["status"] == "pipeline_complete"
+    assert metrics["latency_seconds"] is not None and metrics["latency_seconds"] >= 0
+    assert metrics["stages"]["primers"]["resource_class"] == "cpu"
+    assert metrics["stages"]["finalize"]["resource_class"] == "io"
+    assert body["stage_timings"]["restriction"]["status"] == "restriction_complete"
+
+    resume_resp = client.post(
+        f"/api/cloning-planner/sessions/{body['id']}/resume",
+        json={
+            "step": "qc",
+            "overrides": {
+                "chromatograms": [{"name": "early", "trace": [10.0, 9.8, 9.6, 9.5, 9.4]}],
+            },
+        },
+        headers=headers,
+    )
+    assert resume_resp.status_code == 200, resume_resp.text
+    resumed = resume_resp.json()
+    assert resumed["pipeline_metrics"]["levels"] == [["qc_ingest"], ["qc"], ["finalize"]]
+    assert resumed["stage_timings"]["qc_ingest"]["artifact_count"] == 1
+    assert resumed["guardrail_state"]["qc"]["breaches"]
+    artifact = next(item for item in resumed["qc_artifacts"] if item["artifact_name"] == "early")
+    assert artifact["stage_record_id"]
+
+
+def test_stage_start_merges_into_concurrent_stage_completion(client):
+    _, body = _create_session(client)
+    planner_id = uuid.UUID(body["id"])
+
+    # a worker loads the planner for its stage before a sibling stage finishes
+    late_worker = TestingSessionLocal()
+    sibling = TestingSessionLocal()
+    try:
+        stale = late_worker.get(models.CloningPlannerSession, planner_id)
+        assert stale.stage_timings["restriction"]["status"] == "restriction_complete"
+
+        planner = sibling.get(models.CloningPlannerSession, planner_id)
+        cloning_planner.record_stage_progress(
+            sibling,
+            planner=planner,
+            step="restriction",
+            payload=planner.restriction_digest or {},
+            status="restriction_rerun_complete",
+            task_id="sibling-task",
+        )
+        sibling.commit()
+
+        cloning_planner._mark_stage_started(late_worker, stale, "primers", task_id="late-task")
+        late_worker.commit()
+        failed = late_worker.get(models.CloningPlannerSession, planner_id)
+        cloning_planner._record_stage_failure(
+            late_worker, failed, "primers", RuntimeError("boom"), task_id="late-task"
+        )
+    finally:
+        late_worker.close()
+        sibling.close()
+
+    with TestingSessionLocal() as session:
+        timings = session.get(models.CloningPlannerSession, planner_id).stage_timings
+    assert timings["restriction"]["status"] == "restriction_rerun_complete"
+    assert timings["restriction"]["task_id"] == "sibling-task"
+    assert timings["primers"]["status"] == "primers_errored"
+    assert timings["pipeline"]["status"] == "pipeline_complete"
+
+
+def test_stage_cache_reuses_toolkit_outputs_across_sessions(client, monkeypatch):
+    from app.services import planner_stage_cache
+
+    _, first = _create_session(client)
+    before = planner_stage_cache.cache_stats()
+    _, second = _create_session(client)
+    after = planner_stage_cache.cache_stats()
+    assert after["hits"] >= before["hits"] + 3
+    cache = second["stage_cache"]
+    assert cache["stages"]["primers"]["last"] == "hit"
+    assert cache["stages"]["assembly"]["last"] == "hit"
+    assert cache["hits"] == 3 and cache["hit_rate"] == 1.0
+    assert second["primer_set"]["primers"] == first["primer_set"]["primers"]
+    assert second["assembly_plan"]["steps"] == first["assembly_plan"]["steps"]
+
+    key = planner_stage_cache.compute_cache_key("primers", inputs=[{"sequence": "ATGC"}], config={"preset_id": None})
+    assert key != planner_stage_cache.compute_cache_key(
+        "primers", inputs=[{"sequence": "ATGC"}], config={"preset_id": "qpcr"}
+    )
+
+    monkeypatch.setattr(planner_stage_cache, "STAGE_CACHE_MAX_ENTRIES", 2)
+    db = TestingSessionLocal()
+    try:
+        for index in range(3):
+            payload, status = planner_stage_cache.cached_stage_result(
+                db, "primers", inputs=[index], config={}, compute=lambda index=index: {"value": index}
+            )
+            assert status == "miss" and payload == {"value": index}
+        db.commit()
+        assert db.query(models.CloningPlannerStageCacheEntry).count() == 2
+        payload, status = planner_stage_cache.cached_stage_result(
+            db, "primers", inputs=[2], config={}, compute=lambda: {"value": "recomputed"}
+        )
+        assert (payload, status) == ({"value": 2}, "hit")
+    finally:
+        db.close()
+
+
 def test_cancel_cloning_planner_session_marks_checkpoint(client):
     headers, body = _create_session(client)
     session_id = body["id"]
@@ -874,3 +994,40 @@ async def test_planner_event_published_on_stage_update(client):
     finally:
         await listener.unsubscribe(channel)
         await listener.aclose()
+
+
+@pytest.mark.asyncio
+async def test_background_publisher_batches_and_drops_when_full(monkeypatch):
+    redis = await pubsub.get_redis()
+    channel = "planner:publisher-test"
+    listener = redis.pubsub()
+    await listener.subscribe(channel)
+    publisher = pubsub.BackgroundPublisher(maxsize=2, batch_size=10, block_seconds=0.0)
+    # hold the worker thread back so the queue is full when the third event arrives
+    monkeypatch.setattr(publisher, "start", lambda: None)
+    try:
+        publisher._queue.put_nowait((channel, json.dumps({"seq": 0})))
+        publisher._queue.put_nowait((channel, json.dumps({"seq": 1})))
+        assert publisher.publish(channel, {"seq": 2}) is False
+        assert publisher.stats()["dropped"] == 1
+        assert publisher.stats()["blocked"] == 1
+        monkeypatch.undo()
+        publisher.start()
+        assert await asyncio.to_thread(publisher.flush, 5.0)
+
+        received = []
+        while len(received) < 2:
+            message = await asyncio.wait_for(
+                listener.get_message(ignore_subscribe_messages=True, timeout=1.0), timeout=5.0
+            )
+            if message:
+                received.append(json.loads(message["data"])["seq"])
+        assert received == [0, 1]
+        stats = publisher.stats()
+        assert stats["published"] == 2
+        assert stats["batches"] == 1
+        assert stats["queued"] == 0
+    finally:
+        publisher.stop()
+        await listener.unsubscribe(channel)
+        await listener.aclose()
@@ -1,4 +1,5 @@
-from .conftest import client
+from .conftest import client, ensure_auth_headers
+from app import database
 from app.tasks import backup_database
 import os
 
@@ -13,3 +14,29 @@ def test_backup_database(tmp_path, monkeypatch):
     monkeypatch.setenv("BACKUP_DIR", str(tmp_path))
     path = backup_database()
     assert os.path.exists(path)
+
+
+def test_metrics_report_pool_and_per_route_queries(client):
+    headers, _ = ensure_auth_headers(client, email="pool-metrics@example.com")
+    assert client.get("/api/inventory/items", headers=headers).status_code == 200
+    resp = client.get("/metrics")
+    body = resp.text
+    assert 'db_pool_checked_out{engine="sync"}' in body
+    assert 'db_pool_checked_out{engine="async"}' in body
+    assert "db_pool_wait_seconds_count" in body
+    count_line = next(
+        line
+        for line in body.splitlines()
+        if line.startswith('db_queries_per_request_count{endpoint="/api/inventory/items"}')
+    )
+    assert float(count_line.split()[-1]) >= 1
+    assert 'db_query_seconds_per_request_sum{endpoint="/api/inventory/items"}' in body
+
+
+def test_pool_settings_resolve_per_role(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "7")
+    monkeypatch.setenv("DB_WORKER_POOL_SIZE", "3")
+    assert database.pool_settings("api")["pool_size"] == 7
+    assert database.pool_settings("worker")["pool_size"] == 3
+    assert database.pool_settings("worker")["max_overflow"] == 2
+    assert database.pool_settings("api")["pool_pre_ping"] is True
@@ -193,3 +193,176 @@ def test_guardrail_event_recording(client, auth_headers):
     assert event["event_type"] == "qc.review"
     assert event["version_id"] == version_id
 
+
+
+def test_packed_sequence_storage_round_trip(client, auth_headers):
+    from app.services.dna_assets import _reverse_complement
+    from app.services.packed_sequence import PackedSequence
+    from app.services.sequence_toolkit import compute_sequence_metrics
+
+    headers, _ = auth_headers
+    sequence = "ATGCGTTAGCACGTAGGTCCGTA" * 10 + "gca"
+    resp = client.post(
+        "/api/dna-assets",
+        json={"name": "Packed", "sequence": sequence},
+        headers=headers,
+    )
+    assert resp.status_code == 201
+    latest = resp.json()["latest_version"]
+    assert latest["gc_content"] == compute_sequence_metrics(sequence)["gc_content"]
+
+    session = TestingSessionLocal()
+    try:
+        version = session.get(models.DNAAssetVersion, uuid.UUID(latest["id"]))
+        assert version.sequence_text is None
+        assert len(version.sequence_packed) < len(sequence) // 2
+        assert version.sequence == sequence
+    finally:
+        session.close()
+
+    packed = PackedSequence.encode(sequence)
+    assert packed.slice(5, 37) == sequence[5:37]
+    assert bytes(packed.window(8, 16)) == packed.packed[2:4]
+    assert packed.reverse_complement().decode() == _reverse_complement(sequence)
+    assert packed.subsequence(3, 29).reverse_complement().decode() == _reverse_complement(sequence[3:29])
+    iupac = PackedSequence.encode("ACRYUn" * 3 + "G")
+    assert iupac.decode() == "ACRYUn" * 3 + "G"
+    assert iupac.reverse_complement().decode() == _reverse_complement("ACRYUn" * 3 + "G")
+
+
+def test_viewer_tiles_windowed_payload(client, auth_headers, monkeypatch):
+    from app.services import dna_viewer_tiles
+
+    monkeypatch.setattr(dna_viewer_tiles, "TILE_BINS", 64)
+    monkeypatch.setattr(dna_viewer_tiles, "MAX_TILES_PER_REQUEST", 4)
+    dna_viewer_tiles.get_tile_cache().clear()
+    headers, _ = auth_headers
+    sequence = ("ATGCGTTAGCACGTAGGTCCGTA" * 20)[:400] + "TATAAT" + "GGCC" * 25
+    resp = client.post(
+        "/api/dna-assets",
+        json={
+            "name": "Tiled",
+            "sequence": sequence,
+            "annotations": [
+                {"label": "early", "feature_type": "CDS", "start": 1, "end": 30},
+                {"label": "late", "feature_type": "CDS", "start": 390, "end": 420},
+            ],
+        },
+        headers=headers,
+    )
+    asset_id = resp.json()["id"]
+
+    base = client.get(
+        f"/api/dna-assets/{asset_id}/viewer/tiles",
+        params={"start": 380, "end": 420, "zoom": 0},
+        headers=headers,
+    )
+    assert base.status_code == 200
+    payload = base.json()
+    assert payload["bases_per_bin"] == 1
+    assert [tile["index"] for tile in payload["tiles"]] == [5, 6]
+    tile = payload["tiles"][1]
+    assert tile["sequence"] == sequence[384:448]
+    assert [feature["label"] for feature in payload["features"]] == ["late"]
+    assert any(hit["motif"] == "tata_box" and hit["start"] == 401 for hit in tile["motif_hotspots"])
+
+    summary = client.get(f"/api/dna-assets/{asset_id}/viewer/tiles", headers=headers).json()
+    assert summary["zoom"] == 3
+    assert summary["tiles"][0]["sequence"] is None
+    last_bin = summary["tiles"][0]["bins"][-1]
+    assert last_bin["end"] == len(sequence)
+    assert last_bin["gc_content"] == 100
+
+    client.get(
+        f"/api/dna-assets/{asset_id}/viewer/tiles",
+        params={"start": 380, "end": 420, "zoom": 0},
+        headers=headers,
+    )
+    assert dna_viewer_tiles.get_tile_cache().hits >= 2
+
+    too_wide = client.get(
+        f"/api/dna-assets/{asset_id}/viewer/tiles",
+        params={"zoom": 0},
+        headers=headers,
+    )
+    assert too_wide.status_code == 400
+
+
+def test_viewer_analytics_use_fused_feature_kernel(client, auth_headers):
+    from app.services import dna_assets as dna_service
+    from app.services.sequence_features import analyse_sequence_features
+
+    headers, _ = auth_headers
+    sequence = "ATGAAAAAAAGCCGCGGTATAATCCGCGGCCGCCTTGACAGCGC" * 6
+    resp = client.post(
+        "/api/dna-assets",
+        json={"name": "Fused", "sequence": sequence},
+        headers=headers,
+    )
+    asset_id = resp.json()["id"]
+    viewer = client.get(f"/api/dna-assets/{asset_id}/viewer", headers=headers)
+    assert viewer.status_code == 200
+    analytics = viewer.json()["analytics"]
+    assert analytics["gc_skew"] == dna_service._compute_gc_skew(sequence)
+    assert analytics["motif_hotspots"] == dna_service._find_motif_hotspots(sequence)
+    assert analytics["codon_usage"] == dna_service._compute_codon_usage(sequence)
+    assert analytics["codon_adaptation_index"] == dna_service._compute_codon_adaptation_index(sequence)
+    risk = analytics["thermodynamic_risk"]
+    assert risk["homopolymers"] == dna_service._find_homopolymer_runs(sequence)
+    assert risk["gc_hotspots"] == dna_service._compute_gc_hotspots(sequence)
+
+    features = analyse_sequence_features(sequence.lower())
+    assert features.codon_usage == dna_service._compute_codon_usage(sequence)
+
+    first = dna_service._analyse_sequence_guardrails(sequence, dna_service._DEFAULT_PROFILE)
+    second = dna_service._analyse_sequence_guardrails(sequence, dna_service._DEFAULT_PROFILE)
+    assert first == second and first is not second
+
+
+def test_new_version_features_derived_incrementally(client, auth_headers):
+    from app.services import dna_assets as dna_service
+    from app.services.sequence_features import (
+        analyse_sequence_features,
+        features_match,
+        incremental_stats,
+        update_sequence_features,
+    )
+
+    headers, _ = auth_headers
+    parent = "ATGAAAAAAAGCCGCGGTATAATCCGCGGCCGCCTTGACAGCGC" * 8
+    child = parent[:100] + "GGGGGGGTATAAT" + parent[103:]
+    resp = client.post(
+        "/api/dna-assets",
+        json={"name": "Incremental", "sequence": parent},
+        headers=headers,
+    )
+    asset_id = resp.json()["id"]
+    assert client.get(f"/api/dna-assets/{asset_id}/viewer", headers=headers).status_code == 200
+
+    before = incremental_stats()["updates"]
+    resp = client.post(
+        f"/api/dna-assets/{asset_id}/versions",
+        json={"sequence": child},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    assert incremental_stats()["updates"] == before + 1
+    analytics = client.get(f"/api/dna-assets/{asset_id}/viewer", headers=headers).json()["analytics"]
+    assert analytics["gc_skew"] == dna_service._compute_gc_skew(child)
+    assert analytics["motif_hotspots"] == dna_service._find_motif_hotspots(child)
+    assert analytics["codon_usage"] == dna_service._compute_codon_usage(child)
+    assert analytics["thermodynamic_risk"]["homopolymers"] == dna_service._find_homopolymer_runs(child)
+
+    # verification mode recomputes in full and falls back when the incremental result drifts
+    parent_features = analyse_sequence_features(parent)
+    stale = analyse_sequence_features(parent)
+    stale.homopolymers = []
+    verified_before = incremental_stats()
+    for edited in (parent[:7] + parent[8:], parent[:50] + "ACG" + parent[50:], child):
+        derived = update_sequence_features(parent, parent_features, edited, verify=True)
+        assert features_match(derived, analyse_sequence_features(edited))
+    recovered = update_sequence_features(parent, stale, parent[:300] + "T", verify=True)
+    assert recovered == analyse_sequence_features(parent[:300] + "T")
+    stats = incremental_stats()
+    assert stats["verified"] == verified_before["verified"] + 4
+    assert stats["mismatches"] == verified_before["mismatches"] + 1
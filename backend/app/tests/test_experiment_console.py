@@ -524,6 +524,76 @@ def test_narrative_export_with_multidomain_evidence(client):
         assert notebook_entry_manifest["notebook"]["path"].endswith(".md")
         archive.close()
 
+def test_narrative_export_archive_streams_and_dedupes_attachments(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    from app import storage
+    from app.workers import packaging
+
+    monkeypatch.setenv("UPLOAD_DIR", str(tmp_path))
+    monkeypatch.setattr(packaging, "SPOOL_MAX_BYTES", 1024)
+    payload = bytes(range(256)) * 64
+    stored = storage.save_stream(iter([payload]), "trace.ab1")
+    other = storage.save_stream(iter([b"plasmid map"]), "map.gb")
+    files = [
+        models.File(
+            id=uuid.uuid4(),
+            filename=name,
+            file_type="application/octet-stream",
+            file_size=str(obj.size),
+            storage_path=obj.storage_path,
+            meta={"checksum": obj.checksum, "checksum_algorithm": "sha256"},
+        )
+        for name, obj in (("trace.ab1", stored), ("trace-copy.ab1", stored), ("map.gb", other))
+    ]
+    attachments = [
+        SimpleNamespace(
+            id=uuid.uuid4(),
+            evidence_type="file",
+            reference_id=file_obj.id,
+            file_id=file_obj.id,
+            file=file_obj,
+            label=None,
+            snapshot={},
+            hydration_context={},
+        )
+        for file_obj in files
+    ]
+    export = SimpleNamespace(
+        id=uuid.uuid4(),
+        execution_id=uuid.uuid4(),
+        version=1,
+        generated_at=datetime.now(timezone.utc),
+        event_count=0,
+        notes=None,
+        meta={},
+        requested_by_id=uuid.uuid4(),
+        content="# Narrative",
+        attachments=attachments,
+    )
+
+    fetched: list[str] = []
+    original_open_stream = packaging.open_stream
+
+    def counting_open_stream(path, **kwargs):
+        fetched.append(path)
+        return original_open_stream(path, **kwargs)
+
+    monkeypatch.setattr(packaging, "open_stream", counting_open_stream)
+    stream, manifest = packaging._build_export_artifact_payload(export, db_session=None)
+    assert not fetched, "attachment bytes are only read while the stream is consumed"
+    chunks = list(stream)
+
+    assert sorted(fetched) == sorted([stored.storage_path, other.storage_path])
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+    paths = [entry["file"]["path"] for entry in manifest]
+    assert paths[0] == paths[1] != paths[2]
+    assert archive.read(paths[0]) == payload
+    assert archive.read(paths[2]) == b"plasmid map"
+    assert json.loads(archive.read("attachments.json")) == json.loads(json.dumps(manifest, default=str))
+    assert archive.read("narrative.md") == b"# Narrative"
+
+
 def test_multistage_approval_delegation_and_reset(client):
     headers = get_headers(client)
 
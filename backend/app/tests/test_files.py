@@ -95,3 +95,63 @@ def test_file_sequence_preview(client):
     data = seq_resp.json()
     assert data[0]["id"] == "s1"
     assert data[0]["length"] == 4
+
+
+def test_download_streams_with_range_support(client):
+    headers = get_headers(client)
+    item_resp = client.post(
+        "/api/inventory/items",
+        json={"item_type": "sample", "name": "RangeSample"},
+        headers=headers,
+    )
+    item_id = item_resp.json()["id"]
+    payload = bytes(range(256)) * 64
+    upload_resp = client.post(
+        "/api/files/upload",
+        data={"item_id": item_id},
+        files={"upload": ("run.bin", payload, "application/octet-stream")},
+        headers=headers,
+    )
+    assert upload_resp.status_code == 200
+    body = upload_resp.json()
+    assert body["file_size"] == len(payload)
+    file_id = body["id"]
+
+    full = client.get(f"/api/files/{file_id}/download", headers=headers)
+    assert full.status_code == 200
+    assert full.content == payload
+    assert full.headers["accept-ranges"] == "bytes"
+
+    partial = client.get(
+        f"/api/files/{file_id}/download", headers={**headers, "Range": "bytes=100-355"}
+    )
+    assert partial.status_code == 206
+    assert partial.content == payload[100:356]
+    assert partial.headers["content-range"] == f"bytes 100-355/{len(payload)}"
+
+    suffix = client.get(
+        f"/api/files/{file_id}/download", headers={**headers, "Range": "bytes=-10"}
+    )
+    assert suffix.status_code == 206
+    assert suffix.content == payload[-10:]
+
+    beyond = client.get(
+        f"/api/files/{file_id}/download", headers={**headers, "Range": f"bytes={len(payload)}-"}
+    )
+    assert beyond.status_code == 416
+    assert beyond.headers["content-range"] == f"bytes */{len(payload)}"
+
+
+def test_save_stream_hashes_while_writing(tmp_path, monkeypatch):
+    import hashlib
+
+    from app import storage
+
+    monkeypatch.setenv("UPLOAD_DIR", str(tmp_path))
+    chunks = [b"", b"ACGT" * 1000, b"", b"TTAA" * 500]
+    stored = storage.save_stream(iter(chunks), "reads.fastq", namespace="runs/1")
+    expected = hashlib.sha256(b"".join(chunks)).hexdigest()
+    assert stored.size == 6000
+    assert stored.checksum == expected
+    assert storage.validate_checksum(stored.storage_path, expected)
+    assert b"".join(storage.open_stream(stored.storage_path, start=3998, end=4003)) == b"GTTTAA"
@@ -3,6 +3,7 @@ from uuid import UUID, uuid4
 
 from .conftest import TestingSessionLocal
 from app import models
+from app.services import instrumentation as instrumentation_service
 
 
 def _auth_headers(client):
@@ -178,3 +179,203 @@ def test_simulation_endpoint_produces_deterministic_events(client):
     assert payload["events"][-1]["event_type"] == "status"
     assert payload["envelope"]["samples"][0]["payload"]["simulated"] is True
     assert payload["envelope"]["run"]["run_parameters"]["set_point"] == 42
+
+
+def _dispatch_run(client, headers):
+    team = client.post("/api/teams/", json={"name": "Plate Readers"}, headers=headers).json()
+    equipment = client.post(
+        "/api/equipment/devices",
+        json={"name": "Plate Reader", "eq_type": "reader", "team_id": team["id"]},
+        headers=headers,
+    ).json()
+    start = datetime.now(timezone.utc) + timedelta(minutes=5)
+    reservation = client.post(
+        f"/api/instrumentation/instruments/{equipment['id']}/reservations",
+        json={
+            "team_id": team["id"],
+            "scheduled_start": start.isoformat(),
+            "scheduled_end": (start + timedelta(hours=1)).isoformat(),
+        },
+        headers=headers,
+    ).json()
+    return client.post(
+        f"/api/instrumentation/reservations/{reservation['id']}/dispatch",
+        json={},
+        headers=headers,
+    ).json()
+
+
+def test_telemetry_batch_ingest_chunks_and_pages(client, monkeypatch):
+    headers = _auth_headers(client)
+    run = _dispatch_run(client, headers)
+    base = datetime(2024, 11, 26, 12, 0, 0)
+    samples = [
+        {
+            "channel": channel,
+            "payload": {"value": index},
+            "recorded_at": (base + timedelta(seconds=index)).isoformat(),
+        }
+        for index in range(150)
+        for channel in ("od600", "fluorescence")
+    ]
+    first = client.post(
+        f"/api/instrumentation/runs/{run['id']}/telemetry/batch",
+        json={"samples": samples[:200]},
+        headers=headers,
+    )
+    assert first.status_code == 201
+    # 100 seconds per channel spans two 60s buckets
+    assert first.json()["accepted"] == 200
+    assert first.json()["chunk_count"] == 4
+    second = client.post(
+        f"/api/instrumentation/runs/{run['id']}/telemetry/batch",
+        json={"samples": samples[200:]},
+        headers=headers,
+    ).json()
+    assert second["accepted"] == 100
+
+    with TestingSessionLocal() as session:
+        chunks = session.query(models.InstrumentTelemetryChunk).filter_by(run_id=UUID(run["id"])).all()
+        # the second batch merged into the open bucket instead of adding rows
+        assert len(chunks) == 6
+        assert sum(chunk.sample_count for chunk in chunks) == 300
+
+    decoded = []
+    decode_chunk = instrumentation_service._decode_chunk
+
+    def _counting_decode(blob):
+        decoded[-1] += 1
+        return decode_chunk(blob)
+
+    monkeypatch.setattr(instrumentation_service, "_decode_chunk", _counting_decode)
+    collected = []
+    cursor = None
+    while True:
+        params = {"limit": 70, "channel": "od600"}
+        if cursor:
+            params["cursor"] = cursor
+        decoded.append(0)
+        page = client.get(
+            f"/api/instrumentation/runs/{run['id']}/telemetry", params=params, headers=headers
+        ).json()
+        collected.extend(page["samples"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    monkeypatch.undo()
+    assert [sample["payload"]["value"] for sample in collected] == list(range(150))
+    # od600 spans three 60s chunks; the last page starts past the first two and skips them
+    assert decoded[-1] == 1
+    assert len({sample["id"] for sample in collected}) == 150
+    assert page["total_samples"] == 150
+
+    window = client.get(
+        f"/api/instrumentation/runs/{run['id']}/telemetry",
+        params={
+            "start": (base + timedelta(seconds=10)).isoformat(),
+            "end": (base + timedelta(seconds=19)).isoformat(),
+        },
+        headers=headers,
+    ).json()
+    assert len(window["samples"]) == 20
+    assert [sample["recorded_at"] for sample in window["samples"]] == sorted(
+        sample["recorded_at"] for sample in window["samples"]
+    )
+
+    reduced = client.get(
+        f"/api/instrumentation/runs/{run['id']}/telemetry",
+        params={"max_points": 30},
+        headers=headers,
+    ).json()
+    assert reduced["downsampled"] is True
+    assert len([s for s in reduced["samples"] if s["channel"] == "od600"]) == 30
+
+    invalid = client.get(
+        f"/api/instrumentation/runs/{run['id']}/telemetry",
+        params={"cursor": "not-a-cursor"},
+        headers=headers,
+    )
+    assert invalid.status_code == 400
+
+
+def test_telemetry_rollup_tiers_and_lttb(client):
+    headers = _auth_headers(client)
+    run = _dispatch_run(client, headers)
+    base = datetime(2024, 11, 28, 9, 0, 0)
+    # two samples per second for five minutes with a spike at t=100s
+    samples = [
+        {
+            "channel": "od600",
+            "payload": {"value": 50.0 if index == 200 else float(index % 7), "well": "A1"},
+            "recorded_at": (base + timedelta(milliseconds=500 * index)).isoformat(),
+        }
+        for index in range(600)
+    ]
+    for offset in range(0, 600, 250):
+        response = client.post(
+            f"/api/instrumentation/runs/{run['id']}/telemetry/batch",
+            json={"samples": samples[offset : offset + 250]},
+            headers=headers,
+        )
+        assert response.status_code == 201
+
+    wide = client.get(
+        f"/api/instrumentation/runs/{run['id']}/telemetry/rollups",
+        params={"width": 40},
+        headers=headers,
+    ).json()
+    # 300 seconds over 40 pixels: 10s buckets would need 30, 1s buckets 300
+    assert wide["tier_seconds"] == 10
+    (series,) = wide["series"]
+    assert series["field"] == "value"
+    assert len(series["points"]) == 30
+    assert sum(point["count"] for point in series["points"]) == 600
+    spike = next(point for point in series["points"] if point["max"] == 50.0)
+    assert spike["min"] == 0.0
+
+    narrow = client.get(
+        f"/api/instrumentation/runs/{run['id']}/telemetry/rollups",
+        params={
+            "width": 1000,
+            "start": (base + timedelta(seconds=100)).isoformat(),
+            "end": (base + timedelta(seconds=109)).isoformat(),
+        },
+        headers=headers,
+    ).json()
+    assert narrow["tier_seconds"] == 1
+    points = narrow["series"][0]["points"]
+    assert len(points) == 10
+    assert points[0]["max"] == 50.0
+    assert points[0]["mean"] == (50.0 + 201 % 7) / 2
+
+    coarse = client.get(
+        f"/api/instrumentation/runs/{run['id']}/telemetry/rollups",
+        params={"width": 1000, "tier": 60},
+        headers=headers,
+    ).json()
+    assert [point["count"] for point in coarse["series"][0]["points"]] == [120] * 5
+    bad_tier = client.get(
+        f"/api/instrumentation/runs/{run['id']}/telemetry/rollups",
+        params={"tier": 7},
+        headers=headers,
+    )
+    assert bad_tier.status_code == 400
+
+    shaped = client.get(
+        f"/api/instrumentation/runs/{run['id']}/telemetry",
+        params={"max_points": 20, "downsample": "lttb"},
+        headers=headers,
+    ).json()
+    assert shaped["downsampled"] is True
+    values = [sample["payload"]["value"] for sample in shaped["samples"]]
+    assert len(values) == 20
+    assert 50.0 in values
+    assert shaped["samples"][0]["recorded_at"].startswith("2024-11-28T09:00:00")
+
+    endpoints = client.get(
+        f"/api/instrumentation/runs/{run['id']}/telemetry",
+        params={"max_points": 2, "downsample": "lttb"},
+        headers=headers,
+    ).json()
+    assert len(endpoints["samples"]) == 2
+    assert endpoints["samples"][0]["recorded_at"] == shaped["samples"][0]["recorded_at"]
@@ -1,5 +1,7 @@
 from .conftest import client, ensure_auth_headers
+import io
 import json
+import pytest
 from datetime import datetime
 
 
@@ -50,6 +52,48 @@ def test_update_and_delete_item(client):
     assert all(i["id"] != item_id for i in items)
 
 
+def test_list_items_keyset_pages_projection_and_counts(client, monkeypatch):
+    from app.services import inventory_listing
+
+    monkeypatch.setattr(inventory_listing, "MAX_PAGE_SIZE", 3)
+    monkeypatch.setattr(inventory_listing, "COUNT_ESTIMATE_CAP", 4)
+    headers = get_auth_headers(client)
+    created = [create_item(client, headers, f"Page{i}")["id"] for i in range(5)]
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 50, "count": "exact"}
+        if cursor:
+            params["cursor"] = cursor
+        resp = client.get("/api/inventory/items", params=params, headers=headers)
+        assert resp.status_code == 200
+        assert len(resp.json()) <= 3
+        assert resp.headers["X-Total-Count"] == "5"
+        seen.extend(item["id"] for item in resp.json())
+        cursor = resp.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert sorted(seen) == sorted(created) and len(seen) == 5
+
+    resp = client.get(
+        "/api/inventory/items",
+        params={"fields": "name,status", "limit": 2, "count": "estimate"},
+        headers=headers,
+    )
+    assert set(resp.json()[0]) == {"id", "created_at", "name", "status"}
+    assert resp.headers["X-Total-Count"] == "4"
+    assert resp.headers["X-Total-Count-Estimated"] == "true"
+    follow = client.get(
+        "/api/inventory/items",
+        params={"fields": "name", "limit": 2, "cursor": resp.headers["X-Next-Cursor"]},
+        headers=headers,
+    ).json()
+    assert not {item["id"] for item in follow} & {item["id"] for item in resp.json()}
+
+    for params in ({"fields": "secret"}, {"cursor": "not-a-cursor"}, {"count": "all"}, {"limit": 0}):
+        assert client.get("/api/inventory/items", params=params, headers=headers).status_code == 400
+
+
 def test_filter_items_by_name(client):
     headers = get_auth_headers(client)
     create_item(client, headers, "Alpha Sample")
@@ -96,6 +140,47 @@ def test_export_items_csv(client):
     text = resp.text
     assert "Export1" in text and "Export2" in text
 
+
+def test_export_items_streams_batches_and_parquet(client, monkeypatch):
+    import csv as csv_module
+
+    from app.services import inventory_export
+
+    monkeypatch.setattr(inventory_export, "EXPORT_BATCH_SIZE", 2)
+    headers = get_auth_headers(client)
+    for name, custom_data in [
+        ("Stream1", {"lot": 1, "storage": {"temp": -80}}),
+        ("Stream2", {"lot": 2.5, "note": "thawed"}),
+        ("Stream3", {"lot": 3, "note": ["a", "b"]}),
+    ]:
+        resp = client.post(
+            "/api/inventory/items",
+            json={"item_type": "sample", "name": name, "custom_data": custom_data},
+            headers=headers,
+        )
+        assert resp.status_code == 200
+    create_item(client, get_auth_headers(client), "HiddenStream")
+
+    resp = client.get("/api/inventory/export", headers=headers)
+    rows = list(csv_module.DictReader(io.StringIO(resp.text)))
+    assert sorted(row["name"] for row in rows) == ["Stream1", "Stream2", "Stream3"]
+    assert client.get("/api/inventory/export", params={"format": "xml"}, headers=headers).status_code == 400
+
+    pq = pytest.importorskip("pyarrow.parquet")
+    resp = client.get("/api/inventory/export", params={"format": "parquet"}, headers=headers)
+    assert resp.status_code == 200
+    parquet = pq.ParquetFile(io.BytesIO(resp.content))
+    assert parquet.num_row_groups == 2
+    table = parquet.read().to_pylist()
+    by_name = {row["name"]: row for row in table}
+    assert sorted(by_name) == ["Stream1", "Stream2", "Stream3"]
+    assert [by_name[name]["custom_data.lot"] for name in sorted(by_name)] == [1.0, 2.5, 3.0]
+    assert by_name["Stream1"]["custom_data.storage.temp"] == -80
+    assert by_name["Stream2"]["custom_data.storage.temp"] is None
+    assert by_name["Stream2"]["custom_data.note"] == "thawed"
+    assert by_name["Stream3"]["custom_data.note"] == '["a", "b"]'
+
+
 def test_generate_barcode(client):
     headers = get_auth_headers(client)
     item = create_item(client, headers, "BCItem")
@@ -140,6 +225,67 @@ def test_import_items(client):
     assert "Imp1" in names and "Imp2" in names
 
 
+def test_import_job_streams_batches_and_reports_summary(client, monkeypatch):
+    from uuid import uuid4
+
+    from app.services import inventory_import
+
+    monkeypatch.setattr(inventory_import, "IMPORT_BATCH_SIZE", 2)
+    headers = get_auth_headers(client)
+    barcode = f"IMP-{uuid4()}"
+    csv_data = (
+        "item_type,name,barcode,custom_data\n"
+        f"plasmid,Job1,{barcode},\n"
+        "sample,,,\n"
+        'sample,Job2,,"{""lot"": 7}"\n'
+        "sample,Job3,,[1]\n"
+        f"sample,Job4,{barcode},\n"
+        "reagent,Job5,,\n"
+    )
+    resp = client.post(
+        "/api/inventory/import/jobs",
+        files={"file": ("items.csv", csv_data, "text/csv")},
+        headers=headers,
+    )
+    assert resp.status_code == 202
+    job_id = resp.json()["id"]
+
+    job = client.get(f"/api/inventory/import/jobs/{job_id}", headers=headers).json()
+    assert job["status"] == "completed"
+    summary = job["result"]
+    assert (summary["rows"], summary["created"], summary["failed"]) == (6, 3, 3)
+    assert summary["bytes_read"] == summary["total_bytes"] == len(csv_data.encode())
+    assert [error["row"] for error in summary["errors"]] == [3, 5, 6]
+    assert "name" in summary["errors"][0]["error"]
+
+    listed = {item["name"]: item for item in client.get("/api/inventory/items", headers=headers).json()}
+    assert {"Job1", "Job2", "Job5"} <= listed.keys()
+    assert "Job4" not in listed
+    assert listed["Job2"]["custom_data"] == {"lot": 7}
+
+    other = client.get(f"/api/inventory/import/jobs/{job_id}", headers=get_auth_headers(client))
+    assert other.status_code == 404
+
+    import os
+    from uuid import UUID
+
+    from app import models
+    from .conftest import TestingSessionLocal
+
+    with TestingSessionLocal() as session:
+        stored = session.get(models.InventoryImportJob, UUID(job_id))
+        # the uploaded CSV is removed once the job is terminal
+        assert not os.path.exists(stored.storage_path)
+
+        missing = models.InventoryImportJob(
+            user_id=stored.user_id, filename="gone.csv", storage_path="/nonexistent/gone.csv"
+        )
+        session.add(missing)
+        session.commit()
+        job = inventory_import.run_import_job(session, missing.id)
+        assert job.status == "failed" and job.result["error"]
+
+
 def test_filter_by_status_and_date(client):
     headers = get_auth_headers(client)
     create_item(client, headers, "A", status="available")
@@ -216,6 +362,71 @@ def test_bulk_update_partial_failure(client):
     updated = resp1.json()
     assert updated["name"] == "Updated"
 
+def test_bulk_endpoints_report_per_item_results(client):
+    from uuid import uuid4
+
+    from app import models
+    from .conftest import TestingSessionLocal
+
+    headers = get_auth_headers(client)
+    other_headers = get_auth_headers(client)
+    items = [create_item(client, headers, f"BulkSet{i}") for i in range(4)]
+    foreign = create_item(client, other_headers, "NotMine")
+    missing = str(uuid4())
+
+    resp = client.post(
+        "/api/inventory/bulk/update",
+        json={
+            "items": [
+                *({"id": item["id"], "data": {"status": "used"}} for item in items[:3]),
+                {"id": items[3]["id"], "data": {"name": "Renamed"}},
+                {"id": foreign["id"], "data": {"status": "used"}},
+                {"id": missing, "data": {"status": "used"}},
+            ]
+        },
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    body = resp.json()
+    assert (body["total"], body["successful"], body["failed"]) == (6, 4, 2)
+    assert [result["success"] for result in body["results"]] == [True] * 4 + [False, False]
+    assert body["results"][4]["error"] == "403: Not authorized"
+    assert body["results"][5]["error"] == "404: Item not found"
+    listed = {item["id"]: item for item in client.get("/api/inventory/items", headers=headers).json()}
+    assert all(listed[item["id"]]["status"] == "used" for item in items[:3])
+    assert listed[items[3]["id"]]["name"] == "Renamed"
+
+    resp = client.post(
+        "/api/inventory/bulk/delete",
+        json={"item_ids": [items[0]["id"], items[1]["id"], foreign["id"]]},
+        headers=headers,
+    )
+    body = resp.json()
+    assert (body["successful"], body["failed"]) == (2, 1)
+    remaining = {item["id"] for item in client.get("/api/inventory/items", headers=headers).json()}
+    assert items[0]["id"] not in remaining and items[2]["id"] in remaining
+
+    # one barcode for two items: the shared UPDATE fails, per-item retries isolate the conflict
+    resp = client.post(
+        "/api/inventory/bulk/update",
+        json={"items": [{"id": item["id"], "data": {"barcode": f"BC-{missing}"}} for item in items[2:]]},
+        headers=headers,
+    )
+    body = resp.json()
+    assert (body["successful"], body["failed"]) == (1, 1)
+    assert body["results"][1]["error"]
+
+    with TestingSessionLocal() as session:
+        actions = [
+            action
+            for (action,) in session.query(models.AuditLog.action).filter(
+                models.AuditLog.action.in_(["bulk_update_item", "bulk_delete_item"])
+            )
+        ]
+    assert actions.count("bulk_update_item") >= 4
+    assert actions.count("bulk_delete_item") >= 2
+
+
 def test_create_and_get_relationship(client):
     headers = get_auth_headers(client)
     item1 = create_item(client, headers, "Rel1")
@@ -240,6 +451,41 @@ def test_get_item_graph(client):
     graph = resp.json()
     assert "nodes" in graph and "edges" in graph
 
+def test_moving_items_between_teams_invalidates_both_graph_caches(client):
+    from uuid import UUID
+
+    from app.services import inventory_graph
+
+    headers = get_auth_headers(client)
+    first = client.post("/api/teams/", json={"name": "Graph A"}, headers=headers).json()
+    second = client.post("/api/teams/", json={"name": "Graph B"}, headers=headers).json()
+    team_ids = [UUID(first["id"]), UUID(second["id"])]
+    resp = client.post(
+        "/api/inventory/items",
+        json={"item_type": "sample", "name": "Mover", "team_id": first["id"]},
+        headers=headers,
+    )
+    item = resp.json()
+    cache = inventory_graph.get_adjacency_cache()
+    stale = inventory_graph.TeamAdjacency(members=frozenset({UUID(item["id"])}), neighbors={})
+
+    for team_id in team_ids:
+        cache.put(team_id, stale, ttl=60)
+    resp = client.put(f"/api/inventory/items/{item['id']}", json={"team_id": second["id"]}, headers=headers)
+    assert resp.status_code == 200
+    assert [cache.get(team_id) for team_id in team_ids] == [None, None]
+
+    for team_id in team_ids:
+        cache.put(team_id, stale, ttl=60)
+    resp = client.post(
+        "/api/inventory/bulk/update",
+        json={"items": [{"id": item["id"], "data": {"team_id": first["id"]}}]},
+        headers=headers,
+    )
+    assert resp.json()["successful"] == 1
+    assert [cache.get(team_id) for team_id in team_ids] == [None, None]
+
+
 def test_search_items(client):
     headers = get_auth_headers(client)
     create_item(client, headers, "SearchMe")
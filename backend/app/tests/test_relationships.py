@@ -81,3 +81,59 @@ def test_relationship_permission(client):
 
     resp2 = client.get(f"/api/inventory/items/{item1}/graph", headers=h2)
     assert resp2.status_code == 403
+
+
+def test_relationship_graph_dedupes_caps_and_caches(client, monkeypatch):
+    from app.services import inventory_graph
+
+    headers = get_headers(client, "lineage@example.com")
+    team = client.post("/api/teams/", json={"name": "Lineage"}, headers=headers).json()
+    stock = create_item(client, headers, "Stock")
+    aliquots = [create_item(client, headers, f"Aliquot{i}") for i in range(3)]
+    derived = create_item(client, headers, "Derived")
+    for item_id in [stock, *aliquots, derived]:
+        client.put(f"/api/inventory/items/{item_id}", json={"team_id": team["id"]}, headers=headers)
+
+    def link(source, target):
+        resp = client.post(
+            "/api/inventory/relationships",
+            json={"from_item": source, "to_item": target, "relationship_type": "derived"},
+            headers=headers,
+        )
+        assert resp.status_code == 200
+
+    for aliquot in aliquots:
+        link(stock, aliquot)
+    link(aliquots[0], derived)
+    link(derived, stock)  # cycle back to the parent stock
+
+    def graph(depth):
+        resp = client.get(f"/api/inventory/items/{stock}/graph", params={"depth": depth}, headers=headers)
+        assert resp.status_code == 200
+        return resp.json()
+
+    full = graph(3)
+    assert {node["id"] for node in full["nodes"]} == {stock, *aliquots, derived}
+    edge_ids = [edge["id"] for edge in full["edges"]]
+    assert len(edge_ids) == len(set(edge_ids)) == 5
+    assert not full["truncated"]
+    assert {node["id"] for node in graph(0)["nodes"]} == {stock}
+
+    monkeypatch.setattr(inventory_graph, "GRAPH_MAX_NODES", 3)
+    capped = graph(3)
+    assert len(capped["nodes"]) == 3 and capped["truncated"]
+    assert all(
+        {edge["from_item"], edge["to_item"]} <= {node["id"] for node in capped["nodes"]}
+        for edge in capped["edges"]
+    )
+    monkeypatch.setattr(inventory_graph, "GRAPH_MAX_NODES", 500)
+
+    monkeypatch.setattr(inventory_graph, "GRAPH_CACHE_TTL", 60)
+    inventory_graph.get_adjacency_cache().clear()
+    assert {node["id"] for node in graph(3)["nodes"]} == {stock, *aliquots, derived}
+    late = create_item(client, headers, "LateAliquot")
+    client.put(f"/api/inventory/items/{late}", json={"team_id": team["id"]}, headers=headers)
+    link(derived, late)  # invalidates the team's cached adjacency
+    assert late in {node["id"] for node in graph(3)["nodes"]}
+    assert client.get(f"/api/inventory/items/{stock}/graph", params={"depth": -1}, headers=headers).status_code == 400
+    inventory_graph.get_adjacency_cache().clear()
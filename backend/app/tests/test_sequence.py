@@ -1,6 +1,11 @@
-from .conftest import client
+from .conftest import client, TestingSessionLocal
 import uuid
 
+import numpy as np
+import pytest
+
+from app import models
+
 
 def auth_headers(client):
     resp = client.post(
@@ -50,6 +55,108 @@ def test_sequence_job(client):
 
 
 
+def test_sequence_job_spills_long_sequences(client, monkeypatch):
+    import os
+
+    from app import tasks
+
+    monkeypatch.setattr(tasks, "SEQUENCE_JOB_CHUNK_RECORDS", 2)
+    enqueued = []
+    original_task = tasks.analyze_sequence_job
+
+    def _capture(job_id, storage_path, fmt):
+        enqueued.append(storage_path)
+        return original_task(job_id, storage_path, fmt)
+
+    monkeypatch.setattr(tasks, "analyze_sequence_job", _capture)
+    headers = auth_headers(client)
+    long_seq = "GC" * (tasks.SEQUENCE_JOB_INLINE_LIMIT // 2 + 10)
+    fasta = f">long\n{long_seq}\n>short1\nATGC\n>short2\nAATT\n".encode()
+    resp = client.post(
+        "/api/sequence/jobs",
+        data={"format": "fasta"},
+        files={"upload": ("test.fasta", fasta, "text/plain")},
+        headers=headers,
+    )
+    job_id = resp.json()["id"]
+    job = client.get(f"/api/sequence/jobs/{job_id}", headers=headers).json()
+    assert job["status"] == "completed"
+    long_record = job["result"][0]
+    assert long_record["seq"] == "" and long_record["sequence_path"]
+    assert long_record["length"] == len(long_seq)
+    assert long_record["gc_content"] == 100
+    assert job["result"][1]["seq"] == "ATGC"
+    assert job["progress"]["records"] == 3
+    assert job["progress"]["bytes_read"] == len(fasta)
+    assert job["progress"]["total_length"] == len(long_seq) + 8
+    seq_resp = client.get(f"/api/sequence/jobs/{job_id}/records/0/sequence", headers=headers)
+    assert seq_resp.status_code == 200
+    assert seq_resp.text == long_seq
+    assert client.get(f"/api/sequence/jobs/{job_id}/records/2/sequence", headers=headers).text == "AATT"
+    assert client.get(f"/api/sequence/jobs/{job_id}/records/3/sequence", headers=headers).status_code == 404
+
+    # the worker got a storage locator, not the upload bytes, and dropped the upload when done
+    assert len(enqueued) == 1 and isinstance(enqueued[0], str)
+    assert not os.path.exists(enqueued[0])
+    # each flush stored only its own records instead of rewriting the accumulated result
+    db = TestingSessionLocal()
+    try:
+        stored_job = db.get(models.SequenceAnalysisJob, uuid.UUID(job_id))
+        assert stored_job.result is None
+        assert [(chunk.start_index, len(chunk.records)) for chunk in stored_job.chunks] == [(0, 2), (2, 1)]
+    finally:
+        db.close()
+
+
+def test_failed_sequence_job_removes_spilled_sequences(client, monkeypatch):
+    import os
+    from pathlib import Path
+
+    from app import tasks
+
+    long_seq = "AT" * (tasks.SEQUENCE_JOB_INLINE_LIMIT // 2 + 10)
+
+    def _failing_records(handle, fmt):
+        yield {"id": "long", "seq": long_seq, "length": len(long_seq), "gc_content": 0.0}
+        raise ValueError("truncated upload")
+
+    monkeypatch.setattr(tasks, "iter_sequence_records", _failing_records)
+    headers = auth_headers(client)
+    resp = client.post(
+        "/api/sequence/jobs",
+        data={"format": "fasta"},
+        files={"upload": ("test.fasta", f">long\n{long_seq}\n".encode(), "text/plain")},
+        headers=headers,
+    )
+    job_id = resp.json()["id"]
+    job = client.get(f"/api/sequence/jobs/{job_id}", headers=headers).json()
+    assert job["status"] == "failed"
+    for namespace in ("sequence-jobs", "sequence-uploads"):
+        job_dir = Path(os.environ["UPLOAD_DIR"]) / namespace / job_id
+        assert not job_dir.exists() or not any(job_dir.iterdir())
+
+
+def test_sequence_job_fails_when_upload_is_missing(client):
+    from app import tasks
+
+    auth_headers(client)
+    db = TestingSessionLocal()
+    try:
+        user = db.query(models.User).first()
+        job = models.SequenceAnalysisJob(user_id=user.id, format="fasta", status="pending")
+        db.add(job)
+        db.commit()
+        job_id = job.id
+    finally:
+        db.close()
+    tasks.analyze_sequence_job(str(job_id), "/nonexistent/upload.fasta", "fasta")
+    db = TestingSessionLocal()
+    try:
+        assert db.get(models.SequenceAnalysisJob, job_id).status == "failed"
+    finally:
+        db.close()
+
+
 def test_sequence_alignment(client):
     headers = auth_headers(client)
     payload = {"seq1": "ACTG", "seq2": "ACGG", "mode": "global"}
@@ -60,6 +167,44 @@ def test_sequence_alignment(client):
     assert data["score"] > 0
 
 
+def test_sequence_alignment_banded(client):
+    headers = auth_headers(client)
+    seq1 = "ATGCGTACGTTAGCCGATCGATCGGCTAGCTAGGATCCGATCG" * 4
+    seq2 = seq1[:60] + seq1[63:120] + "T" + seq1[120:]
+    full = client.post(
+        "/api/sequence/align",
+        json={"seq1": seq1, "seq2": seq2, "mode": "global"},
+        headers=headers,
+    ).json()
+    banded = client.post(
+        "/api/sequence/align",
+        json={"seq1": seq1, "seq2": seq2, "mode": "global", "band": 8},
+        headers=headers,
+    ).json()
+    assert banded["banded"] is True and full["banded"] is False
+    assert banded["score"] == pytest.approx(full["score"])
+    assert banded["aligned_seq1"].replace("-", "") == seq1
+    assert banded["aligned_seq2"].replace("-", "") == seq2
+
+
+def test_alignment_cache_and_budget():
+    from app.services.sequence_alignment import (
+        AlignmentBudget,
+        AlignmentBudgetExceeded,
+        align_pair,
+        get_alignment_cache,
+    )
+
+    cache = get_alignment_cache()
+    cache.clear()
+    first = align_pair("ACGTACGTAA", "ACGTTCGTAA", mode="local")
+    second = align_pair("ACGTACGTAA", "ACGTTCGTAA", mode="local")
+    assert first is second
+    assert cache.stats()["hits"] == 1
+    with pytest.raises(AlignmentBudgetExceeded):
+        align_pair("A" * 5000, "C" * 5000, budget=AlignmentBudget(max_memory_mb=0.01))
+
+
 def test_blast_search(client):
     headers = auth_headers(client)
     payload = {"query": "ACTGACTG", "subject": "ACTTACTG"}
@@ -70,6 +215,124 @@ def test_blast_search(client):
     assert data["identity"] > 0
 
 
+def test_blast_search_requires_subject_without_library(client):
+    headers = auth_headers(client)
+    resp = client.post("/api/sequence/blast", json={"query": "ACTG"}, headers=headers)
+    assert resp.status_code == 400
+
+
+def test_blast_search_library(client):
+    import random
+
+    headers = auth_headers(client)
+    rng = random.Random(7)
+    target = "".join(rng.choice("ACGT") for _ in range(600))
+    decoy = "".join(rng.choice("ACGT") for _ in range(600))
+    for name, sequence in (("target", target), ("decoy", decoy)):
+        resp = client.post(
+            "/api/dna-assets",
+            json={"name": name, "sequence": sequence},
+            headers=headers,
+        )
+        assert resp.status_code == 201
+    query = target[200:260]
+    payload = {"query": query, "search_library": True, "top_n": 5}
+    resp = client.post("/api/sequence/blast", json=payload, headers=headers)
+    assert resp.status_code == 200
+    hits = resp.json()["hits"]
+    assert hits[0]["asset_name"] == "target"
+    assert hits[0]["identity"] == 100
+    assert hits[0]["subject_start"] == 200
+    assert hits[0]["score"] == 2 * len(query)
+
+    reverse = query.translate(str.maketrans("ACGT", "TGCA"))[::-1]
+    payload["query"] = reverse
+    resp = client.post("/api/sequence/blast", json=payload, headers=headers)
+    top = resp.json()["hits"][0]
+    assert top["strand"] == "-"
+    assert top["subject_start"] == 200
+
+    # other users never see assets they cannot access
+    other = auth_headers(client)
+    resp = client.post("/api/sequence/blast", json=payload, headers=other)
+    assert resp.json()["hits"] == []
+
+
+def test_library_index_appends_segments_and_compacts_deleted_versions(client, tmp_path, monkeypatch):
+    import random
+
+    from app.services import sequence_search
+
+    headers = auth_headers(client)
+    rng = random.Random(11)
+    index = sequence_search.KmerSeedIndex(tmp_path / "index")
+
+    def _create(name, length):
+        sequence = "".join(rng.choice("ACGT") for _ in range(length))
+        resp = client.post("/api/dna-assets", json={"name": name, "sequence": sequence}, headers=headers)
+        assert resp.status_code == 201
+        return resp.json()["latest_version"]["id"], sequence
+
+    db = TestingSessionLocal()
+    try:
+        _create("index-base", 4000)
+        index.sync(db)
+        base_segment = index._load()["segments"][-1]
+        small_id, small_sequence = _create("index-small", 200)
+        assert index.sync(db) == 1
+        manifest = index._load()
+        # the new version got its own segment; the existing postings were not rewritten
+        assert manifest["segments"][:-1] == [base_segment]
+        assert (tmp_path / "index" / f"kmers.{base_segment}.npy").exists()
+        hits = index.search(db, small_sequence[50:120])
+        assert hits[0].version_id == small_id
+
+        db.query(models.DNAAssetVersion).filter(models.DNAAssetVersion.id == uuid.UUID(small_id)).delete()
+        db.commit()
+        monkeypatch.setattr(sequence_search, "COMPACT_DELETED_RATIO", 1.0)
+        index.sync(db)
+        manifest = index._load()
+        assert [manifest["versions"][ordinal]["id"] for ordinal in manifest["deleted"]] == [small_id]
+        assert index.search(db, small_sequence[50:120]) == []
+
+        monkeypatch.setattr(sequence_search, "COMPACT_DELETED_RATIO", 0.0)
+        index.sync(db)
+        manifest = index._load()
+        assert manifest["deleted"] == [] and len(manifest["segments"]) == 1
+        assert small_id not in {entry["id"] for entry in manifest["versions"]}
+        assert int(np.asarray(index._segments[0]["ordinals"]).max()) < len(manifest["versions"])
+    finally:
+        db.close()
+
+
+def test_library_index_writers_keep_each_others_segments(tmp_path):
+    import random
+    from types import SimpleNamespace
+
+    from app.services import sequence_search
+
+    rng = random.Random(5)
+
+    def _version(length):
+        sequence = "".join(rng.choice("ACGT") for _ in range(length))
+        return SimpleNamespace(
+            id=uuid.uuid4(), sequence=sequence, sequence_checksum=None, sequence_length=length
+        )
+
+    # two processes each hold their own index over the same directory
+    first = sequence_search.KmerSeedIndex(tmp_path / "index")
+    second = sequence_search.KmerSeedIndex(tmp_path / "index")
+    first.add_versions([_version(3000)])
+    second._load()
+    first.add_versions([_version(200)])
+    second.add_versions([_version(200)])
+    first.compact()
+    manifest = second._load()
+    assert len(manifest["versions"]) == 3
+    for segment in manifest["segments"]:
+        assert (tmp_path / "index" / f"kmers.{segment}.npy").exists()
+
+
 def test_primer_design(client):
     headers = auth_headers(client)
     payload = {"sequence": "ATGC" * 30, "size": 10}
@@ -11,3 +11,24 @@ def test_sequence_toolkit_presets_catalog(client):
     first = payload['presets'][0]
     assert 'preset_id' in first and first['preset_id']
     assert 'primer_overrides' in first
+
+
+def test_sequence_toolkit_batch_design_streams_ndjson(client):
+    import json
+
+    headers = get_auth_headers(client)
+    payload = {
+        'templates': [
+            {'name': f'template-{idx}', 'sequence': 'ATGCGT' * 80}
+            for idx in range(3)
+        ],
+        'preset_id': 'qpcr',
+        'max_workers': 2,
+    }
+    response = client.post('/api/sequence-toolkit/primers/batch', json=payload, headers=headers)
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('application/x-ndjson')
+    lines = [json.loads(line) for line in response.text.splitlines() if line]
+    assert [line['type'] for line in lines].count('result') == 3
+    assert lines[-1]['type'] == 'summary'
+    assert lines[-1]['template_count'] == 3
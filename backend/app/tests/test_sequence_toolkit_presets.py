@@ -41,3 +41,30 @@ def test_simulate_assembly_propagates_profile_metadata() -> None:
     )
     assert assembly["profile"]["preset_id"] == "high_gc"
     assert assembly["metadata_tags"]
+
+
+def test_design_primers_batch_streams_results_and_summary() -> None:
+    templates = [
+        _sequence("batch-a", "ATGCGT", 80),
+        _sequence("batch-b", "ATGGCC", 75),
+        {"name": "too-short", "sequence": "ATGC"},
+    ]
+    envelopes = list(
+        sequence_toolkit.design_primers_batch(
+            templates,
+            preset_id="multiplex",
+            max_workers=2,
+        )
+    )
+    results = [entry for entry in envelopes if entry["type"] == "result"]
+    summary = envelopes[-1]
+    assert summary["type"] == "summary"
+    assert sorted(entry["index"] for entry in results) == [0, 1, 2]
+    assert summary["template_count"] == 3
+    assert summary["status_counts"].get("insufficient_sequence") == 1
+    assert summary["profile"]["preset_id"] == "multiplex"
+    assert summary["workers"] == sequence_toolkit.BATCH_MAX_WORKERS
+    assert all("multiplex" not in entry for entry in results)
+    single = sequence_toolkit.design_primers([templates[0]], preset_id="multiplex")
+    batch_record = next(entry["record"] for entry in results if entry["index"] == 0)
+    assert batch_record == single["primers"][0]
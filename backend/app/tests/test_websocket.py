@@ -1,5 +1,9 @@
 import json
 import uuid
+
+import pytest
+
+from app import pubsub
 from .conftest import client, ensure_auth_headers
 
 
@@ -23,3 +27,35 @@ def test_websocket_receives_item_events(client):
         msg = json.loads(data)
         assert msg["type"] == "item_created"
         assert msg["id"] == item_resp.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_subscription_hub_shares_channel_and_evicts_slow_consumer():
+    hub = pubsub.SubscriptionHub(buffer_size=2)
+    # fresh client: the shared one may be bound to the TestClient loop of an earlier test
+    redis = pubsub._create_client()
+    channel = f"team:{uuid.uuid4()}"
+    fast = await hub.subscribe(channel)
+    slow = await hub.subscribe(channel, buffer_size=1)
+    try:
+        assert hub.stats()["channels"] == 1
+        assert hub.stats()["subscribers"] == 2
+        # both local clients ride on one Redis subscription
+        assert (await redis.pubsub_numsub(channel))[0][1] == 1
+
+        await redis.publish(channel, json.dumps({"seq": 1}))
+        assert await fast.get(timeout=2.0) == (channel, json.dumps({"seq": 1}))
+        await redis.publish(channel, json.dumps({"seq": 2}))
+        assert await fast.get(timeout=2.0) == (channel, json.dumps({"seq": 2}))
+
+        # the slow client never read, so the second message overflowed its buffer
+        assert slow.evicted
+        assert await slow.get(timeout=1.0) is None
+        assert hub.stats()["evicted"] == 1
+        assert hub.stats()["subscribers"] == 1
+    finally:
+        await fast.close()
+        await slow.close()
+    assert hub.stats()["channels"] == 0
+    assert (await redis.pubsub_numsub(channel))[0][1] == 0
+    await redis.aclose()
@@ -3,24 +3,26 @@
 from __future__ import annotations
 
 import hashlib
-import io
 import json
 import os
 import re
+import tempfile
+import time
 import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Iterator
 from uuid import UUID, uuid4
 
 from celery.utils.log import get_task_logger
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
 
 from .. import models
 from ..database import SessionLocal
 from ..eventlog import record_execution_event
 from ..services import approval_ladders
-from ..storage import load_binary_payload, save_binary_payload, validate_checksum
+from ..storage import STREAM_CHUNK_SIZE, open_stream, save_stream, stat_payload
 from ..tasks import celery_app
 
 # purpose: manage durable execution narrative packaging outside request lifecycle
@@ -33,6 +35,11 @@ _logger = get_task_logger(__name__)
 MAX_RETRIES = int(os.getenv("NARRATIVE_PACKAGING_MAX_RETRIES", "5"))
 RETRY_BACKOFF_SECONDS = int(os.getenv("NARRATIVE_PACKAGING_RETRY_SECONDS", "60"))
 RETENTION_DAYS = int(os.getenv("NARRATIVE_EXPORT_RETENTION_DAYS", "365"))
+# attachment payloads fetched ahead of the zip writer, and the in-memory size before each spills to disk
+FETCH_CONCURRENCY = max(int(os.getenv("NARRATIVE_PACKAGING_FETCH_CONCURRENCY", "4")), 1)
+SPOOL_MAX_BYTES = int(os.getenv("NARRATIVE_PACKAGING_SPOOL_BYTES", str(8 * 1024 * 1024)))
+
+_EVENT_EVIDENCE_TYPES = {"timeline_event", "analytics_snapshot", "qc_metric", "remediation_report"}
 
 
 def enqueue_narrative_export_packaging(export_id: UUID | str) -> None:
@@ -45,15 +52,123 @@ def enqueue_narrative_export_packaging(export_id: UUID | str) -> None:
         package_execution_narrative_export.delay(identifier)
 
 
-def _build_export_artifact_payload(
+class _ZipChunkSink:
+    """Write-only, non-seekable target that hands ZIP bytes back to the generator."""
+
+    # purpose: let zipfile emit entries with data descriptors so the archive never needs seeking
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        return len(data)
+
+    def flush(self) -> None:
+        return None
+
+    def drain(self) -> bytes:
+        data, self._buffer = bytes(self._buffer), bytearray()
+        return data
+
+
+def _safe_name(base: str, fallback: str, extension: str = "") -> str:
+    sanitized = re.sub(r"[^A-Za-z0-9_.-]", "_", base or "")
+    if not sanitized:
+        sanitized = fallback
+    if extension and not sanitized.endswith(extension):
+        sanitized = f"{sanitized}{extension}"
+    return sanitized
+
+
+def _file_fetch_key(file_obj: models.File) -> str:
+    """Return the dedupe key for a stored file: its recorded checksum, else its locator."""
+
+    meta = file_obj.meta or {}
+    if meta.get("checksum"):
+        return f"{meta.get('checksum_algorithm', 'sha256')}:{meta['checksum']}"
+    return f"path:{file_obj.storage_path}"
+
+
+def _fetch_to_spool(storage_path: str) -> tuple[tempfile.SpooledTemporaryFile, int]:
+    """Copy a stored payload into a spooled temp file that spills to disk past the ceiling."""
+
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    size = 0
+    try:
+        for chunk in open_stream(storage_path):
+            spool.write(chunk)
+            size += len(chunk)
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool, size
+
+
+def _load_attachment_rows(
     export: models.ExecutionNarrativeExport,
     db_session: Session,
-) -> tuple[bytes, list[dict[str, Any]]]:
-    """Return zipped dossier bytes and manifest for a narrative export."""
+) -> tuple[dict[Any, models.File], dict[Any, models.NotebookEntry], dict[Any, models.ExecutionEvent]]:
+    """Batch-load every file, notebook entry, and event referenced by export attachments."""
+
+    # purpose: replace per-attachment lookups with one IN query per evidence type
+    files = {attachment.file.id: attachment.file for attachment in export.attachments if attachment.file}
+    missing_file_ids = {
+        attachment.file_id
+        for attachment in export.attachments
+        if attachment.evidence_type == "file" and attachment.file_id and attachment.file_id not in files
+    }
+    notebook_ids = {
+        attachment.reference_id
+        for attachment in export.attachments
+        if attachment.evidence_type == "notebook_entry"
+    }
+    event_ids = {
+        attachment.reference_id
+        for attachment in export.attachments
+        if attachment.evidence_type in _EVENT_EVIDENCE_TYPES
+    }
+    if missing_file_ids:
+        files.update(
+            (row.id, row)
+            for row in db_session.query(models.File).filter(models.File.id.in_(missing_file_ids))
+        )
+    notebooks = {}
+    if notebook_ids:
+        notebooks = {
+            row.id: row
+            for row in db_session.query(models.NotebookEntry).filter(
+                models.NotebookEntry.id.in_(notebook_ids)
+            )
+        }
+    events = {}
+    if event_ids:
+        events = {
+            row.id: row
+            for row in db_session.query(models.ExecutionEvent).filter(
+                models.ExecutionEvent.id.in_(event_ids)
+            )
+        }
+    return files, notebooks, events
 
-    buffer = io.BytesIO()
-    archive = zipfile.ZipFile(file=buffer, mode="w", compression=zipfile.ZIP_DEFLATED)
+
+def _build_export_artifact_payload(
+    export: models.ExecutionNarrativeExport,
+    db_session: Session,
+) -> tuple[Iterator[bytes], list[dict[str, Any]]]:
+    """Return a chunked dossier ZIP stream and the attachment manifest for a narrative export."""
+
+    # purpose: package dossiers with bounded memory regardless of attachment count or size
+    # inputs: export with attachments loaded, session for batch row lookups
+    # outputs: (iterator of ZIP bytes to hand to storage.save_stream, attachment manifest)
+    # status: pilot
+    # note: database rows are read before the iterator is returned; consuming it only touches storage
+    files, notebooks, events = _load_attachment_rows(export, db_session)
     attachments_manifest: list[dict[str, Any]] = []
+    # archive entries in write order: (path, inline content, None) or (path, None, file fetch key)
+    entries: list[tuple[str, str | bytes | None, str | None]] = []
+    fetch_paths: dict[str, str] = {}
+    archive_paths: dict[str, str] = {}
 
     export_metadata = {
         "export_id": str(export.id),
@@ -65,25 +180,8 @@ def _build_export_artifact_payload(
         "metadata": export.meta or {},
         "requested_by": str(export.requested_by_id),
     }
-
-    archive.writestr("narrative.md", export.content)
-    archive.writestr("export.json", json.dumps(export_metadata, indent=2, default=str))
-
-    def _safe_name(base: str, fallback: str, extension: str = "") -> str:
-        sanitized = re.sub(r"[^A-Za-z0-9_.-]", "_", base or "")
-        if not sanitized:
-            sanitized = fallback
-        if extension and not sanitized.endswith(extension):
-            sanitized = f"{sanitized}{extension}"
-        return sanitized
-
-    def _load_event(event_id: UUID) -> models.ExecutionEvent | None:
-        return (
-            db_session.query(models.ExecutionEvent)
-            .options(joinedload(models.ExecutionEvent.actor))
-            .filter(models.ExecutionEvent.id == event_id)
-            .first()
-        )
+    entries.append(("narrative.md", export.content, None))
+    entries.append(("export.json", json.dumps(export_metadata, indent=2, default=str), None))
 
     for index, attachment in enumerate(export.attachments, start=1):
         manifest_entry: dict[str, Any] = {
@@ -96,52 +194,42 @@ def _build_export_artifact_payload(
         }
 
         if attachment.evidence_type == "file" and attachment.file_id:
-            file_obj = attachment.file
-            if not file_obj:
-                file_obj = (
-                    db_session.query(models.File)
-                    .filter(models.File.id == attachment.file_id)
-                    .first()
-                )
+            file_obj = files.get(attachment.file_id)
             if not file_obj:
                 raise FileNotFoundError("Attachment file missing for export packaging")
-            file_bytes = load_binary_payload(file_obj.storage_path)
-            safe_label = attachment.label or file_obj.filename or f"attachment-{index}"
-            safe_name = _safe_name(safe_label, f"attachment-{index}.bin")
-            file_path = f"attachments/files/{index:02d}-{safe_name}"
-            archive.writestr(file_path, file_bytes)
+            fetch_key = _file_fetch_key(file_obj)
+            file_path = archive_paths.get(fetch_key)
+            if file_path is None:
+                safe_label = attachment.label or file_obj.filename or f"attachment-{index}"
+                safe_name = _safe_name(safe_label, f"attachment-{index}.bin")
+                file_path = f"attachments/files/{index:02d}-{safe_name}"
+                archive_paths[fetch_key] = file_path
+                fetch_paths[fetch_key] = file_obj.storage_path
+                entries.append((file_path, None, fetch_key))
             manifest_entry["file"] = {
                 "id": str(file_obj.id),
                 "filename": file_obj.filename,
                 "path": file_path,
                 "size": file_obj.file_size,
                 "type": file_obj.file_type,
+                "checksum": (file_obj.meta or {}).get("checksum"),
             }
         elif attachment.evidence_type == "notebook_entry":
-            entry = (
-                db_session.query(models.NotebookEntry)
-                .filter(models.NotebookEntry.id == attachment.reference_id)
-                .first()
-            )
+            entry = notebooks.get(attachment.reference_id)
             if not entry:
                 raise FileNotFoundError("Notebook entry missing for export packaging")
             safe_label = attachment.label or entry.title or f"notebook-{index}"
             safe_name = _safe_name(safe_label, f"notebook-{index}", ".md")
             file_path = f"attachments/notebooks/{index:02d}-{safe_name}"
-            archive.writestr(file_path, entry.content or "")
+            entries.append((file_path, entry.content or "", None))
             manifest_entry["notebook"] = {
                 "title": entry.title,
                 "path": file_path,
                 "created_at": entry.created_at.isoformat() if entry.created_at else None,
                 "updated_at": entry.updated_at.isoformat() if entry.updated_at else None,
             }
-        elif attachment.evidence_type in {
-            "timeline_event",
-            "analytics_snapshot",
-            "qc_metric",
-            "remediation_report",
-        }:
-            event = _load_event(attachment.reference_id)
+        elif attachment.evidence_type in _EVENT_EVIDENCE_TYPES:
+            event = events.get(attachment.reference_id)
             if not event:
                 raise FileNotFoundError("Timeline event missing for export packaging")
             manifest_entry["event"] = {
@@ -155,17 +243,58 @@ def _build_export_artifact_payload(
                 safe_label = attachment.label or attachment.evidence_type.replace("_", "-")
                 safe_name = _safe_name(safe_label, f"event-{index}", ".json")
                 file_path = f"attachments/events/{index:02d}-{safe_name}"
-                archive.writestr(file_path, json.dumps(payload, indent=2, default=str))
+                entries.append((file_path, json.dumps(payload, indent=2, default=str), None))
                 manifest_entry["event"]["payload_path"] = file_path
         attachments_manifest.append(manifest_entry)
 
-    archive.writestr(
-        "attachments.json",
-        json.dumps(attachments_manifest, indent=2, default=str),
-    )
-    archive.close()
+    entries.append(("attachments.json", json.dumps(attachments_manifest, indent=2, default=str), None))
+    return _stream_archive(entries, fetch_paths), attachments_manifest
+
 
-    return buffer.getvalue(), attachments_manifest
+def _stream_archive(
+    entries: list[tuple[str, str | bytes | None, str | None]],
+    fetch_paths: dict[str, str],
+) -> Iterator[bytes]:
+    """Yield ZIP bytes entry by entry while attachment payloads are prefetched in parallel."""
+
+    # purpose: overlap storage reads with compression without holding every attachment at once
+    # note: at most FETCH_CONCURRENCY payloads are in flight, each capped at SPOOL_MAX_BYTES in memory
+    sink = _ZipChunkSink()
+    order = [fetch_key for _, _, fetch_key in entries if fetch_key]
+    pending: dict[str, Future] = {}
+    executor = ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY, thread_name_prefix="narrative-fetch")
+
+    def _prefetch(position: int) -> None:
+        for fetch_key in order[position : position + FETCH_CONCURRENCY]:
+            if fetch_key not in pending:
+                pending[fetch_key] = executor.submit(_fetch_to_spool, fetch_paths[fetch_key])
+
+    try:
+        with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+            position = 0
+            for path, content, fetch_key in entries:
+                if fetch_key is None:
+                    archive.writestr(path, content)
+                    yield sink.drain()
+                    continue
+                _prefetch(position)
+                position += 1
+                spool, size = pending.pop(fetch_key).result()
+                with spool:
+                    info = zipfile.ZipInfo(path, date_time=time.localtime()[:6])
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    with archive.open(info, "w", force_zip64=size >= zipfile.ZIP64_LIMIT) as handle:
+                        while chunk := spool.read(STREAM_CHUNK_SIZE):
+                            handle.write(chunk)
+                            yield sink.drain()
+                yield sink.drain()
+        yield sink.drain()
+    finally:
+        # abandoned streams (failed upload, generator closed early) must not leak spooled files
+        executor.shutdown(wait=True, cancel_futures=True)
+        for future in pending.values():
+            if not future.cancelled() and future.exception() is None:
+                future.result()[0].close()
 
 
 @celery_app.task(bind=True, name="app.workers.packaging.package_execution_narrative_export")
@@ -228,21 +357,22 @@ def package_execution_narrative_export(self, export_identifier: str) -> str:
         db.commit()
 
         try:
-            archive_bytes, manifest = _build_export_artifact_payload(export, db)
+            archive_stream, manifest = _build_export_artifact_payload(export, db)
             storage_namespace = f"narratives/{export.execution_id}/v{export.version}"
-            storage_path, file_size = save_binary_payload(
-                archive_bytes,
+            stored = save_stream(
+                archive_stream,
                 f"execution-{export.execution_id}-narrative-v{export.version}.zip",
                 content_type="application/zip",
                 namespace=storage_namespace,
                 encrypt=os.getenv("NARRATIVE_EXPORT_ENCRYPTION", "0") == "1",
             )
-            checksum = hashlib.sha256(archive_bytes).hexdigest()
+            storage_path, file_size, checksum = stored.storage_path, stored.size, stored.checksum
             manifest_digest = hashlib.sha256(
                 json.dumps(manifest, sort_keys=True, default=str).encode("utf-8")
             ).hexdigest()
-            if not validate_checksum(storage_path, checksum):
-                raise ValueError("Stored artifact checksum does not match generated archive")
+            # the checksum was hashed while writing; a size check catches truncation without a re-read
+            if stat_payload(storage_path) != file_size:
+                raise ValueError("Stored artifact size does not match generated archive")
 
             artifact_file = models.File(
                 id=uuid4(),
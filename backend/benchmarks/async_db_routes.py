@@ -0,0 +1,172 @@
+"""Benchmark blocking vs async database sessions inside async FastAPI routes.
+
+Run from the backend directory:
+
+    python -m benchmarks.async_db_routes --items 5000 --concurrency 32 --requests 400
+
+Both handlers run the same inventory listing query against a seeded scratch
+database. While they are under load a probe endpoint is called on a fixed
+schedule; with the blocking session the probe waits behind every query on the
+event loop, with the async session it does not. Local SQLite answers faster
+than a networked database, so `--db-latency-ms` adds a server-side delay to
+each query to model round trips. Set DATABASE_URL (and optionally
+ASYNC_DATABASE_URL) to point at Postgres and pass `--db-latency-ms 0` to
+measure a real server instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+import uuid
+
+_SCRATCH = os.path.join(tempfile.mkdtemp(prefix="biolab-bench-"), "bench.db")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_SCRATCH}")
+
+import httpx  # noqa: E402
+import sqlalchemy as sa  # noqa: E402
+from fastapi import Depends, FastAPI  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+
+from app import models  # noqa: E402
+from app.database import Base, SessionLocal, engine, get_async_db, get_async_engine  # noqa: E402
+
+
+def _seed(count: int) -> None:
+    Base.metadata.create_all(bind=engine, tables=[models.InventoryItem.__table__])
+    with SessionLocal() as db:
+        if db.query(models.InventoryItem).count() >= count:
+            return
+        db.bulk_insert_mappings(
+            models.InventoryItem,
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "item_type": "sample",
+                    "name": f"bench-{index}",
+                    "status": "available",
+                    "custom_data": {"batch": index % 17},
+                }
+                for index in range(count)
+            ],
+        )
+        db.commit()
+
+
+def _register_delay(sync_engine) -> None:
+    @event.listens_for(sync_engine, "connect")
+    def _connect(dbapi_connection, _record):
+        dbapi_connection.create_function("bench_delay", 1, lambda ms: time.sleep(ms / 1000) or 1)
+
+
+def _build_app(limit: int, latency_ms: float) -> FastAPI:
+    app = FastAPI()
+    query = sa.select(models.InventoryItem).order_by(models.InventoryItem.name).limit(limit)
+    delay = sa.select(sa.func.bench_delay(latency_ms)) if latency_ms else None
+
+    @app.get("/blocking")
+    async def blocking():
+        # mirrors the pre-async routes: an `async def` handler calling the sync session.
+        # The session is closed inline; with Depends(get_db) the teardown needs the loop that
+        # the next blocked handler is holding, and the sync pool deadlocks under concurrency.
+        with SessionLocal() as db:
+            if delay is not None:
+                db.execute(delay)
+            return len(db.execute(query).scalars().all())
+
+    @app.get("/async")
+    async def non_blocking(db: AsyncSession = Depends(get_async_db)):
+        if delay is not None:
+            await db.execute(delay)
+        return len((await db.execute(query)).scalars().all())
+
+    @app.get("/probe")
+    async def probe():
+        return {"ok": True}
+
+    return app
+
+
+def _percentiles(samples: list[float]) -> str:
+    ordered = sorted(samples)
+    cuts = statistics.quantiles(ordered, n=100) if len(ordered) > 1 else ordered * 99
+    return f"p50 {cuts[49] * 1000:8.1f} ms  p95 {cuts[94] * 1000:8.1f} ms  p99 {cuts[98] * 1000:8.1f} ms"
+
+
+async def _run(client: httpx.AsyncClient, path: str, concurrency: int, total: int) -> tuple[list[float], list[float], float]:
+    query_latency: list[float] = []
+    probe_latency: list[float] = []
+    remaining = iter(range(total))
+    done = asyncio.Event()
+
+    async def worker() -> None:
+        for _ in remaining:
+            started = time.perf_counter()
+            response = await client.get(path)
+            response.raise_for_status()
+            query_latency.append(time.perf_counter() - started)
+
+    async def prober() -> None:
+        # probes are due on a fixed schedule; latency counts from the due time so event loop
+        # stalls show up even when the probe coroutine itself could not start on time
+        tick = 0
+        while not done.is_set():
+            due = started + tick * 0.005
+            await asyncio.sleep(max(0.0, due - time.perf_counter()))
+            await client.get("/probe")
+            probe_latency.append(time.perf_counter() - due)
+            tick += 1
+
+    started = time.perf_counter()
+    probe_task = asyncio.create_task(prober())
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await probe_task
+    return query_latency, probe_latency, elapsed
+
+
+async def _main(args: argparse.Namespace) -> None:
+    _seed(args.items)
+    async_engine = get_async_engine()
+    if args.db_latency_ms:
+        if engine.dialect.name != "sqlite":
+            raise SystemExit("--db-latency-ms only applies to the SQLite scratch database")
+        _register_delay(engine)
+        _register_delay(async_engine.sync_engine)
+        # drop connections opened while seeding so every pooled connection has the function
+        engine.dispose()
+    app = _build_app(args.limit, args.db_latency_ms)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.get("/async")
+        await client.get("/blocking")
+        print(
+            f"items={args.items} limit={args.limit} concurrency={args.concurrency} "
+            f"requests={args.requests} db_latency_ms={args.db_latency_ms} url={os.environ['DATABASE_URL']}"
+        )
+        for label, path in (("blocking", "/blocking"), ("async", "/async")):
+            query_latency, probe_latency, elapsed = await _run(
+                client, path, args.concurrency, args.requests
+            )
+            print(f"{label:>9} query: {_percentiles(query_latency)}  throughput {len(query_latency) / elapsed:7.1f} req/s")
+            print(f"{label:>9} probe: {_percentiles(probe_latency)}  samples {len(probe_latency)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--db-latency-ms", type=float, default=5.0)
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
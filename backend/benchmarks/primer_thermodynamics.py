@@ -0,0 +1,69 @@
+"""Benchmark scalar vs vectorized primer thermodynamics scoring.
+
+Run from the backend directory:
+
+    python -m benchmarks.primer_thermodynamics --primers 400 --length 24
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from app.services import primer_thermodynamics, sequence_toolkit
+
+
+def _random_primers(count: int, length: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    return ["".join(rng.choice("ACGT") for _ in range(length)) for _ in range(count)]
+
+
+def _scalar(primers: list[str], na_mM: float, primer_nM: float) -> tuple:
+    tm = [
+        sequence_toolkit._nearest_neighbor_tm(seq, na_conc_mM=na_mM, primer_conc_nM=primer_nM)
+        for seq in primers
+    ]
+    hairpin = [sequence_toolkit._max_hairpin_run(seq) for seq in primers]
+    homodimer = [sequence_toolkit._max_homodimer_run(seq) for seq in primers]
+    cross = [
+        [sequence_toolkit._max_cross_dimer_run(a, b) for b in primers] for a in primers
+    ]
+    return tm, hairpin, homodimer, cross
+
+
+def _vectorized(primers: list[str], na_mM: float, primer_nM: float) -> tuple:
+    scored = primer_thermodynamics.score_primer_batch(
+        primers, na_conc_mM=na_mM, primer_conc_nM=primer_nM
+    )
+    cross = primer_thermodynamics.cross_dimer_matrix(
+        primer_thermodynamics.encode_primers(primers)
+    )
+    return scored.tm.tolist(), scored.hairpin_runs.tolist(), scored.homodimer_runs.tolist(), cross.tolist()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--primers", type=int, default=200)
+    parser.add_argument("--length", type=int, default=24)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    primers = _random_primers(args.primers, args.length, args.seed)
+    timings: dict[str, float] = {}
+    results: dict[str, tuple] = {}
+    for label, engine in (("scalar", _scalar), ("vectorized", _vectorized)):
+        started = time.perf_counter()
+        results[label] = engine(primers, 50.0, 250.0)
+        timings[label] = time.perf_counter() - started
+
+    identical = results["scalar"] == results["vectorized"]
+    print(f"primers={args.primers} length={args.length} cross_pairs={args.primers ** 2}")
+    for label, elapsed in timings.items():
+        print(f"{label:>10}: {elapsed * 1000:9.1f} ms")
+    print(f"   speedup: {timings['scalar'] / max(timings['vectorized'], 1e-9):9.1f}x")
+    print(f" identical: {identical}")
+
+
+if __name__ == "__main__":
+    main()
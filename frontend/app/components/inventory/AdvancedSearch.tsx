@@ -140,8 +140,8 @@ export default function AdvancedSearch({
                 >
                   <option value="">All types</option>
                   {facets?.item_types.map(type => (
-                    <option key={type.value} value={type.value}>
-                      {type.value} ({type.count})
+                    <option key={type.key} value={type.key}>
+                      {type.key} ({type.count})
                     </option>
                   ))}
                 </select>
@@ -160,8 +160,8 @@ export default function AdvancedSearch({
                 >
                   <option value="">All statuses</option>
                   {facets?.statuses.map(status => (
-                    <option key={status.value} value={status.value}>
-                      {status.value} ({status.count})
+                    <option key={status.key} value={status.key}>
+                      {status.key} ({status.count})
                     </option>
                   ))}
                 </select>
@@ -224,8 +224,8 @@ export default function BulkOperations({
               >
                 <option value="">Keep current status</option>
                 {facets?.statuses.map(status => (
-                  <option key={status.value} value={status.value}>
-                    {status.value}
+                  <option key={status.key} value={status.key}>
+                    {status.key}
                   </option>
                 ))}
               </select>
@@ -242,8 +242,8 @@ export default function BulkOperations({
               >
                 <option value="">Keep current type</option>
                 {facets?.item_types.map(type => (
-                  <option key={type.value} value={type.value}>
-                    {type.value}
+                  <option key={type.key} value={type.key}>
+                    {type.key}
                   </option>
                 ))}
               </select>
@@ -0,0 +1,42 @@
+import { beforeEach, describe, expect, it, vi } from 'vitest'
+
+import api from '../../api/client'
+import { INVENTORY_LIST_FIELDS, fetchInventoryPage } from '../useInventory'
+
+vi.mock('../../api/client', () => ({
+  default: { get: vi.fn() },
+}))
+
+describe('fetchInventoryPage', () => {
+  beforeEach(() => {
+    vi.mocked(api.get).mockReset()
+  })
+
+  it('requests one projected page with an exact total on the first call', async () => {
+    vi.mocked(api.get).mockResolvedValueOnce({
+      data: [{ id: 'a' }, { id: 'b' }],
+      headers: { 'x-next-cursor': 'c1', 'x-total-count': '3' },
+    } as any)
+
+    const page = await fetchInventoryPage({ status: 'available' })
+
+    expect(page.items.map((item) => item.id)).toEqual(['a', 'b'])
+    expect(page.nextCursor).toBe('c1')
+    expect(page.total).toBe(3)
+    expect(vi.mocked(api.get).mock.calls[0][1]).toEqual({
+      params: { status: 'available', limit: 100, fields: INVENTORY_LIST_FIELDS, count: 'exact' },
+    })
+  })
+
+  it('passes the cursor for later pages and stops at the last one', async () => {
+    vi.mocked(api.get).mockResolvedValueOnce({ data: [{ id: 'c' }], headers: {} } as any)
+
+    const page = await fetchInventoryPage({ status: 'available' }, 'c1')
+
+    expect(page.nextCursor).toBeUndefined()
+    expect(api.get).toHaveBeenCalledTimes(1)
+    expect(vi.mocked(api.get).mock.calls[0][1]).toEqual({
+      params: { status: 'available', limit: 100, fields: INVENTORY_LIST_FIELDS, cursor: 'c1' },
+    })
+  })
+})
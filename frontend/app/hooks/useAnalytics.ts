@@ -142,7 +142,8 @@ export const useLabMetrics = () => {
           notebookResp,
           auditResp
         ] = await Promise.all([
-          api.get('/api/inventory/items'),
+          // only the X-Total-Count header is needed, so fetch a single id-only row
+          api.get('/api/inventory/items', { params: { count: 'exact', limit: 1, fields: 'id' } }),
           api.get('/api/protocols/templates'),
           api.get('/api/projects'),
           api.get('/api/notebook/entries'),
@@ -156,7 +157,7 @@ export const useLabMetrics = () => {
         const auditLogs = auditResp.data
 
         // Calculate metrics from actual data
-        const totalItems = inventory.length
+        const totalItems = Number(inventoryResp.headers?.['x-total-count'] ?? inventory.length)
         const activeProjects = projects.filter((p: any) => p.status === 'active').length
         const completedProtocols = protocols.filter((p: any) => p.status === 'completed').length
         
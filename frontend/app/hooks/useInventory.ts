@@ -1,5 +1,5 @@
 'use client'
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
+import { useInfiniteQuery, useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
 import api from '../api/client'
 import type { InventoryItem } from '../types'
 
@@ -15,25 +15,51 @@ interface InventoryFilters {
 }
 
 interface InventoryFacets {
-  item_types: Array<{ value: string; count: number }>
-  statuses: Array<{ value: string; count: number }>
+  item_types: Array<{ key: string; count: number }>
+  statuses: Array<{ key: string; count: number }>
   teams: Array<{ value: string; count: number; name: string }>
   fields: Array<{ field_key: string; field_label: string; field_type: string }>
 }
 
+// the list endpoint pages by keyset; the UI loads one page at a time and follows X-Next-Cursor on demand
+const INVENTORY_PAGE_LIMIT = 100
+// columns the list view renders; detail and edit views load the full item by id
+export const INVENTORY_LIST_FIELDS = 'id,name,item_type,status,barcode,team_id,created_at,custom_data'
+
+export interface InventoryPage {
+  items: InventoryItem[]
+  nextCursor?: string
+  total?: number
+}
+
+export const fetchInventoryPage = async (
+  filters?: InventoryFilters,
+  cursor?: string,
+): Promise<InventoryPage> => {
+  const resp = await api.get('/api/inventory/items', {
+    params: {
+      ...filters,
+      limit: INVENTORY_PAGE_LIMIT,
+      fields: INVENTORY_LIST_FIELDS,
+      // only the first page asks for the total
+      ...(cursor ? { cursor } : { count: 'exact' }),
+    },
+  })
+  const total = resp.headers?.['x-total-count']
+  return {
+    items: resp.data as InventoryItem[],
+    nextCursor: resp.headers?.['x-next-cursor'] || undefined,
+    total: total != null ? Number(total) : undefined,
+  }
+}
+
 // Core inventory operations
 export const useInventoryItems = (filters?: InventoryFilters) => {
-  return useQuery({
+  return useInfiniteQuery({
     queryKey: ['inventory', filters],
-    queryFn: async () => {
-      try {
-        const resp = await api.get('/api/inventory/items', { params: filters })
-        return resp.data as InventoryItem[]
-      } catch (error) {
-        console.error('Failed to fetch inventory items:', error)
-        return []
-      }
-    },
+    queryFn: ({ pageParam }) => fetchInventoryPage(filters, pageParam),
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (lastPage) => lastPage.nextCursor,
     staleTime: 2 * 60 * 1000, // 2 minutes
   })
 }
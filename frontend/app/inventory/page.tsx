@@ -52,8 +52,21 @@ export default function InventoryPage() {
   }, [searchParams])
 
   // Data fetching
-  const { data: items = [], isLoading, error, refetch } = useInventoryItems(filters)
+  const {
+    data: pages,
+    isLoading,
+    error,
+    refetch,
+    fetchNextPage,
+    hasNextPage,
+    isFetchingNextPage,
+  } = useInventoryItems(filters)
   const { data: facets } = useInventoryFacets()
+  const items = useMemo(() => pages?.pages.flatMap((page) => page.items) ?? [], [pages])
+  // totals come from X-Total-Count and the facets, not from the pages loaded so far
+  const totalItems = pages?.pages[0]?.total ?? items.length
+  const statusCount = (status: string) =>
+    facets?.statuses.find((facet) => facet.key === status)?.count ?? 0
   const searchMutation = useInventorySearch()
   
   // Mutations
@@ -233,7 +246,7 @@ export default function InventoryPage() {
               </div>
               <div className="ml-4">
                 <p className="text-sm font-medium text-neutral-600">Total Items</p>
-                <p className="text-2xl font-bold text-neutral-900">{items.length}</p>
+                <p className="text-2xl font-bold text-neutral-900">{totalItems}</p>
               </div>
             </div>
           </CardBody>
@@ -250,7 +263,7 @@ export default function InventoryPage() {
               <div className="ml-4">
                 <p className="text-sm font-medium text-neutral-600">Available</p>
                 <p className="text-2xl font-bold text-neutral-900">
-                  {items.filter(item => item.status === 'available').length}
+                  {statusCount('available')}
                 </p>
               </div>
             </div>
@@ -268,7 +281,7 @@ export default function InventoryPage() {
               <div className="ml-4">
                 <p className="text-sm font-medium text-neutral-600">In Use</p>
                 <p className="text-2xl font-bold text-neutral-900">
-                  {items.filter(item => item.status === 'used').length}
+                  {statusCount('used')}
                 </p>
               </div>
             </div>
@@ -286,7 +299,7 @@ export default function InventoryPage() {
               <div className="ml-4">
                 <p className="text-sm font-medium text-neutral-600">Expired</p>
                 <p className="text-2xl font-bold text-neutral-900">
-                  {items.filter(item => item.status === 'expired').length}
+                  {statusCount('expired')}
                 </p>
               </div>
             </div>
@@ -315,7 +328,7 @@ export default function InventoryPage() {
       {filteredItems.length > 0 && (
         <div className="flex items-center justify-between text-sm text-neutral-600">
           <span>
-            Showing {filteredItems.length} of {items.length} items
+            Showing {filteredItems.length} of {totalItems} items
             {searchQuery && ` matching "${searchQuery}"`}
             {Object.keys(filters).length > 0 && ' with filters applied'}
           </span>
@@ -357,6 +370,14 @@ export default function InventoryPage() {
         onSort={handleSort}
       />
 
+      {hasNextPage && !searchQuery.trim() && (
+        <div className="flex justify-center">
+          <Button variant="ghost" onClick={() => fetchNextPage()} loading={isFetchingNextPage}>
+            Load more
+          </Button>
+        </div>
+      )}
+
       {/* Search Results Alert */}
       {searchMutation.data && searchQuery.trim() && (
         <Alert variant="info">
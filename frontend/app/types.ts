@@ -61,6 +61,7 @@ export interface GraphEdge {
 export interface GraphData {
   nodes: InventoryItem[]
   edges: GraphEdge[]
+  truncated?: boolean
 }
 
 export interface TroubleshootingArticle {
@@ -261,6 +262,31 @@ export interface InstrumentTelemetrySample {
 export interface InstrumentRunTelemetryEnvelope {
   run: InstrumentRun
   samples: InstrumentTelemetrySample[]
+  total_samples: number
+  next_cursor: string | null
+  downsampled: boolean
+}
+
+export interface InstrumentTelemetryRollupPoint {
+  bucket_start: string
+  count: number
+  min: number
+  max: number
+  mean: number
+}
+
+export interface InstrumentTelemetrySeries {
+  channel: string
+  field: string
+  points: InstrumentTelemetryRollupPoint[]
+}
+
+export interface InstrumentTelemetryRollupEnvelope {
+  run_id: string
+  tier_seconds: number
+  start: string | null
+  end: string | null
+  series: InstrumentTelemetrySeries[]
 }
 
 export interface InstrumentProfile {